@@ -4,7 +4,7 @@ hio.base Package
 """
 
 from .tyming import Tymist, Tymee, Tymer
-from .doing import Doist, doize, doify, Doer, DoDoer
+from .doing import Doist, doize, doify, Doer, DoDoer, Docket
 from .filing import openFiler, Filer, FilerDoer
 from .multidoing import Bosser, Crewer, TagDex
 from .during import (Duror, openDuror, SuberBase, Suber, IoSuber, IoSetSuber,
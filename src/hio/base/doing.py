@@ -3,11 +3,14 @@
 hio.core.doing Module
 """
 import time
+import math
 import types
 import inspect
+import selectors
 from inspect import isgeneratorfunction
 from collections import deque, namedtuple
 import asyncio
+import heapq
 
 from .. import hioing
 from .basing import State
@@ -17,6 +20,174 @@ from ..help import timing, helping
 
 Deed = namedtuple("Deed", "dog retyme doer")
 
+
+class Docket():
+    """Docket is min-heap scheduler of deeds keyed on retyme for use by
+    Doist and DoDoer in place of a deeds deque when most deeds are sleeping.
+    Each recur pass only pulls the deeds that are due instead of popping and
+    reappending every deed so cost per pass scales with due deeds not all deeds.
+
+    Each entry is kept as list of form [retyme, ordinal, dog, doer] where
+    ordinal is monotonically increasing order in which deed was first appended.
+    Due deeds are run in ordinal order so run order matches the deeds deque
+    scheduler where deeds retain their relative order across passes.
+
+    Attributes::
+
+        heap (list): min-heap of entries [retyme, ordinal, dog, doer]
+        pulls (deque): entries pulled as due by .pull and not yet run
+        ordinal (int): next ordinal to assign to newly appended deed
+
+    Methods::
+
+        append: add deed triple (dog, retyme, doer)
+        extend: add iterable of deed triples
+        push: re-add entry for deed with its original ordinal
+        pull: move due entries into .pulls in ordinal order
+        pop: remove and return last deed triple in ordinal order
+        discard: remove and return deeds for doers
+        drain: remove and return all deeds in ordinal order
+        earliest: return earliest retyme or None when empty
+        hasten: make deeds of doers due no later than retyme
+
+    Supports len(), bool(), and iteration over deed triples in ordinal order
+    so may be used where deeds deque is inspected.
+    """
+
+    def __init__(self, deeds=None):
+        """Initialize instance.
+
+        Parameters::
+
+            deeds (Iterable | None): deed triples (dog, retyme, doer) to append
+        """
+        self.heap = []
+        self.pulls = deque()
+        self.ordinal = 0
+        if deeds is not None:
+            self.extend(deeds)
+
+
+    def __len__(self):
+        return len(self.heap) + len(self.pulls)
+
+
+    def __iter__(self):
+        for retyme, ordinal, dog, doer in self._entries():
+            yield (dog, retyme, doer)
+
+
+    def _entries(self):
+        """Returns list of all entries in ordinal order"""
+        return sorted(list(self.heap) + list(self.pulls), key=lambda e: e[1])
+
+
+    def append(self, deed):
+        """Append deed triple (dog, retyme, doer) with next ordinal.
+        """
+        dog, retyme, doer = deed
+        heapq.heappush(self.heap, [retyme, self.ordinal, dog, doer])
+        self.ordinal += 1
+
+
+    def extend(self, deeds):
+        """Append each deed triple (dog, retyme, doer) in deeds.
+        """
+        for deed in deeds:
+            self.append(deed)
+
+
+    def push(self, dog, retyme, doer, ordinal):
+        """Re-add deed with its original ordinal so it keeps its run order.
+        """
+        heapq.heappush(self.heap, [retyme, ordinal, dog, doer])
+
+
+    def pull(self, tyme):
+        """Move all entries with retyme <= tyme from .heap into .pulls in
+        ordinal order. Returns number of due entries pulled.
+
+        Parameters::
+
+            tyme (float): current tyme
+        """
+        due = []
+        while self.heap and self.heap[0][0] <= tyme:
+            due.append(heapq.heappop(self.heap))
+        due.sort(key=lambda e: e[1])
+        self.pulls.extend(due)
+        return len(due)
+
+
+    def pop(self):
+        """Remove and return last deed triple (dog, retyme, doer) in ordinal
+        order. Raises IndexError when empty.
+        """
+        if not self:
+            raise IndexError("pop from an empty Docket")
+        entries = self._entries()
+        retyme, ordinal, dog, doer = entries.pop()
+        self.heap = [e for e in self.heap if e[1] != ordinal]
+        heapq.heapify(self.heap)
+        self.pulls = deque(e for e in self.pulls if e[1] != ordinal)
+        return (dog, retyme, doer)
+
+
+    def discard(self, doers):
+        """Remove and return deque of deed triples for each doer in doers in
+        ordinal order.
+
+        Parameters::
+
+            doers (Iterable): doers whose deeds to remove
+        """
+        rdeeds = deque()
+        for retyme, ordinal, dog, doer in self._entries():
+            if doer in doers:
+                rdeeds.append((dog, retyme, doer))
+        if rdeeds:
+            self.heap = [e for e in self.heap if e[3] not in doers]
+            heapq.heapify(self.heap)
+            self.pulls = deque(e for e in self.pulls if e[3] not in doers)
+        return rdeeds
+
+
+    def drain(self):
+        """Remove and return deque of all deed triples in ordinal order.
+        """
+        deeds = deque(self)
+        self.heap = []
+        self.pulls.clear()
+        return deeds
+
+
+    def earliest(self):
+        """Returns earliest retyme of scheduled deeds or None when empty.
+        """
+        retymes = [e[0] for e in self.pulls]
+        if self.heap:
+            retymes.append(self.heap[0][0])
+        return min(retymes) if retymes else None
+
+
+    def hasten(self, doers, retyme):
+        """Reschedule deeds for each doer in doers to retyme when their
+        retyme is later so they run on the next pass at or after retyme.
+
+        Parameters::
+
+            doers (Iterable): doers whose deeds to hasten
+            retyme (float): tyme by which deeds should be due
+        """
+        hastened = False
+        for entry in self.heap:
+            if entry[3] in doers and entry[0] > retyme:
+                entry[0] = retyme
+                hastened = True
+        if hastened:
+            heapq.heapify(self.heap)
+
+
 class Doist(tyming.Tymist):
     """Doist is the root coroutine scheduler
     (real python generator coroutines not fake asyncio coroutines)
@@ -39,6 +210,15 @@ class Doist(tyming.Tymist):
     use await inside. Notably .do uses time.sleep, while .ado uses await
     asyncio.sleep().
 
+    Alternatively call doist.arun() which is asyncio native. Instead of
+    polling every tock it schedules the next pass with loop.call_at at the
+    earliest retyme of its deeds so an idle doist costs the loop nothing.
+    Fileobjs registered with .register are added to the loop with add_reader
+    or add_writer so their readiness wakes the associated doer instead of
+    the doer polling its socket every tock. The doers of the tcp, http, udp
+    and uxd transports register their sockets with Doer.watch as they open
+    them. For example asyncio.run(doist.arun()).
+
     A doist instance running in an asyncio event loop does not directly execute
     async coroutines as Doers. But regular Doers may themselves execute asyncio
     coroutines defined with async def by emulating an await using the async
@@ -102,6 +282,14 @@ class Doist(tyming.Tymist):
         temp (bool): True means use temp resources such as file path.
                      When True inject into doer enters when True.
                      Otherwise do not inject into doer enters.
+        docketed (bool): True means .deeds is Docket min-heap scheduler that
+                     only runs due deeds. False means .deeds is deque.
+        idle (bool): True means when real sleep until earliest retyme of deeds
+                     instead of one .tock per pass. Skipped passes advance
+                     .tyme by whole tocks. Sleep ends early when fileobj
+                     registered with .register becomes ready.
+        selector (selectors.BaseSelector | None): selector of registered
+                     fileobjs that end idle sleep early. Created by .register
 
     Inherited Properties::
 
@@ -121,15 +309,22 @@ class Doist(tyming.Tymist):
                 - do: repeadedly call .recur until all dogs in deeds are complete or
                     times out do to reaching time limit. Calls .enter., .recur, .exit
                 - ado: async def version of .do
+                - arun: asyncio native version of .do scheduled by loop timers
+                    and fileobj readiness
                 - enter: prepare deeds, deque of triples (dog, retyme, doer)
                 - recur: run through all deeds once each invocaton of .recur
                 - exit: cleanly exit doers upon exception
                 - extend: cleanly add more doers at runtime
                 - remove: cleanly remove some or all doers at runtime
+                - register: register fileobj whose readiness ends idle sleep
+                - unregister: unregister fileobj
+                - earliest: earliest retyme of deeds
+                - hasten: make deeds of doer due now
+                - nap: idle sleep until next due deed or ready fileobj
     """
 
     def __init__(self, *, name='doist', real=False, limit=None, doers=None,
-                          temp=False, **kwa):
+                          temp=False, docketed=False, idle=False, **kwa):
         """
         Returns::
 
@@ -154,6 +349,10 @@ class Doist(tyming.Tymist):
                 The normal case is to initialize here or in .do().
             temp (bool): True means use temp resources such as file path, inject
                          into doers when True. Otherwise do not inject.
+            docketed (bool): True means schedule deeds with Docket min-heap
+                         keyed on retyme. False means use deque of deeds.
+            idle (bool): True means when real sleep until next due deed or
+                         registered fileobj is ready instead of each .tock
         """
         super(Doist, self).__init__(**kwa)
         self.name = name
@@ -161,9 +360,14 @@ class Doist(tyming.Tymist):
         self.limit = abs(float(limit)) if limit is not None else None
         self.done = None
         self.doers = list(doers) if doers is not None else []  # list of Doers
-        self.deeds = deque()  # deque of deeds
+        self.docketed = True if docketed else False
+        self.deeds = Docket() if self.docketed else deque()  # deeds scheduler
         self.timer = timing.MonoTimer(duration = self.tock)
         self.temp = True if temp else False
+        self.idle = True if idle else False
+        self.selector = None  # created on first .register
+        self._loop = None  # running event loop while in .arun
+        self._wake = None  # asyncio.Event set to wake .arun for next pass
 
 
     def __call__(self, *pa, **kwa):
@@ -217,7 +421,7 @@ class Doist(tyming.Tymist):
         self.done = False
         if doers is not None:
             self.doers = list(doers)
-            self.deeds = deque()
+            self.deeds = Docket() if self.docketed else deque()
 
         if limit is not None:  # time limt for running if any. useful in test
             self.limit = abs(float(limit))
@@ -236,9 +440,12 @@ class Doist(tyming.Tymist):
                     self.recur()  # increments .tyme runs recur context
 
                     if self.real:  # wait for real time to expire
-                        while not self.timer.expired:
-                            time.sleep(max(0.0, self.timer.remaining))
-                        self.timer.restart()  #  no time lost
+                        if self.idle:  # wait for next due deed or ready fileobj
+                            self.nap(tymer=tymer if self.limit else None)
+                        else:
+                            while not self.timer.expired:
+                                time.sleep(max(0.0, self.timer.remaining))
+                            self.timer.restart()  #  no time lost
 
                     if not self.deeds:  # no deeds
                         self.done = True
@@ -274,7 +481,7 @@ class Doist(tyming.Tymist):
         self.done = False
         if doers is not None:
             self.doers = list(doers)
-            self.deeds = deque()
+            self.deeds = Docket() if self.docketed else deque()
 
         if limit is not None:  # time limt for running if any. useful in test
             self.limit = abs(float(limit))
@@ -320,6 +527,103 @@ class Doist(tyming.Tymist):
             self.exit()  # force close remaining deeds throws GeneratorExit
 
 
+    async def arun(self, doers=None, limit=None, tyme=None, *, temp=None):
+        """Asyncio native coroutine function. Calling returns asyncio coroutine.
+        Unlike .ado which polls .recur every tock, each pass is scheduled with
+        loop.call_at at the real time of the earliest retyme of the deeds.
+        No pass runs while no deed is due so other asyncio tasks have the loop.
+        .tyme tracks loop time in seconds since start and a pass never runs
+        sooner than one .tock after the previous pass.
+
+        Fileobjs registered with .register are added to the loop via
+        add_reader or add_writer for the duration of the run. On readiness the
+        associated doer is hastened and a pass is scheduled so a doer that
+        yields a long tock wakes on socket readiness instead of polling.
+        Doers register their fileobjs with Doer.watch. A doer nested in a
+        DoDoer registers through the DoDoer which is hastened in turn.
+
+        See .do method for call signature
+        """
+        temp = temp or (self.temp if self.temp else temp)  # inject if temp or self.temp
+
+        self.done = False
+        if doers is not None:
+            self.doers = list(doers)
+            self.deeds = Docket() if self.docketed else deque()
+
+        if limit is not None:  # time limt for running if any. useful in test
+            self.limit = abs(float(limit))
+
+        if tyme is not None:  # re-initialize starting tyme
+            self.tyme = tyme
+
+        loop = asyncio.get_running_loop()
+        base = loop.time() - self.tyme  # loop time at tyme zero
+        stop = (self.tyme + self.limit) if self.limit else None  # limit tyme
+        self._loop = loop
+        self._wake = asyncio.Event()
+        if self.selector is not None:
+            for key in self.selector.get_map().values():
+                self._listen(key.fileobj, key.events, key.data)
+
+        try:  # always clean up resources upon exception
+            self.enter(temp=temp)  # runs enter context on each doer
+
+            while True:  # until doers complete or exception or keyboardInterrupt
+                self.tyme = max(self.tyme, loop.time() - base)
+                if stop is not None:
+                    self.tyme = min(self.tyme, stop)
+                self.recur()  # runs due deeds then increments .tyme by .tock
+
+                if not self.deeds:  # no deeds
+                    self.done = True
+                    break  # break out of forever loop
+
+                if stop is not None and self.tyme >= stop:  # reached limit
+                    break  # break out of forever loop
+
+                retyme = max(self.earliest(), self.tyme)  # at most once per tock
+                if stop is not None:
+                    retyme = min(retyme, stop)
+                self._wake.clear()
+                handle = loop.call_at(base + retyme, self._wake.set)
+                try:
+                    await self._wake.wait()  # timer or fileobj readiness
+                finally:
+                    handle.cancel()
+
+        finally: # finally clause always runs regardless of exception or not.
+            if self.selector is not None:
+                for key in self.selector.get_map().values():
+                    self._unlisten(key.fd, key.events)
+            self._loop = None
+            self._wake = None
+            self.exit()  # force close remaining deeds throws GeneratorExit
+
+
+    def _listen(self, fileobj, events, doer):
+        """Add fileobj to running loop of .arun so readiness calls ._awaken"""
+        if events & selectors.EVENT_READ:
+            self._loop.add_reader(fileobj, self._awaken, doer)
+        if events & selectors.EVENT_WRITE:
+            self._loop.add_writer(fileobj, self._awaken, doer)
+
+
+    def _unlisten(self, fileobj, events):
+        """Remove fileobj or its fd from running loop of .arun"""
+        if events & selectors.EVENT_READ:
+            self._loop.remove_reader(fileobj)
+        if events & selectors.EVENT_WRITE:
+            self._loop.remove_writer(fileobj)
+
+
+    def _awaken(self, doer):
+        """Loop reader or writer callback. Hasten doer if any and wake .arun"""
+        if doer is not None:
+            self.hasten(doer)
+        self._wake.set()
+
+
     def enter(self, doers=None, *, temp=None):
         """Enter context
 
@@ -373,6 +677,8 @@ class Doist(tyming.Tymist):
 
             temp = temp or (doer.temp if hasattr(doer, "temp") and doer.temp else None)
             opts = doer.opts if hasattr(doer, "opts") else {}
+            if isinstance(doer, Doer):  # so doer may watch its fileobjs
+                doer.registry = self
 
             dog = doer(tymth=self.tymen(), tock=doer.tock, temp=temp, **opts)  # calls doer.do
             try:
@@ -417,6 +723,28 @@ class Doist(tyming.Tymist):
         if deeds is None:
             deeds = self.deeds
 
+        if isinstance(deeds, Docket):  # only run due deeds
+            deeds.pull(self.tyme)
+            while deeds.pulls:
+                retyme, ordinal, dog, doer = deeds.pulls.popleft()
+                try:  # send tyme. yield tock, tock may change during sended run
+                    tock = dog.send(self.tyme)  # yielded tock == 0.0 means re-run asap
+                except StopIteration as ex:  # returned instead of yielded
+                    try:  # assign done state non forced return
+                        doer.done = ex.value if ex.value is not None else doer.done
+                    except AttributeError:  # bount method generator
+                        # write to doer.__func__.done read from doer.done
+                        doer.__func__.done = ex.value if ex.value is not None else doer.done
+                else:  # repush for later pass
+                    if not tock:  # tock is None or tock == 0.0 with empty yield tock == None
+                        retyme = self.tyme + self.tock  # rerun at next recur
+                    else:
+                        retyme += tock  # cumulative retyme of doer tock
+                    deeds.push(dog, retyme, doer, ordinal)
+
+            self.tick()  # advance .tyme by one doist .tock
+            return
+
         deeds.append((None, None, None))  # append run through once marker
         while deeds: # do while uses explicit break to exit while
             dog, retyme, doer = deeds.popleft()  # pop it off
@@ -473,6 +801,9 @@ class Doist(tyming.Tymist):
         if deeds is None:
             deeds = self.deeds
 
+        if isinstance(deeds, Docket):
+            deeds = deeds.drain()  # deque in ordinal order
+
         while(deeds):  # .close each remaining dog in deeds in reverse order
             dog, retime, doer = deeds.pop()  # pop it off in reverse (right side)
             if not dog:  # marker deed
@@ -518,14 +849,17 @@ class Doist(tyming.Tymist):
         rdoers = [doer for doer in doers if doer in self.doers] # ensure in .doers
         rdeeds = deque()  # fresh deque for deeds to remove
         deeds = self.deeds  # edit update self.deeds in place
-        for i in range(len(deeds)):  # iterate once over each deed
-            dog, retyme, doer = deeds.popleft()
-            if not dog:  # reappend the run through once marker deed
-                deeds.append((dog, retyme, doer))
-            elif doer in rdoers:  # found deed to remove and close
-                rdeeds.append((dog, retyme, doer))  # add to removal deque
-            else:  # keep deed do not remove and close
-                deeds.append((dog, retyme, doer))  # reappend
+        if isinstance(deeds, Docket):
+            rdeeds = deeds.discard(rdoers)
+        else:
+            for i in range(len(deeds)):  # iterate once over each deed
+                dog, retyme, doer = deeds.popleft()
+                if not dog:  # reappend the run through once marker deed
+                    deeds.append((dog, retyme, doer))
+                elif doer in rdoers:  # found deed to remove and close
+                    rdeeds.append((dog, retyme, doer))  # add to removal deque
+                else:  # keep deed do not remove and close
+                    deeds.append((dog, retyme, doer))  # reappend
 
         for doer in rdoers:  # update .doers to remove rdoers
             self.doers.remove(doer)
@@ -533,6 +867,126 @@ class Doist(tyming.Tymist):
         self.exit(deeds=rdeeds)
 
 
+    def register(self, fileobj, events=selectors.EVENT_READ, doer=None):
+        """
+        Register fileobj with .selector so that when idle its readiness ends
+        sleep early. When doer is provided its deed is hastened to run on
+        the next pass so a doer that otherwise sleeps with a long tock may
+        service its socket or fd on readiness. When running in .arun fileobj
+        is also added to the event loop as reader or writer.
+
+        Parameters::
+
+            fileobj (socket | int | IO): file object or file descriptor
+            events (int): selectors.EVENT_READ and/or selectors.EVENT_WRITE
+            doer (Doer | None): doer to hasten when fileobj is ready
+        """
+        if self.selector is None:
+            self.selector = selectors.DefaultSelector()
+        try:
+            self.selector.register(fileobj, events, data=doer)
+        except KeyError:  # fd of closed fileobj reused so replace stale
+            self.unregister(fileobj)
+            self.selector.register(fileobj, events, data=doer)
+        if self._loop is not None:  # running in .arun
+            self._listen(fileobj, events, doer)
+
+
+    def unregister(self, fileobj):
+        """
+        Unregister fileobj from .selector. Does nothing when not registered.
+
+        Parameters::
+
+            fileobj (socket | int | IO): file object or file descriptor
+        """
+        if self.selector is None:
+            return
+        try:
+            key = self.selector.unregister(fileobj)
+        except (KeyError, ValueError):  # not registered
+            return
+        if self._loop is not None:  # running in .arun
+            self._unlisten(key.fd, key.events)
+
+
+    def earliest(self, deeds=None):
+        """
+        Returns earliest retyme of deeds or None when no deeds.
+
+        Parameters::
+
+            deeds (deque | Docket): deeds. If not provided uses .deeds.
+        """
+        if deeds is None:
+            deeds = self.deeds
+
+        if isinstance(deeds, Docket):
+            return deeds.earliest()
+        retymes = [retyme for dog, retyme, doer in deeds if dog]
+        return min(retymes) if retymes else None
+
+
+    def hasten(self, doer, deeds=None):
+        """
+        Reschedule deed of doer to run at current .tyme when its retyme is
+        later.
+
+        Parameters::
+
+            doer (Doer): doer whose deed to hasten
+            deeds (deque | Docket): deeds. If not provided uses .deeds.
+        """
+        if deeds is None:
+            deeds = self.deeds
+
+        if isinstance(deeds, Docket):
+            deeds.hasten([doer], self.tyme)
+            return
+
+        for i in range(len(deeds)):  # iterate once over each deed in place
+            dog, retyme, dr = deeds.popleft()
+            if dr is doer and dog and retyme > self.tyme:
+                retyme = self.tyme
+            deeds.append((dog, retyme, dr))
+
+
+    def nap(self, tymer=None):
+        """
+        Idle sleep in real time until the earliest retyme of deeds, aligned
+        to whole tocks, instead of a single tock. Advances .tyme by one tock
+        for each tock of real time slept so .tyme stays synchronized to real
+        time. Ends early on the next tock after a fileobj registered with
+        .register becomes ready and hastens its associated doer if any.
+
+        Parameters::
+
+            tymer (Tymer | None): limit tymer. When provided do not sleep past
+                its expiration so limit is honored.
+        """
+        skip = 0  # whole tocks beyond current .tyme with no due deeds
+        retyme = self.earliest()
+        if retyme is not None and self.tock and retyme > self.tyme:
+            skip = math.ceil((retyme - self.tyme) / self.tock)
+            if tymer is not None:  # do not skip past limit
+                skip = min(skip, max(0, int(tymer.remaining / self.tock)))
+
+        timeout = max(0.0, self.timer.remaining + skip * self.tock)
+        if self.selector is not None and self.selector.get_map():
+            for key, mask in self.selector.select(timeout=timeout):
+                if key.data is not None:
+                    self.hasten(key.data)
+        else:
+            time.sleep(timeout)
+
+        while not self.timer.expired:  # arrive at current .tyme
+            time.sleep(max(0.0, self.timer.remaining))
+        self.timer.restart()  #  no time lost
+        while self.tock and self.timer.expired:  # catch up .tyme for tocks slept
+            self.timer.restart()
+            self.tick()
+
+
 def doify(f, *, name=None, tock=0.0, temp=None, **opts):
     """Returns Doist/DoDoer compatible copy, g, of converted generator
     function/method f.
@@ -625,6 +1079,9 @@ class Doer(tyming.Tymee):
             Otherwise incomplete. Incompletion maybe due to close or abort.
         opts (dict): injected options into its .do generator by scheduler
         temp (bool): True means use temporary file resources if any
+        registry (Doist | DoDoer | None): injected scheduler by its enter whose
+            .register makes readiness of a watched fileobj hasten this doer
+        watched (set): fileobjs registered with .registry by .watch
 
     Inherited Properties::
 
@@ -655,6 +1112,7 @@ class Doer(tyming.Tymee):
                 - exit: exit context method
                 - cease: cease context method
                 - abort: abort context method
+                - watch: register readiness of fileobjs with .registry
 
     Hidden::
 
@@ -686,6 +1144,8 @@ class Doer(tyming.Tymee):
         # used for injection of options into .do by scheduler
         self.opts = opts if opts is not None else {}  # empty dict if None
         self.temp = True if temp else False
+        self.registry = None  # injected by enter of Doist or DoDoer
+        self.watched = set()  # fileobjs registered with .registry
 
 
     def __call__(self, *pa, **kwa):
@@ -775,6 +1235,7 @@ class Doer(tyming.Tymee):
 
         finally:  # exit context, exit, unforced if normal exit of try, forced otherwise
             self.exit()
+            self.watch()  # unwatch all
 
         # return value of yield from or StopIteration.value indicates completion
         # python 3.13 gh-104770: If a generator returns a value upon being
@@ -782,6 +1243,37 @@ class Doer(tyming.Tymee):
         return self.done  # Only returns done state if normal return or close not abort raise
 
 
+    def watch(self, *fileobjs):
+        """Registers fileobjs with injected .registry so that when any is ready
+        to read this doer is hastened instead of waiting out its tock. Under
+        Doist.arun readiness is by loop reader and when idle by select.
+        Unregisters fileobjs watched before but not now such as closed sockets.
+        Call with no fileobjs to unwatch all. Without .registry only records.
+
+        Parameters::
+
+            fileobjs (socket | int | IO | None): file objects or descriptors
+                to watch. None or closed is ignored such as an unopened socket
+        """
+        opens = set()
+        for fileobj in fileobjs:
+            if fileobj is None:
+                continue
+            try:  # closed socket has fileno of -1 closed file raises
+                fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+            except (ValueError, OSError):
+                continue
+            if fd >= 0:
+                opens.add(fileobj)
+        fileobjs = opens
+        if self.registry is not None:
+            for fileobj in self.watched - fileobjs:
+                self.registry.unregister(fileobj)
+            for fileobj in fileobjs - self.watched:
+                self.registry.register(fileobj, doer=self)
+        self.watched = fileobjs
+
+
     def enter(self, *, temp=None):
         """Do 'enter' context actions. Override in subclass. Not a generator method.
         Set up resources. Comparable to context manager enter.
@@ -1033,6 +1525,10 @@ class DoDoer(Doer):
         always (bool): True means keep running even when all dogs in deeds
             are complete. Enables dynamically managing extending or removing
             doers and associated deeds while running.
+        docketed (bool): True means .deeds is Docket min-heap scheduler that
+            only runs due deeds. False means .deeds is deque.
+        selector (selectors.BaseSelector | None): selector of fileobjs
+            registered by its doers with .register. Created by .register
 
     Inherited Methods::
 
@@ -1054,6 +1550,12 @@ class DoDoer(Doer):
         - recur
         - exit
 
+    Methods::
+
+        - register: register fileobj whose readiness hastens its doer
+        - unregister: unregister fileobj
+        - hasten: make deeds of doer due now
+
     Hidden::
 
          - _tymth is injected function wrapper closure returned by .tymen() of
@@ -1065,7 +1567,7 @@ class DoDoer(Doer):
 
     """
 
-    def __init__(self, doers=None, always=False, **kwa):
+    def __init__(self, doers=None, always=False, docketed=False, **kwa):
         """
         Initialize instance.
 
@@ -1088,11 +1590,16 @@ class DoDoer(Doer):
                 are complete. Enables dynamically managing extending or removing
                 doers and associated deeds while running.
 
+            docketed is Boolean, True means schedule deeds with Docket min-heap
+                keyed on retyme. False means use deque of deeds.
+
         """
         super(DoDoer, self).__init__(**kwa)
         self.doers = list(doers) if doers is not None else []
-        self.deeds = deque()
+        self.docketed = True if docketed else False
+        self.deeds = Docket() if self.docketed else deque()
         self.always = always
+        self.selector = None  # created on first .register
 
 
     @property
@@ -1118,7 +1625,7 @@ class DoDoer(Doer):
     def deeds(self):
         """
         deeds property getter, get ._deeds
-        .deeds is deque of triples, each of form (dog, retyme, doer).
+        .deeds is deque or Docket of triples, each of form (dog, retyme, doer).
         """
         return self._deeds
 
@@ -1126,10 +1633,10 @@ class DoDoer(Doer):
     @deeds.setter
     def deeds(self, deeds):
         """
-        set ._deeds to deeds deque
+        set ._deeds to deeds deque or Docket
         """
-        if not isinstance(deeds, deque):
-            raise TypeError("Expected deque, got {}.".format(type(deeds)))
+        if not isinstance(deeds, (deque, Docket)):
+            raise TypeError("Expected deque or Docket, got {}.".format(type(deeds)))
         self._deeds = deeds
 
 
@@ -1181,7 +1688,7 @@ class DoDoer(Doer):
         always = always if always is not None else self.always
         if doers is not None:
             self.doers = list(doers)
-            self.deeds = deque()
+            self.deeds = Docket() if self.docketed else deque()
 
         try:
             # enter context
@@ -1263,6 +1770,8 @@ class DoDoer(Doer):
                 doer.__func__.done = False  # False at enter.  False signals incomplete
             temp = temp or (doer.temp if hasattr(doer, "temp") and doer.temp else None)
             opts = doer.opts if hasattr(doer, "opts") else {}
+            if isinstance(doer, Doer):  # so doer may watch its fileobjs
+                doer.registry = self
 
             dog = doer(tymth=self.tymth, tock=doer.tock, temp=temp, **opts)  # calls doer.do
             try:
@@ -1301,10 +1810,37 @@ class DoDoer(Doer):
         Cycle once through deeds deque and update in place
 
         Each cycle checks all generators dogs in deeds deque and runs if retyme past.
+        First hastens the doers of any of its registered fileobjs that are ready.
         """
         if deeds is None:
             deeds = self.deeds
 
+        if self.selector is not None and self.selector.get_map():
+            for key, mask in self.selector.select(timeout=0):  # poll only
+                if key.data is not None:
+                    self.hasten(key.data, deeds=deeds)
+
+        if isinstance(deeds, Docket):  # only run due deeds
+            deeds.pull(tyme)
+            while deeds.pulls:
+                retyme, ordinal, dog, doer = deeds.pulls.popleft()
+                try:  # send tyme. yield tock, tock may change during sended run
+                    tock = dog.send(tyme)  # yielded tock == 0.0 means re-run asap
+                except StopIteration as ex:  # returned instead of yielded
+                    try:  # assign done state non forced return
+                        doer.done = ex.value if ex.value is not None else doer.done
+                    except AttributeError:  # bount method generator
+                        # write to doer.__func__.done read from doer.done
+                        doer.__func__.done = ex.value if ex.value is not None else doer.done
+                else:  # repush for later pass
+                    if not tock:  # tock is None or tock == 0.0 with empty yield tock == None
+                        retyme = tyme + self.tock  # rerun at next recur
+                    else:
+                        retyme += tock  # cumulative retyme of doer tock
+                    deeds.push(dog, retyme, doer, ordinal)
+
+            return (not deeds)  # True if docket is empty
+
         deeds.append((None, None, None))  # append run through once marker
         while deeds:  # do while uses explicit break to exit while
             dog, retyme, doer = deeds.popleft()  # pop it off
@@ -1348,6 +1884,9 @@ class DoDoer(Doer):
         if deeds is None:
             deeds = self.deeds
 
+        if isinstance(deeds, Docket):
+            deeds = deeds.drain()  # deque in ordinal order
+
         while(deeds):  # .close each remaining dog in deeds in reverse order
             dog, retime, doer = deeds.pop()  # pop it off in reverse (right side)
             if not dog:  # marker deed
@@ -1393,14 +1932,17 @@ class DoDoer(Doer):
         rdoers = [doer for doer in doers if doer in self.doers] # ensure in .doers
         rdeeds = deque()  # fresh deque for deeds to remove
         deeds = self.deeds  # edit update self.deeds in place
-        for i in range(len(deeds)):  # iterate once over each deed
-            dog, retyme, doer = deeds.popleft()
-            if not dog:  # reappend the run through once marker deed
-                deeds.append((dog, retyme, doer))
-            elif doer in rdoers:  # found deed to remove and close
-                rdeeds.append((dog, retyme, doer))  # add to removal deque
-            else:  # keep deed do not remove and close
-                deeds.append((dog, retyme, doer))  # reappend
+        if isinstance(deeds, Docket):
+            rdeeds = deeds.discard(rdoers)
+        else:
+            for i in range(len(deeds)):  # iterate once over each deed
+                dog, retyme, doer = deeds.popleft()
+                if not dog:  # reappend the run through once marker deed
+                    deeds.append((dog, retyme, doer))
+                elif doer in rdoers:  # found deed to remove and close
+                    rdeeds.append((dog, retyme, doer))  # add to removal deque
+                else:  # keep deed do not remove and close
+                    deeds.append((dog, retyme, doer))  # reappend
 
         for doer in rdoers:  # update .doers to remove rdoers
             self.doers.remove(doer)
@@ -1408,6 +1950,73 @@ class DoDoer(Doer):
         self.exit(deeds=rdeeds)
 
 
+    def register(self, fileobj, events=selectors.EVENT_READ, doer=None):
+        """
+        Register fileobj with .selector so that when ready the deed of doer
+        is hastened on the next .recur. Also registers fileobj with own
+        .registry if any so its readiness hastens this DoDoer in turn.
+        Equivalent of Doist.register
+
+        Parameters::
+
+            fileobj (socket | int | IO): file object or file descriptor
+            events (int): selectors.EVENT_READ and/or selectors.EVENT_WRITE
+            doer (Doer | None): doer to hasten when fileobj is ready
+        """
+        if self.selector is None:
+            self.selector = selectors.DefaultSelector()
+        try:
+            self.selector.register(fileobj, events, data=doer)
+        except KeyError:  # fd of closed fileobj reused so replace stale
+            self.unregister(fileobj)
+            self.selector.register(fileobj, events, data=doer)
+        if self.registry is not None:
+            self.registry.register(fileobj, events, doer=self)
+
+
+    def unregister(self, fileobj):
+        """
+        Unregister fileobj from .selector and own .registry if any.
+        Does nothing when not registered.
+
+        Parameters::
+
+            fileobj (socket | int | IO): file object or file descriptor
+        """
+        if self.selector is None:
+            return
+        try:
+            self.selector.unregister(fileobj)
+        except (KeyError, ValueError):  # not registered
+            return
+        if self.registry is not None:
+            self.registry.unregister(fileobj)
+
+
+    def hasten(self, doer, deeds=None):
+        """
+        Reschedule deed of doer to run at current .tyme when its retyme is
+        later. Equivalent of Doist.hasten
+
+        Parameters::
+
+            doer (Doer): doer whose deed to hasten
+            deeds (deque | Docket): deeds. If not provided uses .deeds.
+        """
+        if deeds is None:
+            deeds = self.deeds
+
+        if isinstance(deeds, Docket):
+            deeds.hasten([doer], self.tyme)
+            return
+
+        for i in range(len(deeds)):  # iterate once over each deed in place
+            dog, retyme, dr = deeds.popleft()
+            if dr is doer and dog and retyme > self.tyme:
+                retyme = self.tyme
+            deeds.append((dog, retyme, dr))
+
+
 def bareDo(tymth=None, tock=0.0, *, temp=None, **opts):
     """
     Bare bones generator function template as example of generator function
@@ -12,6 +12,7 @@ import stat
 import tempfile
 from contextlib import contextmanager
 
+import blake3
 import lmdb
 from ordered_set import OrderedSet as oset
 
@@ -60,6 +61,10 @@ class Duror(Filer):
     Attributes:
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
+        txn (lmdb.Transaction | None): shared write transaction of open .batch
+            context. None means each method uses its own transaction
+        hooks (list): duples (commit, abort) of callables or None registered
+            by .defer to be called once outermost open .batch commits or aborts
 
     Properties: version.
 
@@ -138,6 +143,8 @@ class Duror(Filer):
         self.env = None
         self._version = None
         self.readonly = True if readonly else False
+        self.txn = None  # shared write transaction of open .batch if any
+        self.hooks = []  # (commit, abort) callables of open .batch if any
         super(Duror, self).__init__(**kwa)
 
 
@@ -225,10 +232,92 @@ class Duror(Filer):
                 pass
 
         self.env = None
+        self.txn = None
 
         return super(Duror, self).close(clear=clear)
 
 
+    @contextmanager
+    def batch(self):
+        """Context manager for a write batch. All reads and writes by methods
+        of this Duror and so of its Subers inside the with block share one
+        write transaction that is committed once, with one fsync, on normal
+        exit of the outermost block or aborted on exception so none of its
+        writes are made. Nested batch blocks join the outermost batch so
+        their writes are not committed until the outermost block exits.
+        Hooks registered by .defer are called after the outermost commit
+        or abort.
+
+        Usage::
+
+            with duror.batch():
+                suber.put(keys="a", val="x")
+                suber.pin(keys="b", val="y")
+
+        Yields:
+            txn (lmdb.Transaction): shared write transaction
+        """
+        if self.txn is not None:  # nested so join outer batch
+            yield self.txn
+            return
+
+        self.txn = self.env.begin(write=True, buffers=True)
+        try:
+            yield self.txn
+        except BaseException:
+            self.txn.abort()
+            self.txn = None
+            hooks, self.hooks = self.hooks, []
+            for commit, abort in hooks:
+                if abort is not None:
+                    abort()
+            raise
+        else:
+            self.txn.commit()
+            self.txn = None
+            hooks, self.hooks = self.hooks, []
+            for commit, abort in hooks:
+                if commit is not None:
+                    commit()
+        finally:
+            self.txn = None
+            self.hooks = []
+
+
+    def defer(self, commit=None, abort=None):
+        """Registers callables to be called once the outermost open .batch
+        commits or aborts so in memory state that depends on whether its
+        writes are durable is only updated once that is known.
+        When no .batch is open calls commit now.
+
+        Parameters:
+            commit (Callable|None): with no arguments called after commit
+            abort (Callable|None): with no arguments called after abort
+        """
+        if self.txn is None:
+            if commit is not None:
+                commit()
+            return
+        self.hooks.append((commit, abort))
+
+
+    @contextmanager
+    def _begin(self, sdb, *, write=False):
+        """Context manager that yields shared transaction of open .batch if
+        any. Otherwise yields own transaction on sdb that is committed on exit.
+        Transaction operations must provide db=sdb so they work on either.
+
+        Parameters:
+            sdb (lmdb._Database): opened named subdb
+            write (bool): True means write transaction. False means read only
+        """
+        if self.txn is not None:
+            yield self.txn
+        else:
+            with self.env.begin(db=sdb, write=write, buffers=True) as txn:
+                yield txn
+
+
     def getVer(self):
         """Returns the value of the the semver formatted version in the
         __version__ key in this database
@@ -270,9 +359,9 @@ class Duror(Filer):
             key (bytes): within subdb's keyspace
             val (bytes):  to be written at key
         """
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+        with self._begin(sdb, write=True) as txn:
             try:
-                return (txn.put(key, val, overwrite=False))
+                return (txn.put(key, val, overwrite=False, db=sdb))
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size.") from ex
@@ -289,9 +378,9 @@ class Duror(Filer):
             key (bytes): within subdb's keyspace
             val (bytes):  to be written at key
         """
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+        with self._begin(sdb, write=True) as txn:
             try:
-                return (txn.put(key, val))
+                return (txn.put(key, val, db=sdb))
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size.") from ex
@@ -308,9 +397,9 @@ class Duror(Filer):
             key (bytes): within subdb's keyspace
 
         """
-        with self.env.begin(db=sdb, write=False, buffers=True) as txn:
+        with self._begin(sdb) as txn:
             try:
-                val = txn.get(key)
+                val = txn.get(key, db=sdb)
                 return (bytes(val) if val is not None else None)
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
@@ -328,9 +417,9 @@ class Duror(Filer):
             db (lmdb._Database): opened named subdb with dupsort=False
             key (bytes): within subdb's keyspace
         """
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+        with self._begin(sdb, write=True) as txn:
             try:
-                return (txn.delete(key))
+                return (txn.delete(key, db=sdb))
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size.") from ex
@@ -345,8 +434,8 @@ class Duror(Filer):
         Parameters:
             db (lmdb._Database): opened named subdb with dupsort=False
         """
-        with self.env.begin(db=sdb, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(sdb) as txn:
+            cursor = txn.cursor(db=sdb)
             count = 0
             for _, _ in cursor:
                 count += 1
@@ -371,8 +460,8 @@ class Duror(Filer):
                         In Python str.startswith('') always returns True so if branch
                         key is empty string it matches all keys in db with startswith.
         """
-        with self.env.begin(db=sdb, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._begin(sdb) as txn:
+            cursor = txn.cursor(db=sdb)
             if cursor.set_range(top):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
                     ckey = bytes(ckey)
@@ -400,9 +489,9 @@ class Duror(Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+        with self._begin(sdb, write=True) as txn:
             result = False
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=sdb)
             if cursor.set_range(top):  # move to val at key >= key if any
                 ckey, cval = cursor.item()
                 while ckey:  # end of database key == b''
@@ -454,6 +543,40 @@ class Duror(Filer):
         ion = int(ion, 16)
         return (key, ion)
 
+    def _lastIon(self, cursor, key, *, sep=b'.'):
+        """Returns ordinal ion of last (max ion) entry at apparent effective key
+        or None when no entries at key. Leaves cursor at last entry when found.
+
+        Seeks directly to max suffix iokey at key and steps back so constant
+        time regardless of number of entries at key. Steps back further only
+        over entries of other keys that begin with key plus sep such as
+        b'key.other' whose iokeys sort between those of key and its max.
+
+        Parameters:
+            cursor (lmdb.Cursor): cursor on subdb with dupsort==False
+            key (bytes): Apparent effective key
+            sep (bytes): separator character(s) of suffix
+        """
+        maxkey = self.suffix(key, ion=self.MaxSuffix, sep=sep)
+        prefix = maxkey[:-self.SuffixSize]  # key plus sep
+        if cursor.set_range(maxkey):  # cursor at key >= maxkey
+            if cursor.key() == maxkey:  # already at max
+                return self.MaxSuffix
+            if not cursor.prev():  # no entry before
+                return None
+        elif not cursor.last():  # maxkey past end and empty db
+            return None
+
+        while True:  # cursor at entry just before maxkey
+            ckey = cursor.key()
+            if ckey[:len(prefix)] != prefix:  # no entries at key
+                return None
+            if len(ckey) == len(maxkey):  # suffixed entry at key
+                return int(bytes(ckey[len(prefix):]), 16)
+            if not cursor.prev():  # other key that begins with prefix
+                return None
+
+
     #Io and IoSet get methods work the same since IoSet operations do not dedup
     # on get, cnt, or del all only on add, put, set or del given val.
     # So common get, cnt, del all operations here and the add, put, set, del one
@@ -471,9 +594,9 @@ class Duror(Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=sdb, write=False, buffers=True) as txn:
+        with self._begin(sdb) as txn:
             iokey = self.suffix(key, ion, sep=sep)  # start ion_th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=sdb)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 iokey, cval = cursor.item()  # get iokey, cval at cursor
                 ckey, cion = self.unsuffix(iokey, sep=sep)
@@ -493,42 +616,11 @@ class Duror(Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             key (bytes): Apparent effective key
         """
-        val = None
-        ion = None  # no last value
-        iokey = self.suffix(key, ion=self.MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=sdb, write=False, buffers=True) as txn:
-            cursor = txn.cursor()  # create cursor to walk back
-            if not cursor.set_range(iokey):  # max is past end of database
-                # Three possibilities for max past end of database
-                # 1. last entry in db is for same key
-                # 2. last entry in db is for other key before key
-                # 3. database is empty
-                if cursor.last():  # not 3. empty db, so either 1. or 2.
-                    ckey, cion = self.unsuffix(cursor.key(), sep=sep)
-                    if ckey == key:  # 1. last is last entry for same key
-                        ion = cion  # so set ion to cion
-            else:  # max is not past end of database
-                # Two possibilities for max not past end of databseso
-                # 1. cursor at max entry at key
-                # 2. other key after key with entry in database
-                ckey, cion = self.unsuffix(cursor.key(), sep=sep)
-                if ckey == key:  # 1. last entry for key is already at max
-                    ion = cion
-                else:  # 2. other key after key so backup one entry
-                    # Two possibilities: 1. no prior entry 2. prior entry
-                    if cursor.prev():  # prev entry, maybe same or earlier pre
-                        # 2. prior entry with two possiblities:
-                        # 1. same key
-                        # 2. other key before key
-                        ckey, cion = self.unsuffix(cursor.key(), sep=sep)
-                        if ckey == key:  # prior (last) entry at key
-                            ion = cion  # so set ion to the cion
-
-            if ion is not None:
-                iokey = self.suffix(key, ion=ion, sep=sep)
-                val = bytes(cursor.get(iokey))
-
-            return val
+        with self._begin(sdb) as txn:
+            cursor = txn.cursor(db=sdb)
+            if self._lastIon(cursor, key, sep=sep) is None:
+                return None
+            return bytes(cursor.value())
 
 
     def getIoVals(self, sdb, key, *, ion=0, sep=b'.'):
@@ -544,10 +636,10 @@ class Duror(Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=sdb, write=False, buffers=True) as txn:
+        with self._begin(sdb) as txn:
             vals = []
             iokey = self.suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=sdb)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = self.unsuffix(iokey, sep=sep)
@@ -573,9 +665,9 @@ class Duror(Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=sdb, write=False, buffers=True) as txn:
+        with self._begin(sdb) as txn:
             iokey = self.suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=sdb)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get key, val at cursor
                     ckey, cion = self.unsuffix(iokey, sep=sep)
@@ -585,7 +677,7 @@ class Duror(Filer):
             return  # done raises StopIteration
 
 
-    def popIoVal(self, sdb, key, *, ion=0, sep=b'.'):
+    def popIoVal(self, sdb, key, *, ion=0, sep=b'.', isdb=None):
         """Pops first of the insertion ordered set of values at key.
         None if no entry. Pop deletes the returned entry.
 
@@ -600,22 +692,25 @@ class Duror(Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
+            isdb (lmdb._Database | None): IoSet value index sub db of sdb if any
 
         """
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+        with self._begin(sdb, write=True) as txn:
             iokey = self.suffix(key, ion, sep=sep)  # start ion_th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=sdb)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 iokey, cval = cursor.item()  # get iokey, cval at cursor
                 ckey, cion = self.unsuffix(iokey, sep=sep)
                 if ckey == key:  # first entry for key >= iokey at ion
                     val = bytes(cval) # make copy so not deleted
                     cursor.delete()
+                    if isdb is not None:  # remove from IoSet index
+                        txn.delete(self.ixkey(key, val, sep=sep), db=isdb)
                     return val
             return None  # no item at key
 
 
-    def remIoVals(self, sdb, key, *, sep=b'.'):
+    def remIoVals(self, sdb, key, *, sep=b'.', isdb=None):
         """Deletes all values at apparent effective key.
         Uses hidden ordinal key suffix for insertion ordering.
         The suffix is appended and stripped transparently.
@@ -627,17 +722,20 @@ class Duror(Filer):
         Parameters:
             db (lmdb._Database): instance of named sub db with dupsort==False
             key (bytes): Apparent effective key
+            isdb (lmdb._Database | None): IoSet value index sub db of sdb if any
         """
         result = False
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+        with self._begin(sdb, write=True) as txn:
             iokey = self.suffix(key, 0, sep=sep)  # start at zeroth value for key
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=sdb)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 iokey = cursor.key()
                 while iokey:  # end of database iokey == b'' cant internext.
                     ckey, cion = self.unsuffix(iokey, sep=sep)
                     if ckey != key:  # past key
                         break
+                    if isdb is not None:  # remove from IoSet index
+                        txn.delete(self.ixkey(key, cursor.value(), sep=sep), db=isdb)
                     result = cursor.delete() or result  # delete moves cursor to next item
                     iokey = cursor.key()  # cursor now at next item after deleted
             return result
@@ -658,6 +756,31 @@ class Duror(Filer):
         return len(self.getIoVals(sdb=sdb, key=key, sep=sep))
 
 
+    def getIoIonSpan(self, sdb, key, *, sep=b'.'):
+        """Gets ordinals of first and last values at apparent effective key.
+        When values at key are only popped from the front and added to the back,
+        as with a queue, the ordinals are contiguous so the count of values is
+        last - first + 1 without scanning them.
+
+        Returns:
+            span (tuple[int, int]|None): (first, last) ordinals at key.
+                None if no values at key
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db with dupsort==False
+            key (bytes): Apparent effective key
+        """
+        with self._begin(sdb) as txn:
+            cursor = txn.cursor(db=sdb)
+            if (last := self._lastIon(cursor, key, sep=sep)) is None:
+                return None
+            if cursor.set_range(self.suffix(key, 0, sep=sep)):
+                ckey, cion = self.unsuffix(cursor.key(), sep=sep)
+                if ckey == key:  # first entry for key
+                    return (cion, last)
+            return (last, last)
+
+
     def getTopIoItemIter(self, sdb, top=b'', *, sep=b'.'):
         """Gets Iterator of all values in branch rooted at top key
         The suffix is appended and stripped transparently.
@@ -699,18 +822,10 @@ class Duror(Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
-            ion = 0
-            iokey = self.suffix(key, ion, sep=sep)  # start zeroth entry if any
-            cursor = txn.cursor()
-            if cursor.set_range(iokey):  # move to val at key >= iokey if any
-                for iokey in cursor.iternext(values=False):  # get iokey at cursor
-                    ckey, cion = self.unsuffix(iokey, sep=sep)
-                    if ckey == key:  # found one
-                        ion = cion + 1  # next ion is increment of found cion
-                    else:  # prev entry if any was the last entry for key
-                        break  # done
-
+        with self._begin(sdb, write=True) as txn:
+            cursor = txn.cursor(db=sdb)
+            last = self._lastIon(cursor, key, sep=sep)
+            ion = last + 1 if last is not None else 0
             iokey = self.suffix(key, ion, sep=sep)  # ion is 1 after last
             return cursor.put(iokey, val, dupdata=False, overwrite=True)
 
@@ -732,18 +847,10 @@ class Duror(Filer):
 
         """
         result = False
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
-            ion = 0  # start at zeroth one
-            iokey = self.suffix(key, ion, sep=sep)  # start zeroth entry if any
-            cursor = txn.cursor()
-            if cursor.set_range(iokey):  # move to val at key >= iokey if any
-                for iokey in cursor.iternext(values=False):  # get iokey at cursor
-                    ckey, cion = self.unsuffix(iokey, sep=sep)
-                    if ckey == key:  # found one
-                        ion = cion + 1  # next ion is increment of found cion
-                    else:
-                        break  # prev entry if any was the last entry for key
-
+        with self._begin(sdb, write=True) as txn:
+            cursor = txn.cursor(db=sdb)
+            last = self._lastIon(cursor, key, sep=sep)
+            ion = last + 1 if last is not None else 0
 
             for i, val in enumerate(vals):  # i is zero based
                 iokey = self.suffix(key, ion+i, sep=sep)  # ion is 1 after last
@@ -770,18 +877,41 @@ class Duror(Filer):
         """
         self.remIoVals(sdb=sdb, key=key, sep=sep)
         result = False
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+        with self._begin(sdb, write=True) as txn:
             for i, val in enumerate(vals):  # starts at zero
                 iokey = self.suffix(key, i, sep=sep)  # ion is at add on amount
-                result = txn.put(iokey, val, dupdata=False, overwrite=True)
+                result = txn.put(iokey, val, dupdata=False, overwrite=True, db=sdb)
             return result
 
 
     # IoSet insertion ordered set with FIFO access queue. Set dedups entries
-    def addIoSetVal(self, sdb, key, val, *, sep=b'.'):
+    # Optional value index sub db isdb maps ixkey of (key, val) to ion of val so
+    # set membership, add and remove are single lookups instead of scans.
+    @staticmethod
+    def ixkey(key: bytes|str|memoryview, val: bytes|memoryview, *,
+              sep: bytes|str=b'.'):
+        """
+        Return IoSet index key made by concatenating the blake3 digest of `val`
+        to `key` using `sep`. Fixed digest size so index entries of key sort
+        together like the suffixed iokeys of key.
+
+        Parameters:
+            key (bytes|str|memoryview): apparent effective database key (unsuffixed)
+            val (bytes|memoryview): serialized value
+            sep (bytes): separator character(s) for concatenating digest
+        """
+        if isinstance(key, memoryview):
+            key = bytes(key)
+        elif hasattr(key, "encode"):
+            key = key.encode()  # encode str to bytes
+        if hasattr(sep, "encode"):
+            sep = sep.encode()
+        return sep.join((key, blake3.blake3(val).digest()))
+
+
+    def addIoSetVal(self, sdb, key, val, *, sep=b'.', isdb=None):
         """Add val idempotently to insertion ordered set of values all with the
         same apparent effective key if val not already in set of vals at key.
-        Dedups the added val.
         Uses hidden ordinal key suffix for insertion ordering.
         The suffix is appended and stripped transparently.
 
@@ -792,13 +922,18 @@ class Duror(Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             key (bytes): Apparent effective key
             val (bytes): serialized value to add
+            isdb (lmdb._Database | None): IoSet value index sub db of sdb.
+                None means no index so scan vals at key for membership
 
         """
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+        if isdb is not None:
+            return self.putIoSetVals(sdb, key, (val, ), sep=sep, isdb=isdb)
+
+        with self._begin(sdb, write=True) as txn:
             vals = oset()
             ion = 0
             iokey = self.suffix(key, ion, sep=sep)  # start zeroth entry if any
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=sdb)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = self.unsuffix(iokey, sep=sep)
@@ -815,7 +950,7 @@ class Duror(Filer):
             return cursor.put(iokey, val, dupdata=False, overwrite=False)
 
 
-    def putIoSetVals(self, sdb, key, vals, *, sep=b'.'):
+    def putIoSetVals(self, sdb, key, vals, *, sep=b'.', isdb=None):
         """Adds idempotently each val in vals to insertion ordered set of values
         all with the same apparent effective key for each val that is not already
         in set of vals at key. Dedups the put vals.
@@ -829,14 +964,30 @@ class Duror(Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             key (bytes): Apparent effective key
             vals (Iterable): serialized values to add to set of vals at key
+            isdb (lmdb._Database | None): IoSet value index sub db of sdb.
+                None means no index so scan vals at key for membership
 
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+        with self._begin(sdb, write=True) as txn:
+            if isdb is not None:  # index lookup each val
+                cursor = txn.cursor(db=sdb)
+                last = self._lastIon(cursor, key, sep=sep)
+                ion = last + 1 if last is not None else 0
+                for val in vals:
+                    ixkey = self.ixkey(key, val, sep=sep)
+                    if txn.get(ixkey, db=isdb) is not None:  # already in set
+                        continue
+                    iokey = self.suffix(key, ion, sep=sep)
+                    txn.put(ixkey, iokey[-self.SuffixSize:], db=isdb)
+                    result = txn.put(iokey, val, overwrite=False, db=sdb) or result
+                    ion += 1
+                return result
+
             ion = 0
             iokey = self.suffix(key, ion, sep=sep)  # start zeroth entry if any
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=sdb)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 pvals = oset()  # pre-existing vals at key
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
@@ -857,7 +1008,7 @@ class Duror(Filer):
             return result
 
 
-    def pinIoSetVals(self, sdb, key, vals, *, sep=b'.'):
+    def pinIoSetVals(self, sdb, key, vals, *, sep=b'.', isdb=None):
         """Erase all vals at key and then add unique vals as insertion ordered set of
         values all with the same apparent effective key. Dedups the set vals.
         Uses hidden ordinal key suffix for insertion ordering.
@@ -870,24 +1021,29 @@ class Duror(Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             key (bytes): Apparent effective key
             vals (abc.Iterable): serialized values to add to set of vals at key
+            isdb (lmdb._Database | None): IoSet value index sub db of sdb if any
         """
-        self.remIoVals(sdb=sdb, key=key, sep=sep)
+        self.remIoVals(sdb=sdb, key=key, sep=sep, isdb=isdb)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+        with self._begin(sdb, write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = self.suffix(key, i, sep=sep)  # ion is at add on amount
-                result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
+                if isdb is not None:
+                    txn.put(self.ixkey(key, val, sep=sep), iokey[-self.SuffixSize:],
+                            db=isdb)
+                result = txn.put(iokey, val, dupdata=False, overwrite=True, db=sdb) or result
             return result
 
 
-    def remIoSetVal(self, sdb, key, val, *, sep=b'.'):
+    def remIoSetVal(self, sdb, key, val, *, sep=b'.', isdb=None):
         """Removes (delete) matching val at apparent effective key if exists.
         Uses hidden ordinal key suffix for insertion ordering.
         The suffix is appended and stripped transparently.
 
-        Because the insertion order of val is not provided must perform a linear
-        search over set of values.
+        Without index because the insertion order of val is not provided must
+        perform a linear search over set of values. With index isdb the
+        insertion order of val is looked up.
 
         Another problem is that vals may get added and deleted in any order so
         the max suffix ion may creep up over time. The suffix ordinal max > 2**16
@@ -908,10 +1064,20 @@ class Duror(Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             key (bytes): Apparent effective key
             val (bytes): value to delete
-        """
-        with self.env.begin(db=sdb, write=True, buffers=True) as txn:
+            isdb (lmdb._Database | None): IoSet value index sub db of sdb.
+                None means no index so scan vals at key for val
+        """
+        with self._begin(sdb, write=True) as txn:
+            if isdb is not None:
+                ixkey = self.ixkey(key, val, sep=sep)
+                if (ion := txn.get(ixkey, db=isdb)) is None:  # not in set
+                    return False
+                iokey = self.suffix(key, int(bytes(ion), 16), sep=sep)
+                txn.delete(ixkey, db=isdb)
+                return txn.delete(iokey, db=sdb)
+
             iokey = self.suffix(key, 0, sep=sep)  # start zeroth value for key
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=sdb)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = self.unsuffix(iokey, sep=sep)
@@ -922,6 +1088,31 @@ class Duror(Filer):
             return False
 
 
+    def reindexIoSet(self, sdb, isdb, *, sep=b'.'):
+        """Rebuilds IoSet value index sub db isdb from all entries of sdb.
+        Use to migrate an existing IoSet sub db written without an index or to
+        repair its index.
+
+        Returns:
+            count (int): number of entries indexed
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db with dupsort==False
+            isdb (lmdb._Database): IoSet value index sub db of sdb
+            sep (bytes): separator character(s) of suffix
+        """
+        count = 0
+        with self._begin(sdb, write=True) as txn:
+            txn.drop(isdb, delete=False)  # empty index
+            cursor = txn.cursor(db=sdb)
+            for iokey, val in cursor.iternext():
+                key, ion = self.unsuffix(iokey, sep=sep)
+                txn.put(self.ixkey(key, val, sep=sep), bytes(iokey[-self.SuffixSize:]),
+                        db=isdb)
+                count += 1
+        return count
+
+
 @contextmanager
 def openDuror(*, cls=None, name="test", temp=True, **kwa):
     """Context manager wrapper for Duror instances.
@@ -1430,13 +1621,14 @@ class IoSuber(SuberBase):
                                              sep=self.ionsep)])
 
 
-    def getIter(self, keys: str | bytes | memoryview | Iterable):
+    def getIter(self, keys: str | bytes | memoryview | Iterable, *, ion=0):
         """Gets vals iterator at effecive key made from keys and hidden ordinal suffix.
         All vals in set of vals that share same effecive key are retrieved in
         insertion order.
 
         Parameters:
             keys (Iterable): of key strs to be combined in order to form key
+            ion (int): starting ordinal value, default 0
 
         Returns:
             vals (Iterator):  str values. Raises StopIteration when done
@@ -1444,10 +1636,26 @@ class IoSuber(SuberBase):
         """
         for val in self.db.getIoValsIter(sdb=self.sdb,
                                             key=self._tokey(keys),
+                                            ion=ion,
                                             sep=self.ionsep):
             yield self._des(val)
 
 
+    def getSpan(self, keys: str | bytes | memoryview | Iterable):
+        """Gets ordinals of first and last vals at effective key made from keys.
+        When only popped and added, as by a Durq, count is last - first + 1.
+
+        Parameters:
+            keys (Iterable): of key strs to be combined in order to form key
+
+        Returns:
+            span (tuple[int, int]|None): (first, last) ordinals. None if no
+                entry at keys
+        """
+        return self.db.getIoIonSpan(sdb=self.sdb, key=self._tokey(keys),
+                                    sep=self.ionsep)
+
+
     def pop(self, keys: str | bytes | memoryview | Iterable):
         """Pops first val if any inserted at effecive key made from keys and
         hidden ordinal suffix. Pop returns and deletes value if any.
@@ -1605,13 +1813,22 @@ class IoSetSuber(SuberBase):
     """Insertion-ordered Suber that supports a set of distinct values per key.
 
     Uses a hidden ordinal suffix to preserve insertion order.
+    When indexed uses companion value index sub db so that set membership, add,
+    and remove are single lookups instead of scans over all vals at key.
+
+    Attributes:
+        ionsep (str): separator to suffix insertion order ordinal number
+        isdb (lmdb._Database|None): instance of lmdb named value index sub db
+            for this Suber. None when not indexed.
     """
     IonSep = '.'  # separator for suffixing insertion order ordinal number
+    IxSubkey = 'ix.'  # appended to subkey for value index sub db
 
     def __init__(self, db: dbing.LMDBer, *,
                        subkey: str='docs.',
                        dupsort: bool=False,
-                       ionsep: str=None, **kwa):
+                       ionsep: str=None,
+                       indexed: bool=False, **kwa):
         """Initialize instance
 
         Inherited Parameters:
@@ -1628,9 +1845,56 @@ class IoSetSuber(SuberBase):
         Parameters:
             ionsep (str|None): separator to suffix insertion order ordinal number
                        default is self.IonSep == '.'
+            indexed (bool): True means maintain value index sub db.
+                       Migrates pre-existing unindexed entries on first open
+                       unless db is readonly in which case uses index only
+                       when it already exists.
+                       False (default) means no index so scan vals at key
+                       for membership.
         """
         super(IoSetSuber, self).__init__(db=db, subkey=subkey, dupsort=False, **kwa)
         self.ionsep = ionsep if ionsep is not None else self.IonSep
+        self.isdb = None
+        if indexed:
+            ixkey = f"{subkey}{self.IxSubkey}".encode("utf-8")
+            if self.db.readonly:  # can neither create nor migrate index
+                try:
+                    self.isdb = self.db.env.open_db(key=ixkey, dupsort=False,
+                                                    create=False)
+                except lmdb.NotFoundError:
+                    pass  # unindexed so scan
+                return
+            self.isdb = self.db.env.open_db(key=ixkey, dupsort=False)
+            with self.db.env.begin() as txn:
+                migrate = (txn.stat(self.sdb)['entries'] and
+                           not txn.stat(self.isdb)['entries'])
+            if migrate:  # existing unindexed entries
+                self.reindex()
+
+
+    def reindex(self):
+        """Rebuilds value index sub db from all entries. Migration helper for
+        databases written before indexing or to repair index.
+
+        Returns:
+            count (int): number of entries indexed. Zero when not indexed.
+        """
+        if self.isdb is None:
+            return 0
+        return self.db.reindexIoSet(sdb=self.sdb, isdb=self.isdb, sep=self.ionsep)
+
+
+    def trim(self, keys: str|bytes|memoryview|Iterable=b"", *, topive=False):
+        """Removes all entries whose keys startswith keys along with their value
+        index entries. See SuberBase.trim
+
+        Returns:
+           result (bool): True if val at key exists so delete successful. False otherwise
+        """
+        top = self._tokey(keys, topive=topive)
+        if self.isdb is not None:
+            self.db.remTopVals(sdb=self.isdb, top=top)
+        return(self.db.remTopVals(sdb=self.sdb, top=top))
 
 
     def getFirst(self, keys: str | bytes | memoryview | Iterable):
@@ -1709,7 +1973,8 @@ class IoSetSuber(SuberBase):
             val (str|None):  value str, None if no entry at keys
 
         """
-        val = self.db.popIoVal(sdb=self.sdb, key=self._tokey(keys))
+        val = self.db.popIoVal(sdb=self.sdb, key=self._tokey(keys),
+                                  sep=self.ionsep, isdb=self.isdb)
         return (self._des(val) if val is not None else val)
 
 
@@ -1733,7 +1998,8 @@ class IoSetSuber(SuberBase):
         return (self.db.addIoSetVal(sdb=self.sdb,
                                     key=self._tokey(keys),
                                     val=self._ser(val),
-                                    sep=self.ionsep))
+                                    sep=self.ionsep,
+                                    isdb=self.isdb))
 
 
     def put(self, keys: str | bytes | memoryview | Iterable,
@@ -1757,7 +2023,8 @@ class IoSetSuber(SuberBase):
         return (self.db.putIoSetVals(sdb=self.sdb,
                                      key=self._tokey(keys),
                                      vals=[self._ser(val) for val in vals],
-                                     sep=self.ionsep))
+                                     sep=self.ionsep,
+                                     isdb=self.isdb))
 
 
     def pin(self, keys: str | bytes | memoryview | Iterable,
@@ -1779,7 +2046,8 @@ class IoSetSuber(SuberBase):
         return (self.db.pinIoSetVals(sdb=self.sdb,
                                      key=self._tokey(keys),
                                      vals=[self._ser(val) for val in vals],
-                                     sep=self.ionsep))
+                                     sep=self.ionsep,
+                                     isdb=self.isdb))
 
 
     def rem(self, keys: str | bytes | memoryview | Iterable,
@@ -1803,11 +2071,13 @@ class IoSetSuber(SuberBase):
             return self.db.remIoSetVal(sdb=self.sdb,
                                        key=self._tokey(keys),
                                        val=self._ser(val),
-                                       sep=self.ionsep)
+                                       sep=self.ionsep,
+                                       isdb=self.isdb)
         else:
             return self.db.remIoVals(sdb=self.sdb,
                                        key=self._tokey(keys),
-                                       sep=self.ionsep)
+                                       sep=self.ionsep,
+                                       isdb=self.isdb)
 
 
     def cnt(self, keys: str | bytes | memoryview | Iterable):
@@ -2014,16 +2284,153 @@ class DomIoSetSuber(DomSuberBase, IoSetSuber):
 class Subery(Duror):
     """Subery subclass of Duror for managing subdbs of Duror for durable storage
     of action data
+
+    When .behind then durable values (Can, Durq, Dusq) do not write through on
+    each update but instead mark themselves dirty. All dirty values are then
+    written together in one transaction by .flush. So repeated updates of the
+    same value between flushes coalesce into one write. A crash between flushes
+    loses the unflushed updates but the durable copy is always the consistent
+    state as of the last flush.
+
+    Attributes:
+        behind (bool): True means write behind by marking dirty and flushing
+                       False means write through on each update
+        span (float|None): minimum tyme between flushes given tyme.
+                           None means flush whenever .flush is called
+        drain (bool): True means flush dirty values on close
+                      False means discard dirty values on close
+        dirty (dict): pending writes of dirty values. Each value is triple
+            (pin, done, full) of callable pin that writes its durable value,
+            callable done or None called once the write is committed, and
+            callable full or None that writes all of the value, keyed
+            by (id(suber), key) of that value so later marks of same key
+            replace earlier ones.
+        flights (dict): written but not yet committed entries of .dirty when
+            .flush is nested in an open batch. Once the outermost batch
+            commits their done is called. When it aborts they are dirty again.
+        fulls (set): keys of .dirty whose pending deltas were partly written
+            so their next flush writes all of value with full instead of pin
+        last (float|None): tyme of last flush. None means no flush yet given tyme
     """
-    def __init__(self, **kwa):
+    def __init__(self, *, behind=False, span=None, drain=True, **kwa):
         """
         Setup named sub databases.
 
         Inherited Parameters:  (see Duror)
+
+        Parameters:
+            behind (bool): True means write behind. False means write through
+            span (float|None): minimum tyme between flushes given tyme
+            drain (bool): True means flush dirty values on close
         """
+        self.behind = True if behind else False
+        self.span = span
+        self.drain = True if drain else False
+        self.dirty = {}
+        self.flights = {}
+        self.fulls = set()
+        self.last = None
         super(Subery, self).__init__(**kwa)
 
 
+    def close(self, clear=False):
+        """Close lmdb at .env after flushing dirty values when .drain.
+        Otherwise dirty values are discarded.
+
+        Parameters:
+           clear (bool), True means clear lmdb directory after close
+                         Otherwise do not clear after close
+        """
+        if self.drain and self.opened:
+            self.flush()
+        self.dirty.clear()
+        self.flights.clear()
+        self.fulls.clear()
+        self.last = None
+        return super(Subery, self).close(clear=clear)
+
+
+    def mark(self, suber, key, pin, done=None, full=None):
+        """Marks durable value at key in suber as dirty so written by next .flush.
+
+        Parameters:
+            suber (SuberBase): sub db of value
+            key (str): key of value in suber
+            pin (Callable): with no arguments that writes durable value
+            done (Callable|None): with no arguments called once the write of
+                pin is committed so value may reset pending deltas that pin
+                writes. None means nothing to call
+            full (Callable|None): with no arguments that writes all of durable
+                value. Used instead of pin when pending deltas of value were
+                already written but not yet committed so not written twice.
+                None means pin writes all of value
+        """
+        self.dirty[(id(suber), key)] = (pin, done, full)
+
+
+    def flush(self, tyme=None):
+        """Writes all dirty values in one transaction. When tyme is provided
+        and .span then only flushes when at least .span since .last flush.
+        On exception the transaction is aborted and the values remain dirty.
+        When nested in an open batch the written values are in .flights until
+        the outermost batch commits. Should it abort they are dirty again.
+
+        Returns:
+            count (int): number of values written
+
+        Parameters:
+            tyme (float|None): current tyme. None means flush regardless of .span
+        """
+        if tyme is not None:
+            if (self.span is not None and self.last is not None and
+                    tyme - self.last < self.span):
+                return 0  # not yet due
+            self.last = tyme
+
+        if not self.dirty:
+            return 0
+
+        with self.batch():
+            fulls = []  # keys whose deltas are now partly written
+            for key, (pin, done, full) in self.dirty.items():
+                if full is not None and key in self.fulls:
+                    full()  # deltas partly written so write all instead
+                else:
+                    pin()
+                    if full is not None:
+                        fulls.append(key)
+            self.fulls.update(fulls)
+            if not self.flights:  # first flush of outermost batch
+                self.defer(commit=self._land, abort=self._ground)
+            self.flights.update(self.dirty)
+            count = len(self.dirty)
+            self.dirty.clear()
+        return count
+
+
+    def _land(self):
+        """Calls done of each committed entry of .flights. An entry dirty
+        again since its flush keeps its pending deltas for its next flush
+        which writes all of its value.
+        """
+        flights, self.flights = self.flights, {}
+        for key, (pin, done, full) in flights.items():
+            if key in self.dirty:  # marked again since flush
+                continue
+            if done is not None:
+                done()
+            self.fulls.discard(key)
+
+
+    def _ground(self):
+        """Returns each aborted entry of .flights to .dirty unless marked
+        again since its flush so its write is retried by next flush.
+        """
+        flights, self.flights = self.flights, {}
+        for key, entry in flights.items():
+            self.dirty.setdefault(key, entry)
+
+
     def reopen(self, **kwa):
         """Open sub databases
 
@@ -2034,12 +2441,13 @@ class Subery(Duror):
                 Interfaced via a Durq which is a durable queue (FIFO)
             dsqs (IoSetSub): subdb whose values are serialized RegDom instances
                 Interfaced via a Dusq which is  durable set queue (FIFO deduped)
+                Value indexed so membership, add and remove are single lookups
 
         """
         super(Subery, self).reopen(**kwa)
 
         self.cans = DomSuber(db=self, subkey='cans.')
         self.drqs = DomIoSuber(db=self, subkey="drqs.")  # durable queue
-        self.dsqs = DomIoSetSuber(db=self, subkey="dsqs.")  # durable set queue
+        self.dsqs = DomIoSetSuber(db=self, subkey="dsqs.", indexed=True)  # durable set queue
 
         return self.env
@@ -351,6 +351,15 @@ class Boxer(Tymee):
     Box instance holds a reference to its first (beginning) box.
     Box instance holds references to all its boxes in dict keyed by box name.
 
+    When .hold is durable each pass of .run runs all its acts inside one
+    .hold.batch write transaction so the pass commits its durable updates
+    once. The pass is all or nothing. An exception raised by any act aborts
+    the durable updates of every act of that pass, including earlier unrelated
+    acts, and ends the run. In memory values keep their updates so their
+    durable copies are as of the end of the last completed pass. The LMDB write
+    lock of .hold.subery is held for the whole pass so other writers of the
+    same database wait until the pass ends.
+
     Inherited Properties:  (Tymee)::
 
         .tyme (float | None):  relative cycle time of associated Tymist which is
@@ -505,67 +514,76 @@ class Boxer(Tymee):
             return False  # signal failure due to end in enter before first pass
 
         # setup boxer state in hold  tyme, active box, and tock
-        tymeKey = self.hold.tokey(("", "boxer", self.name, "tyme"))
-        if tymeKey not in self.hold:  # setup tyme bag
-            self.hold[tymeKey] = Bag()
-        self.hold[tymeKey].value = self.tyme
-
-        activeKey = self.hold.tokey(("", "boxer", self.name, "active"))
-        if activeKey not in self.hold:  # setup active box bag
-            self.hold[activeKey] = Bag()
-        self.hold[activeKey].value = self.box.name  # assign active box name
-
-        tockKey = self.hold.tokey(("", "boxer", self.name, "tock"))
-        if tockKey not in self.hold:  # setup tock bag
-            self.hold[tockKey] = Bag()
-        self.hold[tockKey].value = tock  # assign tock
+        # each pass commits its durable hold updates once in one batch
+        # all or nothing so an act that raises aborts the whole pass
+        with self.hold.batch():
+            tymeKey = self.hold.tokey(("", "boxer", self.name, "tyme"))
+            if tymeKey not in self.hold:  # setup tyme bag
+                self.hold[tymeKey] = Bag()
+            self.hold[tymeKey].value = self.tyme
+
+            activeKey = self.hold.tokey(("", "boxer", self.name, "active"))
+            if activeKey not in self.hold:  # setup active box bag
+                self.hold[activeKey] = Bag()
+            self.hold[activeKey].value = self.box.name  # assign active box name
+
+            tockKey = self.hold.tokey(("", "boxer", self.name, "tock"))
+            if tockKey not in self.hold:  # setup tock bag
+                self.hold[tockKey] = Bag()
+            self.hold[tockKey].value = tock  # assign tock
+            self.hold.flush(tyme=self.tyme)  # write behind dirty durables if due
 
         # finished of enter next() delegation 'yield from' delegation
         # tyme injected from yield should be self.tyme when recur by Doist or DoDoer
         tyme = yield(tock)  # pause end of next, resume start of send
-        self.hold[tymeKey].value = tyme  # assign tyme for Hog same as self.tyme
+        with self.hold.batch():
+            self.hold[tymeKey].value = tyme  # assign tyme for Hog same as self.tyme
 
-        # begin first pass after send()
-        self.rendo(rendos)  # rendo nabe, action remarks and renacts
-        self.endo(endos)  # endo nabe, action enmarks and enacts
-        self.redo()  # redo nabe all boxes in pile top down
+            # begin first pass after send()
+            self.rendo(rendos)  # rendo nabe, action remarks and renacts
+            self.endo(endos)  # endo nabe, action enmarks and enacts
+            self.redo()  # redo nabe all boxes in pile top down
+            self.hold.flush(tyme=tyme)  # write behind dirty durables if due
 
         while True:  # run forever
             tock = self.hold[tockKey].value  # get tock in case Act changed it
             # tyme injected from yield should be self.tyme when recur by Doist or DoDoer
             tyme = yield(tock)  # resume on send after tyme tick
-            self.hold[tymeKey].value = tyme  # assign tyme for Hog same as self.tyme
-            rendos = []  # make empty for new pass, reset on transit
-            endos = []  # make empty for new pass, reset on transit
-
-            if self.endial():  # previous pass actioned desire to end
-                self.end()  # exdos all active boxes in self.box.pile
-                self.box = None  # no active box
-                self.hold[activeKey].value = None  # assign active box name to None
-                return True  # signal successful end after last pass
-
-            transit = False
-            for box in self.box.pile:  # top down afdos and godos after tyme tick
-                box.afdo()   # afdo nabe
-
-                for goact in box.goacts:  # godo nabe top down
-                    if dest := goact():  # transition condition satisfied
-                        exdos, endos, rendos, rexdos = self.exen(box, dest)
-                        if not self.predo(endos):  # godo not satisfied
-                            continue  # keep trying
-                        self.exdo(exdos)  # exdo bottom up
-                        self.rexdo(rexdos)  # rexdo bottom up  (boxes retained)
-                        self.box = dest  # set new active box
-                        self.hold[activeKey].value = self.box.name  # active box name
-                        transit = True
+            with self.hold.batch():
+                self.hold[tymeKey].value = tyme  # assign tyme for Hog same as self.tyme
+                rendos = []  # make empty for new pass, reset on transit
+                endos = []  # make empty for new pass, reset on transit
+
+                if self.endial():  # previous pass actioned desire to end
+                    self.end()  # exdos all active boxes in self.box.pile
+                    self.box = None  # no active box
+                    self.hold[activeKey].value = None  # assign active box name to None
+                    self.hold.flush()  # write behind all dirty durables
+                    return True  # signal successful end after last pass
+
+                transit = False
+                for box in self.box.pile:  # top down afdos and godos after tyme tick
+                    box.afdo()   # afdo nabe
+
+                    for goact in box.goacts:  # godo nabe top down
+                        if dest := goact():  # transition condition satisfied
+                            exdos, endos, rendos, rexdos = self.exen(box, dest)
+                            if not self.predo(endos):  # godo not satisfied
+                                continue  # keep trying
+                            self.exdo(exdos)  # exdo bottom up
+                            self.rexdo(rexdos)  # rexdo bottom up  (boxes retained)
+                            self.box = dest  # set new active box
+                            self.hold[activeKey].value = self.box.name  # active box name
+                            transit = True
+                            break
+
+                    if transit:
                         break
 
-                if transit:
-                    break
-
-            self.rendo(rendos)  # rendo nabe, action remarks and renacts
-            self.endo(endos)  # endo nabe, action enmarks and enacts
-            self.redo()  # redo nabe all boxes in pile top down
+                self.rendo(rendos)  # rendo nabe, action remarks and renacts
+                self.endo(endos)  # endo nabe, action enmarks and enacts
+                self.redo()  # redo nabe all boxes in pile top down
+                self.hold.flush(tyme=tyme)  # write behind dirty durables if due
 
 
     def end(self):
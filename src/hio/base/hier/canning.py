@@ -51,6 +51,8 @@ class CanDom(TymeDom):
         _durable (bool): True means ._sdb and ._key and ._sdb.db and
             ._sdb.db.opened are not None
             False otherwise
+        _behind (bool): True means ._durable and ._sdb.db is write behind
+            False otherwise
 
     Non-Field Attributes::
 
@@ -90,7 +92,7 @@ class CanDom(TymeDom):
         if name in self._names:
             super().__setattr__("_tyme", self._now)
             if not self._bulk:
-                self._pin()
+                self._save()
 
 
     def _update(self, *pa, **kwa):
@@ -124,7 +126,7 @@ class CanDom(TymeDom):
                     write = True
 
             if write:
-                self._pin()
+                self._save()
         finally:
             self._bulk = False
 
@@ -142,6 +144,28 @@ class CanDom(TymeDom):
                 and self._sdb.db.opened)
 
 
+    @property
+    def _behind(self):
+        """Property behind True when durable and durable subdb is write behind.
+
+        Returns::
+
+            behind (bool): True means durable and ._sdb.db.behind
+                False otherwise
+        """
+        return bool(self._durable and getattr(self._sdb.db, "behind", False))
+
+
+    def _save(self):
+        """Saves own fields on update. When ._behind marks self dirty so
+        ._pin is deferred to next flush of ._sdb.db. Otherwise ._pin now.
+        """
+        if self._behind and not self._fresh:
+            self._sdb.db.mark(self._sdb, self._key, self._pin)
+            return True
+        return self._pin()
+
+
     def _pin(self):
         """Writes own fields to ._sdb at ._key if any when not ._fresh.
         Sets ._stale to False on success
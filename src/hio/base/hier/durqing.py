@@ -7,6 +7,7 @@ Provides durable  queue for hold hierarchical actions
 from __future__ import annotations  # so type hints of classes get resolved later
 
 from collections import deque
+from itertools import islice
 from typing import Any
 
 from hio import HierError
@@ -17,28 +18,65 @@ class Durq():
     .sdb and .key will store its ordered list durably and allow access as a FIFO
     queue
 
+    By default the in-memory deque mirrors all of the durable queue. When
+    .page then once durable only a head window and a tail window of at most
+    .page vals each are kept in memory. Vals between them remain durable only
+    and are faulted into the head window a page at a time as the queue is
+    pulled. So sync is O(page) and memory is bounded whatever the length of the
+    durable queue. Paged assumes this Durq is the only writer of .sdb at .key
+    and always writes through, ignoring write behind.
+
+    When write behind the appends and head pulls since the last flush are
+    coalesced as pending deltas that the flush applies, so a flush writes
+    only what changed. Only a clear since the last flush pins all of self.
+
     Properties:
         stale (bool): True means in-memory and durable on disk not synced.
             False means in-memory and durable on disk synced.
         durable (bool): True means ._sdb and ._key and ._sdb.db and
             ._sdb.db.opened are not None.
             False otherwise.
+        behind (bool): True means durable and ._sdb.db is write behind.
+            False otherwise.
+        paged (bool): True means durable and .page so windowed.
+            False otherwise.
+
+    Attributes:
+        page (int|None): max vals in each of head and tail windows when paged.
+            None means not paged so full in-memory mirror
 
     Hidden:
-       _deq (deque): in-memory cache as deque
+       _deq (deque): in-memory cache as deque. Head window when paged
+       _tail (deque): in-memory tail window when paged
+       _gap (int): count of durable only vals between head and tail windows
+       _pends (deque): vals appended since last flush when write behind
+       _pops (int): count of durable head vals pulled since last flush when
+                    write behind
+       _cleared (bool): True means cleared since last flush when write behind
+                        so next flush pins all of self
        _sdb (DomIoSuber): instance of durable store
        _key (str): into .sdb
        _stale (bool): stale-status cache for .stale property.
 
     """
-    def __init__(self, *pa):
+    def __init__(self, *pa, page=None):
         """Initialize instance
 
         Parameters:
            pa[0] (NonStringIterable[hio.help.doming.RegDom]): instances to preload self._deq
+           page (int|None): max vals in each of head and tail windows when paged
+                            None means not paged
 
         """
+        if page is not None and page < 1:
+            raise HierError(f"Invalid page={page}")
+        self.page = page
         self._deq = deque()
+        self._tail = deque()
+        self._gap = 0
+        self._pends = deque()
+        self._pops = 0
+        self._cleared = False
         self._stale = True
 
         self._sdb = None
@@ -59,16 +97,23 @@ class Durq():
 
     def __repr__(self):
         """Custom repr for Durq"""
-        return (f"Durq({repr(list(self._deq))})")
+        return (f"Durq({repr(list(self))})")
 
 
     def __iter__(self):
-        """Makes iterator out of self by returning iterable ._deq"""
-        return iter(self._deq)
+        """Makes iterator out of self by returning iterable ._deq
+        When paged reads durable only vals between windows"""
+        if not (self._gap or self._tail):
+            return iter(self._deq)
+        vals = list(self._deq)
+        if self._gap:
+            vals.extend(self._fetch(self._gap, skip=len(self._deq)))
+        vals.extend(self._tail)
+        return iter(vals)
 
     def __len__(self):
         """Supports len()"""
-        return len(self._deq)
+        return len(self._deq) + self._gap + len(self._tail)
 
 
     @property
@@ -94,6 +139,71 @@ class Durq():
                 and self._sdb.db.opened)
 
 
+    @property
+    def behind(self):
+        """Property behind True when durable and durable subdb is write behind.
+
+        Returns::
+
+            behind (bool): True means durable and ._sdb.db.behind
+                False otherwise
+        """
+        return bool(self.durable and self.page is None and
+                    getattr(self._sdb.db, "behind", False))
+
+
+    @property
+    def paged(self):
+        """Property paged True when durable and .page so windowed.
+
+        Returns::
+
+            paged (bool): True means durable and .page is not None
+                False otherwise
+        """
+        return bool(self.durable and self.page is not None)
+
+
+    def _append(self, val):
+        """Appends val to in-memory cache. When paged and head window full
+        appends to tail window and evicts first of overfull tail window to
+        durable only gap.
+        """
+        if self.paged and (self._gap or self._tail or len(self._deq) >= self.page):
+            self._tail.append(val)
+            if len(self._tail) > self.page:  # evict to durable only
+                self._tail.popleft()
+                self._gap += 1
+        else:
+            self._deq.append(val)
+
+
+    def _fetch(self, count, *, skip=0, ion=0):
+        """Returns list of up to count durable vals after first skip at or after
+        ordinal ion. Closes cursor iterator so its read transaction ends.
+        """
+        vals = self._sdb.getIter(self._key, ion=ion)
+        try:
+            return list(islice(vals, skip, skip + count))
+        finally:
+            vals.close()
+
+
+    def _fault(self):
+        """Refills empty head window when paged from front of durable only gap
+        a page at a time or else from tail window.
+        """
+        if self._gap:  # durable front is now front of gap
+            vals = self._fetch(min(self.page, self._gap))
+            if not vals:
+                raise HierError(f"Mismatch between cache and durable at "
+                                f"key={self._key}")
+            self._deq.extend(vals)
+            self._gap -= len(vals)
+        else:
+            self._deq, self._tail = self._tail, self._deq
+
+
     def extend(self, vals: NonStringIterable[RegDom|IceRegDom]):
         """Extend ._deq with vals
         Performs equivalent operation on durable .sdb at .key if any
@@ -106,7 +216,8 @@ class Durq():
             if not isinstance(val, (RegDom, IceRegDom)):
                 raise HierError(f"Expected RegDom instance got {val}")
 
-        self._deq.extend(vals)
+        for val in vals:
+            self._append(val)
         if self.put(vals) is False:  # durable but put failed
             raise HierError(f"Mismatch between cache and durable at "
                             f"key={self._key}")
@@ -123,7 +234,7 @@ class Durq():
         if val is not None:
             if not isinstance(val, (RegDom, IceRegDom)):
                 raise HierError(f"Expected RegDom instance got {val}")
-            self._deq.append(val)
+            self._append(val)
             result = self.add(val)
             if result == False:  # durable but not added
                 raise HierError(f"Mismatch between cache and durable at "
@@ -144,10 +255,12 @@ class Durq():
                when attempt to pull
                False means normal behavior of deque
         """
+        if not self._deq and (self._gap or self._tail):  # paged head window empty
+            self._fault()
         try:
             val = self._deq.popleft()
         except IndexError:  # empty
-            if self.durable and self.pop() is not None:
+            if self.durable and not self.behind and self.pop() is not None:
                 raise HierError(f"Mismatch between cache and durable at "
                                 f"key={self._key}")
             if not emptive:
@@ -166,8 +279,10 @@ class Durq():
         Performs equivalent operation on durable .sdb at .key if any
 
         """
-        prior = len(self._deq)
+        prior = len(self)
         self._deq.clear()
+        self._tail.clear()
+        self._gap = 0
         unique = prior > 0
         if not unique:
             return False
@@ -181,13 +296,18 @@ class Durq():
     def count(self, value):
         """Returns count of entries in ._deq equal to value
         """
-        return(self._deq.count(value))  # counts matching values
+        if not (self._gap or self._tail):
+            return(self._deq.count(value))  # counts matching values
+        return(sum(1 for val in self if val == value))
 
 
 
     def put(self, vals: NonStringIterable[RegDom|IceRegDom]):
         """Put (append) vals to .sdb at .key if any"""
         if self.durable:
+            if self.behind:  # defer to flush
+                self._pends.extend(vals)
+                return self.mark()
             self._stale = False
             return self._sdb.put(keys=self._key, vals=vals)
         return None
@@ -196,6 +316,9 @@ class Durq():
     def add(self, val):
         """Add value to .sdb at .key if any"""
         if self.durable:
+            if self.behind:  # defer to flush
+                self._pends.append(val)
+                return self.mark()
             self._stale = False
             return self._sdb.add(keys=self._key, val=val)
         return None
@@ -204,6 +327,12 @@ class Durq():
     def pop(self):
         """Pop value from .sdb at .key if any"""
         if self.durable:
+            if self.behind:  # defer to flush
+                if len(self) < len(self._pends):  # pulled val not yet durable
+                    self._pends.popleft()
+                else:
+                    self._pops += 1
+                return self.mark()
             return self._sdb.pop(keys=self._key)
         return None
 
@@ -211,6 +340,10 @@ class Durq():
     def rem(self):
         """Remove all values from .sdb at .key if any"""
         if self.durable:
+            if self.behind:  # defer to flush
+                self._settle()
+                self._cleared = True
+                return self.mark()
             return self._sdb.rem(keys=self._key)
         return None
 
@@ -222,14 +355,48 @@ class Durq():
         return None
 
 
+    def mark(self):
+        """Marks self dirty so next flush of ._sdb.db applies pending deltas
+        to ._sdb at ._key or when cleared pins all of self
+        """
+        self._sdb.db.mark(self._sdb, self._key,
+                          self._pin if self._cleared else self._delta,
+                          self._settle, self._pin)
+        return True
+
+
+    def _delta(self):
+        """Applies pending deltas to ._sdb at ._key by popping ._pops head
+        vals then appending ._pends vals
+        """
+        for _ in range(self._pops):
+            self._sdb.pop(keys=self._key)
+        if self._pends:
+            self._sdb.put(keys=self._key, vals=list(self._pends))
+        self._stale = False
+
+
+    def _settle(self):
+        """Resets pending deltas once written"""
+        self._pends.clear()
+        self._pops = 0
+        self._cleared = False
+
+
+    def _pin(self):
+        """Pins all of self to ._sdb at ._key"""
+        vals = [val for val in self]
+        self._sdb.pin(self._key, vals)  # pin sdb._ser to ._deq vals
+        self._stale = False
+
+
     def pin(self):
-        """Pins all of ._deq to ._sdb at ._key if any.
-        Sets ._stale to False on success
+        """Pins all of self to ._sdb at ._key if any superseding any pending
+        deltas. Sets ._stale to False on success
         """
         if self.durable:
-            vals = [val for val in self._deq]
-            self._sdb.pin(self._key, vals)  # pin sdb._ser to ._deq vals
-            self._stale = False
+            self._pin()
+            self._settle()
             return True
         return None
 
@@ -243,6 +410,23 @@ class Durq():
             force (bool): True means force read even if not ._stale
                           False means do not force read
         """
+        if self.paged and (self.stale or force):
+            if span := self._sdb.getSpan(self._key):  # not empty
+                first, last = span
+                size = last - first + 1  # contiguous ordinals
+                self._deq.clear()
+                self._tail.clear()
+                self._deq.extend(self._fetch(self.page))
+                count = min(self.page, size - len(self._deq))
+                if count:
+                    self._tail.extend(self._fetch(count, ion=last - count + 1))
+                self._gap = size - len(self._deq) - len(self._tail)
+                self._stale = False
+                return True
+
+            else: # empty
+                return self.pin()
+
         if self.durable and (self.stale or force):
             if self._sdb.cnt(self._key):  # not empty
                 self._deq.clear()
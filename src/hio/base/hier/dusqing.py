@@ -10,36 +10,65 @@ from ordered_set import OrderedSet as oset
 from copy import deepcopy
 
 from hio import HierError
-from ...help import RegDom, IceRegDom, NonStringIterable
+from ...help import RegDom, IceRegDom, NonStringIterable, Orset
 
 class Dusq():
     """Dusq (durable set queue) class when injected with
     .sdb and .key will store its ordered set durably and allow access as a
     deduped FIFO queue. A set is deduped.
 
+    The default in-memory ordered set is ordered_set.OrderedSet whose remove,
+    and hence pull, is O(n). When linked the in-memory ordered set is Orset,
+    a linked hash set, so pull, remove, and contains are O(1). Use linked for
+    large work queues.
+
+    When write behind the adds and removes since the last flush are coalesced
+    as pending deltas that the flush applies, so a flush writes only what
+    changed. Only a clear since the last flush pins all of self.
+
     Properties:
         stale (bool): True means in-memory and durable on disk not synced.
             False means in-memory and durable on disk synced.
         durable (bool): True means ._sdb and ._key and ._sdb.db and
             ._sdb.db.opened are not None.
             False otherwise.
+        behind (bool): True means durable and ._sdb.db is write behind.
+            False otherwise.
 
     Hidden:
-       _oset (oset): in-memory cache as ordered set
+       _oset (oset|Orset): in-memory cache as ordered set
+       _deep (bool): True means deepcopy mutable vals in and out so can't
+                     mutate outside. False means no copies
+       _adds (dict): vals added since last flush when write behind in order
+                     added, keyed by val with None values
+       _rems (dict): durable vals removed since last flush when write behind,
+                     keyed by val with None values
+       _cleared (bool): True means cleared since last flush when write behind
+                        so next flush pins all of self
        _sdb (DomIoSuber): instance of durable store
        _key (str): into .sdb
        _stale (bool): stale-status cache for .stale property.
 
     """
 
-    def __init__(self, *pa):
+    def __init__(self, *pa, linked=False, deep=True):
         """Initialize instance
 
         Parameters:
            pa[0] (NonStringIterable[hio.help.doming.RegDom]): instances to preload self._oset
+           linked (bool): True means in-memory ordered set is Orset with O(1)
+                          pull, remove, and contains
+                          False means in-memory ordered set is oset
+           deep (bool): True means deepcopy mutable vals in and out
+                        False means do not deepcopy. Caller must not mutate
+                        vals once pushed since set membership uses their hash
 
         """
-        self._oset = oset()
+        self._oset = Orset() if linked else oset()
+        self._deep = True if deep else False
+        self._adds = {}
+        self._rems = {}
+        self._cleared = False
         self._stale = True
 
         self._sdb = None
@@ -65,8 +94,7 @@ class Dusq():
 
     def __iter__(self):
         """Makes iterator out of self by returning iterable ._oset"""
-        return iter(tuple(val if val.__dataclass_params__.frozen else deepcopy(val)
-                          for val in self._oset))  # ensure not mutable outside
+        return iter(tuple(self._copy(val) for val in self._oset))  # ensure not mutable outside
         #return iter(self._oset)
 
     def __len__(self):
@@ -74,6 +102,16 @@ class Dusq():
         return len(self._oset)
 
 
+    def __contains__(self, value):
+        """Supports in"""
+        return value in self._oset
+
+
+    def _copy(self, val):
+        """Returns val when frozen or not ._deep else deepcopy of val"""
+        return val if (not self._deep or val.__dataclass_params__.frozen) else deepcopy(val)
+
+
     @property
     def stale(self):
         """Getter for ._stale
@@ -97,26 +135,39 @@ class Dusq():
                 and self._sdb.db.opened)
 
 
-    def update(self, vals: NonStringIterable[RegDom|IceRegDom], *, deep=True):
+    @property
+    def behind(self):
+        """Property behind True when durable and durable subdb is write behind.
+
+        Returns::
+
+            behind (bool): True means durable and ._sdb.db.behind
+                False otherwise
+        """
+        return bool(self.durable and getattr(self._sdb.db, "behind", False))
+
+
+    def update(self, vals: NonStringIterable[RegDom|IceRegDom], *, deep=None):
         """Update ._oset with vals
         Performs equivalent operation on durable .sdb at .key if any
 
         Parameters:
             vals (NonStringIterable[hio.help.doming.RegDom]): to add to dusq
-            deep (bool): True means deepcopy to ensure can't mutate outside
-                         False means do not deepcopy
+            deep (bool|None): True means deepcopy to ensure can't mutate outside
+                              False means do not deepcopy
+                              None means use ._deep
 
         """
         for val in vals:
             if not isinstance(val, (RegDom, IceRegDom)):
                 raise HierError(f"Expected RegDom instance got {val}")
-        vals = tuple(val if val.__dataclass_params__.frozen else deepcopy(val)
-                     for val in vals)  # so can't mutate
-        prior = len(self)
-        self._oset.update(vals)
-        unique = len(self._oset) > prior  # uniquely added some val from vals to set
-        if unique:
-            if self.put(vals) is False:  # durable unique update but put failed
+        deep = self._deep if deep is None else deep
+        vals = tuple(val if (not deep or val.__dataclass_params__.frozen)
+                     else deepcopy(val) for val in vals)  # so can't mutate
+        fresh = [val for val in vals if val not in self._oset]  # not yet in set
+        self._oset.update(fresh)
+        if fresh:  # uniquely added some val from vals to set
+            if self.put(fresh) is False:  # durable unique update but put failed
                 raise HierError(f"Mismatch between cache and durable at "
                                 f"key={self._key}")
             return True
@@ -133,13 +184,11 @@ class Dusq():
         if val is not None:
             if not isinstance(val, (RegDom, IceRegDom)):
                 raise HierError(f"Expected RegDom instance got {val}")
-            # so can't mutate
-            val = val if val.__dataclass_params__.frozen else deepcopy(val)
+            val = self._copy(val)  # so can't mutate
             prior = len(self._oset)
             self._oset.add(val)
             unique = len(self._oset) > prior  # uniquely added val to set
-            result = self.add(val)
-            if unique and result == False:  # durable unique but not added
+            if unique and self.add(val) == False:  # durable unique but not added
                 raise HierError(f"Mismatch between cache and durable at "
                                 f"key={self._key}")
             return True
@@ -162,18 +211,18 @@ class Dusq():
             val = self._oset[0]
             self._oset.remove(val)
         except IndexError:  # empty
-            if self.durable and self.pop() is not None:
+            if self.durable and not self.behind and self.pop() is not None:
                 raise HierError(f"Mismatch between cache and durable at "
                                 f"key={self._key}")
             if not emptive:
                 raise
             return None
         else:  # successfully popped so pop from ._sdb
-            if self.durable and self.pop() is None:  # not popped from ._sdb
+            if self.durable and self.pop(val) is None:  # not popped from ._sdb
                 raise HierError(f"Mismatch between cache and durable at "
                                 f"key={self._key}")
         # value to return ensure not mutable outside
-        return val if val.__dataclass_params__.frozen else deepcopy(val)
+        return self._copy(val)
 
 
     def clear(self):
@@ -198,14 +247,12 @@ class Dusq():
         Returns::
 
             result (bool): True value was removed
-                           Raises KeyError if value not found
+                           False value not found
 
         Performs equivalent operation on durable .sdb at .key if any
         """
-        if not isinstance(val, (RegDom, IceRegDom)):
-            raise HierError(f"Expected RegDom instance got {val}")
-         # so can't mutate
-        val = val if val.__dataclass_params__.frozen else deepcopy(val)
+        if not isinstance(value, (RegDom, IceRegDom)):
+            raise HierError(f"Expected RegDom instance got {value}")
         try:
             self._oset.remove(value)
         except KeyError as ex:
@@ -220,6 +267,9 @@ class Dusq():
     def put(self, vals: NonStringIterable[RegDom|IceRegDom]):
         """Put (append) vals to .sdb at .key if any and unique to set"""
         if self.durable:
+            if self.behind:  # defer to flush
+                self._adds.update(dict.fromkeys(vals))
+                return self.mark()
             self._stale = False
             return self._sdb.put(keys=self._key, vals=vals)
         return None
@@ -228,25 +278,53 @@ class Dusq():
     def add(self, val):
         """Add value to .sdb at .key if any"""
         if self.durable:
+            if self.behind:  # defer to flush
+                self._adds[val] = None
+                return self.mark()
             self._stale = False
             return self._sdb.add(keys=self._key, val=val)
         return None
 
 
-    def pop(self):
-        """Pop value from .sdb at .key if any"""
+    def pop(self, val=None):
+        """Pop value from .sdb at .key if any
+
+        Parameters:
+            val (RegDom|IceRegDom|None): first in val pulled from ._oset whose
+                removal is deferred when write behind
+        """
         if self.durable:
+            if self.behind:  # defer to flush
+                self._drop(val)
+                return self.mark()
             return self._sdb.pop(keys=self._key)
         return None
 
 
     def rem(self, val=None):
-        """Remove all values from .sdb at .key if any"""
+        """Remove val or when val is None all values from .sdb at .key if any"""
         if self.durable:
+            if self.behind:  # defer to flush
+                if val is None:
+                    self._settle()
+                    self._cleared = True
+                else:
+                    self._drop(val)
+                return self.mark()
             return self._sdb.rem(keys=self._key, val=val)
         return None
 
 
+    def _drop(self, val):
+        """Records pending removal of val. A val added since last flush is
+        not yet durable so only its pending add is dropped.
+        """
+        if val in self._adds:
+            del self._adds[val]
+        else:
+            self._rems[val] = None
+
+
     def cnt(self):
         """Count all values in .sdb at .key if any"""
         if self.durable:
@@ -254,14 +332,48 @@ class Dusq():
         return None
 
 
+    def mark(self):
+        """Marks self dirty so next flush of ._sdb.db applies pending deltas
+        to ._sdb at ._key or when cleared pins all of ._oset
+        """
+        self._sdb.db.mark(self._sdb, self._key,
+                          self._pin if self._cleared else self._delta,
+                          self._settle, self._pin)
+        return True
+
+
+    def _delta(self):
+        """Applies pending deltas to ._sdb at ._key by removing ._rems vals
+        then adding ._adds vals
+        """
+        for val in self._rems:
+            self._sdb.rem(keys=self._key, val=val)
+        if self._adds:
+            self._sdb.put(keys=self._key, vals=list(self._adds))
+        self._stale = False
+
+
+    def _settle(self):
+        """Resets pending deltas once written"""
+        self._adds.clear()
+        self._rems.clear()
+        self._cleared = False
+
+
+    def _pin(self):
+        """Pins all of ._oset to ._sdb at ._key"""
+        vals = [val for val in self._oset]
+        self._sdb.pin(self._key, vals)  # pin sdb._ser to ._oset vals
+        self._stale = False
+
+
     def pin(self):
-        """Pins all of ._oset to ._sdb at ._key if any.
-        Sets ._stale to False on success
+        """Pins all of ._oset to ._sdb at ._key if any superseding any pending
+        deltas. Sets ._stale to False on success
         """
         if self.durable:
-            vals = [val for val in self._oset]
-            self._sdb.pin(self._key, vals)  # pin sdb._ser to ._oset vals
-            self._stale = False
+            self._pin()
+            self._settle()
             return True
         return None
 
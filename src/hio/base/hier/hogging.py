@@ -9,6 +9,8 @@ Provides support for hold logging (hogging)
 from __future__ import annotations  # so type hints of classes get resolved later
 
 import os
+import queue
+import threading
 import uuid
 from contextlib import contextmanager
 import inspect
@@ -16,6 +18,8 @@ from collections import namedtuple, deque
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
 
+import msgpack
+
 from ...hioing import HierError
 from ...help import timing  # import timing to pytest mock of nowIso8601 works
 from ...help.helping import ocfn
@@ -111,6 +115,8 @@ class Hog(ActBase, Filer):
             0 means no maximum. One of cycleSpan or cycleHigh must be non zero
         cyclePaths (list[str]): paths for cycled logs
         cycleLast (float|None): tyme last cycled. None means not yet running
+        size (int|None): bytes in current log file tracked in memory when
+            cycleSize. None means not yet known since (re)open
         hits (dict): hold items to log. Item label is log header tag
             Item value is hold key that provides value to log
         marks (dict): tyme or value tuples marks of hold items logged with
@@ -281,6 +287,7 @@ class Hog(ActBase, Filer):
         self.cycleSize = cycleSize
         self.cyclePaths = []  # need to init
         self.cycleLast = None
+        self.size = None  # bytes in file when cycleSize, None means not yet known
 
         self.activeKey = None
         self.tockKey = None
@@ -338,11 +345,6 @@ class Hog(ActBase, Filer):
                 #self.rid = self.Proem + uid  # same as CESR salt
             self.stamp = timing.nowIso8601()  # current real datetime as ISO8601 string
 
-            metaLine = (f"rid\tbase\tname\tstamp\trule\tcount\n")
-
-            metaValLine = (f"{self.rid}\t{self.base}\t{self.name}"
-                           f"\t{self.stamp}\t{self.rule}\t{self.cycleCount}\n")
-
             if self.tymeKey and self.tymeKey in self.hold:  # need tyme for logging
                 hits = dict(tyme=self.tymeKey)  # logging tyme
                 for tag, key in self.hits.items():  # copy valid .hits
@@ -360,15 +362,8 @@ class Hog(ActBase, Filer):
                 if self.tockKey and self.tockKey in self.hold:
                     self.hits["tock"] = self.tockKey
 
-            tagKeyLine = '\t'.join(f"{tag}.key" for tag in self.hits.keys()) + "\n"
-            keyLine = '\t'.join(key for key in self.hits.values()) + "\n"
-
-            # need to expand tags for hits with vector bags in hold
-            tagValLine = ('\t'.join(f"{tag}.{fld}" for tag, key in self.hits.items()
-                                    for fld in self.hold[key]._names) + "\n")
-
-            self.header = metaLine + metaValLine + tagKeyLine + keyLine + tagValLine
-            self.file.write(self.header)
+            self.header = self.formHeader()
+            self.write(self.header)
             self.started = True
 
         tyme = self.hold[self.hits["tyme"]].value if self.hits else None
@@ -432,7 +427,7 @@ class Hog(ActBase, Filer):
             force (bool): True means force flush even when not flushSpan elapsed
                           False means do not force flush only if flushSpan elapsed
         """
-        self.file.write(record)
+        self.write(record)
         self.last = tyme
 
         if force or self.flushForce or (tyme - self.flushLast) >= self.flushSpan:
@@ -452,13 +447,93 @@ class Hog(ActBase, Filer):
                     cycled = True
 
             if self.cycleSize and not cycled:
+                if self.size is not None and self.size >= self.cycleSize:
+                    self.cycle(tyme=tyme)
+
+
+    def schema(self):
+        """Generate schema of log from run meta data and .hits. Each hit tag
+        expands to one column per field of the vector bag in hold at its key.
+
+        Returns::
+
+            schema (dict): with items rid, base, name, stamp, rule, count for
+                run meta data and tags, keys, fields lists for columns
+        """
+        return dict(rid=self.rid, base=self.base, name=self.name,
+                    stamp=self.stamp, rule=self.rule, count=self.cycleCount,
+                    tags=[f"{tag}.key" for tag in self.hits.keys()],
+                    keys=[key for key in self.hits.values()],
+                    # need to expand tags for hits with vector bags in hold
+                    fields=[f"{tag}.{fld}" for tag, key in self.hits.items()
+                                for fld in self.hold[key]._names])
+
+
+    @staticmethod
+    def tsvHeader(schema):
+        """Generate tab delimited header lines from schema
+
+        Parameters::
+
+            schema (dict): as given by .schema
+
+        Returns::
+
+            header (str): newline delimited lines of tab delimited values
+        """
+        metaLine = (f"rid\tbase\tname\tstamp\trule\tcount\n")
+        metaValLine = (f"{schema['rid']}\t{schema['base']}\t{schema['name']}"
+                       f"\t{schema['stamp']}\t{schema['rule']}\t{schema['count']}\n")
+        tagKeyLine = '\t'.join(schema['tags']) + "\n"
+        keyLine = '\t'.join(schema['keys']) + "\n"
+        tagValLine = '\t'.join(schema['fields']) + "\n"
+        return metaLine + metaValLine + tagKeyLine + keyLine + tagValLine
+
+
+    def formHeader(self):
+        """Generate header for log file(s)
+
+        Returns::
+
+            header (str): tab delimited header lines from .schema
+        """
+        return self.tsvHeader(self.schema())
+
+
+    def write(self, data):
+        """Write data to .file. When .cycleSize tracks .size of file in bytes
+        in memory so does not stat file on every write.
+
+        Parameters::
+
+            data (str|bytes): header or record to write
+        """
+        self._count(data)
+        self.file.write(data)
+
+
+    def _count(self, data):
+        """Add byte count of data to .size when .cycleSize. When .size is None,
+        as after (re)open, first gets .size from file on disk.
+        """
+        if self.cycleSize:
+            if self.size is None:
                 try:
-                    size = os.path.getsize(self.path)
+                    self.size = os.path.getsize(self.path)
                 except OSError as ex:
-                    pass
-                else:
-                    if size >= self.cycleSize:
-                        self.cycle(tyme=tyme)
+                    self.size = 0
+            self.size += len(data.encode() if isinstance(data, str) else data)
+
+
+    def close(self, clear=False):
+        """Close .file if any and if clear rm directory or file at .path
+        Resets .size so next write gets it from file on disk.
+
+        Parameters:
+           clear (bool): True means remove dir or file at .path
+        """
+        self.size = None
+        return super(Hog, self).close(clear=clear)
 
 
     def record(self):
@@ -511,12 +586,226 @@ class Hog(ActBase, Filer):
         else:  # all cycled so recreate self.file
             self.reopen() # not reuse so recreates empty
 
-        self.file.write(self.header)  # rewrite header
+        self.write(self.header)  # rewrite header
         self.flush()
         self.flushLast = tyme
         self.cycleLast = tyme
 
 
+@register(names=('binlog', 'BinLog'))
+class BinHog(Hog):
+    """BinHog is Hog that logs in binary instead of tab delimited text.
+    Its log file is a stream of msgpack objects. The first object after each
+    (re)start or cycle is the header map given by .schema. Each following object
+    is one record as an array of the field values of the .hits in column order
+    of the header fields. Values not native to msgpack are logged as their str.
+    Tuple values are logged as msgpack arrays so read back as lists.
+    Use tsvify to convert a BinHog log file to the tab delimited Hog format.
+
+    When .threaded, writes are offloaded to a background writer thread via a
+    bounded queue so logging in the boxwork does not block on file io unless
+    the writer falls behind by more than .qsize writes. Once the writer fails
+    on an io error it stops, .error holds the error, later writes raise
+    HierError, and flush, drain, and close no longer wait on it.
+
+    Class Attributes::
+
+        Flush (bytes): queue sentinel to flush file from writer thread
+        Stop (None): queue sentinel to stop writer thread
+        Wait (float): seconds to wait on full queue before checking writer
+
+    Attributes::
+
+        threaded (bool): True means write with background writer thread
+                         False means write inline
+        qsize (int): max pending writes in queue before log blocks
+        queue (queue.Queue|None): pending writes for writer thread
+        writer (threading.Thread|None): background writer thread when running
+        error (Exception|None): exception raised in writer thread if any
+
+    See Hog for inherited attributes and parameters
+    """
+    Flush = b""  # queue sentinel to flush file from writer thread
+    Stop = None  # queue sentinel to stop writer thread
+    Wait = 0.1  # seconds to wait on full queue before checking writer
+
+    def __init__(self, *, fext="bog", mode="ab+", threaded=True, qsize=1024,
+                 **kwa):
+        """Initialize instance.
+
+        Parameters::
+
+            threaded (bool): True means write with background writer thread
+                             False means write inline
+            qsize (int): max pending writes in queue before log blocks
+
+        See Hog for other parameters
+        """
+        self.threaded = True if threaded else False
+        self.qsize = qsize
+        self.queue = None
+        self.writer = None
+        self.error = None
+        super(BinHog, self).__init__(fext=fext, mode=mode, **kwa)
+
+
+    def formHeader(self):
+        """Generate header for log file(s)
+
+        Returns::
+
+            header (bytes): msgpack map from .schema
+        """
+        return msgpack.packb(self.schema())
+
+
+    def record(self):
+        """Generate one record from .hits values from .hold
+
+          Returns::
+
+              record (bytes): msgpack array of values of .hits each expanded
+                  per field. Empty when no .hits
+        """
+        if self.hits:
+            return msgpack.packb([self.hold[key][fld]
+                                    for key in self.hits.values()
+                                        for fld in self.hold[key]._names],
+                                 default=str)
+        else:
+            return b""
+
+
+    def write(self, data):
+        """Write data to .file via writer thread when .threaded else inline.
+        Starts writer thread if not running. Tracks .size when .cycleSize.
+
+        Parameters::
+
+            data (bytes): header or record to write
+        """
+        if not data:
+            return
+        if self.error:
+            raise HierError(f"BinHog writer failed") from self.error
+        self._count(data)
+        if not self.threaded:
+            self.file.write(data)
+            return
+        if self.writer is None:
+            self.queue = queue.Queue(maxsize=self.qsize)
+            self.writer = threading.Thread(target=self._run,
+                                           args=(self.file, self.queue),
+                                           name=f"BinHog.{self.name}",
+                                           daemon=True)
+            self.writer.start()
+        if not self._enqueue(data):  # waits when writer falls qsize behind
+            raise HierError(f"BinHog writer failed") from self.error
+
+
+    def _enqueue(self, item):
+        """Put item on .queue for writer thread. Waits while .queue is full
+        but only as long as writer is alive and has not failed.
+
+        Returns::
+
+            result (bool): True means item put on .queue
+                           False means writer failed or stopped so not put
+
+        Parameters::
+
+            item (bytes|None): data to write or .Flush or .Stop sentinel
+        """
+        while self.error is None and self.writer.is_alive():
+            try:
+                self.queue.put(item, timeout=self.Wait)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+
+    def _run(self, file, writes):
+        """Writer thread body. Writes each data from writes to file until
+        .Stop. Flushes on .Flush.
+
+        Parameters::
+
+            file (File): log file
+            writes (queue.Queue): pending writes
+        """
+        while (data := writes.get()) is not self.Stop:
+            try:
+                if data == self.Flush:
+                    file.flush()
+                    os.fsync(file.fileno())
+                else:
+                    file.write(data)
+            except Exception as ex:
+                self.error = ex
+                break
+
+
+    def flush(self):
+        """Flush .file. When writer thread running flush is performed by
+        writer after pending writes so does not block.
+        """
+        if self.writer is not None:
+            self._enqueue(self.Flush)
+        else:
+            super(BinHog, self).flush()
+
+
+    def drain(self):
+        """Stops writer thread if running after it finishes all pending writes.
+        Does not wait on a failed writer since it has already stopped.
+        """
+        if self.writer is not None:
+            self._enqueue(self.Stop)
+            self.writer.join()
+            self.writer = None
+            self.queue = None
+
+
+    def close(self, clear=False):
+        """Drain writer thread then close .file if any and if clear rm
+        directory or file at .path
+
+        Parameters:
+           clear (bool): True means remove dir or file at .path
+        """
+        self.drain()
+        return super(BinHog, self).close(clear=clear)
+
+
+def tsvify(path, dst=None):
+    """Convert BinHog log file at path to tab delimited Hog log format.
+    msgpack does not distinguish tuples from lists so a tuple value reads back
+    as a list and is converted as its list str, such as [1, 2] not (1, 2).
+
+    Parameters::
+
+        path (str): path to BinHog log file
+        dst (str|None): path to converted log file.
+                        None means path with extension replaced by .hog
+
+    Returns::
+
+        dst (str): path to converted log file
+    """
+    if dst is None:
+        root, ext = os.path.splitext(path)
+        dst = root + ".hog"
+
+    with open(path, "rb") as src, open(dst, "w") as out:
+        for obj in msgpack.Unpacker(src):
+            if isinstance(obj, dict):  # header
+                out.write(Hog.tsvHeader(obj))
+            else:  # record
+                out.write('\t'.join(f"{val}" for val in obj) + "\n")
+    return dst
+
+
 @contextmanager
 def openHog(cls=None, name=None, temp=True, reopen=True, clear=False, **kwa):
     """Context manager wrapper Hog instances for managing a filesystem directory
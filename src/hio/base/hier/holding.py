@@ -11,7 +11,7 @@ import platform
 import stat
 import tempfile
 from collections.abc import Mapping
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from typing import Any
 
 import lmdb
@@ -52,6 +52,8 @@ class Hold(Mine):
 
     Methods:
         - inject: injects .cans into val._sdb and key into val._key
+        - batch: context manager so durable updates share one transaction
+        - flush: writes dirty durable values when subery is write behind
 
 
     """
@@ -132,6 +134,8 @@ class Hold(Mine):
             val (Any|CanDom): for item. When instance subclass of CanDom then
                 inject to ._key and ._sdb
         """
+        if self.subery and self.subery.dirty:  # write behind pending
+            self.subery.flush()  # so sync of val reads latest durable
         if isinstance(val, CanDom):
             val._key = key
             val._sdb = self.subery.cans if self.subery else None
@@ -146,6 +150,35 @@ class Hold(Mine):
             val.sync()  # attempt to sync with sdb at key if any
 
 
+    def batch(self):
+        """Returns context manager in which all durable updates of values in
+        this Hold such as the many field assignments of its Cans share one
+        write transaction that is committed once on exit.
+        When not durable returns do nothing context manager.
+
+        Usage::
+
+            with hold.batch():
+                hold.can.value = 1
+                hold.can.other = 2
+        """
+        return self.subery.batch() if self.subery else nullcontext()
+
+
+    def flush(self, tyme=None):
+        """Writes all dirty durable values of this Hold in one transaction
+        when its subery is write behind. When tyme is provided then only when
+        at least subery.span since last flush. When not durable does nothing.
+
+        Returns:
+            count (int): number of durable values written
+
+        Parameters:
+            tyme (float|None): current tyme. None means flush regardless of span
+        """
+        return self.subery.flush(tyme=tyme) if self.subery else 0
+
+
     @property
     def subery(self):
         """Gets value of special item '_hold_subery'
@@ -14,6 +14,7 @@ import logging
 import json
 import signal
 import re
+import pickle
 import multiprocessing as mp
 
 from collections import deque, namedtuple
@@ -80,6 +81,43 @@ Retag = re.compile(TAGREX)  # compile is faster
 #   _asjson(self): return bytes self converted to json
 #   _ascbor(self): return bytes self converted to cbor
 #   _asmgpk(self): return bytes self converted to mgpk
+@dataclass(frozen=True)
+class RestartCodex(IceMapDom):
+    """Codex of crew hand restart policies used by Bosser supervision.
+
+    Attributes:
+        never (str): never restart crew hand once its subprocess has exited
+        always (str): always restart crew hand when its subprocess has exited
+                      or is hung unless commanded to exit
+        failure (str): restart crew hand only when its subprocess has exited
+                       with non-zero exit code or is hung
+    """
+    never: str = 'never'
+    always: str = 'always'
+    failure: str = 'failure'
+
+RestartDex = RestartCodex()  # make instance
+
+
+@dataclass
+class PolicyDom(RawDom):
+    """Configuration dataclass of supervision policy of a Crewer crew hand
+    by its Bosser boss.
+
+    Attributes:
+        restart (str): restart policy, value of RestartDex
+        limit (int): max restarts within window after which hand is left down
+        window (float): tyme window in seconds of restart limit
+        timeout (float or None): liveness timeout in seconds since last
+                    heartbeat after which a registered hand is deemed hung
+                    and is killed. None means no liveness timeout
+    """
+    restart: str = RestartDex.never  # restart policy
+    limit: int = 3  # max restarts within window
+    window: float = 60.0  # tyme window of restart limit
+    timeout: float | None = None  # liveness timeout since last heartbeat
+
+
 @dataclass
 class HandDom(RawDom):
     """Configuration dataclass of Crewer crew hand info managed by its Bosser
@@ -89,10 +127,29 @@ class HandDom(RawDom):
         proc (typing.Any or None): crew hand subprocess or None
         exiting (bool): True means commanded to exit but may not have exited yet
                         False means not yet commanded to exit
+        jobs (dict): in flight job work dispatched to crew hand keyed by job id
+        done (int): count of jobs completed by crew hand
+        load (dict): parameters used to spinup crew hand subprocess .start()
+        policy (PolicyDom): supervision policy of crew hand
+        restarts (list[float]): tymes of restarts within policy window
+        tymer (typing.Any or None): liveness Tymer restarted on each heartbeat
+                                    None means not yet registered or no timeout
+        down (bool): True means exited and not to be restarted
+                     False otherwise
+        startup (dict): startup timing report of crew hand from its TIM memo
+                        with seconds spent in boot, unpickle, and enter
 
     """
     proc: typing.Any = None  # crew hand subprocess
     exiting: bool = False  # True means commanded to exit but may not have exited yet
+    jobs: dict = field(default_factory=dict)  # in flight job work keyed by jid
+    done: int = 0  # count of jobs completed by crew hand
+    load: dict = field(default_factory=dict)  # .start() parameters of crew hand
+    policy: PolicyDom = field(default_factory=PolicyDom)  # supervision policy
+    restarts: list = field(default_factory=list)  # tymes of restarts in window
+    tymer: typing.Any = None  # liveness Tymer
+    down: bool = False  # True means exited and not to be restarted
+    startup: dict = field(default_factory=dict)  # startup timing report
 
 
 @dataclass
@@ -223,6 +280,90 @@ class BokDom(RawDom):
     load: dict = field(default_factory=dict)  # needs to be filled
 
 
+@dataclass
+class HbtDom(RawDom):
+    """Inter Boss Crew Hand structured memo dataclass. Used for HBT memos
+    Sent periodically by Crew hand to its Boss as heartbeat of liveness.
+
+    Attributes:
+        tag (str): type of memo
+        name (str): unique identifier of crew hand
+        load (dict): empty dict
+    """
+    tag: str = 'HBT'    # type of memo
+    name: str ='hand'  # unique identifier of crew hand
+    load: dict = field(default_factory=dict)  # empty dict
+
+
+@dataclass
+class TimDom(RawDom):
+    """Inter Boss Crew Hand structured memo dataclass. Used for TIM memos
+    Sent once by Crew hand to its Boss with its startup timing report.
+
+    The load value is a dict with the seconds spent in each startup phase:
+        boot (float or None): from boss spawn to crew start target, i.e.
+            interpreter startup and imports. None when unknown
+        unpickle (float): unpickling crew doers
+        enter (float): crew Doist enter of all its doers
+
+    Attributes:
+        tag (str): type of memo
+        name (str): unique identifier of crew hand
+        load (dict): startup timing report
+    """
+    tag: str = 'TIM'    # type of memo
+    name: str ='hand'  # unique identifier of crew hand
+    load: dict = field(default_factory=dict)  # startup timing report
+
+
+@dataclass
+class WorkDom(RawDom):
+    """Load Field Value of JOB and RES
+
+    Attributes:
+        jid (int): job id unique to boss that submitted the job
+        data (typing.Any): JSON serializable work of JOB or result of RES
+        error (str): empty means job succeeded otherwise error message of
+                     failed job. Always empty for JOB
+    """
+    jid: int = 0  # job id unique to boss
+    data: typing.Any = None  # work of JOB or result of RES
+    error: str = ''  # non-empty means failed job
+
+
+@dataclass
+class JobDom(RawDom):
+    """Inter Boss Crew Hand structured memo dataclass. Used for JOB memos
+    Sent by Boss to a Crew hand to dispatch a unit of work.
+    The load of the JOB is a WorkDom instance with the job id and work data.
+
+    Attributes:
+        tag (str): type of memo
+        name (str): unique identifier of boss
+        load (WorkDom): job id and work
+    """
+    tag: str = 'JOB'    # type of memo
+    name: str ='boss'  # unique identifier of boss
+    load: WorkDom = field(default_factory=WorkDom)  # instance of WorkDom
+
+
+@dataclass
+class ResDom(RawDom):
+    """Inter Boss Crew Hand structured memo dataclass. Used for RES memos
+    Sent by Crew hand to its Boss with the result of a dispatched JOB.
+    The load of the RES is a WorkDom instance with the job id of the JOB and
+    either the result data or an error message.
+
+    Attributes:
+        tag (str): type of memo
+        name (str): unique identifier of crew hand
+        load (WorkDom): job id and result or error
+    """
+    tag: str = 'RES'    # type of memo
+    name: str ='hand'  # unique identifier of crew hand
+    load: WorkDom = field(default_factory=WorkDom)  # instance of WorkDom
+
+
 @dataclass(frozen=True)
 class TagDomCodex(IceMapDom):
     """Codex keyed by memo tag with value of associated MemoDom subclass.
@@ -235,12 +376,20 @@ class TagDomCodex(IceMapDom):
         ACK (type[AckDom]): AckDom
         END (type[EndDom]): EndDom
         BOK (type[BokDom]): BokDom
+        JOB (type[JobDom]): JobDom
+        RES (type[ResDom]): ResDom
+        HBT (type[HbtDom]): HbtDom
+        TIM (type[TimDom]): TimDom
 
     """
     REG: type[RegDom] = RegDom  # value is class not instance
     ACK: type[AckDom] = AckDom  # value is class not instance
     END: type[EndDom] = EndDom  # value is class not instance
     BOK: type[BokDom] = BokDom  # value is class not instance
+    JOB: type[JobDom] = JobDom  # value is class not instance
+    RES: type[ResDom] = ResDom  # value is class not instance
+    HBT: type[HbtDom] = HbtDom  # value is class not instance
+    TIM: type[TimDom] = TimDom  # value is class not instance
 
 TagDex = TagDomCodex()  # make instance
 
@@ -442,11 +591,42 @@ class Bosser(MultiDoerBase):
                     containing both crew doist parameters for Process target
                     kwargs and Crewer parameters
                             (see Loadage._asdict() or CrewDom._asdict())
-        ctx (mp.context.SpawnContext or None): context under which to spawn processes
+        method (str): multiprocessing start method of crew hand subprocesses,
+                      either 'spawn' or 'forkserver'
+        preload (list[str]): names of modules the forkserver imports once so
+                      each forked crew hand need not import them again
+        ctx (mp.context.BaseContext): context under which to spawn processes
         crew (dict): values HandDom instances keyed by name
         crewed (bool): True means all crew members have registered memo interface
                             with this boss.
                        False means not yet
+        flight (int): max count of jobs in flight at any one crew hand
+        jobs (deque): duples (jid, work) of submitted jobs not yet dispatched
+        results (deque): quadruples (jid, data, error, name) of completed jobs
+                         where data is job result, error is empty or error
+                         message of failed job, and name is crew hand name
+        jid (int): job id of last submitted job
+        submitted (int): count of jobs submitted
+        dispatched (int): count of jobs dispatched to crew hands
+        completed (int): count of jobs completed successfully
+        failed (int): count of jobs completed with error
+        first (float | None): tyme of first submitted job. None means none yet
+        policy (PolicyDom): default supervision policy of crew hands
+        policies (dict): PolicyDom instances keyed by crew hand name that
+                         override default .policy
+        restarted (int): count of crew hand restarts
+
+
+    Class Attributes::
+
+        Flight (int): default max count of jobs in flight per crew hand
+        Method (str): default multiprocessing start method
+        Preload (tuple[str]): default forkserver preload module names
+
+    Properties::
+
+        inflight (int): count of dispatched jobs not yet completed
+        throughput (float): jobs completed per second of tyme since first job
 
 
     Inherited Properties::
@@ -457,8 +637,12 @@ class Bosser(MultiDoerBase):
 
         See MultiDoerBase Class
     """
+    Flight = 4  # default max count of jobs in flight per crew hand
+    Method = 'spawn'  # default multiprocessing start method
+    Preload = ('hio.base.multidoing', )  # default forkserver preload modules
 
-    def __init__(self, *, name='boss',loads=None, **kwa):
+    def __init__(self, *, name='boss',loads=None, flight=None, policy=None,
+                 policies=None, method=None, preload=None, **kwa):
         """Initialize instance.
 
         Inherited Parameters::  (see Doer and PeerMemoer for all)
@@ -470,13 +654,60 @@ class Bosser(MultiDoerBase):
 
             loads (list[dict]): parameters used to spinup crew hand subprocess
                                 .start(). See fields of Loadage and Bossage
+            flight (int | None): max count of jobs in flight per crew hand.
+                                 None means use default .Flight
+            policy (PolicyDom | None): default supervision policy of crew hands
+                                 None means PolicyDom() never restart
+            policies (dict | None): PolicyDom instances keyed by crew hand name
+                                 that override default policy
+            method (str | None): multiprocessing start method 'spawn' or
+                                 'forkserver'. None means use default .Method
+            preload (iterable[str] | None): names of modules for forkserver to
+                                 preload such as heavy dependencies of crew
+                                 doers. None means use default .Preload.
+                                 Preload is process wide and only takes effect
+                                 when the forkserver is first started.
 
         """
         super(Bosser, self).__init__(name=name, **kwa)
         self.loads = loads if loads is not None else []
-        self.ctx = mp.get_context('spawn')
+        self.method = method if method is not None else self.Method
+        if self.method not in ('spawn', 'forkserver'):
+            raise hioing.MultiError(f"Unsupported start method={self.method}.")
+        self.preload = list(preload if preload is not None else self.Preload)
+        self.ctx = mp.get_context(self.method)
+        if self.method == 'forkserver':
+            self.ctx.set_forkserver_preload(self.preload)
         self.crew = {}  # dict of HandDom instances keyed by crew name
         self.crewed = False  # True means crew successfully registered with boss
+        self.flight = max(1, flight if flight is not None else self.Flight)
+        self.jobs = deque()  # (jid, work) of jobs to dispatch
+        self.results = deque()  # (jid, data, error, name) of completed jobs
+        self.jid = 0  # job id of last submitted job
+        self.submitted = 0
+        self.dispatched = 0
+        self.completed = 0
+        self.failed = 0
+        self.first = None  # tyme of first submitted job
+        self.policy = policy if policy is not None else PolicyDom()
+        self.policies = dict(policies) if policies is not None else {}
+        self.restarted = 0  # count of crew hand restarts
+
+
+    @property
+    def inflight(self):
+        """Returns count of dispatched jobs not yet completed"""
+        return sum(len(dom.jobs) for dom in self.crew.values())
+
+
+    @property
+    def throughput(self):
+        """Returns jobs completed per second of tyme since first submitted job.
+        Zero when no jobs or no elapsed tyme.
+        """
+        if self.first is None or self.tyme <= self.first:
+            return 0.0
+        return (self.completed + self.failed) / (self.tyme - self.first)
 
 
 
@@ -517,16 +748,29 @@ class Bosser(MultiDoerBase):
             doers[0].name = name  # make name of Crewer same as name of crew doist
 
             if name not in self.crew:  # ensure unique by name
-                proc = self.ctx.Process(name=name,
-                                         target=self.start,
-                                         kwargs=load)
-                dom = HandDom(proc=proc, exiting=False)
-                self.crew[proc.name] = dom
-                proc.start()
+                dom = HandDom(exiting=False, load=load,
+                              policy=self.policies.get(name, self.policy))
+                self.crew[name] = dom
+                self.spawn(name)
             else:
                 raise hioing.MultiError(f"Non-unique crew hand {name=} in loads.")
 
 
+    def spawn(self, name):
+        """Start new subprocess for crew hand name from its load.
+
+        Parameters::
+
+            name (str): crew hand name of HandDom in .crew
+        """
+        dom = self.crew[name]
+        kwargs = dict(dom.load)  # pickle doers here so crew can time unpickle
+        kwargs.update(doers=pickle.dumps(kwargs["doers"]), stamp=time.time())
+        dom.proc = self.ctx.Process(name=name, target=self.start, kwargs=kwargs)
+        dom.tymer = None  # not registered yet
+        dom.proc.start()
+
+
 
     def recur(self, tyme):
         """Do 'recur' context."""
@@ -537,6 +781,8 @@ class Bosser(MultiDoerBase):
             sys.exit()
 
         self.service()
+        self.serviceCrew()
+        self.serviceJobs()
 
         if self.crewed:
             if not self.ctx.active_children():
@@ -574,6 +820,95 @@ class Bosser(MultiDoerBase):
         """Do 'abort' context."""
 
 
+    def submit(self, work):
+        """Submit job to be dispatched to least loaded crew hand.
+        Result is appended to .results when the crew hand returns it.
+
+        Parameters::
+
+            work (typing.Any): JSON serializable work of job given to the
+                               crew hand Crewer.work
+
+        Returns::
+
+            jid (int): job id of submitted job. Use to match its result
+        """
+        self.jid += 1
+        self.jobs.append((self.jid, work))
+        self.submitted += 1
+        if self.first is None:
+            self.first = self.tyme
+        return self.jid
+
+
+    def serviceCrew(self):
+        """Supervise crew hands. Kill any registered hand whose liveness tymer
+        has expired since its last heartbeat as hung. Requeue the in flight jobs
+        of any exited hand and restart it per its policy unless commanded to
+        exit or it has already been restarted policy limit times within policy
+        window. A restarted hand reregisters and then all hands get an updated
+        BOK address book. Otherwise the hand is left down.
+        """
+        for name, dom in self.crew.items():
+            if dom.exiting or dom.down:
+                continue
+
+            hung = dom.tymer is not None and dom.tymer.expired
+            if dom.proc.is_alive():
+                if not hung:
+                    continue
+                self.logger.debug("Boss name=%s killing hung hand name=%s "
+                                  "pid=%d.", self.name, name, dom.proc.pid)
+                dom.proc.kill()
+                dom.proc.join()
+
+            failed = hung or dom.proc.exitcode != 0
+            self.remNameAddr(name=name)
+            dom.tymer = None
+            while dom.jobs:  # requeue in flight jobs in order ahead of others
+                self.jobs.appendleft(dom.jobs.popitem())
+
+            policy = dom.policy
+            if (policy.restart == RestartDex.always or
+                    (policy.restart == RestartDex.failure and failed)):
+                dom.restarts = [tyme for tyme in dom.restarts
+                                if tyme > self.tyme - policy.window]
+                if len(dom.restarts) < policy.limit:
+                    self.logger.debug("Boss name=%s restarting hand name=%s "
+                                      "exitcode=%s.", self.name, name,
+                                      dom.proc.exitcode)
+                    dom.restarts.append(self.tyme)
+                    self.restarted += 1
+                    self.crewed = False  # until restarted hand reregisters
+                    self.spawn(name)
+                    continue
+
+            self.logger.debug("Boss name=%s hand name=%s down exitcode=%s.",
+                              self.name, name, dom.proc.exitcode)
+            dom.down = True
+
+
+    def serviceJobs(self):
+        """Dispatch pending jobs from .jobs to registered crew hands, each
+        to the least loaded hand with fewer than .flight jobs in flight.
+        Stops when no pending jobs or all hands are at their .flight limit.
+        """
+        while self.jobs:
+            hands = [(len(dom.jobs), name) for name, dom in self.crew.items()
+                     if not dom.exiting and len(dom.jobs) < self.flight
+                     and self.getAddr(name=name) is not None]
+            if not hands:
+                break  # all hands busy or not yet registered
+
+            count, name = min(hands)  # least loaded
+            jid, work = self.jobs.popleft()
+            self.crew[name].jobs[jid] = work
+            memo = JobDom(name=self.name,
+                          load=WorkDom(jid=jid, data=work))._asjson().decode()
+            self.memoit(memo, self.getAddr(name=name))
+            self.dispatched += 1
+
+
     def serviceRxMemos(self):
         """Service all memos in .rxms (greedy) if any
 
@@ -607,7 +942,12 @@ class Bosser(MultiDoerBase):
                 mack = AckDom(name=self.name, load=AddrDom(name=name, addr=src))._asjson().decode()
                 self.memoit(mack, dst)
 
-                if self.countNameAddr == len(self.crew):
+                if (dom := self.crew.get(name)) is not None and dom.policy.timeout is not None:
+                    dom.tymer = tyming.Tymer(tymth=self.tymth,
+                                             duration=dom.policy.timeout)
+
+                if self.countNameAddr == len([dom for dom in self.crew.values()
+                                              if not dom.down]):
                     self.crewed = True
                     self.logger.debug("Boss name=%s crewed=%s with size=%d at "
                                       "tyme=%f.", self.name, self.crewed,
@@ -621,11 +961,44 @@ class Bosser(MultiDoerBase):
                             dst = self.getAddr(name=name)
                             self.memoit(mbok, dst)
 
+            elif tag == "TIM":
+                if (dom := self.crew.get(mdom.name)) is not None:
+                    dom.startup = mdom.load
+                    self.logger.debug("Boss name=%s hand name=%s startup %s.",
+                                      self.name, mdom.name, mdom.load)
+
+            elif tag == "HBT":
+                if (dom := self.crew.get(mdom.name)) is not None and dom.tymer is not None:
+                    dom.tymer.start()  # restart liveness timeout
+
+            elif tag == "RES":
+                name = mdom.name
+                load = mdom.load
+                if (dom := self.crew.get(name)) is None or load.jid not in dom.jobs:
+                    continue  # unknown hand or job so drop memo
+
+                if src != self.getAddr(name=name):  # not from registered hand
+                    self.logger.debug("Boss name=%s dropped RES jid=%d for "
+                                      "hand name=%s from src=%s.", self.name,
+                                      load.jid, name, src)
+                    continue  # late RES from killed or spoofed hand so drop
+
+                if dom.tymer is not None:
+                    dom.tymer.start()  # result is as good as heartbeat
+
+                del dom.jobs[load.jid]
+                dom.done += 1
+                if load.error:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+                self.results.append((load.jid, load.data, load.error, name))
+
 
 
     @staticmethod
     def start(*, name='crew', tyme=0.0, tock=None, real=True, limit=None,
-               doers=None, temp=None, boss=None):
+               doers=None, temp=None, boss=None, stamp=None):
         """Process target function to spinup and run doist inside crew subprocess
         after it has been started.
 
@@ -638,12 +1011,15 @@ class Bosser(MultiDoerBase):
                         Otherwise run faster than real
             limit (float or None): crew doist seconds for max run time of doist.
                                   None means no limit.
-            doers (iterable[Doer] or None): crew doist Doer class instances
+            doers (iterable[Doer] or bytes or None): crew doist Doer class
+                                   instances or their pickle.
                                    First entry must be Crewer
             temp (bool or None): True means use temp file resources by injection.
                                 Otherwise ignore do not inject.
             boss (Bossage or None): boss info. May be filled at enter time
                                   Crewer uses to contact Bosser.
+            stamp (float or None): boss wall clock time.time() at spawn used
+                                  to time crew boot. None means unknown
 
 
         Doist must be built after process started so local tymth closure is created
@@ -658,12 +1034,23 @@ class Bosser(MultiDoerBase):
         neede. In the case of ogler this means changing ogler.level, ogler.temp
         and running ogler.reopen(temp=temp) as appropriate.
         """
+        began = time.time()
+        boot = began - stamp if stamp is not None else None
+        if isinstance(doers, bytes):
+            doers = pickle.loads(doers)
+        unpickle = time.time() - began
+        if doers and isinstance(doers[0], Crewer):  # crewer reports startup
+            doers[0].startup = dict(boot=boot, unpickle=unpickle, enter=None)
+
         logger = ogler.getLogger()  # uses ogler from subprocess scope
 
         logger.debug("Crew Start: name=%s, ppid=%d, pid=%s, module=%s, temp=%s, ogler=%s.",
                         name, os.getppid(), os.getpid(), __name__, temp, ogler.name)
         time.sleep(0.01)
 
+        if doers and isinstance(doers[0], Crewer):
+            doers[0].mark = time.time()  # crewer times enter from here
+
         doist = Doist(name=name, tyme=tyme, tock=tock, real=real, limit=limit,
                       doers=doers, temp=temp)
         try:
@@ -705,6 +1092,18 @@ class Crewer(MultiDoerBase):
         boss (Bossage or None): contact info for communicating with boss
         registered (bool): True means .path acked registered with boss memoing
                            False not yet registered
+        jobs (deque): duples (jid, work) of jobs received from boss not yet worked
+        worked (int): count of jobs worked
+        beat (float): heartbeat interval in seconds of HBT memos to boss
+        beater (Tymer | None): heartbeat Tymer created at enter time
+        startup (dict): startup timing report sent to boss in TIM memo.
+                        Filled by Bosser.start
+        mark (float | None): wall clock time before crew Doist enter.
+                        None means startup timing report already sent
+
+    Class Attributes::
+
+        Beat (float): default heartbeat interval in seconds
 
 
     Inherited Properties::
@@ -717,7 +1116,9 @@ class Crewer(MultiDoerBase):
 
     """
 
-    def __init__(self, *, name='crew', boss=None, **kwa):
+    Beat = 1.0  # default heartbeat interval in seconds
+
+    def __init__(self, *, name='crew', boss=None, beat=None, **kwa):
         """Initialize instance.
 
         Inherited Parameters::
@@ -730,12 +1131,20 @@ class Crewer(MultiDoerBase):
         Parameters::
 
             boss (Bossage): contact info for Bosser. assigned by boss at enter
+            beat (float | None): heartbeat interval in seconds.
+                                 None means use default .Beat
 
 
         """
         super(Crewer, self).__init__(name=name, **kwa)
         self.boss = boss if boss is not None else Bossage(name=None, path=None)
         self.registered = False  # True means .path acked registered with boss memoing
+        self.jobs = deque()  # (jid, work) of jobs from boss
+        self.worked = 0  # count of jobs worked
+        self.beat = beat if beat is not None else self.Beat
+        self.beater = None  # heartbeat Tymer created at enter
+        self.startup = {}  # startup timing report
+        self.mark = None  # time before crew Doist enter
 
 
     def force(self, signum, frame):  # signal handler for forced but graceful exit
@@ -776,6 +1185,7 @@ class Crewer(MultiDoerBase):
         memo = RegDom(name=self.name)._asjson().decode()
         dst = self.boss.path
         self.memoit(memo, dst)
+        self.beater = tyming.Tymer(tymth=self.tymth, duration=self.beat)
 
 
 
@@ -786,8 +1196,19 @@ class Crewer(MultiDoerBase):
         if self.graceful:  # signal handler.force caught signal so exit here
             sys.exit()
 
+        if self.mark is not None:  # first recur so crew doist enter done
+            self.startup["enter"] = time.time() - self.mark
+            self.mark = None
+            memo = TimDom(name=self.name, load=self.startup)._asjson().decode()
+            self.memoit(memo, self.boss.path)
+
         self.service()
+        self.serviceJobs()
 
+        if self.registered and self.beater.expired:
+            memo = HbtDom(name=self.name)._asjson().decode()
+            self.memoit(memo, self.boss.path)
+            self.beater.start()
 
         return False  # incomplete
 
@@ -811,6 +1232,37 @@ class Crewer(MultiDoerBase):
         """Do 'abort' context."""
 
 
+    def work(self, data):
+        """Returns result of working job with work data.
+        Raise exception to fail job with exception message as its error.
+
+        Stub override in subclass to do actual work. Default returns data.
+
+        Parameters::
+
+            data (typing.Any): work of JOB from boss
+        """
+        return data
+
+
+    def serviceJobs(self):
+        """Service all jobs in .jobs (greedy) if any by working each with
+        .work and sending its result or error back to boss as RES memo.
+        """
+        while self.jobs:
+            jid, data = self.jobs.popleft()
+            try:  # result must be JSON serializable
+                memo = ResDom(name=self.name,
+                              load=WorkDom(jid=jid, data=self.work(data)))._asjson().decode()
+            except Exception as ex:
+                self.logger.debug("Hand name=%s job jid=%d failed with %s.",
+                                  self.name, jid, ex)
+                memo = ResDom(name=self.name,
+                              load=WorkDom(jid=jid,
+                                           error=str(ex) or type(ex).__name__))._asjson().decode()
+            self.worked += 1
+            self.memoit(memo, self.boss.path)
+
 
     def serviceRxMemos(self):
         """Service all memos in .rxms (greedy) if any
@@ -847,6 +1299,11 @@ class Crewer(MultiDoerBase):
                     self.logger.debug("Hand name=%s registered with boss=%s",
                                         self.name, self.boss.name)
 
+            elif tag == "JOB":
+                name = mdom.name
+                if name == self.boss.name and src == self.boss.path:
+                    self.jobs.append((mdom.load.jid, mdom.load.data))
+
             elif tag == "BOK":
                 name = mdom.name
                 if name == self.boss.name:
@@ -857,4 +1314,7 @@ class Crewer(MultiDoerBase):
                                       self.name, self.boss.name)
                     for name, addr in load.items():
                         if name != self.name:  # don't put self in own address book
-                            self.addNameAddr(name=name, addr=addr)
+                            try:
+                                self.addNameAddr(name=name, addr=addr)
+                            except hioing.NamerError:  # restarted hand new addr
+                                self.changeAddrAtName(name=name, addr=addr)
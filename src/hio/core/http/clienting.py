@@ -1326,11 +1326,13 @@ class ClientDoer(doing.Doer):
         if self.tymth:  # Doist or DoDoer winds its doers on enter
             self.client.wind(self.tymth)
         self.client.reopen()
+        self.watch(self.client.connector.cs)
 
 
     def recur(self, tyme):
         """Service the client once per cycle."""
         self.client.service()
+        self.watch(self.client.connector.cs)  # reconnect replaces socket
 
 
     def exit(self):
@@ -550,6 +550,7 @@ class Server():
             scheme is http scheme u'http' or u'https' or empty
                 for servant and WSGI environment
             kwa needed to pass additional parameters to servant
+                such as selective=True for readiness driven servant
             tymeout is tymeout in seconds for dropping idle connections
 
         Attributes:
@@ -560,6 +561,9 @@ class Server():
             .tymeout is tymeout in seconds for dropping idle connections
             .scheme is http scheme http or https for servant and environment
             .secured is Boolean true if TLS
+            .pends is set of ca whose requestants need parsing regardless of
+                readiness such as new or reused requestants when selective
+            .busies is set of ca whose responders are in progress when selective
 
         """
         self.name = name
@@ -568,6 +572,8 @@ class Server():
         self.reqs.clear()  # items should only be assigned by valet
         self.reps = reps if reps is not None else dict()  # allows external view
         self.reps.clear()  # items should only be assigned by valet
+        self.pends = set()  # ca of requestants to parse without readiness
+        self.busies = set()  # ca of responders in progress
 
         if tymeout is None:
             tymeout = self.Tymeout
@@ -729,6 +735,8 @@ class Server():
             if ca in self.servant.ixes:
                 self.servant.ixes[ca].serviceSends()  #  send final bytes to socket
             del self.reps[ca]
+        self.pends.discard(ca)
+        self.busies.discard(ca)
         self.servant.removeIx(ca)
 
 
@@ -746,16 +754,27 @@ class Server():
 
             if ca not in self.reqs:  # point requestant.msg to incomer.rxbs
                 self.reqs[ca] = Requestant(msg=ix.rxbs, remoter=ix)
+                self.pends.add(ca)
 
             if ix.tymeout > 0.0 and ix.tymer.expired:
                 self.closeConnection(ca)
 
 
-    def serviceReqs(self):
+    def serviceReqs(self, cas=None):
         """
         Service pending requestants
+
+        Parameters:
+            cas (Iterable | None): connection addresses of requestants to
+                service such as those readable from servant select.
+                None means service all requestants in .reqs
         """
-        for ca, requestant in list(self.reqs.items()):
+        if cas is None:
+            reqs = list(self.reqs.items())
+        else:
+            reqs = [(ca, self.reqs[ca]) for ca in cas if ca in self.reqs]
+
+        for ca, requestant in reqs:
             if requestant.parser:
                 try:
                     requestant.parse()
@@ -790,13 +809,24 @@ class Server():
                     else:  # reuse
                         responder = self.reps[ca]
                         responder.reset(environ=environ)
+                    self.busies.add(ca)
 
 
-    def serviceReps(self):
+    def serviceReps(self, cas=None):
         """
         Service pending responders
+
+        Parameters:
+            cas (Iterable | None): connection addresses of responders to
+                service such as those in progress. None means service all
+                responders in .reps
         """
-        for ca, responder in list(self.reps.items()):
+        if cas is None:
+            reps = list(self.reps.items())
+        else:
+            reps = [(ca, self.reps[ca]) for ca in cas if ca in self.reps]
+
+        for ca, responder in reps:
             if responder.closed:
                 self.closeConnection(ca)
                 continue
@@ -809,6 +839,8 @@ class Server():
                 if requestant.persisted:
                     if requestant.parser is None:  # reuse
                         requestant.makeParser()  # resets requestant parser
+                        self.pends.add(ca)  # may already have pipelined request
+                    self.busies.discard(ca)
                 else:  # not persistent so close and remove requestant and responder
                     ix = self.servant.ixes[ca]
                     if not ix.txbs:  # wait for outgoing txbs to be empty
@@ -817,11 +849,24 @@ class Server():
     def service(self):
         """
         Service request response
-        """
+        When servant is selective only the requestants of readable connections
+        and the responders in progress are serviced.
+        """
+        if not self.servant.selective:
+            self.serviceConnects()
+            self.servant.serviceReceivesAllIx()
+            self.serviceReqs()
+            self.serviceReps()
+            self.servant.serviceSendsAllIx()
+            return
+
+        self.servant.serviceSelects()
         self.serviceConnects()
+        cas = self.pends | self.servant.readables  # readables consumed below
+        self.pends.clear()
         self.servant.serviceReceivesAllIx()
-        self.serviceReqs()
-        self.serviceReps()
+        self.serviceReqs(cas=cas)
+        self.serviceReps(cas=list(self.busies))
         self.servant.serviceSendsAllIx()
 
 WsgiServer = Server  # alias
@@ -1225,6 +1270,7 @@ class BareServer():
         """
         Service request response
         """
+        self.servant.serviceSelects()  # nop unless servant is selective
         self.serviceConnects()
         self.servant.serviceReceivesAllIx()
         self.serviceStewards()
@@ -1341,11 +1387,13 @@ class ServerDoer(doing.Doer):
         if self.tymth:
             self.server.wind(self.tymth)
         self.server.reopen(temp=temp)
+        self.watch(*self.server.servant.fileobjs())
 
 
     def recur(self, tyme):
         """Service the HTTP server once per recurrence."""
         self.server.service()
+        self.watch(*self.server.servant.fileobjs())  # connections come and go
 
 
     def exit(self):
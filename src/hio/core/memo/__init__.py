@@ -4,8 +4,10 @@ hio.core.memo Package
 """
 
 
-from .memoing import (Versionage, Sizage, Keyage,
+from .memoing import (Versionage, Sizage, Keyage, Pickage, Surety, Pacer,
                       MemoDex, ZeroDex, GramDex, AuthDex, SureDex, AckDex,
+                      MemoAuthDex,
                       openMemoer, Memoer, MemoerDoer,
-                      openAM, AuthMemoer, AuthMemoerDoer)
+                      openAM, AuthMemoer, AuthMemoerDoer,
+                      openSM, SureMemoer)
 
@@ -11,6 +11,7 @@ which messages are larger than  a single datagram in the underlying transport.
 
 import socket
 import errno
+import ctypes
 import math
 import uuid
 #import struct
@@ -19,9 +20,10 @@ from collections import deque, namedtuple
 from contextlib import contextmanager
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
-from dataclasses import dataclass, astuple, asdict
+from dataclasses import dataclass, astuple, asdict, field
 
 import pysodium
+import blake3
 
 from ... import hioing, help
 from ...base import tyming, doing
@@ -267,6 +269,9 @@ the gram num only appears in non-zeroth grams
 """
 Sizage = namedtuple("Sizage", "bz nz mz vz az")
 
+# Pickage is result of parsing a gram header with Memoer.pick
+Pickage = namedtuple("Pickage", "mid vid gn gc body code")
+
 @dataclass(frozen=True)
 class MemoGramCodex:
     """MemoGramCodex is codex of all varieties of MemoGram Both Codes.
@@ -283,6 +288,10 @@ class MemoGramCodex:
     GramSureAuth:    str = 'bAAH'  # non-zeroth reliable authenticated gram code (acked & signed)
     Ack:     str = 'bAAI'  # ack code to enable reliable grams
     AckAuth:    str = 'bAAJ'  # authenticated ack code to enable reliable grams (signed)
+    GramMemoAuthZero:     str = 'bAAK'  # zeroth memo authenticated gram code (memo signed)
+    GramMemoAuth:    str = 'bAAL'  # non-zeroth memo authenticated gram code (memo signed)
+    GramSureMemoAuthZero:     str = 'bAAM'  # zeroth reliable memo authenticated gram code (acked & memo signed)
+    GramSureMemoAuth:    str = 'bAAN'  # non-zeroth reliable memo authenticated gram code (acked & memo signed)
 
     def __iter__(self):
         return iter(astuple(self))
@@ -300,6 +309,8 @@ class ZeroGramCodex:
     GramAuthZero:     str = 'bAAC'  # zeroth authenticated gram code (signed)
     GramSureZero:     str = 'bAAE'  # zeroth reliable gram code (acked)
     GramSureAuthZero:     str = 'bAAG'  # zeroth reliable authenticated gram code (acked & signed)
+    GramMemoAuthZero:     str = 'bAAK'  # zeroth memo authenticated gram code (memo signed)
+    GramSureMemoAuthZero:     str = 'bAAM'  # zeroth reliable memo authenticated gram code (acked & memo signed)
 
     def __iter__(self):
         return iter(astuple(self))
@@ -316,6 +327,8 @@ class GramCodex:
     GramAuth:    str = 'bAAD'  # non-zeroth authenticated gram code (signed)
     GramSure:    str = 'bAAF'  # non-zeroth reliable gram code (acked)
     GramSureAuth:    str = 'bAAH'  # non-zeroth reliable authenticated gram code (acked & signed)
+    GramMemoAuth:    str = 'bAAL'  # non-zeroth memo authenticated gram code (memo signed)
+    GramSureMemoAuth:    str = 'bAAN'  # non-zeroth reliable memo authenticated gram code (acked & memo signed)
 
     def __iter__(self):
         return iter(astuple(self))
@@ -334,12 +347,37 @@ class AuthGramCodex:
     GramSureAuthZero:     str = 'bAAG'  # zeroth reliable authenticated gram code (acked & signed)
     GramSureAuth:    str = 'bAAH'  # non-zeroth reliable authenticated gram code (acked & signed)
     AckAuth:    str = 'bAAJ'  # authenticated ack code to enable reliable grams (signed)
+    GramMemoAuthZero:     str = 'bAAK'  # zeroth memo authenticated gram code (memo signed)
+    GramMemoAuth:    str = 'bAAL'  # non-zeroth memo authenticated gram code (memo signed)
+    GramSureMemoAuthZero:     str = 'bAAM'  # zeroth reliable memo authenticated gram code (acked & memo signed)
+    GramSureMemoAuth:    str = 'bAAN'  # non-zeroth reliable memo authenticated gram code (acked & memo signed)
 
     def __iter__(self):
         return iter(astuple(self))
 
 AuthDex = AuthGramCodex()  # Make instance
 
+
+@dataclass(frozen=True)
+class MemoAuthGramCodex:
+    """MemoAuthGramCodex is codex of all MemoAuthGram (memo authenticated) Both
+    Codes. Only the zeroth gram of a memo authenticated memo carries a signature.
+    It signs the zeroth gram header concatenated with the blake3 digest of all
+    the gram bodies in gram number order so the memo is verified once when
+    complete instead of once per gram.
+    Only provide defined codes.
+    Undefined are left out so that inclusion(exclusion) via 'in' operator works.
+    """
+    GramMemoAuthZero:     str = 'bAAK'  # zeroth memo authenticated gram code (memo signed)
+    GramMemoAuth:    str = 'bAAL'  # non-zeroth memo authenticated gram code (memo signed)
+    GramSureMemoAuthZero:     str = 'bAAM'  # zeroth reliable memo authenticated gram code (acked & memo signed)
+    GramSureMemoAuth:    str = 'bAAN'  # non-zeroth reliable memo authenticated gram code (acked & memo signed)
+
+    def __iter__(self):
+        return iter(astuple(self))
+
+MemoAuthDex = MemoAuthGramCodex()  # Make instance
+
 @dataclass(frozen=True)
 class SureGramCodex:
     """SureGramCodex is codex of all SureGram (reliable) Both Codes.
@@ -350,6 +388,8 @@ class SureGramCodex:
     GramSure:    str = 'bAAF'  # non-zeroth reliable gram code (acked)
     GramSureAuthZero:     str = 'bAAG'  # zeroth reliable authenticated gram code (acked & signed)
     GramSureAuth:    str = 'bAAH'  # non-zeroth reliable authenticated gram code (acked & signed)
+    GramSureMemoAuthZero:     str = 'bAAM'  # zeroth reliable memo authenticated gram code (acked & memo signed)
+    GramSureMemoAuth:    str = 'bAAN'  # non-zeroth reliable memo authenticated gram code (acked & memo signed)
 
     def __iter__(self):
         return iter(astuple(self))
@@ -372,6 +412,113 @@ class AckCodex:
 AckDex = AckCodex()  # Make instance
 
 
+@dataclass
+class Surety:
+    """Surety is transmit state of one reliable (Sure) memo awaiting acks.
+
+    Attributes:
+        dst (str | tuple): destination address of memo
+        grams (list[bytes]): all rended grams of memo in gram number order
+        acks (set[int]): gram numbers acknowledged by destination
+        vid (str | None): verifier ID of destination pinned by its first
+            authenticated ack. None until then.
+        nxt (int): gram number of next gram not yet sent for the first time.
+            Grams below .nxt are in flight unless acked.
+        tries (int): count of retransmissions since last ack progress
+    """
+    dst: str | tuple
+    grams: list
+    acks: set = field(default_factory=set)
+    vid: str | None = None
+    nxt: int = 0
+    tries: int = 0
+
+
+class Pacer(Tymee):
+    """Pacer is a token bucket transmit pacer for one destination whose rate
+    adapts additive increase multiplicative decrease (AIMD) style.
+
+    Tokens are bytes that refill at .rate bytes per second of tyme up to
+    .burst. A gram may be sent while any tokens remain so a gram larger than
+    the remaining tokens goes into debt instead of starving. When not wound
+    pacing is disabled and the pacer is always ready.
+
+    Class Attributes:
+        Rate (float): default initial rate in bytes per second
+        MinRate (float): floor of rate after decreases
+        MaxRate (float): ceiling of rate after increases
+        Step (float): additive rate increase in bytes per second per increase
+        Backoff (float): multiplicative rate decrease factor per decrease
+        Burst (float): default max tokens in bytes
+
+    Attributes:
+        rate (float): current refill rate in bytes per second
+        burst (float): max tokens in bytes
+        tokens (float): current tokens in bytes, may be negative when in debt
+        last (float or None): tyme of last refill
+    """
+    Rate = 4194304.0  # (2**22) bytes per second
+    MinRate = 65535.0  # one max gram per second
+    MaxRate = 1073741824.0  # (2**30) bytes per second
+    Step = 65535.0  # one max gram per second per increase
+    Backoff = 0.5
+    Burst = 262140.0  # four max grams
+
+
+    def __init__(self, *, rate=None, burst=None, **kwa):
+        """Initialize instance.
+
+        Parameters:
+            rate (float or None): initial rate in bytes per second.
+                None means use default .Rate
+            burst (float or None): max tokens in bytes. None means use .Burst
+        """
+        super().__init__(**kwa)
+        self.rate = float(rate) if rate is not None else self.Rate
+        self.burst = float(burst) if burst is not None else self.Burst
+        self.tokens = self.burst
+        self.last = self.tyme
+
+
+    def wind(self, tymth):
+        """Inject new tymist.tymth and restart refill from its tyme."""
+        super().wind(tymth)
+        self.last = self.tyme
+
+
+    @property
+    def ready(self):
+        """Refill tokens given elapsed tyme and return True when a gram may
+        be sent now, False otherwise.
+        """
+        tyme = self.tyme
+        if tyme is None:  # not wound so unpaced
+            return True
+        if self.last is None:
+            self.last = tyme
+        self.tokens = min(self.burst, self.tokens + (tyme - self.last) * self.rate)
+        self.last = tyme
+        return self.tokens > 0
+
+
+    def spend(self, size):
+        """Spend size tokens for sent bytes. Negative size refunds."""
+        self.tokens -= size
+
+
+    def increase(self):
+        """Additive increase of rate on delivery progress signal."""
+        self.rate = min(self.MaxRate, self.rate + self.Step)
+
+
+    def decrease(self):
+        """Multiplicative decrease of rate on loss or congestion signal.
+        Never decreases below .MinRate nor raises a rate already below it.
+        """
+        self.rate = max(min(self.MinRate, self.rate), self.rate * self.Backoff)
+
+
+
 class Memoer(Tymee):
     """Memoer base class subclass of Tymee that adds memogram support to a
     transport class.
@@ -463,6 +610,21 @@ class Memoer(Tymee):
         MaxGramCount (int): absolute max gram count
         BufSize (int): used to set default buffer size for transport datagram buffers
         Tymeout (float): default timeout for retry tymer(s) if any
+        BatchCount (int): default max grams per batched receive or send
+        RxTymeout (float): default tymeout for incomplete rx memo since its
+            last received gram. 0.0 means never expire
+        RxBudget (int): default max total bytes of rx gram bodies held for
+            all incomplete memos
+        SourceBudget (int): default max bytes of rx gram bodies held for
+            incomplete memos from any one source
+        Window (int): default max grams of Sure memos in flight unacked per
+            destination
+        Retries (int): default max retransmissions of a Sure memo without ack
+            progress before it fails
+        DoneCount (int): max completed Sure rx memos remembered so their
+            retransmitted grams are reacked not reassembled
+        RendCount (int): max grams queued for tx in .txgs and .txqs before
+            lazily rended memos in .txrs stop yielding more grams
 
 
     Stubbed Attributes::
@@ -481,11 +643,14 @@ class Memoer(Tymee):
 
         send(gram, dst, *, echoic=False) -> int  # send gram over transport to dst
         receive(self, *, echoic=False) -> (bytes, str or tuple or None)  # receive gram
+        receiveBatch(bn, *, echoic=False) -> list  # receive up to bn grams
+        sendBatch(grams, *, echoic=False) -> list  # send batch of (gram, dst)
 
     Attributes::
 
         version (Versionage): version for this memoir instance consisting of
                 namedtuple of form (major: int, minor: int)
+        bn (int): max grams per batched receive or send in greedy services
         rxgs (dict): keyed by mid (memoID) with value of dict where each
                 value dict holds grams from memo keyed by gram number.
                 Grams have been stripped of their headers.
@@ -499,19 +664,77 @@ class Memoer(Tymee):
                 ID str for the memo indexed by its mid (memoID). This enables
                 reattaching the vid to memo when placing fused memo in rxms deque.
                 vid is only present when signed header otherwise vid is None
+        completes (deque): mids whose gram count is known and all of whose
+                grams have been received so are ready to be fused. Only these
+                are visited when servicing .rxgs.
+        rxtymeout (float): tymeout for incomplete rx memo since its last
+                received gram. 0.0 means never expire
+        rxbudget (int): max total bytes of rx gram bodies held in .rxgs
+        srcbudget (int): max bytes of rx gram bodies held in .rxgs per source
+        sizes (dict): keyed by mid holds bytes of gram bodies held for mid
+        srcloads (dict): keyed by src holds bytes of gram bodies held for src
+        load (int): total bytes of gram bodies held in .rxgs
+        rxtymers (dict): keyed by mid holds expiry Tymer for incomplete memo
+                restarted on each received gram. Only when wound and .rxtymeout
+        dropped (int): count of incomplete memos dropped to stay in budget
+        expired (int): count of incomplete memos dropped on expiry
+        window (int): max grams of Sure memos in flight unacked per destination
+        retries (int): max retransmissions of a Sure memo without ack progress
+        sures (dict): keyed by mid holds Surety of each Sure tx memo awaiting acks
+        flights (dict): keyed by dst holds count of Sure grams in flight unacked
+        ackables (dict): keyed by mid holds src of each incomplete Sure rx memo
+        acks (dict): keyed by mid holds src of Sure rx memos to be acked on next
+                tx service. Coalesces acks to one per mid per service pass
+        dones (dict): keyed by mid holds gram count of recently completed Sure
+                rx memos. Bounded by .DoneCount
+        delivered (int): count of Sure tx memos completely acked
+        failed (int): count of Sure tx memos abandoned after .retries
+        rate (float or None): initial pacer rate in bytes per second for each
+                new destination. None means use default Pacer.Rate
+        txqs (dict): keyed by dst holds deque of grams waiting to be sent to
+                dst. Serviced round robin so one destination can not starve
+                the others. A partially sent gram remainder is put back at
+                the front of its deque as bytearray
+        pacers (dict): keyed by dst holds Pacer that paces sends to dst
+        deferred (bool): True means defer signature verification of rx grams
+                until all grams of a memo are received then verify them
+                together as a batch before fusing. False means verify each
+                gram as it is received
+        rxsgs (dict): keyed by mid holds dict of signed rx grams keyed by gram
+                number awaiting deferred batch verification
+        pends (set): mids of incomplete deferred signed memos whose zeroth gram
+                has not yet been verified and of all incomplete memo signed
+                memos whether or not deferred. Their bodies are charged to
+                .pendload not to .srcloads and .load so unverified grams
+                can only evict other unverified grams
+        pendload (int): total bytes of gram bodies held for mids in .pends.
+                Limited to .srcbudget
+        families (dict): keyed by mid holds non-zeroth gram code of the code
+                family of the first received gram of mid. Later grams of mid
+                from any other family are dropped so a memo can not mix per
+                gram signed and memo signed grams
+        forged (int): count of rx memos dropped on failed batch verification
+        binary (bool): True means rx memos are fused into bytes in .rxms for
+                binary payloads such as CBOR, MsgPack, or CESR qb2. False means
+                rx memos are utf-8 decoded into str. Tx memos in .txms may be
+                str or bytes like per memo either way
         rxms (deque): holding rx (receive) memo tuples desegmented from rxgs grams
                 each entry in deque is tuple of form:
-                (memo: str, src: str, vid: str) where:
-                memo is fused memo, src is source addr, vid is verifier ID
+                (memo: str | bytes, src: str, vid: str) where:
+                memo is fused memo, bytes when .binary, src is source addr,
+                vid is verifier ID
         txms (deque): holding tx (transmit) memo tuples to be segmented into
                 txgs grams where each entry in deque is tuple of form
-                (memo: str, dst: str, vid: str or None)
+                (memo: str | bytes, dst: str, vid: str or None)
                 memo is memo to be partitioned into gram
                 dst is dst addr for grams
                 vid is verifier id when gram is to be signed
                     (authenticated) or None otherwise
         txgs (deque): grams to transmit, each entry is duple of form:
                 (gram: bytes, dst: str).
+        txrs (deque): lazy rendings of memos waiting to be gramified, each
+                entry is duple of form (grams: Generator, dst: str). Grams are
+                pulled into .txgs as queued grams drain below .RendCount
         txbs (tuple): current transmisstion duple of form:
             (gram: bytearray, dst: str). gram bytearray may hold untransmitted
             portion when Encodesdatagram is not able to be sent all at once so can
@@ -571,6 +794,10 @@ class Memoer(Tymee):
         _echoic (bool): see echoic property
         _keep (dict): see keep property
         _oid (str or None): see vid property
+        _verkeys (dict): keyed by vid holds duple (keyage, verkey) cache of
+            raw verkey derived from keyage in .keep. Stale when keyage changes
+        _sigkeys (dict): keyed by vid holds duple (keyage, sigkey) cache of
+            raw sigkey derived from keyage in .keep. Stale when keyage changes
     """
     Version = Versionage(major=0, minor=0)  # default version
     Codex = MemoDex
@@ -578,6 +805,7 @@ class Memoer(Tymee):
     Names = {val : key for key, val in Codes.items()} # invert map code to code name
     Zedex = ZeroDex  # only zeroth gram codes for rending
     Audex = AuthDex  # signed gram codex
+    Madex = MemoAuthDex  # memo signed gram codex
 
     # dict of gram header part sizes keyed by gram codes: bz nz mz vz az
     Sizes = {
@@ -591,6 +819,10 @@ class Memoer(Tymee):
                 'bAAH': Sizage(bz=4, nz=4, mz=24, vz=0, az=88),
                 'bAAI': Sizage(bz=4, nz=4, mz=24, vz=0, az=0),
                 'bAAJ': Sizage(bz=4, nz=4, mz=24, vz=44, az=88),
+                'bAAK': Sizage(bz=4, nz=4, mz=24, vz=44, az=88),
+                'bAAL': Sizage(bz=4, nz=4, mz=24, vz=0, az=0),
+                'bAAM': Sizage(bz=4, nz=4, mz=24, vz=44, az=88),
+                'bAAN': Sizage(bz=4, nz=4, mz=24, vz=0, az=0),
              }
 
     Pairs = dict()  # pair the zeroth code with the non-zeroth code of same type
@@ -598,6 +830,8 @@ class Memoer(Tymee):
     Pairs[MemoDex.GramAuthZero] = MemoDex.GramAuth
     Pairs[MemoDex.GramSureZero] = MemoDex.GramSure
     Pairs[MemoDex.GramSureAuthZero] = MemoDex.GramSureAuth
+    Pairs[MemoDex.GramMemoAuthZero] = MemoDex.GramMemoAuth
+    Pairs[MemoDex.GramSureMemoAuthZero] = MemoDex.GramSureMemoAuth
 
     # Base2 Binary index representation of Text Base64 Char Codes
     #Bodes = ({helping.codeB64ToB2(c): c for n, c in Codes.items()})
@@ -607,6 +841,14 @@ class Memoer(Tymee):
     MaxGramSize = 65535  # (2**16-1) absolute max gram size overridden in subclass
     BufSize = 65535  # (2**16-1)  default buffersize
     Tymeout = 0.0  # tymeout in seconds, tymeout of 0.0 means ignore tymeout
+    BatchCount = 16  # default max grams per batched receive or send
+    RxTymeout = 30.0  # tymeout in seconds for incomplete rx memo, 0.0 is never
+    RxBudget = 67108864  # (2**26) max total body bytes of incomplete rx memos
+    SourceBudget = 16777216  # (2**24) max body bytes of incomplete rx memos per src
+    Window = 64  # max unacked Sure grams in flight per destination
+    Retries = 8  # max Sure retransmissions without ack progress
+    DoneCount = 1024  # max remembered completed Sure rx memos
+    RendCount = 256  # max queued tx grams before lazy rending waits
 
     @classmethod
     def makeMID(cls, code='0A'):
@@ -970,6 +1212,15 @@ class Memoer(Tymee):
                  bc=None,
                  bs=None,
                  version=None,
+                 bn=None,
+                 rxtymeout=None,
+                 rxbudget=None,
+                 srcbudget=None,
+                 window=None,
+                 retries=None,
+                 rate=None,
+                 deferred=False,
+                 binary=False,
                  rxgs=None,
                  sources=None,
                  counts=None,
@@ -1002,11 +1253,31 @@ class Memoer(Tymee):
         Parameters:
             version (Versionage): version for this memoir instance consisting of
                 namedtuple of form (major: int, minor: int)
+            bn (int or None): max grams per batched receive or send in greedy
+                services. None means use default .BatchCount
+            rxtymeout (float or None): tymeout for incomplete rx memo since its
+                last received gram. None means use default .RxTymeout
+            rxbudget (int or None): max total bytes of rx gram bodies held for
+                incomplete memos. None means use default .RxBudget
+            srcbudget (int or None): max bytes of rx gram bodies held for
+                incomplete memos per source. None means use default .SourceBudget
+            window (int or None): max grams of Sure memos in flight unacked per
+                destination. None means use default .Window
+            retries (int or None): max retransmissions of a Sure memo without
+                ack progress. None means use default .Retries
+            rate (float or None): initial pacer rate in bytes per second for
+                each destination. None means use default Pacer.Rate
+            deferred (bool): True means defer signature verification of rx
+                grams until memo complete then batch verify all its grams.
+                False means verify each gram as received
+            binary (bool): True means fuse rx memos into bytes. False means
+                fuse rx memos into utf-8 decoded str
             rxgs (dict): keyed by mid (memoID) with value of dict where each
                 value dict holds grams from memo keyed by gram number.
                 Grams have been stripped of their headers.
                 The mid appears in every gram from the same memo.
-                The value dict is keyed by the gram number gn, with value bytes.
+                The value dict is keyed by the gram number gn, with value
+                body bytes or memoryview of body in received gram bytes.
             sources (dict): keyed by mid that holds the src for the memo indexed
                 by its mid (memoID). This enables reattaching src to memo when
                 placing fused memo in rxms deque.
@@ -1066,15 +1337,46 @@ class Memoer(Tymee):
 
         # initialize attributes
         self.version = version if version is not None else self.Version
+        self.bn = max(1, int(bn)) if bn is not None else self.BatchCount
         self.rxgs = rxgs if rxgs is not None else dict()
         self.sources = sources if sources is not None else dict()
         self.counts = counts if counts is not None else dict()
         self.vids = vids if vids is not None else dict()
+        self.completes = deque()  # mids with all grams received to be fused
+        self.rxtymeout = rxtymeout if rxtymeout is not None else self.RxTymeout
+        self.rxbudget = rxbudget if rxbudget is not None else self.RxBudget
+        self.srcbudget = srcbudget if srcbudget is not None else self.SourceBudget
+        self.sizes = dict()
+        self.srcloads = dict()
+        self.load = 0
+        self.rxtymers = dict()
+        self.dropped = 0
+        self.expired = 0
+        self.window = max(1, int(window)) if window is not None else self.Window
+        self.retries = retries if retries is not None else self.Retries
+        self.sures = dict()
+        self.flights = dict()
+        self.ackables = dict()
+        self.acks = dict()
+        self.dones = dict()
+        self.delivered = 0
+        self.failed = 0
+        self.rate = rate
+        self.txqs = dict()
+        self.pacers = dict()
+        self.deferred = True if deferred else False
+        self.rxsgs = dict()
+        self.pends = set()
+        self.pendload = 0
+        self.families = dict()
+        self.forged = 0
+        self.binary = True if binary else False
         self.rxms = rxms if rxms is not None else deque()
 
         self.txms = txms if txms is not None else deque()
         self.txgs = txgs if txgs is not None else deque()
         self.txbs = txbs if txbs is not None else (bytearray(), None)
+        self.txrs = deque()
 
         self.echos = deque()  # only used in testing as echoed tx
         self.inbox = deque()  # holds complete receive memos for testing
@@ -1107,6 +1409,8 @@ class Memoer(Tymee):
 
         self._echoic = True if echoic else False
         self._keep = keep if keep is not None else dict()
+        self._verkeys = dict()
+        self._sigkeys = dict()
         self.vid = vid if vid else None
 
     @property
@@ -1280,15 +1584,36 @@ class Memoer(Tymee):
         super().wind(tymth)  # wind Tymee superclass
         for tid, tymer in self.tymers.items():
             tymer.wind(tymth)
+        for mid, tymer in self.rxtymers.items():
+            tymer.wind(tymth)
+        for dst, pacer in self.pacers.items():
+            pacer.wind(tymth)
 
 
     def serviceTymers(self):
-        """Service all retry tymers
+        """Service all retry tymers of Sure tx memos.
 
-        Must be overriden in subclass.
-        This is a stub.
+        On expiry retransmit only the grams already sent that are not yet acked
+        and restart. After .retries retransmissions without ack progress the
+        memo fails and is abandoned.
         """
-        pass
+        for mid, tymer in list(self.tymers.items()):
+            if not tymer.expired or mid not in self.sures:
+                continue
+            sure = self.sures[mid]
+            if sure.tries >= self.retries:  # give up
+                logger.error("Failed Sure memo %s to %s after %s retries.",
+                             mid, sure.dst, sure.tries)
+                self._release(mid)
+                self.failed += 1
+                continue
+
+            for gn in range(sure.nxt):  # only those sent but missing
+                if gn not in sure.acks:
+                    self.txgs.append((sure.grams[gn], sure.dst))
+            sure.tries += 1
+            self.pacer(sure.dst).decrease()  # loss signal
+            tymer.start()  # from now
 
     def wiff(self, gram):
         """Determines encoding of gram bytes header when parsing grams.
@@ -1333,6 +1658,64 @@ class Memoer(Tymee):
         raise hioing.MemoerError(f"Unexpected {sextet=} at gram head start.")
 
 
+    def verkey(self, vid):
+        """Get raw verkey for vid from cache when its keyage in .keep is
+        unchanged else derive and cache it.
+
+        Cached entries are checked against the current keyage in .keep on every
+        lookup so replacing or removing a keyage in .keep invalidates its entry.
+        Non-transferable vids without keyage have their verkey in the vid itself.
+
+        Returns:
+            verkey (bytes): raw Ed25519 public verification key
+
+        Parameters:
+            vid (str): qualified base64 of verifier ID
+        """
+        keyage = self.keep.get(vid)
+        if (cached := self._verkeys.get(vid)) and cached[0] == keyage:
+            return cached[1]
+
+        verkey, code = Memoer._decodeVID(vid)
+        if code not in ('B', ):  # not non-trans so lookup in keep
+            if not keyage:
+                self._verkeys.pop(vid, None)
+                raise hioing.MemoerVerifyError(f"Missing keyage in keep for {vid=}")
+            verkey, _ = Memoer._decodeQVK(keyage.qvk)
+        if keyage:  # only cache vids in keep so cache is bounded by keep
+            self._verkeys[vid] = (keyage, verkey)
+        else:
+            self._verkeys.pop(vid, None)
+        return verkey
+
+
+    def sigkey(self, vid):
+        """Get raw sigkey for vid from cache when its keyage in .keep is
+        unchanged else derive from its sigseed and cache it.
+
+        Returns:
+            sigkey (bytes): raw Ed25519 private signing key
+
+        Parameters:
+            vid (str): qualified base64 of verifier ID
+        """
+        keyage = self.keep.get(vid)
+        if (cached := self._sigkeys.get(vid)) and cached[0] == keyage:
+            return cached[1]
+
+        self._sigkeys.pop(vid, None)
+        if not keyage:
+            raise hioing.MemoerError(f"Invalid {vid=} for signing")
+
+        sigseed, code = self._decodeQSS(keyage.qss)  # raises MemoerError if problem
+        if code not in ('A'):
+            raise hioing.MemoerError(f"Invalid sigseed algorithm type {code=}")
+
+        verkey, sigkey = pysodium.crypto_sign_seed_keypair(sigseed)
+        self._sigkeys[vid] = (keyage, sigkey)
+        return sigkey
+
+
     def verify(self, vid, sig, ser):
         """Verify signature sig on signed part of gram, ser, using current verkey
         for vid.
@@ -1351,17 +1734,15 @@ class Memoer(Tymee):
         Parameters:
             vid (bytes or str): qualified base64 qb64b of verifier ID
             sig (bytes or str): qualified base64 qb64b signature
-            ser (bytes or str): serialization to be signed
+            ser (bytes or str or memoryview): serialization that was signed.
+                A writable memoryview such as a view into a receive buffer is
+                verified in place without copying.
 
         """
         if hasattr(vid, "decode"):  # bytes
             vid = vid.decode()  # make str
 
-        verkey, code = Memoer._decodeVID(vid)
-        if code not in ('B', ):  # not non-trans so lookup in keep
-            if not (keyage := self.keep.get(vid)):
-                raise hioing.MemoerVerifyError(f"Missing keyage in keep for {vid=}")
-            verkey, _ = Memoer._decodeQVK(keyage.qvk)  #
+        verkey = self.verkey(vid)  # raises MemoerVerifyError if missing
 
         try:  # may be correct size but not validly encoded
             rawsig, code = Memoer._decodeSGN(sig)
@@ -1374,8 +1755,15 @@ class Memoer(Tymee):
         if hasattr(ser, "encode"):  # str
             ser = ser.encode()  # make bytes
 
+        msg = ser
+        if isinstance(ser, memoryview):  # ctypes can not take view directly
+            if ser.readonly:  # must copy
+                msg = ser.tobytes()
+            else:  # zero copy ctypes array over same memory
+                msg = (ctypes.c_char * len(ser)).from_buffer(ser)
+
         try:  # _sign_verify_detached returns None if valid else raises ValueError
-            pysodium.crypto_sign_verify_detached(rawsig, ser, verkey)
+            pysodium.crypto_sign_verify_detached(rawsig, msg, verkey)
         except Exception as ex:
             raise hioing.MemoerVerifyError(f"Signature verification failed from {vid=}"
                                      f"for {sig=} on {ser=}") from ex
@@ -1383,10 +1771,11 @@ class Memoer(Tymee):
         return True
 
 
-    def pick(self, gram):
-        """Strips header from gram bytearray leaving only gram body in gram and
-        returns (mid, gn, gc). Raises MemoerError if unrecognized or invalid
-        header this includes signature verification failure when signed.
+    def pick(self, gram, *, defer=False):
+        """Parses header from gram without copying or stripping the gram and
+        returns (mid, vid, gn, gc, body) where body is a memoryview of the gram
+        body. Raises MemoerError if unrecognized or invalid header this includes
+        signature verification failure when signed.
 
         When signed the signature is computed on the body of the gram as is when
         gramified for transmission whether the body be in domain qb64b or qb2.
@@ -1403,34 +1792,46 @@ class Memoer(Tymee):
         such as framing group code and re-encoding body to 24 bit align.
 
         Returns:
-            result (tuple): tuple of form:
-                (mid: str, vid: str, gn: int, gc: int or None) where:
+            result (Pickage): namedtuple of form:
+                (mid: str, vid: str, gn: int, gc: int or None, body: memoryview,
+                 code: str) where:
                 mid is fully qualified memoID,
                 vid is verifier ID used to look up signature verification key,
                 gn is gram number,
-                gc is gram count.
-                When first gram (zeroth) returns (mid, vid, 0, gc).
-                When other gram returns (mid, vid, gn, None)
+                gc is gram count,
+                body is view of gram body between header and signature,
+                code is gram code in base64.
+                When first gram (zeroth) returns (mid, vid, 0, gc, body, code).
+                When other gram returns (mid, vid, gn, None, body, code)
+                When ack gram returns (mid, vid, gn, None, body, code) where gn
+                is the count of grams received by the acker.
                 When code has empty vid then vid is None
                 Otherwise raises MemoerError error.
 
-        When valid recognized header, strips header bytes from front of gram
-        leaving the gram body part bytearray.
+        Only the small header fields are copied out of the gram. The signed part
+        is verified in place and body is a view into gram so body is only valid
+        as long as the underlying gram buffer is not reused.
 
         Parameters:
-            gram (bytearray): memo gram from which to parse and strip its header.
+            gram (bytes | bytearray | memoryview): memo gram from which to parse
+                its header.
+            defer (bool): True means do not verify signature now because caller
+                defers verification to .verifyBatch. False means verify now
 
 
         """
+        gram = memoryview(gram)  # no copy
         curt = self.wiff(gram)  # rx gram encoding True=B2 or False=B64
         if curt:  # base2 binary encoding in triplets
             if len(gram) < 3:  # assumes len(code) must be 3 triplets (4 sextexts)
                 raise hioing.MemoerError(f"Gram length={len(gram)} to short to "
                                          f"hold code.")
-            code = helping.codeB2ToB64(gram, 4)  # code from first 4 sextets
+            code = helping.codeB2ToB64(bytes(gram[:3]), 4)  # code from first 4 sextets
             if self.authic and code not in self.Audex:  # must be signed
                 raise hioing.MemoerError(f"Unsigned gram {code =} when signed "
                                          f"required.")
+            if code not in self.Sizes:
+                raise hioing.MemoerError(f"Invalid {code=}")
 
             bz, nz, mz, vz, az = self.Sizes[code]  # bz nz mz vz az
             # head encoced as b2 means bz head part sizes (bizes) are smaller by 3/4
@@ -1447,37 +1848,21 @@ class Memoer(Tymee):
                                          f" < {oz}.")
 
 
-            gnum = gram[bz:bz+nz]  # bytearray to bytes gnum
-            gn = int.from_bytes(gnum)  # gram number/count convert to int
+            gn = int.from_bytes(gram[bz:bz+nz])  # gram number/count convert to int
             mid = encodeB64(gram[bz+nz:bz+nz+mz])  # convert to b64b
             vid = encodeB64(gram[bz+nz+mz:bz+nz+mz+vz])  # convert to b64b
-            if code in ZeroDex: # first (zeroth) gram so get gram count
-                gc = gn  # zeroth so gcnt in neck where gnum
-                gn = 0   # zeroth so gnum must be zero
-            elif code in GramDex:
-                gc = None # not provided in this gram
-                if not vid:
-                    vid = self.vids.get(mid.decode()) # if not then get from .vids
-                    vid = vid.encode() if vid is not None else b""
-            elif code in AckDex:
-                pass
-            else:
-                raise hioing.MemoerError(f"Invalid {code=}")
-
-
-            sig = encodeB64(gram[-az if az else len(gram):])   # last ss bytes are signature
-            del gram[-az if az else len(gram):]  # strip sig if any
-            sgram = bytes(gram[:])  # signed raw part make bytes copy to sign
-            del gram[:oz-az]  # strip off fore head leaving body in gram
+            sig = encodeB64(gram[len(gram)-az:]) if az else b''  # last az bytes
 
         else:  # base64 text encoding in quadlets
             if len(gram) < 4:  # assumes len(code) must be 4
                 raise hioing.MemoerError(f"Gram length={len(gram)} to short to "
                                          f"hold code.")
-            code = gram[:4].decode()  # assumes len(code) must be 2
+            code = bytes(gram[:4]).decode()  # assumes len(code) must be 4
             if self.authic and code not in self.Audex:  # must be signed
                 raise hioing.MemoerError(f"Unsigned gram {code =} when signed "
                                          f"required.")
+            if code not in self.Sizes:
+                raise hioing.MemoerError(f"Invalid {code=}")
             bz, nz, mz, vz, az = self.Sizes[code]  # bz nz mz vz az
             oz =  bz + nz + mz  + vz + az
 
@@ -1485,32 +1870,33 @@ class Memoer(Tymee):
                 raise hioing.MemoerError(f"Not enough rx bytes for b64 gram"
                                          f" < {oz}.")
 
-            gnum = bytes(gram[bz:bz+nz])  # qb64b short part of neck
-            gn = helping.b64ToInt(gnum)
-            mid = bytes(gram[bz+nz:bz+nz+mz])  # bytearray to bytes qb64b with prefix
-            vid = bytes(gram[bz+mz+nz:bz+mz+nz+vz]) #bytearry to bytes qb64b convert to qb64
-            if code in ZeroDex: # first (zeroth) gram so get gram count
-                gc = gn  # zeroth so gcnt in neck where gnum
-                gn = 0   # zeroth so gnum must be zero
-            elif code in GramDex:
-                gc = None # not provided in this gram
-                if not vid:
-                    vid = self.vids.get(mid.decode()) # if not then get from .vids
-                    vid = vid.encode() if vid is not None else b""
-            elif code in AckDex:
-                pass
-            else:
-                raise hioing.MemoerError(f"Invalid {code=}")
+            gn = helping.b64ToInt(bytes(gram[bz:bz+nz]))  # qb64b short part of neck
+            mid = bytes(gram[bz+nz:bz+nz+mz])  # qb64b with prefix
+            vid = bytes(gram[bz+mz+nz:bz+mz+nz+vz])  # qb64b
+            sig = bytes(gram[len(gram)-az:]) if az else b''  # last az bytes
+
+        if code in ZeroDex: # first (zeroth) gram so get gram count
+            gc = gn  # zeroth so gcnt in neck where gnum
+            gn = 0   # zeroth so gnum must be zero
+        elif code in GramDex:
+            gc = None # not provided in this gram
+            if not vid:
+                vid = self.vids.get(mid.decode()) # if not then get from .vids
+                vid = vid.encode() if vid is not None else b""
+        elif code in AckDex:
+            gc = None
+        else:
+            raise hioing.MemoerError(f"Invalid {code=}")
 
-            sig = bytes(gram[-az if az else len(gram):])  # last az bytes signature
-            del gram[-az if az else len(gram):]  # strip sig if any
-            sgram = bytes(gram[:]) # signed raw part make bytes copy to sign
-            del gram[:oz-az]  # strip of fore head leaving body in gram
+        sgram = gram[:len(gram)-az]  # signed part view, excludes sig if any
+        body = sgram[oz-az:]  # view of body between head and sig
 
-        if sig:  # signature not empty when Auth code sig is never empty
+        # memo signed sig is verified by .verifyBatch once memo is complete
+        if sig and not defer and code not in self.Madex:  # Auth code sig is never empty
             self.verify(vid, sig, sgram)  # raises MemoerVerifyError if invalid
 
-        return (mid.decode(), vid.decode() if vid else None, gn, gc)
+        return Pickage(mid=mid.decode(), vid=vid.decode() if vid else None,
+                       gn=gn, gc=gc, body=body, code=code)
 
 
     def receive(self, *, echoic=False) -> (bytes, str or tuple or None):
@@ -1588,35 +1974,269 @@ class Memoer(Tymee):
         if not gram:  # no received data
             return False  # so try again later
 
-        gram = bytearray(gram)  # make copy bytearray so can strip off header
+        self._absorbGram(gram, src)
+        return True  # received data so can try again now
+
+
+    def receiveBatch(self, bn, *, echoic=False):
+        """Attempts to receive up to bn grams from remote sources.
+
+        Fallback batch receive that repeatedly calls .receive until either bn
+        grams are received or there is nothing more to receive. Override in
+        transport subclass that can receive many datagrams into preallocated
+        buffers per call.
+
+        Returns:
+            grams (list[tuple]): of received duples of form
+                (gram: bytes | memoryview, src: str | tuple) in order received.
+                Empty list when nothing received. A memoryview gram may be
+                over a reused buffer so is only valid until the next call.
+
+        Parameters:
+            bn (int): max number of grams to receive
+            echoic (bool): True means use .echos in .receive debugging purposes
+                where echo is duple of form (gram: bytes, src: str). False means
+                do not use .echos.
+        """
+        grams = []
+        while len(grams) < bn:
+            gram, src = self.receive(echoic=echoic)  # (b'', None) when empty
+            if not gram:
+                break
+            grams.append((gram, src))
+        return grams
+
+
+    def _serviceBatchReceived(self, *, echoic=False):
+        """Service one batch of up to .bn received (gram, src) duples.
+
+        Returns:
+            bool: True means a full batch was received so greedy callers should
+                call again; False means the transport is drained so try again later.
+
+        Parameters:
+            echoic (bool): True means use .echos in .receive debugging purposes
+                where echo is duple of form (gram: bytes, src: str). False means
+                do not use .echos.
+        """
+        grams = self.receiveBatch(self.bn, echoic=echoic)
+        for gram, src in grams:
+            self._absorbGram(gram, src)
+        return (len(grams) >= self.bn)  # full batch so may be more waiting
+
+
+    def _absorbGram(self, gram, src):
+        """Parse received gram from src and save its body into .rxgs to be
+        fused later. Invalid grams are logged and dropped.
+
+        The header is parsed in place. When gram is bytes its body is saved as
+        a view into gram without copying. When gram is a memoryview it may be
+        over a reused receive buffer so only its body is copied out.
+
+        When .deferred signature verification is deferred until the memo is
+        complete so a non bytes gram is copied whole instead and its signed
+        gram kept in .rxsgs for .verifyBatch. Acks and zeroth grams that are
+        signed per gram are never deferred. Until the zeroth gram of a deferred
+        signed memo is verified its bodies are charged to .pendload instead of
+        the budget of its src. Likewise the bodies of a memo signed memo are
+        charged to .pendload whether or not .deferred since its signature is
+        only verifiable once the memo is complete.
+
+        Parameters:
+            gram (bytes | bytearray | memoryview): received gram with header
+            src (str | tuple): source address of gram
+        """
+        if self.deferred and not isinstance(gram, bytes):
+            gram = bytes(gram)  # whole gram copy so body is view into it
 
         try:
-            mid, vid, gn, gc = self.pick(gram)  # parse and strip off head leaving body
+            mid, vid, gn, gc, body, code = self.pick(gram, defer=self.deferred)
+            if self.deferred and (code in AckDex or (gc is not None and
+                                                     code not in self.Madex)):
+                self.pick(gram)  # acks and zeroth never deferred so verify now
         except hioing.MemoerError as ex: # invalid gram so drop
             # may be bad signature when signed or unrecognized header format
             logger.error("Invalid Memoer gram from %s.\n %s.", src, ex)
-            return True  # did receive data so can try again now
+            return
+
+        if code in AckDex:
+            self._absorbAck(mid, body, src=src, vid=vid, code=code)
+            return
+
+        family = self.Pairs.get(code, code)  # non-zeroth code of code family
+        if self.families.get(mid, family) != family:  # mixed so forged
+            logger.error("Dropped Memoer gram of %s from %s with code=%s not "
+                         "of family %s.", mid, src, code, self.families[mid])
+            return
+
+        if code in SureDex:  # ack every sure gram even duplicates
+            self.acks[mid] = src
+            if mid in self.dones:  # already fused so only reack
+                return
+            self.ackables[mid] = src
+
+        if gc is not None and mid not in self.counts:  # new count so check
+            # non-zeroth bodies are never smaller than zeroth except last
+            least = len(body) * (gc - 1) + (1 if gc > 1 else len(body))
+            if least > min(self.srcbudget, self.rxbudget):  # can never fit
+                logger.error("Dropped Memoer memo %s from %s with gram count"
+                             " %s over budget.", mid, src, gc)
+                self.dropped += 1
+                if mid in self.rxgs:
+                    self._discard(mid)
+                return
+
+        # unverified until zeroth verified or whole memo verified when memo
+        # signed which can never be until all its grams are received
+        pend = code in self.Madex or (self.deferred and code in self.Audex and
+                                      gc is None)
 
         if mid not in self.rxgs:
             self.rxgs[mid] = dict()
+            self.sizes[mid] = 0
+            self.families[mid] = family  # pin code family of mid
+            if pend:
+                self.pends.add(mid)
+        else:  # least recently received first so move to end
+            self.rxgs[mid] = self.rxgs.pop(mid)
 
-        # save stripped gram to be fused later
+        # assumes unique mid across all possible sources. No replay by different
+        # source only first source for a given mid is ever recognized
+        if mid not in self.sources:  # make idempotent first only no replay
+            self.sources[mid] = src  # save source for later
+
+        if mid in self.pends and not pend:  # zeroth verified so charge src
+            self.pends.discard(mid)
+            self.pendload -= self.sizes[mid]
+            first = self.sources[mid]
+            self.srcloads[first] = self.srcloads.get(first, 0) + self.sizes[mid]
+            self.load += self.sizes[mid]
+            if not self._budget(mid):  # mid itself evicted
+                return
+
+        if mid in self.rxtymers:
+            self.rxtymers[mid].start()  # from now
+        elif self.rxtymeout and self.tymth:
+            self.rxtymers[mid] = Tymer(tymth=self.tymth, duration=self.rxtymeout)
+
+        # save body to be fused later
+        added = False
         if gn not in self.rxgs[mid]:  # make idempotent first only no replay
-            self.rxgs[mid][gn] = gram  # index body by its gram number
+            if not isinstance(gram, bytes):  # buffer may be reused or mutated
+                body = body.tobytes()  # so copy body only
+            self.rxgs[mid][gn] = body  # index body by its gram number
+            if code in self.Madex:  # memo signed so keep zeroth to verify later
+                if gn == 0:
+                    self.rxsgs.setdefault(mid, dict())[gn] = bytes(gram)
+            elif self.deferred and code in self.Audex and gc is None:
+                self.rxsgs.setdefault(mid, dict())[gn] = gram  # verify later
+            added = True
+            self.sizes[mid] += len(body)
+            if mid in self.pends:  # unverified so not charged to src
+                self.pendload += len(body)
+            else:
+                src = self.sources[mid]
+                self.srcloads[src] = self.srcloads.get(src, 0) + len(body)
+                self.load += len(body)
+            if not self._budget(mid):  # mid itself evicted
+                return
 
         if gc is not None:
             if mid not in self.counts:  # make idempotent first only no replay
                 self.counts[mid] = gc  # save gram count for mid
+                added = True
 
-        if mid not in self.vids:
+        # only newly completed mids are queued to be fused
+        if added and mid in self.counts and len(self.rxgs[mid]) >= self.counts[mid]:
+            self.completes.append(mid)
+
+        if self.vids.get(mid) is None:  # zeroth gram may arrive after others
             self.vids[mid] = vid
 
-        # assumes unique mid across all possible sources. No replay by different
-        # source only first source for a given mid is ever recognized
-        if mid not in self.sources:  # make idempotent first only no replay
-            self.sources[mid] = src  # save source for later
 
-        return True  # received valid so can try again now
+    def _budget(self, mid):
+        """Evict least recently received incomplete memos until the load of
+        the source of mid and the total load are within budget. Unverified
+        memos in .pends are evicted only to keep .pendload within .srcbudget
+        so they never evict verified memos.
+
+        Returns:
+            kept (bool): True means mid itself was kept. False means mid was
+                evicted.
+
+        Parameters:
+            mid (str): memo ID of most recently received gram
+        """
+        while self.pendload > self.srcbudget:  # least recent unverified
+            self._evict(next(m for m in self.rxgs if m in self.pends))
+
+        src = self.sources[mid]
+        while self.srcloads.get(src, 0) > self.srcbudget:  # least recent from src
+            lru = next(m for m in self.rxgs
+                       if self.sources[m] == src and m not in self.pends)
+            self._evict(lru)
+
+        while self.load > self.rxbudget:  # least recent verified from any src
+            self._evict(next(m for m in self.rxgs if m not in self.pends))
+
+        return mid in self.rxgs
+
+
+    def _evict(self, mid):
+        """Drop incomplete memo mid to stay within budget and count it.
+
+        Parameters:
+            mid (str): memo ID to drop
+        """
+        logger.error("Dropped Memoer memo %s from %s over budget.",
+                     mid, self.sources.get(mid))
+        self._discard(mid)
+        self.dropped += 1
+
+
+    def _discard(self, mid):
+        """Remove all reassembly state for mid and release its load.
+
+        Parameters:
+            mid (str): memo ID to remove
+        """
+        size = self.sizes.pop(mid, 0)
+        src = self.sources.pop(mid, None)
+        if mid in self.pends:  # unverified so charged to .pendload
+            self.pends.discard(mid)
+            self.pendload -= size
+        else:
+            if src in self.srcloads:
+                self.srcloads[src] -= size
+                if self.srcloads[src] <= 0:
+                    del self.srcloads[src]
+            self.load -= size
+        self.rxgs.pop(mid, None)
+        self.counts.pop(mid, None)
+        self.vids.pop(mid, None)
+        self.rxtymers.pop(mid, None)
+        self.ackables.pop(mid, None)
+        self.rxsgs.pop(mid, None)
+        self.families.pop(mid, None)
+
+
+    def _serviceRxExpiries(self):
+        """Drop incomplete memos whose rx tymer has expired and count them.
+
+        .rxgs is ordered least recently received first and each rx tymer is
+        restarted on every received gram so expiry stops at the first
+        unexpired tymer.
+        """
+        for mid in list(self.rxgs):
+            tymer = self.rxtymers.get(mid)
+            if tymer is None:  # not wound when created so never expires
+                continue
+            if not tymer.expired:
+                break
+            logger.info("Expired Memoer memo %s from %s.", mid,
+                        self.sources.get(mid))
+            self._discard(mid)
+            self.expired += 1
 
 
     def serviceReceivesOnce(self, *, echoic=False):
@@ -1633,7 +2253,7 @@ class Memoer(Tymee):
 
 
     def serviceReceives(self, *, echoic=False):
-        """Service all receives (greedy) and queue up
+        """Service all receives (greedy) in batches of up to .bn grams and queue up
 
         Parameters:
             echoic (bool): True means use .echos in .receive debugging purposes
@@ -1642,16 +2262,22 @@ class Memoer(Tymee):
                             indicates nothing to receive of form (b'', None)
         """
         while self.opened:
-            if not self._serviceOneReceived(echoic=echoic):
+            if not self._serviceBatchReceived(echoic=echoic):
                 break
 
 
-    def fuse(self, grams, cnt):
+    def fuse(self, grams, cnt, *, kind=str):
         """Fuse cnt gram body parts from grams dict into whole memo . If any
         grams are missing then returns None.
 
+        The bodies are copied once into a single buffer preallocated to the
+        total body size of all cnt grams. For bytes that buffer is the
+        returned bytes so no further copy is made.
+
         Returns:
-            memo (str or None): fused memo or None if incomplete.
+            memo (str | bytes | memoryview | None): fused memo of type kind
+                or None if incomplete. A memoryview is over the preallocated
+                buffer so no further copy is made.
 
         Override in subclass
 
@@ -1659,53 +2285,138 @@ class Memoer(Tymee):
             grams (dict): memo gram body parts each keyed by gram number from which
                           to fuse memo. Headers have been stripped.
             cnt (int): gram count for mid
+            kind (type): type of returned memo one of str, bytes, or memoryview
         """
         if len(grams) < cnt:  # must be missing one or more grams
             return None
 
-        memo = bytearray()
-        for i in range(cnt):  # iterate in numeric order, items are insertion ordered
-            memo.extend(grams[i])  # extend memo with gram body part at gram i
+        try:
+            parts = [grams[i] for i in range(cnt)]  # in numeric order
+        except KeyError:  # must be missing one or more grams
+            return None
+
+        if kind is bytes:
+            return b''.join(parts)  # one copy into preallocated bytes
+
+        memo = bytearray(sum(len(part) for part in parts))  # preallocate
+        view = memoryview(memo)
+        i = 0
+        for part in parts:
+            view[i:i + len(part)] = part  # copy gram body part into place
+            i += len(part)
 
+        if kind is memoryview:
+            return view
         return memo.decode()  # convert bytearray to str
 
 
+    def _split(self, gram, code):
+        """Split signed gram into its header and its signature.
+
+        Returns:
+            duple (tuple): (head: bytes, sig: bytes) where sig is qb64b
+
+        Parameters:
+            gram (bytes): signed gram in either base2 or base64
+            code (str): gram code of gram
+        """
+        bz, nz, mz, vz, az = self.Sizes[code]
+        hz = bz + nz + mz + vz
+        if self.wiff(gram):  # base2 so sizes smaller by 3/4
+            hz = 3 * hz // 4
+            az = 3 * az // 4
+            return (gram[:hz], encodeB64(gram[len(gram)-az:]))
+        return (gram[:hz], gram[len(gram)-az:])
+
+
+    def verifyBatch(self, mid):
+        """Verify together the signatures of all deferred signed grams of
+        complete memo mid held in .rxsgs. Each signer's key material is looked
+        up once from cache so the batch does no per gram key derivation.
+        When memo signed only its zeroth gram is held and its signature is
+        verified once on its header and the rolling blake3 digest of all the
+        gram bodies of mid. A memo signed mid must hold its zeroth gram.
+        When any gram fails the whole memo is dropped.
+
+        Returns:
+            result (bool): True means all grams of mid verified. False means
+                some gram failed verification so mid was dropped
+
+        Parameters:
+            mid (str): memo ID of complete memo
+        """
+        try:
+            sgrams = self.rxsgs.get(mid, {})
+            if self.families.get(mid) in self.Madex and 0 not in sgrams:
+                raise hioing.MemoerVerifyError("Missing memo signed zeroth "
+                                               "gram.")
+            for gn, gram in sgrams.items():
+                _, vid, _, _, _, code = self.pick(gram, defer=True)
+                if code in self.Madex:  # memo signed
+                    head, sig = self._split(gram, code)
+                    hasher = blake3.blake3()
+                    for i in range(self.counts[mid]):  # rolling over bodies
+                        hasher.update(self.rxgs[mid][i])
+                    self.verify(vid, sig, head + hasher.digest())
+                else:
+                    self.pick(gram)  # raises MemoerVerifyError if invalid
+        except hioing.MemoerError as ex:
+            logger.error("Dropped Memoer memo %s from %s on failed batch "
+                         "verify.\n %s.", mid, self.sources.get(mid), ex)
+            self.forged += 1
+            self._discard(mid)
+            return False
+
+        self.rxsgs.pop(mid, None)
+        return True
+
 
     def _serviceOnceRxGrams(self):
-        """Service one pass over .rxgs dict for each unique mid in .rxgs
+        """Service one pass over .completes deque fusing each newly completed
+        mid in .rxgs. Incomplete mids are not revisited.
 
         Deleting an item from a dict at a key (since python dicts are key
         insertion ordered) means that the next time an item is created it will
         be last.
         """
-        for i, mid in enumerate(list(self.rxgs.keys())):  # items may be deleted in loop
-            # if mid then grams dict at mid must not be empty
-            if not mid in self.counts:  # missing first gram so skip
+        while self.completes:
+            mid = self.completes.popleft()
+            if mid not in self.rxgs or mid not in self.counts:  # already fused
+                continue
+            if ((mid in self.rxsgs or self.families.get(mid) in self.Madex)
+                    and not self.verifyBatch(mid)):  # forged
                 continue
-            memo = self.fuse(self.rxgs[mid], self.counts[mid])
+            memo = self.fuse(self.rxgs[mid], self.counts[mid],
+                             kind=bytes if self.binary else str)
             if memo is not None:  # allows for empty "" memo for some src
                 self.rxms.append((memo, self.sources[mid], self.vids[mid]))
-                del self.rxgs[mid]
-                del self.counts[mid]
-                del self.sources[mid]
-                del self.vids[mid]
+                if mid in self.ackables:  # remember so retransmits are reacked
+                    self.dones[mid] = self.counts[mid]
+                    self.acks[mid] = self.ackables[mid]  # final full ack
+                    while len(self.dones) > self.DoneCount:
+                        del self.dones[next(iter(self.dones))]
+                self._discard(mid)
 
 
     def serviceRxGramsOnce(self):
-        """Service one pass (non-greedy) over all unique sources in .rxgs
+        """Service one pass (non-greedy) over all newly completed mids in .rxgs
         dict if any for received incoming grams.
         """
-        if self.rxgs:
+        if self.completes:
             self._serviceOnceRxGrams()
+        if self.rxtymers:
+            self._serviceRxExpiries()
 
 
     def serviceRxGrams(self):
-        """Service one pass (non-greedy) over all unique sources in .rxgs
+        """Service one pass (non-greedy) over all newly completed mids in .rxgs
         dict if any for received incoming grams.  No different from
-        serviceRxGramsOnce because service all mids each pass.
+        serviceRxGramsOnce because service all completed mids each pass.
         """
-        if self.rxgs:
+        if self.completes:
             self._serviceOnceRxGrams()
+        if self.rxtymers:
+            self._serviceRxExpiries()
 
 
     def _serviceOneRxMemo(self):
@@ -1758,16 +2469,60 @@ class Memoer(Tymee):
 
 
     def memoit(self, memo, dst, vid=None):
-        """Append (memo, dst, vid) tuple to .txms deque
+        """Append (memo, dst, vid) tuple to .txms deque once memo and its
+        signer are validated by .vetMemo so a bad memo is rejected here
+        instead of failing later while queued.
+
+        Raises MemoerError when memo or signer is invalid
 
         Parameters:
-            memo (str): to be segmented and packed into gram(s)
+            memo (str | bytes | bytearray | memoryview): to be segmented and
+                packed into gram(s). A bytes like memo is not copied so must not
+                be mutated until it has been gramified
             dst (str): address of remote destination of memo
             vid (str or None): verifier ID for verifying signature on grams
         """
+        self.vetMemo(memo, vid)
         self.txms.append((memo, dst, vid))
 
 
+    def vetMemo(self, memo, vid=None):
+        """Validate memo and its signer for rending with .code without rending.
+
+        Raises MemoerError when memo is not str or bytes like, when memo
+        exceeds the max memo size for .size, or when .code is signed and vid
+        is missing, invalid, or has no signing key in .keep.
+
+        Parameters:
+            memo (str | bytes | bytearray | memoryview): to be rended
+            vid (str or None): verifier ID when gram is to be signed.
+                None means use own .vid
+        """
+        if hasattr(memo, "encode"):  # str
+            ml = len(memo.encode())
+        else:
+            try:
+                ml = memoryview(memo).nbytes
+            except TypeError as ex:
+                raise hioing.MemoerError(f"Invalid memo type={type(memo)}") from ex
+
+        zoz = sum(self.Sizes[self.code])  # overhead on zeroth gram
+        noz = sum(self.Sizes[self.Pairs[self.code]])  # overhead on non-zeroth
+        if self.curt:  # base2 head part sizes smaller by 3/4
+            zoz, noz = 3 * zoz // 4, 3 * noz // 4
+        mms = min(self.MaxMemoSize,
+                  (self.size - noz) * (self.MaxGramCount - 1) + self.size - zoz)
+        if ml > mms:
+            raise hioing.MemoerError(f"Memo length={ml} exceeds max={mms}")
+
+        _, _, _, vz, az = self.Sizes[self.code]
+        vid = vid if vid is not None else self.vid
+        if vz and (not vid or len(vid) != vz):
+            raise hioing.MemoerError(f"Missing or invalid {vid=} for {vz=}")
+        if az:
+            self.sigkey(vid)  # raises MemoerError if no signing key
+
+
     def sign(self, vid, ser):
         """Sign serialization ser using private sigkey for verifier ID vid and return
         signature in serialized format defined by .curt
@@ -1793,18 +2548,11 @@ class Memoer(Tymee):
         if hasattr(vid, "decode"):  # bytes
             vid = vid.decode()  # make str
 
-        if vid not in self.keep:
-            raise hioing.MemoerError(f"Invalid {vid=} for signing")
-
-        qvk, qss = self.keep[vid]
-        sigseed, code = self._decodeQSS(qss)  # raises MemoerError if problem
-        if code not in ('A'):
-            raise hioing.MemoerError(f"Invalid sigseed algorithm type {code=}")
+        sigkey = self.sigkey(vid)  # raises MemoerError if problem
 
         if hasattr(ser, "encode"):  # str
             ser = ser.encode()  # make bytes
 
-        verkey, sigkey = pysodium.crypto_sign_seed_keypair(sigseed)
         raw = pysodium.crypto_sign_detached(ser, sigkey)  # raw sig
         sig = self._encodeSGN(raw).encode()  # raise MemoerError if problem
 
@@ -1814,23 +2562,60 @@ class Memoer(Tymee):
         return sig
 
 
-    def rend(self, memo, vid=None):
+    def rend(self, memo, vid=None, mid=None):
         """Partition memo into packed grams with headers.
 
         Returns:
             grams (list[bytes]): list of grams with headers.
 
         Parameters:
-            memo (str): to be partitioned into grams with headers
+            memo (str | bytes | bytearray | memoryview): to be partitioned into
+                grams with headers. str is utf-8 encoded
             vid (str or None): verifier ID when gram is to be signed, used to
                               lookup sigkey to sign.
                               None means not signable
+            mid (str or None): memo ID for grams. None means make new one
+
+        See .rendit
+        """
+        return list(self.rendit(memo, vid=vid, mid=mid))
+
+
+    def rendit(self, memo, vid=None, mid=None):
+        """Partition memo into packed grams with headers lazily. The memo is
+        validated now and a generator is returned that yields each gram as
+        it is needed so the grams of a large memo need not all be in memory.
+
+        The memo is segmented through a memoryview so the memo is never
+        copied nor shifted. Each gram is built with a single copy of its body
+        slice into the gram. A bytes like memo is not copied at all so it must
+        not be mutated until the generator is exhausted. A str memo is utf-8
+        encoded once.
+
+        Returns:
+            grams (Generator[bytes]): yields grams with headers in gram number
+                order
+
+        Parameters:
+            memo (str | bytes | bytearray | memoryview): to be partitioned into
+                grams with headers. str is utf-8 encoded
+            vid (str or None): verifier ID when gram is to be signed, used to
+                              lookup sigkey to sign.
+                              None means not signable
+            mid (str or None): memo ID for grams. None means make new one
 
         Note zeroth gram assumes gram num is zero and neck is gram count whereas
         non-zeroth gram uses neck for gram num.
+
+        When .code is memo signed (in .Madex) only the zeroth gram is signed.
+        Its signature is on its header concatenated with the blake3 digest of
+        the whole memo, that is, of all the gram bodies in gram number order.
         """
-        grams = []
-        memo = bytearray(memo.encode()) # convert and copy to bytearray
+        if hasattr(memo, "encode"):  # str
+            memo = memo.encode()  # convert to bytes
+        memo = memoryview(memo)  # no copy
+        if memo.format != 'B' or memo.ndim != 1:
+            memo = memo.cast('B')  # flat view of raw bytes
 
         zcode = self.code  # zeroth gram code
         zbz, znz, zmz, zvz, zaz = self.Sizes[zcode]  # bz nz mz vz az
@@ -1844,7 +2629,7 @@ class Memoer(Tymee):
         if zvz and (not vid or len(vid) != zvz):
             raise hioing.MemoerError(f"Missing or invalid {vid=} for {zvz=}")
 
-        mid = self.makeMID()
+        mid = mid if mid is not None else self.makeMID()
         if len(mid) != zmz:
             raise hioing.MemoerError(f"Invalid {mid=} for {zmz=}")
 
@@ -1880,18 +2665,47 @@ class Memoer(Tymee):
         else:
             gcnt = helping.intToB64b(gc, l=znz)  # gcnt as b64 bytes
 
-        gn = 0
-        while memo:
+        zhead = zcodeb + gcnt + midb
+        if zvz:
+            zhead += vidb
+        msig = b''
+        if zaz and zcode in self.Madex:  # memo signed on digest of bodies
+            msig = self.sign(vid, zhead + blake3.blake3(memo).digest())
+
+        ntail = midb + vidb if nvz else midb  # non-zeroth header after neck
+        return self._rendGrams(memo, vid, zhead, msig, zbz, zaz,
+                               ncodeb, ntail, nbz, naz, znz)
+
 
+    def _rendGrams(self, memo, vid, zhead, msig, zbz, zaz,
+                   ncodeb, ntail, nbz, naz, znz):
+        """Generator of grams for .rendit. Each gram is joined from its header,
+        body slice view of memo, and signature if any so its body is copied
+        once into the gram and once more when appending a per gram signature.
+
+        Parameters:
+            memo (memoryview): flat view of memo bytes
+            vid (str or None): verifier ID used to sign
+            zhead (bytes): zeroth gram header
+            msig (bytes): memo signature for zeroth gram when memo signed
+                else empty
+            zbz (int): max zeroth gram body size
+            zaz (int): zeroth gram signature size
+            ncodeb (bytes): non-zeroth gram code
+            ntail (bytes): non-zeroth gram header after gram num
+            nbz (int): max non-zeroth gram body size
+            naz (int): non-zeroth gram signature size
+            znz (int): neck size
+        """
+        i = 0  # offset of next body in memo
+        gn = 0
+        ml = len(memo)
+        while i < ml:
             if gn == 0:
-                head = zcodeb + gcnt + midb
-                if zvz:
-                    head += vidb
-                gram = head + memo[:zbz]  # copy slice past end just copies to end
-                del memo[:zbz]  # del slice past end just deletes to end
+                gram = b''.join((zhead, memo[i:i + zbz]))  # copy body slice into gram
+                i += zbz
                 if zaz:  # signed gram, .sign returns proper sig format when .curt
-                    sig = self.sign(vid, gram) # raises MemoerError if invalid
-                    gram = gram + sig
+                    gram = b''.join((gram, msig if msig else self.sign(vid, gram)))
 
             else:
                 if self.curt:
@@ -1899,20 +2713,14 @@ class Memoer(Tymee):
                 else:
                     gnum = helping.intToB64b(gn, l=znz)  # gnum as b64 bytes
 
-                head = ncodeb + gnum + midb
-                if nvz:
-                    head += vidb
-                gram = head + memo[:nbz]  # copy slice past end just copies to end
-                del memo[:nbz]  # del slice past end just deletes to end
+                gram = b''.join((ncodeb, gnum, ntail, memo[i:i + nbz]))  # copy body
+                i += nbz
                 if naz:  # signed gram, .sign returns proper sig format when .curt
-                    sig = self.sign(vid, gram) # raises MemoerError if invalid
-                    gram = gram + sig
+                    gram = b''.join((gram, self.sign(vid, gram)))  # raises MemoerError
 
-            grams.append(gram)
+            yield gram
             gn += 1
 
-        return grams
-
 
     def send(self, gram, dst, *, echoic=False) -> int:
         """Attempts to send bytes in txbs to remote destination dst.
@@ -1955,16 +2763,205 @@ class Memoer(Tymee):
         memo, dst is the destination address, and vid is the verifier ID used to
         look up the sigkey to sign.
 
-        Calls .rend method to process the partitioning and packing as
+        Calls .rendit method to process the partitioning and packing as
         appropriate to convert memo into grams with headers and sign when
         indicated.
 
-        Appends (gram, dst) duple to .txgs deque.
+        Appends (grams, dst) duple of lazy rending to .txrs deque whose grams
+        are appended to .txgs by ._serviceRendings as .txgs drains. Sure memos
+        are rended whole since their grams are kept for retransmission.
+        A memo that fails to rend is logged and dropped.
         """
         memo, dst, vid = self.txms.popleft()  # raises IndexError if empty deque
 
-        for gram in self.rend(memo, vid):  # partition memo into gram parts with head
-            self.txgs.append((gram, dst))  # append duples (gram: bytes, dst: str)
+        try:
+            if self.code in SureDex:  # reliable so grams sent through window
+                mid = self.makeMID()
+                self.sures[mid] = Surety(dst=dst,
+                                         grams=self.rend(memo, vid, mid=mid))
+                return
+
+            self.txrs.append((self.rendit(memo, vid), dst))
+        except hioing.MemoerError as ex:
+            logger.error("Dropped Memoer memo to %s on failed rend.\n %s.",
+                         dst, ex)
+
+
+    def _serviceRendings(self):
+        """Pull grams from lazy rendings in .txrs in order into .txgs until
+        .RendCount grams are queued for tx in .txgs and .txqs. A rending that
+        fails such as on signing is logged and dropped so it does not stall
+        the rendings queued after it.
+        """
+        queued = len(self.txgs) + sum(len(q) for q in self.txqs.values())
+        while self.txrs and queued < self.RendCount:
+            grams, dst = self.txrs[0]
+            try:
+                for gram in grams:
+                    self.txgs.append((gram, dst))  # append duples (gram: bytes, dst: str)
+                    queued += 1
+                    if queued >= self.RendCount:
+                        break
+                else:  # exhausted
+                    self.txrs.popleft()
+            except hioing.MemoerError as ex:
+                logger.error("Dropped Memoer rending to %s on failed rend.\n %s.",
+                             dst, ex)
+                self.txrs.popleft()
+
+
+    def rendAck(self, mid, cnt, spans):
+        """Pack selective ack gram for Sure memo mid.
+
+        The ack body is a sequence of spans of received gram numbers each packed
+        as a pair of 3 byte big endian ints (start, stop) for the half open
+        range start <= gn < stop. Spans that do not fit in .MaxGramSize are
+        left off so the sender retransmits those grams on its tymeout.
+        When .code is authenticated the ack is signed with own .vid.
+
+        Returns:
+            gram (bytes): ack gram with header
+
+        Parameters:
+            mid (str): memo ID being acked
+            cnt (int): count of grams received for mid, goes in ack neck
+            spans (list[tuple]): sorted (start, stop) spans of received gram
+                numbers
+        """
+        code = MemoDex.AckAuth if self.code in self.Audex else MemoDex.Ack
+        bz, nz, mz, vz, az = self.Sizes[code]
+        vid = self.vid
+        if vz and (not vid or len(vid) != vz):
+            raise hioing.MemoerError(f"Missing or invalid {vid=} for {vz=}")
+
+        codeb = code.encode()
+        midb = mid.encode()
+        vidb = vid.encode() if vz else b''
+        if self.curt:  # rend header parts in base2 instead of base64
+            nz, az = 3 * nz // 4, 3 * az // 4
+            codeb, midb, vidb = decodeB64(codeb), decodeB64(midb), decodeB64(vidb)
+            neck = cnt.to_bytes(nz)
+        else:
+            neck = helping.intToB64b(cnt, l=nz)
+
+        head = codeb + neck + midb + vidb
+        room = (self.MaxGramSize - len(head) - az) // 6  # max spans that fit
+        body = b''.join(start.to_bytes(3) + stop.to_bytes(3)
+                        for start, stop in spans[:room])
+        gram = head + body
+        if az:  # signed gram, .sign returns proper sig format when .curt
+            gram = gram + self.sign(vid, gram)
+        return gram
+
+
+    def _absorbAck(self, mid, body, src, vid=None, code=MemoDex.Ack):
+        """Apply selective ack body to Sure tx memo mid. Releases in flight
+        window for newly acked grams and restarts retry tymer on progress.
+        Memo is delivered once all its grams are acked.
+
+        Acks not from the destination of mid are ignored. When .code is
+        authenticated unsigned acks are ignored and the verified vid of the
+        first ack for mid is pinned so later acks from any other vid are
+        ignored.
+
+        Parameters:
+            mid (str): memo ID being acked
+            body (memoryview): ack body of packed (start, stop) spans
+            src (str | tuple): source address of ack gram
+            vid (str | None): verified verifier ID of ack gram when signed
+            code (str): ack code of ack gram
+        """
+        if not (sure := self.sures.get(mid)):  # stale or unknown so ignore
+            return
+
+        if src != sure.dst:  # not from destination so spoofed or stray
+            logger.info("Ignored ack for mid=%s from %s not %s.", mid, src,
+                        sure.dst)
+            return
+
+        if self.code in self.Audex:  # authenticated so ack must be signed
+            if code not in self.Audex:
+                logger.info("Ignored unsigned ack for mid=%s from %s.", mid, src)
+                return
+            if sure.vid is None:
+                sure.vid = vid  # pin verified vid of destination
+            elif vid != sure.vid:
+                logger.info("Ignored ack for mid=%s with %s not %s.", mid,
+                            vid, sure.vid)
+                return
+
+        progress = 0
+        for i in range(0, len(body) - 5, 6):
+            start = int.from_bytes(body[i:i+3])
+            stop = min(int.from_bytes(body[i+3:i+6]), sure.nxt)  # only sent
+            for gn in range(start, stop):
+                if gn not in sure.acks:
+                    sure.acks.add(gn)
+                    progress += 1
+
+        if not progress:
+            return
+
+        self.flights[sure.dst] -= progress
+        self.pacer(sure.dst).increase()  # delivery signal
+        if len(sure.acks) >= len(sure.grams):  # all acked
+            self._release(mid)
+            self.delivered += 1
+            return
+
+        sure.tries = 0
+        if mid in self.tymers:
+            self.tymers[mid].start()  # from now
+
+
+    def _release(self, mid):
+        """Remove Sure tx memo mid and release its remaining in flight grams.
+
+        Parameters:
+            mid (str): memo ID of Sure tx memo
+        """
+        sure = self.sures.pop(mid)
+        self.tymers.pop(mid, None)
+        flight = self.flights.get(sure.dst, 0) - (sure.nxt - len(sure.acks))
+        if flight > 0:
+            self.flights[sure.dst] = flight
+        else:
+            self.flights.pop(sure.dst, None)
+
+
+    def _serviceSures(self):
+        """Service Sure transmit state. Queue pending selective acks then
+        release unsent grams of Sure memos into .txgs up to .window grams in
+        flight per destination. Starts a retry tymer when wound and .tymeout.
+        """
+        for mid, src in self.acks.items():
+            if mid in self.dones:
+                cnt = self.dones[mid]
+                spans = [(0, cnt)]
+            elif mid in self.rxgs:
+                spans = []
+                for gn in sorted(self.rxgs[mid]):
+                    if spans and spans[-1][1] == gn:
+                        spans[-1] = (spans[-1][0], gn + 1)
+                    else:
+                        spans.append((gn, gn + 1))
+                cnt = len(self.rxgs[mid])
+            else:  # dropped so nothing to ack
+                continue
+            self.txgs.append((self.rendAck(mid, cnt, spans), src))
+        self.acks.clear()
+
+        for mid, sure in self.sures.items():
+            flight = self.flights.get(sure.dst, 0)
+            if sure.nxt >= len(sure.grams) or flight >= self.window:
+                continue
+            while sure.nxt < len(sure.grams) and flight < self.window:
+                self.txgs.append((sure.grams[sure.nxt], sure.dst))
+                sure.nxt += 1
+                flight += 1
+            self.flights[sure.dst] = flight
+            if mid not in self.tymers and self.tymeout and self.tymth:
+                self.tymers[mid] = Tymer(tymth=self.tymth, duration=self.tymeout)
 
 
     def serviceTxMemosOnce(self):
@@ -1975,6 +2972,8 @@ class Memoer(Tymee):
             self._serviceOneTxMemo()
         except IndexError:
             pass
+        self._serviceSures()
+        self._serviceRendings()
 
 
     def serviceTxMemos(self):
@@ -1982,6 +2981,8 @@ class Memoer(Tymee):
         """
         while self.txms:
             self._serviceOneTxMemo()
+        self._serviceSures()
+        self._serviceRendings()
 
 
     def gramit(self, gram, dst):
@@ -2034,9 +3035,31 @@ class Memoer(Tymee):
             except IndexError:
                 return False  # nothing more to send, return False to try later
 
-        cnt = 0
+        cnt = self._sendGram(gram, dst, echoic=echoic)  # assumes .opened == True
+        if cnt:
+            del gram[:cnt]  # remove from buffer those bytes sent
+            if not gram:  # all sent or dropped
+                dst = None  # done indicated by setting dst to None
+            self.txbs = (gram, dst)  # update .txbs to indicate if completely sent
+
+        return (False if dst else True)  # incomplete return False, else True
+
+
+    def _sendGram(self, gram, dst, *, echoic=False):
+        """Send gram to dst via .send, dropping the gram when the far peer is
+        unavailable.
+
+        Returns:
+            cnt (int): bytes sent. A dropped gram returns len(gram) because
+                dropped is same as all sent.
+
+        Parameters:
+            gram (bytes | bytearray | memoryview): gram to send
+            dst (str | tuple): remote destination address
+            echoic (bool): True means echo sends into receives via. echos
+        """
         try:
-            cnt = self.send(gram, dst, echoic=echoic)  # assumes .opened == True
+            cnt = self.send(gram, dst, echoic=echoic)
         except socket.error as ex:  # OSError.errno always .args[0] for compat
             if (ex.args[0] in (errno.ECONNREFUSED,
                                errno.ENOENT,
@@ -2054,44 +3077,150 @@ class Memoer(Tymee):
                 # uxd file path is not available to send to.
                 logger.error("Error send from %s to %s\n %s\n",
                                                          self.name, dst, ex)
-                self.txbs = (bytearray(), None) # far peer unavailable, so drop.
-                dst = None  # dropped is same as all sent
+                self.pacer(dst).decrease()  # loss signal
+                cnt = len(gram)  # far peer unavailable, so drop.
             else:
                 raise  # unexpected error
 
-        if cnt:
-            del gram[:cnt]  # remove from buffer those bytes sent
-            if not gram:  # all sent
-                dst = None  # done indicated by setting dst to None
-            self.txbs = (gram, dst)  # update .txbs to indicate if completely sent
+        return cnt
 
-        return (False if dst else True)  # incomplete return False, else True
+
+    def sendBatch(self, grams, *, echoic=False):
+        """Attempts to send each (gram, dst) duple in grams in order, possibly
+        to different destinations. Stops at the first gram not completely sent.
+
+        Fallback batch send that calls .send once per gram. Override in
+        transport subclass that can send many datagrams per call.
+
+        Returns:
+            cnts (list[int]): bytes sent for each gram attempted in order.
+                When the last count is less than the length of its gram then
+                that gram and any following grams were not completely sent.
+
+        Parameters:
+            grams (list[tuple]): duples of form (gram: bytes, dst: str | tuple)
+            echoic (bool): True means echo sends into receives via. echos
+        """
+        cnts = []
+        for gram, dst in grams:
+            cnt = self._sendGram(gram, dst, echoic=echoic)
+            cnts.append(cnt)
+            if cnt < len(gram):  # incomplete so try again later
+                break
+        return cnts
+
+
+    def pacer(self, dst):
+        """Get Pacer for dst creating it when missing.
+
+        Returns:
+            pacer (Pacer): pacer of sends to dst
+
+        Parameters:
+            dst (str | tuple): destination address
+        """
+        if (pacer := self.pacers.get(dst)) is None:
+            pacer = Pacer(rate=self.rate, tymth=self.tymth)
+            self.pacers[dst] = pacer
+        return pacer
+
+
+    def _serviceBatchTxGrams(self, *, bn=None, echoic=False):
+        """Service one batch of up to bn grams taken round robin across the
+        destinations in .txqs each as allowed by its pacer. New grams in .txgs
+        are first queued into .txqs by destination. Any partial send remaining
+        in .txbs is finished first.
+
+        Grams are sent without first copying them. Only when a gram is not
+        completely sent is its remainder copied into a bytearray and put back
+        at the front of its destination deque along with any unattempted grams
+        of the batch in order. A zero count send is a congestion signal.
+
+        Returns:
+            bool: True means the whole batch sent completely so greedy callers
+                can keep sending; False means either a send was incomplete or
+                there are no more grams that pacing allows now so try again later.
+
+        Parameters:
+           bn (int or None): max grams in batch. None means use .bn
+           echoic (bool): True means echo sends into receives via. echos
+                           False means do not echo
+        """
+        if self.txbs[1] is not None:  # partial send remaining so finish first
+            if not self._serviceOnceTxGrams(echoic=echoic):
+                return False
+
+        if self.txrs:  # refill from lazy rendings
+            self._serviceRendings()
+
+        while self.txgs:  # queue by destination
+            gram, dst = self.txgs.popleft()
+            if dst not in self.txqs:
+                self.txqs[dst] = deque()
+            self.txqs[dst].append(gram)
+
+        bn = bn if bn is not None else self.bn
+        batch = []
+        readies = [dst for dst in self.txqs if self.pacer(dst).ready]
+        while readies and len(batch) < bn:  # round robin one gram per dst
+            for dst in list(readies):
+                gram = self.txqs[dst].popleft()
+                if not self.txqs[dst]:
+                    del self.txqs[dst]
+                    readies.remove(dst)
+                pacer = self.pacers[dst]
+                pacer.spend(len(gram))
+                if dst in readies and pacer.tokens <= 0:
+                    readies.remove(dst)
+                batch.append((gram, dst))
+                if len(batch) >= bn:
+                    break
+
+        if not batch:
+            return False  # nothing more to send now
+
+        cnts = self.sendBatch(batch, echoic=echoic)
+        n = len(cnts)
+        gram, dst = batch[n - 1]
+        if cnts[-1] < len(gram):  # incomplete so requeue remainder in front
+            if not cnts[-1]:  # could not send any so back off
+                self.pacers[dst].decrease()
+            for ugram, udst in reversed(batch[n:]):  # restore unattempted
+                self.pacers[udst].spend(-len(ugram))  # refund
+                self.txqs.setdefault(udst, deque()).appendleft(ugram)
+            self.pacers[dst].spend(cnts[-1] - len(gram))  # refund unsent
+            self.txqs.setdefault(dst, deque()).appendleft(bytearray(gram[cnts[-1]:]))
+            return False
+
+        return True
 
 
     def serviceTxGramsOnce(self, *, echoic=False):
-        """Service one pass (non-greedy) over all unique destinations in .txgs
-        dict if any for blocked destination or unblocked with pending outgoing
-        grams.
+        """Service one gram (non-greedy) from the next paced destination in
+        .txqs after queuing any new grams in .txgs.
 
         Parameters:
            echoic (bool): True means echo sends into receives via. echos
                            False measn do not echo
         """
-        if self.opened and self.txgs:
-            self._serviceOnceTxGrams(echoic=echoic)
+        if self.opened and (self.txgs or self.txqs or self.txrs
+                            or self.txbs[1] is not None):
+            self._serviceBatchTxGrams(bn=1, echoic=echoic)
 
 
     def serviceTxGrams(self, *, echoic=False):
         """Service multiple passes (greedy) over all unqique destinations in
-        .txgs dict if any for blocked destinations or unblocked with pending
-        outgoing grams until there is no unblocked destination with a pending gram.
+        .txqs if any for blocked destinations or unblocked with pending
+        outgoing grams until there is no unblocked destination with a pending
+        gram that its pacer allows. Each pass sends a batch of up to .bn grams.
 
         Parameters:
            echoic (bool): True means echo sends into receives via. echos
                            False measn do not echo
         """
-        while self.opened and self.txgs:  # pending gram(s)
-            if not self._serviceOnceTxGrams(echoic=echoic):  # send incomplete
+        while self.opened and (self.txgs or self.txqs or self.txrs
+                               or self.txbs[1] is not None):
+            if not self._serviceBatchTxGrams(echoic=echoic):  # send incomplete
                 break  # try again later
 
 
@@ -2458,3 +3587,76 @@ class AuthMemoerDoer(doing.Doer):
     def exit(self):
         """"""
         self.peer.close()
+
+
+
+class SureMemoer(Memoer):
+    """SureMemoer mixin base class that provides reliable (Sure) memo delivery
+    over unreliable datagram transports.
+
+    Subclass of Tymee and Memoer
+
+    Each tx memo is rended with a Sure gram code and held in .sures until all
+    of its grams are acked. Unsent grams are released into .txgs at most
+    .window grams in flight per destination. The receiver answers Sure grams
+    with selective acks of the gram numbers it holds. When wound, the retry
+    tymer of each memo in .tymers retransmits only the grams sent but not yet
+    acked on expiry.
+
+    See Memoer for inherited class attributes, attributes, properties, and
+    methods.
+
+    Class Attributes::
+
+        Tymeout (float): default retry tymeout for unacked Sure grams
+
+    """
+    Tymeout = 1.0  # retry tymeout in seconds for unacked Sure grams
+
+
+    def __init__(self, *, code=MemoDex.GramSureZero, **kwa):
+        """Initialization method for instance.
+
+        Defaults code to Sure type
+
+        Inherited Parameters::
+            see superclass
+
+        """
+        if code not in SureDex:
+            raise hioing.MemoerError(f"Invalid {code=} not Sure.")
+        super().__init__(code=code, **kwa)
+
+
+
+@contextmanager
+def openSM(cls=None, name="test", **kwa):
+    """Wrapper to create and open SureMemoer instances
+    When used in with statement block, calls .close() on exit of with block
+
+    Parameters:
+        cls (Class): instance of subclass instance
+        name (str): unique identifier of Memoer peer.
+            Enables management of transport by name.
+    Usage::
+
+        with openSM() as peer:
+            peer.receive()
+
+        with openSM(cls=SureMemoerSub) as peer:
+            peer.receive()
+
+    """
+    peer = None
+
+    if cls is None:
+        cls = SureMemoer
+    try:
+        peer = cls(name=name, **kwa)
+        peer.reopen()
+
+        yield peer
+
+    finally:
+        if peer:
+            peer.close()
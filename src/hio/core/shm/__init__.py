@@ -0,0 +1,7 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.core.shm Package
+"""
+
+from .shming import Ring, Peer, openPeer, PeerDoer
+from .peermemoing import PeerMemoer, openPM, PeerMemoerDoer
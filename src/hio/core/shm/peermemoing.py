@@ -0,0 +1,117 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.core.shm.peermemoing Module
+"""
+from contextlib import contextmanager
+
+from ... import help
+
+from ...base import doing
+from .shming import Peer
+from ..memo import Memoer
+
+logger = help.ogler.getLogger()
+
+
+class PeerMemoer(Peer, Memoer):
+    """Class for sending memograms over shared memory Ring transport
+    Mixin base classes Peer and Memoer to attain memogram over shared memory.
+
+    Large grams and binary memos move between processes on the same host at
+    memory bandwidth. Receive batches are views into the Rings so only the
+    gram bodies are copied out.
+
+    Inherited Class Attributes:
+        See Peer Class
+        See memoing.Memoer Class
+
+    Inherited Attributes:
+        See Peer Class
+        See Memoer Class
+
+    Inherited Properties:
+        See Peer Class
+        See Memoer Class
+    """
+
+    def __init__(self, *, bc=64, **kwa):
+        """Initialization method for instance.
+
+        Inherited Parameters:
+            bc (int or None): count of transport buffers of MaxGramSize
+
+            See memoing.Memoer for other inherited parameters
+            See Peer for other inherited parameters
+        """
+        super(PeerMemoer, self).__init__(bc=bc, **kwa)
+
+
+
+@contextmanager
+def openPM(cls=None, name="test", reopen=True, **kwa):
+    """
+    Wrapper to create and open shared memory PeerMemoer instances
+    When used in with statement block, calls .close() on exit of with block
+
+    Parameters:
+        cls (Class): instance of subclass instance
+        name (str): unique identifier of PeerMemoer peer used as its address.
+        reopen (bool): True (re)open with this init (default)
+                       False not (re)open with this init but later
+
+    See shming.Peer for other keyword parameter passthroughs
+
+    Usage::
+
+        with openPM(peers=["beta"]) as peer:
+            peer.receive()
+
+    """
+    peer = None
+    if cls is None:
+        cls = PeerMemoer
+    try:
+        peer = cls(name=name, reopen=reopen, **kwa)
+
+        yield peer
+
+    finally:
+        if peer:
+            peer.close()
+
+
+
+class PeerMemoerDoer(doing.Doer):
+    """PeerMemoerDoer Doer for reliable shared memory transport.
+    Does not require retry tymers.
+
+    See Doer for inherited attributes, properties, and methods.
+
+    Attributes:
+       .peer (PeerMemoer): underlying transport instance subclass of Memoer
+
+    """
+
+    def __init__(self, peer, **kwa):
+        """Initialize instance.
+
+        Parameters:
+           peer (PeerMemoer): is Memoer Subclass instance
+        """
+        super(PeerMemoerDoer, self).__init__(**kwa)
+        self.peer = peer
+
+
+    def enter(self, *, temp=None):
+        """"""
+        self.peer.reopen()
+
+
+    def recur(self, tyme):
+        """"""
+        self.peer.service()
+
+
+    def exit(self):
+        """"""
+        self.peer.close()
@@ -0,0 +1,515 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.core.shm.shming Module
+
+Shared memory single producer single consumer ring buffer transport for moving
+bulk data between processes on the same host at memory bandwidth.
+
+Each one way link between two named peers is its own Ring in its own
+multiprocessing.shared_memory segment. The consumer (receiver) creates and
+owns the segment. The producer (sender) attaches to it on its first send and
+reattaches when the consumer has since recreated the segment. A pair of peers
+that talk both ways have a pair of Rings, one each way. Doers poll their
+transports every recur so no wakeup channel is needed.
+
+Bosser and Crewer do not use this transport. They keep their UXD memo
+transport. PeerMemoer in peermemoing may be used in its place for bulk data.
+"""
+import os
+import struct
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+from ... import hioing
+from ...base import doing
+from ... import help
+
+logger = help.ogler.getLogger()
+
+
+class Ring():
+    """Ring is a single producer single consumer (SPSC) ring buffer of length
+    prefixed records in a shared memory segment.
+
+    Layout of segment:
+        head (u64) at offset 0: count of bytes ever written by producer
+        tail (u64) at offset 64: count of bytes ever read by consumer
+        capacity (u64) at offset 128: size in bytes of record area
+        epoch (u64) at offset 136: random nonzero generation of segment set by
+            consumer on create and zeroed by consumer on close
+        record area starting at .HeadSize
+
+    head and tail are on separate cache lines and each is only ever written by
+    one side. Each record is a 4 byte little endian length followed by its
+    data padded to an 8 byte boundary. A record never wraps. When a record
+    does not fit in the rest of the record area a pad marker is written and
+    the record starts at the beginning of the record area instead.
+    The producer writes the record before publishing the new head and the
+    consumer publishes the new tail only once it is done with the records
+    it has read so the producer never overwrites a record in use.
+
+    The producer keeps the epoch it saw on attach. Once the consumer closes or
+    replaces the segment its epoch no longer matches so .current is False and
+    the producer must reattach by name instead of writing into a segment no
+    consumer will ever read.
+
+    Class Attributes:
+        HeadSize (int): bytes of segment header before record area
+        Capacity (int): default bytes of record area
+        Pad (int): length marker of pad to end of record area
+        Align (int): record alignment in bytes
+        Closed (int): epoch of segment closed by its consumer
+
+    Attributes:
+        name (str): shared memory segment name
+        owned (bool): True means created here so unlink on close
+        shm (SharedMemory | None): shared memory segment when opened
+        capacity (int): bytes of record area
+        epoch (int): generation of segment when created or attached
+        buf (memoryview | None): view of record area
+        cursor (int): consumer read position not yet published as tail
+        head (int): producer write position last published as head
+    """
+    HeadSize = 192  # three 64 byte cache lines head, tail, capacity & epoch
+    Capacity = 4194304  # (2**22) 4 MiB
+    Pad = 0xFFFFFFFF
+    Align = 8
+    Closed = 0
+
+
+    def __init__(self, name, *, capacity=None, create=False):
+        """Initialize instance and create or attach its shared memory segment.
+
+        Parameters:
+            name (str): shared memory segment name
+            capacity (int | None): bytes of record area when create. Rounded
+                up to multiple of .Align. None means use default .Capacity
+            create (bool): True means create and own segment. A stale segment
+                left by a consumer that did not close is closed and replaced.
+                False means attach to existing segment created by other side.
+                Raises FileNotFoundError when segment does not exist
+        """
+        self.name = name
+        self.owned = create
+        if create:
+            capacity = capacity if capacity is not None else self.Capacity
+            capacity = -(-capacity // self.Align) * self.Align
+            try:
+                self.shm = shared_memory.SharedMemory(name=name, create=True,
+                                                size=self.HeadSize + capacity)
+            except FileExistsError:  # left by prior consumer so replace it
+                stale = shared_memory.SharedMemory(name=name, track=False)
+                struct.pack_into("<Q", stale.buf, 136, self.Closed)
+                stale.close()
+                stale.unlink()
+                self.shm = shared_memory.SharedMemory(name=name, create=True,
+                                                size=self.HeadSize + capacity)
+            epoch = int.from_bytes(os.urandom(8)) or 1  # never .Closed
+            struct.pack_into("<Q", self.shm.buf, 0, 0)  # head
+            struct.pack_into("<Q", self.shm.buf, 64, 0)  # tail
+            struct.pack_into("<QQ", self.shm.buf, 128, capacity, epoch)
+        else:  # consumer owns segment so do not track for cleanup here
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+            capacity, epoch = struct.unpack_from("<QQ", self.shm.buf, 128)
+
+        self.capacity = capacity
+        self.epoch = epoch
+        self.buf = self.shm.buf[self.HeadSize:self.HeadSize + capacity]
+        self.cursor, = struct.unpack_from("<Q", self.shm.buf, 64)
+        self.head, = struct.unpack_from("<Q", self.shm.buf, 0)
+
+
+    def put(self, data):
+        """Producer appends data as one record if there is room.
+
+        Returns:
+            result (bool): True means appended. False means not enough free
+                room now so try again later
+
+        Parameters:
+            data (bytes | bytearray | memoryview): record data
+        """
+        size = len(data)
+        need = -(-(4 + size) // self.Align) * self.Align
+        if need > self.capacity:
+            raise hioing.SizeError(f"Record size={size} too big for ring "
+                                   f"capacity={self.capacity}.")
+
+        tail, = struct.unpack_from("<Q", self.shm.buf, 64)
+        free = self.capacity - (self.head - tail)
+        pos = self.head % self.capacity
+        room = self.capacity - pos  # contiguous room to end
+        if room < need:  # must wrap so pad to end
+            if free < room + need:
+                return False
+            struct.pack_into("<I", self.buf, pos, self.Pad)
+            self.head += room
+            pos = 0
+        elif free < need:
+            return False
+
+        struct.pack_into("<I", self.buf, pos, size)
+        self.buf[pos + 4:pos + 4 + size] = data
+        self.head += need
+        struct.pack_into("<Q", self.shm.buf, 0, self.head)  # publish
+        return True
+
+
+    def get(self):
+        """Consumer reads next record if any without copying it. The view is
+        only valid until the next .release so the producer can not overwrite it
+        until then.
+
+        Returns:
+            data (memoryview | None): view of record data. None means empty
+        """
+        head, = struct.unpack_from("<Q", self.shm.buf, 0)
+        if self.cursor == head:
+            return None
+
+        pos = self.cursor % self.capacity
+        size, = struct.unpack_from("<I", self.buf, pos)
+        if size == self.Pad:  # wrapped
+            self.cursor += self.capacity - pos
+            pos = 0
+            size, = struct.unpack_from("<I", self.buf, pos)
+
+        self.cursor += -(-(4 + size) // self.Align) * self.Align
+        return self.buf[pos + 4:pos + 4 + size]
+
+
+    def release(self):
+        """Consumer publishes as tail all records read so far so the producer
+        may reuse their room.
+        """
+        struct.pack_into("<Q", self.shm.buf, 64, self.cursor)
+
+
+    @property
+    def count(self):
+        """Returns bytes of records written but not yet released"""
+        head, = struct.unpack_from("<Q", self.shm.buf, 0)
+        tail, = struct.unpack_from("<Q", self.shm.buf, 64)
+        return head - tail
+
+
+    @property
+    def current(self):
+        """Returns True when segment is still the generation attached to.
+        False means its consumer has since closed or replaced it.
+        """
+        epoch, = struct.unpack_from("<Q", self.shm.buf, 136)
+        return epoch == self.epoch != self.Closed
+
+
+    def close(self):
+        """Close segment and unlink it when owned. When owned its epoch is
+        first set to .Closed so an attached producer knows to reattach.
+        An owned segment already replaced by a new consumer is not unlinked
+        since its name now belongs to the replacement.
+        """
+        if self.shm is None:
+            return
+        unlink = self.owned and self.current
+        if unlink:
+            struct.pack_into("<Q", self.shm.buf, 136, self.Closed)
+        self.buf.release()
+        self.buf = None
+        self.shm.close()
+        if unlink:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+        self.shm = None
+
+
+
+class Peer(hioing.Mixin):
+    """Class to manage non blocking I/O over shared memory Rings with other
+    named Peers on the same host. Addresses are Peer names.
+
+    Because shared memory rings are reliable no need for retry tymer.
+
+    Class Attributes:
+        BufSize (int): used to set default buffer size for transport buffers
+        MaxGramSize (int): max bytes in gram for this transport
+        Prefix (str): shared memory segment name prefix
+
+    Attributes:
+        name (str): unique identifier of peer used as its address
+        peers (list[str]): names of peers to receive from. A receive Ring from
+            each is created on open
+        capacity (int | None): bytes of record area of each receive Ring
+        bc (int | None): count of transport buffers of MaxGramSize
+        bs (int): buffer size
+        wl (WireLog): instance ref for debug logging of tx and rx
+        opened (bool): True means receive Rings are created. False otherwise
+        rxrings (dict): receive Rings keyed by source peer name
+        txrings (dict): transmit Rings keyed by destination peer name. Attached
+            on first send to destination and reattached when no longer current
+
+    Properties:
+        path (str): .name alias to match .uxd
+    """
+    BufSize = 65535  # 2 ** 16 - 1  default buffersize
+    MaxGramSize = 65535  # 2 ** 16 - 1  max gram size
+    Prefix = "hio_"
+
+
+    def __init__(self, *,
+                 name='main',
+                 peers=None,
+                 capacity=None,
+                 bc=None,
+                 bs=None,
+                 wl=None,
+                 reopen=False,
+                 **kwa):
+        """Initialization method for instance.
+
+        Parameters:
+            name (str): unique identifier of peer used as its address
+            peers (iterable[str] | None): names of peers to receive from
+            capacity (int | None): bytes of record area of each receive Ring.
+                None means use default Ring.Capacity
+            bc (int | None): count of transport buffers of MaxGramSize
+            bs (int | None): buffer size of transport buffers. When .bc is provided
+                then .bs is calculated by multiplying, .bs = .bc * .MaxGramSize.
+                When .bc is not provided, then if .bs is provided use provided
+                value else use default .BufSize
+            wl (WireLog): instance ref for debug logging of tx and rx
+            reopen (bool): True (re)open with this init
+                           False not (re)open with this init but later (default)
+        """
+        self.name = name
+        self.peers = list(peers) if peers is not None else []
+        self.capacity = capacity
+
+        self.bc = int(bc) if bc is not None and bc > 0 else None
+        if self.bc:
+            self.bs = self.MaxGramSize * self.bc
+        else:
+            self.bs = bs if bs is not None else self.BufSize
+
+        self.wl = wl
+        self.opened = False
+        self.rxrings = {}
+        self.txrings = {}
+
+        super(Peer, self).__init__(**kwa)
+        if reopen:
+            self.reopen()
+
+
+    @property
+    def path(self):
+        """Property that returns .name as address to match uxd interface"""
+        return self.name
+
+
+    def ringName(self, src, dst):
+        """Returns shared memory segment name of Ring from src to dst."""
+        return f"{self.Prefix}{src}_{dst}"
+
+
+    def open(self):
+        """Creates a receive Ring from each of .peers.
+
+        Returns:
+            result (bool): True if opened successfully. False otherwise
+        """
+        for src in self.peers:
+            self.addPeer(src)
+        self.opened = True
+        return self.opened
+
+
+    def addPeer(self, src):
+        """Create receive Ring from src if not already.
+
+        Parameters:
+            src (str): name of peer to receive from
+        """
+        if src not in self.peers:
+            self.peers.append(src)
+        if src not in self.rxrings:
+            self.rxrings[src] = Ring(self.ringName(src, self.name),
+                                    capacity=self.capacity, create=True)
+
+
+    def reopen(self, **kwa):
+        """Idempotently open by closing first if need be"""
+        self.close()
+        return self.open()
+
+
+    def close(self):
+        """Closes all Rings and unlinks receive Rings."""
+        for ring in self.txrings.values():
+            ring.close()
+        self.txrings = {}
+        for ring in self.rxrings.values():
+            ring.close()
+        self.rxrings = {}
+        self.opened = False
+        return not self.opened  # True means closed successfully
+
+
+    def receive(self, **kwa):
+        """Perform non blocking receive of one gram from the receive Rings
+        in turn.
+
+        Returns:
+            result (tuple): of form (bytes, str | None) labeled (data, src) where
+                data is bytes of data received
+                src is str name of source peer or None
+                If data empty then returns (b'', None) but always returns duple
+        """
+        for src, ring in self.rxrings.items():
+            ring.release()  # done with any previous views
+            if (data := ring.get()) is not None:
+                data = bytes(data)  # copy out so release now
+                ring.release()
+                self.rxrings[src] = self.rxrings.pop(src)  # next src first next time
+                if self.wl:
+                    self.wl.writeRx(data, who=src)
+                return (data, src)
+        return (b'', None)
+
+
+    def receiveBatch(self, bn, **kwa):
+        """Perform up to bn non blocking receives round robin across the
+        receive Rings without copying.
+
+        Returns:
+            grams (list[tuple]): duples of form (gram, src) in order received
+                where gram is a memoryview into the Ring that is only valid
+                until the next call and src is the source peer name.
+                Empty list when nothing received.
+
+        Parameters:
+            bn (int): max number of grams to receive
+        """
+        grams = []
+        rings = list(self.rxrings.items())
+        for src, ring in rings:
+            ring.release()  # done with views from previous call
+
+        while rings and len(grams) < bn:
+            for src, ring in list(rings):
+                if (gram := ring.get()) is None:
+                    rings.remove((src, ring))
+                    continue
+                if self.wl:  # log receive
+                    self.wl.writeRx(bytes(gram), who=src)
+                grams.append((gram, src))
+                if len(grams) >= bn:
+                    break
+
+        return grams
+
+
+    def send(self, data, dst, **kwa):
+        """Perform non blocking send to dst.
+
+        When dst has closed or recreated its receive Ring since it was
+        attached, the stale Ring is dropped and the new one attached so data
+        is never written into a segment no consumer reads.
+
+        Returns:
+            cnt (int): number of bytes actually sent, either all or 0 when
+                ring is full or dst has not yet created it so try again later
+
+        Parameters:
+           data (bytes): payload to send
+           dst (str):  name of destination peer
+        """
+        if (ring := self.txrings.get(dst)) is not None and not ring.current:
+            ring.close()  # consumer restarted so reattach to new generation
+            del self.txrings[dst]
+            ring = None
+
+        if ring is None:
+            try:
+                ring = Ring(self.ringName(self.name, dst))
+            except FileNotFoundError:
+                return 0  # dst not open yet so try again later
+            self.txrings[dst] = ring
+
+        if not ring.put(data):
+            return 0  # full so try again later with same data
+
+        if self.wl:  # log send
+            self.wl.writeTx(bytes(data), who=dst)
+
+        return len(data)
+
+
+
+@contextmanager
+def openPeer(cls=None, name="test", **kwa):
+    """
+    Wrapper to create and open shared memory Peer instances
+    When used in with statement block, calls .close() on exit of with block
+
+    Parameters:
+        cls (Class): instance of subclass instance
+        name (str): unique identifier of peer used as its address
+
+    Usage:
+        with openPeer(peers=["beta"]) as peer0:
+            peer0.receive()
+
+    """
+    peer = None
+
+    if cls is None:
+        cls = Peer
+    try:
+        peer = cls(name=name, **kwa)
+        peer.reopen()
+
+        yield peer
+
+    finally:
+        if peer:
+            peer.close()
+
+
+
+class PeerDoer(doing.Doer):
+    """Basic shared memory Peer Doer
+    Stub Override in Subclass
+
+    See Doer for inherited attributes, properties, and methods.
+
+    Attributes:
+       .peer is shared memory Peer instance
+
+    """
+
+    def __init__(self, peer, **kwa):
+        """
+        Initialize instance.
+
+        Parameters:
+           peer is shared memory Peer instance
+        """
+        super(PeerDoer, self).__init__(**kwa)
+        self.peer = peer
+
+
+    def enter(self, *, temp=None):
+        """"""
+        self.peer.reopen()
+
+
+    def recur(self, tyme):
+        """"""
+        # service receives and sends
+
+
+    def exit(self):
+        """"""
+        self.peer.close()
@@ -793,11 +793,13 @@ class ClientDoer(doing.Doer):
         if self.tymth:  # Doist or DoDoer winds is doers on enter
             self.client.wind(self.tymth)
         self.client.reopen()
+        self.watch(self.client.cs)
 
 
     def recur(self, tyme):
         """"""
         self.client.service()
+        self.watch(self.client.cs)  # reconnect replaces socket
 
 
     def exit(self):
@@ -16,6 +16,7 @@ import sys
 import os
 import errno
 import socket
+import selectors
 import ssl
 from collections import deque
 from contextlib import contextmanager
@@ -76,14 +77,21 @@ class Acceptor(tyming.Tymee):
         .ss is server listen socket for incoming accept requests
         .axes is deque of accepte connection duples (ca, cs)
         .opened is boolean, True if listen socket .ss opened. False otherwise
+        .selective is boolean, True means service sockets by readiness from
+                  .selector instead of polling every socket on every pass
+        .selector is selectors.BaseSelector instance when .selective and opened
+                  otherwise None
+        .acceptable is boolean, True when last select found .ss readable
     """
 
-    def __init__(self, ha=None, bs=8096, bl=128, **kwa):
+    def __init__(self, ha=None, bs=8096, bl=128, selective=False, **kwa):
         """
         Initialization method for instance.
         ha is host address duple (host, port) listen interfaces. host = "" or
         "0.0.0.0" means listen on all interfaces. bs is buffer size. bl is
         backlog size of not yet accepted concurrent tcp connections.
+        selective is True means register sockets with a selector (epoll on
+        linux) and only service those sockets that are ready.
         """
         super(Acceptor, self).__init__(**kwa)
         self.ha = ha or (host, port)  # ha = host address
@@ -100,6 +108,9 @@ class Acceptor(tyming.Tymee):
         self.ss = None  # listen socket for accepts
         self.axes = deque()  # deque of duple (ca, cs) accepted connections
         self.opened = False
+        self.selective = True if selective else False
+        self.selector = None  # created on open when selective
+        self.acceptable = False  # True when .ss readable on last select
 
     def actualBufSizes(self):
         """
@@ -149,6 +160,9 @@ class Acceptor(tyming.Tymee):
             return False
 
         self.ha = self.ss.getsockname()  # get resolved ha after bind
+        if self.selective:  # register listen socket once for accept readiness
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.ss, selectors.EVENT_READ, data=None)
         self.opened = True
         return True
 
@@ -163,6 +177,10 @@ class Acceptor(tyming.Tymee):
         """
         Closes listen socket.
         """
+        if self.selector:
+            self.selector.close()  # drops all registrations
+            self.selector = None
+            self.acceptable = False
         if self.ss:
             try:
                 self.ss.shutdown(socket.SHUT_RDWR)  # shutdown socket
@@ -192,7 +210,13 @@ class Acceptor(tyming.Tymee):
         """
         Service any accept requests
         Adds to .cxes dict key by ca
+        When selective only attempts accept when last select found .ss readable
         """
+        if self.selector:
+            if not self.acceptable:
+                return
+            self.acceptable = False
+
         while True:
             cs, ca = self.accept()
             if not cs:
@@ -220,6 +244,17 @@ class Server(Acceptor):
         tymeout (float): timeout in seconds for connection refresh
         wl (WireLog | None): WireLog instance if any
         ixes (dict): incoming connections indexed by remote (host, port) duple
+        readables (set): ca of ixes found readable by last .serviceSelects
+        writables (set): ca of ixes found writable by last .serviceSelects
+        txpends (set): ca of ixes with newly queued tx data when selective
+        txblocks (set): ca of ixes whose send blocked so wait for writable
+
+    When .selective each Remoter socket is registered once with .selector
+    when added to .ixes and unregistered when removed. .serviceSelects
+    performs one select pass so that receives only touch readable sockets
+    and sends only touch sockets with pending data that are not blocked or
+    have since become writable. Per pass cost then scales with active
+    connections not open connections.
     """
 
     Tymeout = 1.0  # tymeout in seconds virtual tyme
@@ -246,6 +281,10 @@ class Server(Acceptor):
         self.tymeout = tymeout if tymeout is not None else self.Tymeout
         self.wl = wl
         self.ixes = dict()  # ready to rx tx incoming connections, Remoter instances
+        self.readables = set()  # ca of readable ixes from last select
+        self.writables = set()  # ca of writable ixes from last select
+        self.txpends = set()  # ca of ixes with newly queued tx data
+        self.txblocks = set()  # ca of ixes waiting on write readiness
 
 
     def wind(self, tymth):
@@ -278,10 +317,13 @@ class Server(Acceptor):
                               cs=cs,
                               bs=self.bs,
                               wl=self.wl,
-                              timeout=self.tymeout)
+                              timeout=self.tymeout,
+                              pends=self.txpends if self.selective else None)
             if ca in self.ixes and self.ixes[ca] is not remoter:
                 self.shutdownIx(ca)
+                self.unregisterIx(ca)
             self.ixes[ca] = remoter
+            self.registerIx(ca)
 
 
     def serviceConnects(self):
@@ -291,6 +333,66 @@ class Server(Acceptor):
         self.serviceAxes()
 
 
+    def registerIx(self, ca):
+        """
+        Register socket of remoter given by connection address ca with
+        .selector for read readiness. Does nothing when not selective.
+        """
+        if not self.selector:
+            return
+        if ca not in self.ixes:
+            emsg = "Invalid connection address '{0}'".format(ca)
+            raise ValueError(emsg)
+        cs = self.ixes[ca].cs
+        try:
+            self.selector.register(cs, selectors.EVENT_READ, data=ca)
+        except KeyError:  # stale registration of fd reused after outside close
+            self.selector.unregister(cs)
+            self.selector.register(cs, selectors.EVENT_READ, data=ca)
+
+
+    def unregisterIx(self, ca):
+        """
+        Unregister socket of remoter given by connection address ca from
+        .selector and forget any readiness for ca. Does nothing when not
+        selective or when not registered.
+        """
+        self.readables.discard(ca)
+        self.writables.discard(ca)
+        self.txpends.discard(ca)
+        self.txblocks.discard(ca)
+        if not self.selector or ca not in self.ixes or not self.ixes[ca].cs:
+            return
+        try:
+            self.selector.unregister(self.ixes[ca].cs)
+        except (KeyError, ValueError):  # not registered or already closed
+            pass
+
+
+    def serviceSelects(self, timeout=0.0):
+        """
+        Perform one select pass on .selector and update .acceptable,
+        .readables, and .writables with readiness of listen socket and ixes.
+        Does nothing when not selective.
+
+        Parameters:
+            timeout (float | None): seconds to wait for readiness. 0.0 means
+                poll without waiting. None means wait until something ready.
+        """
+        if not self.selector:
+            return
+        self.readables.clear()
+        self.writables.clear()
+        for key, events in self.selector.select(timeout=timeout):
+            if key.data is None:  # listen socket
+                self.acceptable = True
+                continue
+            if events & selectors.EVENT_READ:
+                self.readables.add(key.data)
+            if events & selectors.EVENT_WRITE:
+                self.writables.add(key.data)
+
+
     def shutdownIx(self, ca, how=socket.SHUT_RDWR):
         """
         Shutdown remoter given by connection address ca
@@ -328,6 +430,7 @@ class Server(Acceptor):
         if ca not in self.ixes:
             emsg = "Invalid connection address '{0}'".format(ca)
             raise ValueError(emsg)
+        self.unregisterIx(ca)
         self.ixes[ca].close()
 
 
@@ -335,7 +438,8 @@ class Server(Acceptor):
         """
         Shutdown and close all remoter connections
         """
-        for rm in self.ixes.values():  # remoter
+        for ca, rm in self.ixes.items():  # remoter
+            self.unregisterIx(ca)
             rm.close()
 
 
@@ -354,6 +458,7 @@ class Server(Acceptor):
         if ca not in self.ixes:
             emsg = "Invalid connection address '{0}'".format(ca)
             raise ValueError(emsg)
+        self.unregisterIx(ca)
         if close:
             self.ixes[ca].close()  # shutdown and close socket
         del self.ixes[ca]
@@ -367,8 +472,9 @@ class Server(Acceptor):
             emsg = "Invalid connection address '{0}'".format(ca)
             raise ValueError(emsg)
 
+        ix = self.ixes[ca]
         try:
-            self.ixes[ca].serviceReceives()
+            ix.serviceReceives()
         except OSError as ex:
             logger.error("Closing incoming socket on %s.\n%s\n", ix.cs.getpeername(), ex)
             self.removeIx(ca=ca)  # also closes ix
@@ -377,8 +483,15 @@ class Server(Acceptor):
     def serviceReceivesAllIx(self):
         """
         Service receives for all remoters in .ixes
+        When selective only services remoters in .readables from last select
         """
-        for ca, ix in list(self.ixes.items()):  # list so can remove while iterating
+        if self.selector:
+            ixes = [(ca, self.ixes[ca]) for ca in self.readables if ca in self.ixes]
+            self.readables.clear()  # consumed
+        else:
+            ixes = list(self.ixes.items())  # list so can remove while iterating
+
+        for ca, ix in ixes:
             try:
                 ix.serviceReceives()
             except OSError as ex:
@@ -401,20 +514,60 @@ class Server(Acceptor):
     def serviceSendsAllIx(self):
         """
         Service transmits for all remoters in .ixes
-        """
-        for rm in self.ixes.values():  # remoter
+        When selective only services remoters with newly queued data in
+        .txpends or previously blocked remoters that are now in .writables.
+        A remoter whose send leaves data in .txbs is registered for write
+        readiness until its .txbs drains.
+        """
+        if not self.selector:
+            for rm in self.ixes.values():  # remoter
+                rm.serviceSends()
+            return
+
+        cas = self.txpends | (self.txblocks & self.writables)
+        self.txpends.clear()
+        self.writables.clear()  # consumed
+        for ca in cas:
+            if ca not in self.ixes:
+                self.txblocks.discard(ca)
+                continue
+            rm = self.ixes[ca]
             rm.serviceSends()
+            if rm.txbs and not rm.cutoff:  # blocked so wait for writable
+                if ca not in self.txblocks:
+                    self.txblocks.add(ca)
+                    self.selector.modify(rm.cs,
+                                         selectors.EVENT_READ | selectors.EVENT_WRITE,
+                                         data=ca)
+            elif ca in self.txblocks:  # drained so stop waiting for writable
+                self.txblocks.discard(ca)
+                if rm.cs:
+                    self.selector.modify(rm.cs, selectors.EVENT_READ, data=ca)
 
 
     def service(self):
         """
         Service connects and service receives and sends for all ix.
+        When selective first performs one select pass for readiness.
         """
+        self.serviceSelects()
         self.serviceConnects()
         self.serviceReceivesAllIx()
         self.serviceSendsAllIx()
 
 
+    def fileobjs(self):
+        """
+        Returns tuple of fileobjs whose readiness to read means .service has
+        work so that its doer may watch them. When selective .selector is
+        ready whenever any of its sockets is ready so stands in for them all.
+        Otherwise listen socket and socket of each incoming connection.
+        """
+        if self.selector is not None and hasattr(self.selector, "fileno"):
+            return (self.selector, )
+        return (self.ss, ) + tuple(ix.cs for ix in self.ixes.values())
+
+
 
 def initServerContext(context=None,
                       version=None,
@@ -563,6 +716,7 @@ class ServerTls(Server):
                                  keypath=self.keypath,
                                  certpath=self.certpath,
                                  cafilepath=self.cafilepath,
+                                 pends=self.txpends if self.selective else None,
                                 )
 
             self.cxes[ca] = remoter
@@ -578,6 +732,7 @@ class ServerTls(Server):
             if cx.connected:  # handshake completed successfully
                 del self.cxes[ca]
                 self.ixes[ca] = cx  # add to incoming connections
+                self.registerIx(ca)
                 continue
             if cx.aborted:  # handshake completed unsuccessfully
                 del self.cxes[ca] # remove and let client startover
@@ -594,6 +749,16 @@ class ServerTls(Server):
         self.serviceCxes()
 
 
+    def fileobjs(self):
+        """
+        Returns tuple of fileobjs whose readiness to read means .service has
+        work. See Server.fileobjs. Adds sockets of connections in .cxes
+        still handshaking.
+        """
+        return (super(ServerTls, self).fileobjs() +
+                tuple(cx.cs for cx in self.cxes.values()))
+
+
 class Remoter(tyming.Tymee):
     """
     Class to service an incoming nonblocking TCP connection from a remote client.
@@ -609,6 +774,7 @@ class Remoter(tyming.Tymee):
                  refreshable=True,
                  bs=8096,
                  wl=None,
+                 pends=None,
                  **kwa
                 ):
 
@@ -619,6 +785,8 @@ class Remoter(tyming.Tymee):
            cs is connection socket object. tymeout is tymeout for .tymer.
            refreshable True means tx/rx activity refreshes timer.
            bs is buffer size. wl is WireLog object if any.
+           pends is set shared with selective Server to which .tx adds .ca
+           so server knows to send. None means not selective.
         """
         super(Remoter, self).__init__(**kwa)
         self.ha = ha  # connection address of server
@@ -634,6 +802,7 @@ class Remoter(tyming.Tymee):
         self.txbs = bytearray()  # bytearray of data to send
         self.rxbs = bytearray()  # bytearray of data received
         self.wl = wl
+        self.pends = pends  # set of ca with pending tx shared with server
 
 
     def wind(self, tymth):
@@ -809,6 +978,8 @@ class Remoter(tyming.Tymee):
         Queue data onto .txbs
         '''
         self.txbs.extend(data)
+        if self.pends is not None:
+            self.pends.add(self.ca)
 
 
     def serviceSends(self):
@@ -1056,11 +1227,13 @@ class ServerDoer(doing.Doer):
         if self.tymth:
             self.server.wind(self.tymth)
         self.server.reopen(temp=temp)
+        self.watch(*self.server.fileobjs())
 
 
     def recur(self, tyme):
         """"""
         self.server.service()
+        self.watch(*self.server.fileobjs())  # connections come and go
 
 
     def exit(self):
@@ -1082,6 +1255,7 @@ class EchoServerDoer(ServerDoer):
     def recur(self, tyme):
         """"""
         self.server.service()
+        self.watch(*self.server.fileobjs())  # connections come and go
         for ca, ix in self.server.ixes.items():
             if ix.rxbs:
                 ix.tx(bytes(ix.rxbs))  # echo back
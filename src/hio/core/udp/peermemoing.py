@@ -218,6 +218,7 @@ class PeerMemoerDoer(doing.Doer):
         """
         # inject temp into file resources here if any
         self.peer.reopen(temp=temp)
+        self.watch(self.peer.ls)
 
 
     def recur(self, tyme):
@@ -276,6 +277,7 @@ class SafePeerMemoerDoer(doing.Doer):
             self.peer.wind(self.tymth)
         # inject temp into file resources here if any
         self.peer.reopen(temp=temp)
+        self.watch(self.peer.ls)
 
 
     def recur(self, tyme):
@@ -134,6 +134,7 @@ class PeerMemoerDoer(doing.Doer):
         """
         # inject temp into file resources here if any
         self.peer.reopen(temp=temp)
+        self.watch(self.peer.ls)
 
 
     def recur(self, tyme):
@@ -69,6 +69,8 @@ class Peer(filing.Filer):
             is provided value or default .BufSize
         wl (WireLog): instance ref for debug logging of over the wire tx and rx
         ls (socket.socket): local socket of this Peer
+        rxslots (list[memoryview]): preallocated receive buffer slots of
+            MaxGramSize bytes each used by .receiveBatch
 
     """
     HeadDirPath = "/usr/local/var"  # default in /usr/local/var
@@ -135,6 +137,7 @@ class Peer(filing.Filer):
 
         self.wl = wl
         self.ls = None  # local socket of this Peer, needs to be opened/bound
+        self.rxslots = []  # preallocated on first .receiveBatch
 
         super(Peer, self).__init__(reopen=reopen,
                                    clear=clear,
@@ -290,6 +293,61 @@ class Peer(filing.Filer):
         return (data, src)
 
 
+    def receiveBatch(self, bn, **kwa):
+        """Perform up to bn non blocking receives on socket each into its own
+        preallocated receive buffer slot of .MaxGramSize bytes.
+
+        Uses socket.recvmsg_into so datagrams land directly in the reused slots
+        without allocating. Datagrams truncated because they exceed .MaxGramSize
+        are logged and dropped. Falls back to repeated .receive on platforms
+        whose sockets do not provide recvmsg_into such as Windows.
+
+        Returns:
+            grams (list[tuple]): duples of form (gram, src) in order received
+                where gram is a memoryview into a slot that is only valid
+                until the next call (bytes when falling back) and src is the
+                source address. Empty list when nothing received.
+
+        Parameters:
+            bn (int): max number of datagrams to receive
+        """
+        grams = []
+        if not hasattr(self.ls, "recvmsg_into"):  # fallback one copy per gram
+            while len(grams) < bn:
+                data, src = self.receive()
+                if not data:
+                    break
+                grams.append((data, src))
+            return grams
+
+        if len(self.rxslots) < bn:  # (re)allocate slots once
+            z = self.MaxGramSize
+            buf = memoryview(bytearray(bn * z))
+            self.rxslots = [buf[i * z:(i + 1) * z] for i in range(bn)]
+
+        for slot in self.rxslots[:bn]:
+            try:
+                cnt, _, flags, src = self.ls.recvmsg_into([slot])
+            except OSError as ex:
+                # ex.args[0] is always ex.errno for better compat
+                if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break  # nothing more to receive
+                logger.error("Error receive on UXD %s\n %s\n", self.path, ex)
+                raise
+
+            if flags & socket.MSG_TRUNC:  # larger than slot so drop
+                logger.error("Dropped truncated gram on UXD %s from %s\n",
+                             self.path, src)
+                continue
+
+            gram = slot[:cnt]
+            if self.wl:  # log over the wire receive
+                self.wl.writeRx(bytes(gram), who=src)
+            grams.append((gram, src))
+
+        return grams
+
+
     def send(self, data, dst, **kwa):
         """Perform non blocking send on socket.
 
@@ -418,6 +476,7 @@ class PeerDoer(doing.Doer):
         """
         # inject temp into file resources here if any
         self.peer.reopen(temp=temp)
+        self.watch(self.peer.ls)
 
 
     def recur(self, tyme):
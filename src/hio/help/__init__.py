@@ -17,6 +17,7 @@ ogler = ogling.initOgler(prefix='hio')  # init only runs  once on import
 from .helping import isNonStringIterable, isNonStringSequence, isIterator, Reat
 from .helping import NonStringIterable, NonStringSequence
 from .decking import Deck
+from .ordering import Orset
 from .hicting import Hict, Mict
 from .timing import (Timer, MonoTimer, TimerError, RetroTimerError,
                      nowIso8601, toIso8601, fromIso8601)
@@ -0,0 +1,130 @@
+# -*- encoding: utf-8 -*-
+"""hio.help.ordering module
+
+Support for Orset class
+
+"""
+from collections import OrderedDict
+from collections.abc import MutableSet
+from itertools import islice
+
+
+class Orset(MutableSet):
+    """
+    Insertion ordered set backed by OrderedDict which is a linked hash map.
+    Unlike ordered_set.OrderedSet, whose remove rebuilds its index, removal of
+    any element and pull of the first element are O(1) as is membership.
+    Indexing is only O(1) at the ends, index 0 and -1, otherwise O(n).
+
+    Usage::
+
+        orset = Orset([1, 2, 3, 2])
+        assert list(orset) == [1, 2, 3]
+        assert orset[0] == 1
+        orset.remove(2)
+        assert orset.pull() == 1
+        assert orset.pull() == 3
+        assert orset.pull() is None
+
+    Local methods::
+
+        .add(x): add x to right side if not already in set
+        .discard(x): remove x if in set
+        .update(iterable): add each element of iterable
+        .clear(): remove all elements
+        .pull(emptive=True): remove and return element from left side
+
+    Inherited methods from MutableSet::
+
+        .remove(x): remove x. If not in set then raise KeyError
+        .pop(): remove and return element from left side.
+                If empty then raise KeyError
+
+    """
+
+    def __init__(self, iterable=()):
+        """Initialize instance
+
+        Parameters:
+            iterable (Iterable): hashable elements to preload in order
+        """
+        self._map = OrderedDict()
+        self.update(iterable)
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+    def __contains__(self, value):
+        return value in self._map
+
+
+    def __iter__(self):
+        return iter(self._map)
+
+
+    def __reversed__(self):
+        return reversed(self._map)
+
+
+    def __len__(self):
+        return len(self._map)
+
+
+    def __getitem__(self, index):
+        """Gets element at index. O(1) for index 0 and -1 otherwise O(n)
+
+        Raises IndexError when index out of range
+        """
+        try:
+            if index == 0:
+                return next(iter(self._map))
+            if index == -1:
+                return next(reversed(self._map))
+        except StopIteration:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        if index < 0:
+            index += len(self._map)
+        if not 0 <= index < len(self._map):
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        return next(islice(self._map, index, None))
+
+
+    def add(self, value):
+        """Add value to right side if not already in set"""
+        self._map[value] = None
+
+
+    def discard(self, value):
+        """Remove value if in set"""
+        self._map.pop(value, None)
+
+
+    def update(self, iterable):
+        """Add each element of iterable in order"""
+        for value in iterable:
+            self._map[value] = None
+
+
+    def clear(self):
+        """Remove all elements"""
+        self._map.clear()
+
+
+    def pull(self, emptive=True):
+        """Remove and return element from left side.
+        If empty and emptive return None else raise IndexError
+
+        Parameters::
+
+            emptive (bool): True means return None instead of raise IndexError
+               when attempt to pull
+               False means raise IndexError when empty
+        """
+        try:
+            return self._map.popitem(last=False)[0]
+        except KeyError as ex:
+            if not emptive:
+                raise IndexError(f"pull from empty {self.__class__.__name__}") from ex
+            return None
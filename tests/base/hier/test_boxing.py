@@ -578,6 +578,59 @@ def test_boxer_run():
     """Done Test"""
 
 
+def test_boxer_run_abort():
+    """Test that each pass of Boxer with durable hold commits its durable
+    updates all or nothing so act that raises aborts durable updates of
+    earlier acts in same pass
+    """
+    def tally(**iops):
+        H = iops['H']
+        H.tally.value += 1
+        return H.tally.value
+
+
+    def boom(**iops):
+        H = iops['H']
+        if H.boom.value:
+            raise ValueError("act failed")
+
+
+    def fun(H, bx, go, do, on, at, be, *pa):
+        H.tally = Can(value=0)
+        H.boom = Bag(value=False)
+        bx(name='top')
+        do(tally, nabe="redo")
+        do(boom, nabe="redo")
+
+    tymist = Tymist(tock=1.0)
+    boxer = Boxer()
+    boxer.make(fun, durable=True, temp=True)
+    hold, subery = boxer.hold, boxer.hold.subery
+
+    rung = boxer.run(tock=1.0)
+    next(rung)
+    rung.send(tymist.tyme)  # first pass
+    assert hold.tally.value == 1
+    assert subery.cans.get("tally").value == 1  # committed
+    tymist.tick()
+    rung.send(tymist.tyme)
+    assert subery.cans.get("tally").value == 2
+
+    hold.boom.value = True
+    tymist.tick()
+    with pytest.raises(ValueError):
+        rung.send(tymist.tyme)
+    assert hold.tally.value == 3  # in memory update of earlier act kept
+    assert subery.cans.get("tally").value == 2  # durable update aborted
+    assert subery.txn is None  # write lock released
+    with pytest.raises(StopIteration):
+        rung.send(tymist.tyme)  # run ends on exception
+
+    subery.close(clear=True)
+
+    """Done Test"""
+
+
 def test_boxer_run_on_update():
     """Test make method of Boxer with on verb special need update
     """
@@ -1738,6 +1791,7 @@ if __name__ == "__main__":
     test_boxer_make_durable()
     test_boxer_make_go()
     test_boxer_run()
+    test_boxer_run_abort()
     test_boxer_run_on_update()
     test_boxer_run_on_change()
     test_boxer_run_on_count()
@@ -6,6 +6,7 @@ from __future__ import annotations  # so type hints of classes get resolved late
 import pytest
 
 import os
+import logging
 from collections import deque
 
 
@@ -14,6 +15,8 @@ from hio.help import RegDom, IceRegDom
 from hio.base import Duror, openDuror, Subery, DomIoSuber
 from hio.base.hier import Durq, Bag, IceBag
 
+logger = logging.getLogger(__name__)
+
 
 def test_durq_basic():
     """Test Durq class basic"""
@@ -170,7 +173,107 @@ def test_durq_basic():
     """Done Test"""
 
 
+def test_durq_paged():
+    """Test Durq paged mode with head and tail windows"""
+    with pytest.raises(HierError):
+        Durq(page=0)
+
+    durq = Durq(page=2)  # not durable so not paged
+    assert not durq.paged
+    durq.extend([Bag(value=i) for i in range(5)])
+    assert len(durq._deq) == 5
+    assert not durq._tail
+
+    with openDuror(cls=Subery) as subery:
+        vals = [Bag(value=i) for i in range(10)]
+        durq = Durq(page=3)
+        durq._sdb = subery.drqs
+        durq._key = "paged"
+        assert durq.paged
+        assert durq.sync()  # empty so pins empty
+
+        assert durq.extend(vals[:5])
+        assert list(durq._deq) == vals[:3]  # head window
+        assert list(durq._tail) == vals[3:5]
+        assert durq._gap == 0
+        for val in vals[5:]:
+            assert durq.push(val)
+        assert list(durq._deq) == vals[:3]
+        assert list(durq._tail) == vals[7:]  # tail window
+        assert durq._gap == 4  # durable only
+        assert len(durq) == 10
+        assert list(durq) == vals
+        assert durq.count(vals[4]) == 1
+        assert subery.drqs.get("paged") == vals
+
+        assert durq.pull() == vals[0]
+        assert durq.pull() == vals[1]
+        assert durq.pull() == vals[2]
+        assert durq.pull() == vals[3]  # faults page from gap
+        assert list(durq._deq) == vals[4:6]
+        assert durq._gap == 1
+        assert len(durq) == 6
+        assert subery.drqs.get("paged") == vals[4:]
+
+        # sync new paged durq from pre-existing durable O(page)
+        durq = Durq(page=2)
+        durq._sdb = subery.drqs
+        durq._key = "paged"
+        assert subery.drqs.getSpan("paged") == (4, 9)
+        assert durq.sync()
+        assert list(durq._deq) == vals[4:6]
+        assert list(durq._tail) == vals[8:]
+        assert durq._gap == 2
+        assert len(durq) == 6
+        assert list(durq) == vals[4:]
+
+        pulled = []
+        while (val := durq.pull()) is not None:
+            pulled.append(val)
+            if val == vals[5]:
+                durq.push(vals[0])  # push while paged and pulling
+        assert pulled == vals[4:] + [vals[0]]
+        assert len(durq) == 0
+        assert subery.drqs.cnt("paged") == 0
+        assert subery.drqs.getSpan("paged") is None
+
+        durq.extend(vals)
+        assert durq.clear()
+        assert len(durq) == 0 and durq._gap == 0
+        assert subery.drqs.cnt("paged") == 0
+
+    """Done Test"""
+
+
+@pytest.mark.benchmark
+def test_durq_paged_benchmark():
+    """Benchmark Durq sync of full mirror versus paged at 1k and 20k vals"""
+    import time
+
+    with openDuror(cls=Subery) as subery:
+        for size in (1000, 20000):
+            key = f"size{size}"
+            with subery.batch():
+                subery.drqs.put(key, [Bag(value=i) for i in range(size)])
+
+            for page in (None, 100):
+                durq = Durq(page=page)
+                durq._sdb = subery.drqs
+                durq._key = key
+                start = time.perf_counter()
+                assert durq.sync()
+                elapsed = time.perf_counter() - start
+                assert len(durq) == size
+                assert len(durq._deq) == (size if page is None else page)
+                logger.info("Durq page=%s sync at %d vals %.2fms", page, size,
+                            elapsed * 1e3)
+
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_durq_basic()
+    test_durq_paged()
+    test_durq_paged_benchmark()
 
 
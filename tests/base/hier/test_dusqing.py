@@ -7,13 +7,16 @@ from __future__ import annotations  # so type hints of classes get resolved late
 import pytest
 
 import os
+import logging
 from ordered_set import OrderedSet as oset
 
 from hio import HierError
-from hio.help import RegDom
+from hio.help import RegDom, Orset
 from hio.base import Duror, openDuror, Subery, DomIoSuber, DomIoSetSuber
 from hio.base.hier import Dusq, Bag, IceBag
 
+logger = logging.getLogger(__name__)
+
 
 def test_dusq_basic():
     """Test Dusq class basic"""
@@ -170,6 +173,114 @@ def test_dusq_basic():
     """Done Test"""
 
 
+def test_dusq_linked():
+    """Test Dusq with linked Orset in-memory ordered set and deep policy"""
+    dusq = Dusq(linked=True)
+    assert isinstance(dusq._oset, Orset)
+    assert dusq._deep
+
+    b0 = Bag(value=0)
+    b1 = IceBag(value=1)
+    b2 = Bag(value=2)
+    b3 = Bag(value=3)
+
+    assert dusq.pull() is None
+    assert dusq.push(b0)
+    assert dusq.push(b1)
+    assert dusq.push(b0)  # dup ignored
+    assert dusq.update([b2, b3, b1])
+    assert len(dusq) == 4
+    assert list(dusq) == [b0, b1, b2, b3]
+    assert b2 in dusq
+    assert Bag(value=4) not in dusq
+
+    assert dusq.remove(b2)
+    assert not dusq.remove(b2)
+    assert b2 not in dusq
+    assert dusq.pull() == b0
+    assert dusq.pull() == b1
+    assert dusq.pull() == b3
+    assert dusq.pull() is None
+
+    pushed = Bag(value=5)  # deepcopied on push and pull so independent
+    dusq.push(pushed)
+    pulled = dusq.pull()
+    assert pulled == pushed
+    assert pulled is not pushed
+
+    dusq = Dusq([b0, b1], linked=True, deep=False)  # no copies
+    assert not dusq._deep
+    assert next(iter(dusq)) is b0
+    assert dusq.pull() is b0
+    dusq.push(b2)
+    assert dusq.pull() is b1
+    assert dusq.pull() is b2
+
+    with openDuror(cls=Subery) as subery:
+        dusq = Dusq(linked=True)
+        dusq._sdb = subery.dsqs
+        dusq._key = "linked"
+        assert dusq.durable
+
+        assert dusq.update([b0, b1, b2, b3])
+        assert dusq._sdb.get("linked") == [b0, b1, b2, b3]
+        assert dusq.remove(b2)
+        assert dusq._sdb.get("linked") == [b0, b1, b3]
+        assert dusq.pull() == b0
+        assert dusq._sdb.get("linked") == [b1, b3]
+
+        dusq = Dusq(linked=True)  # sync from pre-existing
+        dusq._sdb = subery.dsqs
+        dusq._key = "linked"
+        assert dusq.sync()
+        assert isinstance(dusq._oset, Orset)
+        assert list(dusq) == [b1, b3]
+
+    """Done Test"""
+
+
+@pytest.mark.benchmark
+def test_dusq_benchmark():
+    """Benchmark Dusq pull and remove of oset versus linked Orset and push with
+    deepcopy versus without at 1k, 10k, and 50k entries."""
+    import time
+
+    for size in (1000, 10000, 50000):
+        vals = [Bag(value=i) for i in range(size)]
+        for linked in (False, True):
+            count = 200 if linked else 10  # timed operations at each size
+            dusq = Dusq(linked=linked, deep=False)
+            dusq.update(vals)
+
+            start = time.perf_counter()
+            for i in range(count):
+                assert dusq.pull() == vals[i]
+            pulling = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for i in range(count):
+                assert dusq.remove(vals[size - 1 - i])
+            removing = time.perf_counter() - start
+            assert len(dusq) == size - 2 * count
+
+            logger.info("Dusq linked=%s at %d entries %.1fus per pull "
+                        "%.1fus per remove", linked, size,
+                        pulling / count * 1e6, removing / count * 1e6)
+
+    for deep in (True, False):
+        dusq = Dusq(linked=True, deep=deep)
+        start = time.perf_counter()
+        for val in vals:
+            dusq.push(val)
+        elapsed = time.perf_counter() - start
+        logger.info("Dusq deep=%s %.2fus per push", deep,
+                    elapsed / len(vals) * 1e6)
+
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_dusq_basic()
+    test_dusq_linked()
+    test_dusq_benchmark()
 
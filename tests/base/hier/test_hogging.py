@@ -4,6 +4,7 @@
 """
 
 import os
+import logging
 import platform
 import tempfile
 import inspect
@@ -14,10 +15,15 @@ import pytest
 
 import hio
 from hio.base import Doist, Tymist
-from hio.base.hier import Nabes, Rules, Hog, openHog, HogDoer, Hold, Bag
+import msgpack
+
+from hio.base.hier import (Nabes, Rules, Hog, BinHog, tsvify, openHog, HogDoer,
+                           Hold, Bag)
 from hio.help import TymeDom, namify, registerify
 from hio.help.timing import nowIso8601  # timing so pytest mock nowIso8601 works
 
+logger = logging.getLogger(__name__)
+
 
 def test_hog_basic():
     """Test Hog class"""
@@ -1557,9 +1563,178 @@ def test_hog_cycle_span(mockHelpingNowIso8601):
     """Done Test"""
 
 
+def test_bin_hog(mockHelpingNowIso8601):
+    """Test BinHog binary logging, writer thread, cycling, and tsvify"""
+    Hog._clearall()  # clear Hog.Instances for debugging
+
+    @namify
+    @dataclass
+    class LocationBag(TymeDom):
+        """Vector Bag dataclass"""
+        latN: Any = None
+        lonE: Any = None
+
+    tymist = Tymist()
+    boxerName = "BoxerTest"
+    iops = dict(_boxer=boxerName, _box="BoxTop")
+    rid = '__DqITqY1HgR8JA98qyvRW-S'
+
+    hold = Hold()
+    tymeKey = hold.tokey(("", "boxer", boxerName, "tyme"))
+    hold[tymeKey] = Bag(value=tymist.tyme)
+    homeKey = hold.tokey(("location", "home", ))
+    hold[homeKey] = LocationBag(latN=45.0, lonE=-90.0)
+
+    assert BinHog.Registry['binlog'] is BinHog
+    assert BinHog.Registry['BinLog'] is BinHog
+
+    for threaded in (True, False):
+        tymist = Tymist()
+        hog = Hog(name="tsv", iops=iops, hold=hold, temp=True, rid=rid,
+                  home=homeKey)
+        bog = BinHog(name="bin", iops=iops, hold=hold, temp=True, rid=rid,
+                     threaded=threaded, qsize=4, home=homeKey)
+        assert bog.fext == "bog"
+        assert bog.path.endswith("bin.bog")
+        assert bog.threaded == threaded
+
+        for i in range(10):
+            hold[tymeKey].value = tymist.tyme
+            hold[homeKey].latN = 45.0 + i
+            hold[homeKey].lonE = None if i == 5 else f"E{i}"
+            hog()
+            bog()
+            tymist.tick()
+
+        assert (bog.writer is not None) == threaded
+        assert bog.schema() == dict(rid=rid, base=boxerName, name="bin",
+                                    stamp='2021-06-27T21:26:21.233257+00:00',
+                                    rule=Rules.every, count=0,
+                                    tags=['tyme.key', 'home.key'],
+                                    keys=['_boxer_BoxerTest_tyme', 'location_home'],
+                                    fields=['tyme.value', 'home.latN', 'home.lonE'])
+        bog.close()  # drains writer
+        assert bog.writer is None
+        hog.close()
+
+        with open(bog.path, "rb") as file:
+            objs = list(msgpack.Unpacker(file))
+        assert objs[0]["fields"] == ['tyme.value', 'home.latN', 'home.lonE']
+        assert len(objs) == 11
+        assert objs[1] == [0.0, 45.0, "E0"]
+        assert objs[6] == [0.15625, 50.0, None]
+
+        dst = tsvify(bog.path)
+        assert dst.endswith("bin.hog")
+        with open(dst) as file:
+            bins = file.read()
+        with open(hog.path) as file:
+            tsvs = file.read()
+        assert bins == tsvs.replace("\ttsv\t", "\tbin\t")
+
+        os.remove(dst)
+        hog.close(clear=True)
+        bog.close(clear=True)
+        assert not os.path.exists(bog.path)
+        Hog._clearall()
+
+    # cycle by size tracked in memory with writer thread
+    bog = BinHog(name="cyc", iops=iops, hold=hold, temp=True, rid=rid,
+                 flushForce=True, cycleCount=2, cycleSize=300, home=homeKey)
+    for i in range(20):
+        hold[tymeKey].value = tymist.tyme
+        bog()
+        tymist.tick()
+    assert bog.size is not None and bog.size < 300
+    bog.drain()
+    assert bog.size == os.path.getsize(bog.path)
+    assert os.path.getsize(bog.cyclePaths[0]) >= 300
+    with open(bog.cyclePaths[0], "rb") as file:
+        objs = list(msgpack.Unpacker(file))
+    assert isinstance(objs[0], dict)  # header rewritten on cycle
+    assert all(isinstance(obj, list) for obj in objs[1:])
+    bog.close(clear=True)
+
+    """Done Test"""
+
+
+def test_bin_hog_writer_failure():
+    """Test BinHog writer thread io failure with full queue does not block
+    writes or close"""
+    import threading
+
+    Hog._clearall()
+    gate = threading.Event()
+
+    class Broken:
+        """File whose writes fail once gate is set"""
+        def write(self, data):
+            gate.wait()
+            raise OSError("disk full")
+
+    bog = BinHog(name="broken", temp=True, qsize=2)
+    file = bog.file
+    bog.file = Broken()  # writer thread takes file on first write
+    bog.write(b"abc")  # writer blocks in write
+    for i in range(bog.qsize):
+        bog.write(b"abc")
+    assert bog.queue.full()
+    gate.set()  # writer fails and stops with full queue
+    bog.writer.join(timeout=5.0)
+    assert not bog.writer.is_alive()
+    assert isinstance(bog.error, OSError)
+    assert bog.queue.full()
+
+    with pytest.raises(hio.HierError):
+        bog.write(b"abc")
+    bog.flush()  # does not wait on failed writer
+    bog.drain()
+    assert bog.writer is None and bog.queue is None
+    bog.file = file
+    bog.close(clear=True)
+    assert not bog.opened
+
+    """Done Test"""
+
+
+@pytest.mark.benchmark
+def test_bin_hog_benchmark():
+    """Benchmark per tick logging cost of Hog versus BinHog inline and threaded
+    with cycleSize set"""
+    import time
+
+    Hog._clearall()
+    tymist = Tymist()
+    boxerName = "BoxerBench"
+    iops = dict(_boxer=boxerName, _box="BoxTop")
+    hold = Hold()
+    tymeKey = hold.tokey(("", "boxer", boxerName, "tyme"))
+    hold[tymeKey] = Bag(value=tymist.tyme)
+    hits = {}
+    for k in range(10):
+        hits[f"h{k}"] = key = hold.tokey(("bench", f"k{k}"))
+        hold[key] = Bag(value=float(k))
+
+    count = 5000
+    for cls, kwa in ((Hog, {}), (BinHog, dict(threaded=False)), (BinHog, {})):
+        hog = cls(iops=iops, hold=hold, temp=True, cycleCount=1,
+                  cycleSize=1 << 30, hits=dict(hits), **kwa)
+        start = time.perf_counter()
+        for i in range(count):
+            hold[tymeKey].value = float(i)
+            hog()
+        elapsed = time.perf_counter() - start
+        hog.close(clear=True)
+        logger.info("%s %s %.1fus per tick", cls.__name__, kwa,
+                    elapsed / count * 1e6)
+
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_hog_basic()
     test_open_hog()
     test_hog_doer()
-
-
+    test_bin_hog()
+    test_bin_hog_writer_failure()
+    test_bin_hog_benchmark()
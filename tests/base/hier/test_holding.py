@@ -212,5 +212,249 @@ def test_hold_basic():
 
 
 
+def test_hold_batch():
+    """Test Hold.batch so Can field updates commit once"""
+    hold = Hold()
+    with hold.batch():  # not durable so does nothing
+        hold.red = Can(value=1)
+
+    with openDuror(cls=Subery) as subery:
+        hold = Hold(_hold_subery=subery)
+        hold.blue = Can(value=1)
+        can = hold.blue
+        assert subery.cans.get("blue") == can
+
+        with hold.batch():
+            assert subery.txn is not None
+            can.value = 2
+            can.value = 3
+            assert subery.cans.get("blue").value == 3
+        assert subery.txn is None
+        assert subery.cans.get("blue").value == 3
+
+        with pytest.raises(ValueError):
+            with hold.batch():
+                can.value = 4
+                raise ValueError("abort")
+        assert subery.cans.get("blue").value == 3  # durable update aborted
+
+    """Done Test"""
+
+
+def test_hold_write_behind():
+    """Test Hold write behind so dirty durable values flush in one transaction"""
+    with openDuror(cls=Subery, behind=True, span=1.0) as subery:
+        assert subery.behind
+        hold = Hold(_hold_subery=subery)
+        hold.blue = Can(value=1)  # inject syncs so writes through
+        can = hold.blue
+        assert can._behind
+        assert subery.cans.get("blue").value == 1
+        hold.queue = Durq()
+        hold.squeue = Dusq()
+
+        for i in range(2, 10):  # coalesced
+            can.value = i
+        hold.queue.push(Bag(value=1))
+        hold.queue.push(Bag(value=2))
+        assert hold.queue.pull() == Bag(value=1)
+        hold.squeue.push(IceBag(value=1))
+        hold.squeue.push(IceBag(value=1))
+        assert len(subery.dirty) == 3
+        assert subery.cans.get("blue").value == 1  # not yet written
+        assert subery.drqs.cnt("queue") == 0
+        assert subery.dsqs.cnt("squeue") == 0
+
+        assert hold.flush(tyme=0.0) == 3
+        assert not subery.dirty
+        assert subery.cans.get("blue").value == 9
+        assert subery.drqs.get("queue") == [Bag(value=2)]
+        assert subery.dsqs.get("squeue") == [IceBag(value=1)]
+
+        can.value = 10
+        assert hold.flush(tyme=0.5) == 0  # not yet span
+        assert subery.cans.get("blue").value == 9
+        assert hold.flush(tyme=1.0) == 1
+        assert subery.cans.get("blue").value == 10
+
+        can.value = 11
+        hold.green = Can(value=1)  # inject flushes pending so green syncs after
+        assert subery.cans.get("blue").value == 11
+        assert not subery.dirty
+
+    """Done Test"""
+
+
+def test_hold_write_behind_deltas():
+    """Test write behind Durq and Dusq flush only pending deltas and pin all
+    only when cleared since last flush"""
+    with openDuror(cls=Subery, behind=True) as subery:
+        hold = Hold(_hold_subery=subery)
+        hold.queue = Durq([Bag(value=i) for i in range(4)])
+        hold.squeue = Dusq([IceBag(value=i) for i in range(4)])
+        queue, squeue = hold.queue, hold.squeue
+        assert subery.drqs.cnt("queue") == subery.dsqs.cnt("squeue") == 4
+
+        pins = []  # full pins of queues
+        def spy(sdb):
+            pin = sdb.pin
+            def wrap(*pa, **kwa):
+                pins.append(pa)
+                return pin(*pa, **kwa)
+            sdb.pin = wrap
+        spy(subery.drqs)
+        spy(subery.dsqs)
+
+        assert queue.pull() == Bag(value=0)
+        queue.push(Bag(value=4))
+        queue.push(Bag(value=5))
+        assert queue.pull() == Bag(value=1)
+        assert (list(queue._pends), queue._pops) == ([Bag(value=4), Bag(value=5)], 2)
+        assert squeue.pull() == IceBag(value=0)
+        squeue.push(IceBag(value=4))
+        squeue.push(IceBag(value=2))  # not unique so no delta
+        assert squeue.remove(IceBag(value=4))  # pending add dropped
+        assert squeue.remove(IceBag(value=2))
+        squeue.push(IceBag(value=2))  # readded at end
+        assert list(squeue._adds) == [IceBag(value=2)]
+        assert list(squeue._rems) == [IceBag(value=0), IceBag(value=2)]
+
+        assert hold.flush() == 2
+        assert not pins  # deltas only
+        assert subery.drqs.get("queue") == list(queue)
+        assert list(queue) == [Bag(value=i) for i in (2, 3, 4, 5)]
+        assert subery.dsqs.get("squeue") == list(squeue)
+        assert list(squeue) == [IceBag(value=i) for i in (1, 3, 2)]
+        assert not queue._pends and not queue._pops
+        assert not squeue._adds and not squeue._rems
+
+        queue.push(Bag(value=6))  # pulled before flush so never durable
+        for i in range(5):
+            queue.pull()
+        assert not queue._pends and queue._pops == 4
+        assert hold.flush() == 1
+        assert not pins and not queue and subery.drqs.cnt("queue") == 0
+
+        queue.push(Bag(value=7))
+        queue.clear()
+        queue.push(Bag(value=8))
+        squeue.clear()
+        squeue.push(IceBag(value=9))
+        assert hold.flush() == 2
+        assert len(pins) == 2  # cleared so pinned
+        assert subery.drqs.get("queue") == [Bag(value=8)]
+        assert subery.dsqs.get("squeue") == [IceBag(value=9)]
+        assert not queue._cleared and not squeue._cleared
+
+        queue.push(Bag(value=10))  # flush aborted so deltas kept
+        def fail():
+            raise ValueError("crash in flush")
+        subery.mark(subery.cans, "fail", fail)
+        with pytest.raises(ValueError):
+            hold.flush()
+        assert list(queue._pends) == [Bag(value=10)]
+        del subery.dirty[(id(subery.cans), "fail")]
+        assert hold.flush() == 1
+        assert subery.drqs.get("queue") == [Bag(value=8), Bag(value=10)]
+
+    """Done Test"""
+
+
+def test_hold_write_behind_nested():
+    """Test write behind flush nested in outer batch settles pending deltas
+    only once outer batch commits and keeps them dirty when it aborts"""
+    with openDuror(cls=Subery, behind=True) as subery:
+        hold = Hold(_hold_subery=subery)
+        hold.blue = Can(value=1)
+        hold.queue = Durq([Bag(value=0)])
+        can, queue = hold.blue, hold.queue
+
+        with pytest.raises(ValueError):
+            with hold.batch():
+                can.value = 2
+                queue.push(Bag(value=1))
+                assert hold.flush() == 2  # nested so not yet committed
+                assert not subery.dirty
+                assert len(subery.flights) == 2
+                assert list(queue._pends) == [Bag(value=1)]  # not yet settled
+                raise ValueError("act failed")
+
+        assert not subery.flights
+        assert len(subery.dirty) == 2  # still dirty since aborted
+        assert list(queue._pends) == [Bag(value=1)]
+        assert subery.cans.get("blue").value == 1  # none of flush written
+        assert subery.drqs.get("queue") == [Bag(value=0)]
+
+        assert hold.flush() == 2  # retried
+        assert not subery.dirty and not subery.flights
+        assert not queue._pends
+        assert subery.cans.get("blue").value == 2
+        assert subery.drqs.get("queue") == [Bag(value=0), Bag(value=1)]
+
+        with hold.batch():  # flush twice in one batch writes deltas once
+            queue.push(Bag(value=2))
+            assert hold.flush() == 1
+            queue.push(Bag(value=3))
+            assert hold.flush() == 1  # pins all since deltas partly written
+            queue.push(Bag(value=4))  # dirty again at commit
+        assert list(queue._pends) == [Bag(value=2), Bag(value=3), Bag(value=4)]
+        assert subery.drqs.get("queue") == [Bag(value=i) for i in range(4)]
+        assert hold.flush() == 1
+        assert not queue._pends and not subery.fulls
+        assert subery.drqs.get("queue") == [Bag(value=i) for i in range(5)]
+
+    """Done Test"""
+
+
+def test_hold_write_behind_crash():
+    """Test write behind crash consistency at flush boundary"""
+    with tempfile.TemporaryDirectory() as headDirPath:
+        subery = Subery(name="crash", headDirPath=headDirPath, temp=False,
+                        reopen=True, behind=True, drain=False)
+        hold = Hold(_hold_subery=subery)
+        hold.red = Can(value=0)
+        hold.blue = Can(value=0)
+        hold.red.value = 1
+        hold.blue.value = 1
+        assert hold.flush() == 2  # boundary
+
+        hold.red.value = 2
+        hold.blue.value = 2
+
+        def fail():
+            raise ValueError("crash in flush")
+
+        subery.mark(subery.cans, "fail", fail)  # fails after red and blue pins
+        with pytest.raises(ValueError):
+            hold.flush()
+        assert len(subery.dirty) == 3  # still dirty since aborted
+        assert subery.cans.get("red").value == 1  # none of flush written
+        assert subery.cans.get("blue").value == 1
+
+        subery.close()  # crash without drain loses unflushed updates
+        assert not subery.dirty
+        subery.reopen()
+        hold = Hold(_hold_subery=subery)
+        hold.red = Can()
+        hold.blue = Can()
+        assert hold.red.value == 1  # state as of last flush boundary
+        assert hold.blue.value == 1
+
+        hold.red.value = 3
+        subery.drain = True
+        subery.close()  # synchronous flush on exit
+        subery.reopen()
+        assert subery.cans.get("red").value == 3
+        assert subery.cans.get("blue").value == 1
+        subery.close(clear=True)
+
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_hold_basic()
+    test_hold_batch()
+    test_hold_write_behind()
+    test_hold_write_behind_deltas()
+    test_hold_write_behind_nested()
+    test_hold_write_behind_crash()
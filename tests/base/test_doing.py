@@ -776,6 +776,52 @@ def test_dodoer_always():
     """End Test """
 
 
+def test_dodoer_docketed():
+    """
+    Test DoDoer class with Docket scheduler and tryDoers
+    """
+    tock = 1.0
+    doer0 = TryDoer(stop=1)
+    doer1 = TryDoer(stop=2)
+    doer2 = TryDoer(stop=3)
+
+    doers = [doer0, doer1, doer2]
+    dodoer = doing.DoDoer(tock=tock, doers=list(doers), docketed=True)
+    assert dodoer.docketed
+    assert isinstance(dodoer.deeds, doing.Docket)
+    with pytest.raises(TypeError):
+        dodoer.deeds = []
+
+    doist = doing.Doist(tock=tock, limit=5.0, doers=[dodoer], docketed=True)
+    doist.do()
+    assert doist.tyme == 4.0
+    assert dodoer.done
+    for doer in dodoer.doers:
+        assert doer.done
+        assert doer.tyme == dodoer.tyme == doist.tyme
+    assert not dodoer.deeds
+
+    # redo with limit so not all complete
+    doist.do(limit=2)
+    assert doist.tyme == 6.0
+    assert not dodoer.done
+    assert doer0.done
+    assert not doer1.done
+    assert not doer2.done
+    assert not dodoer.deeds
+
+    # always keeps running after deeds complete
+    dodoer = doing.DoDoer(tock=tock, doers=list(doers), always=True, docketed=True)
+    doist = doing.Doist(tock=tock, limit=5.0, doers=[dodoer])
+    doist.do()
+    assert doist.tyme == 5.0
+    assert not doist.done  # forced close at limit
+    for doer in dodoer.doers:
+        assert doer.done
+    assert not dodoer.deeds
+    """End Test """
+
+
 def test_dodoer_remove():
     """
     Test .remove method of DoDoer
@@ -6,6 +6,10 @@ tests.base.test_doist module
 import platform
 import inspect
 import asyncio
+import time
+import socket
+import threading
+import logging
 from datetime import datetime
 import traceback
 
@@ -16,6 +20,9 @@ from hio.base.doing import Doist, Doer
 from hio.base.basing import State
 from hio.base.doing import TryDoer, tryDo
 
+logger = logging.getLogger(__name__)
+
+
 def test_doist_basic():
     """
     Test basic doist
@@ -1448,6 +1455,290 @@ def test_doist_asyncio():
     #assert True
 
 
+def test_doist_idle():
+    """
+    Test Doist idle real time mode that sleeps until next due deed and wakes
+    early when registered fileobj is ready
+    """
+    class CountDoist(Doist):
+        """Doist that counts recur passes"""
+        def __init__(self, **kwa):
+            super().__init__(**kwa)
+            self.passes = 0
+
+        def recur(self, deeds=None):
+            self.passes += 1
+            super().recur(deeds=deeds)
+
+    class LogDoer(Doer):
+        """Doer that logs tyme on each recur"""
+        def __init__(self, stop, **kwa):
+            super().__init__(**kwa)
+            self.stop = stop
+            self.tymes = []
+
+        def recur(self, tyme):
+            self.tymes.append(tyme)
+            return len(self.tymes) >= self.stop
+
+    for docketed in (False, True):
+        doer = LogDoer(stop=3, tock=0.25)
+        doist = CountDoist(tock=0.03125, real=True, limit=2.0, idle=True,
+                           docketed=docketed)
+        assert doist.idle
+        assert doist.selector is None
+        start = time.perf_counter()
+        doist.do(doers=[doer])
+        elapsed = time.perf_counter() - start
+        assert doer.done
+        assert doer.tymes == [0.0, 0.25, 0.5]  # same tymes as busy mode
+        assert doist.done
+        assert doist.passes == 3  # one pass per due deed not one per tock
+        assert elapsed >= 0.45  # still synchronized to real time
+
+        # sleeping doer wakes when its registered socket becomes ready
+        class SockDoer(Doer):
+            """Doer that reads from socket and sleeps otherwise"""
+            def __init__(self, sock, **kwa):
+                super().__init__(**kwa)
+                self.sock = sock
+                self.reads = []
+
+            def recur(self, tyme):
+                try:
+                    data = self.sock.recv(1024)
+                except BlockingIOError:
+                    data = b""
+                if data:
+                    self.reads.append((tyme, data))
+                return False
+
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        sdoer = SockDoer(sock=rsock, tock=10.0)  # sleeps long after each run
+        doist = CountDoist(tock=0.03125, real=True, limit=0.5, idle=True,
+                           docketed=docketed)
+        doist.register(rsock, doer=sdoer)
+        assert doist.selector is not None
+        writer = threading.Timer(0.2, wsock.send, args=(b"wake up", ))
+        writer.start()
+        doist.do(doers=[sdoer])
+        writer.join()
+        assert not sdoer.done  # forced close at limit
+        assert doist.tyme == 0.5
+        assert len(sdoer.reads) == 1
+        tyme, data = sdoer.reads[0]
+        assert data == b"wake up"
+        assert 0.1875 <= tyme <= 0.3125  # hastened on next tock after ready
+        assert doist.passes < 8  # idles between wakes not one pass per tock
+        doist.unregister(rsock)
+        assert not doist.selector.get_map()
+        doist.unregister(rsock)  # idempotent
+        rsock.close()
+        wsock.close()
+
+    """Done Test"""
+
+
+def test_doist_arun():
+    """
+    Test Doist asyncio native .arun scheduled by loop timers and fileobj
+    readiness
+    """
+    class CountDoist(Doist):
+        """Doist that counts recur passes"""
+        def __init__(self, **kwa):
+            super().__init__(**kwa)
+            self.passes = 0
+
+        def recur(self, deeds=None):
+            self.passes += 1
+            super().recur(deeds=deeds)
+
+    class LogDoer(Doer):
+        """Doer that logs tyme on each recur"""
+        def __init__(self, stop, **kwa):
+            super().__init__(**kwa)
+            self.stop = stop
+            self.tymes = []
+
+        def recur(self, tyme):
+            self.tymes.append(tyme)
+            return len(self.tymes) >= self.stop
+
+    class SockDoer(Doer):
+        """Doer that reads from socket and sleeps otherwise"""
+        def __init__(self, sock, **kwa):
+            super().__init__(**kwa)
+            self.sock = sock
+            self.reads = []
+
+        def recur(self, tyme):
+            try:
+                data = self.sock.recv(1024)
+            except BlockingIOError:
+                data = b""
+            if data:
+                self.reads.append((tyme, data))
+            return False
+
+    for docketed in (False, True):
+        doer = LogDoer(stop=3, tock=0.1)
+        doist = CountDoist(tock=0.01, limit=2.0, docketed=docketed)
+        ticks = []
+
+        async def ticker():  # other asyncio task shares the loop
+            while not doist.done:
+                ticks.append(asyncio.get_running_loop().time())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            task = asyncio.create_task(ticker())
+            await doist.arun(doers=[doer])
+            await task
+
+        asyncio.run(main())
+        assert doer.done
+        assert doist.done
+        assert doist.passes == 3  # one pass per due deed not one per tock
+        assert 0.0 <= doer.tymes[0] < 0.01  # tyme tracks loop time
+        assert 0.1 <= doer.tymes[1] < 0.2
+        assert 0.2 <= doer.tymes[2] < 0.4
+        assert len(ticks) >= 10  # loop free for other tasks between passes
+
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        sdoer = SockDoer(sock=rsock, tock=10.0)  # sleeps long after each run
+        doist = CountDoist(tock=0.01, limit=0.3, docketed=docketed)
+        doist.register(rsock, doer=sdoer)
+
+        async def main():
+            asyncio.get_running_loop().call_later(0.1, wsock.send, b"wake up")
+            await doist.arun(doers=[sdoer])
+
+        asyncio.run(main())
+        assert not sdoer.done  # forced close at limit
+        assert not doist.done
+        assert doist.tyme >= 0.3
+        assert len(sdoer.reads) == 1
+        tyme, data = sdoer.reads[0]
+        assert data == b"wake up"
+        assert 0.1 <= tyme < 0.2  # woken by loop reader
+        # enter pass, wake pass, maybe one spurious wake pass from reader
+        # event already queued when wake pass read socket, limit pass
+        assert doist.passes <= 4
+        assert doist._loop is None
+        doist.unregister(rsock)
+        rsock.close()
+        wsock.close()
+
+    """Done Test"""
+
+
+def test_doist_docketed():
+    """
+    Test Doist with Docket scheduler matches deque scheduler run order and
+    done semantics
+    """
+    class LogDoer(Doer):
+        """Doer that logs (tyme, name) to shared log on each recur"""
+        def __init__(self, name, log, stop, **kwa):
+            super().__init__(**kwa)
+            self.name = name
+            self.log = log
+            self.stop = stop
+            self.count = 0
+
+        def recur(self, tyme):
+            self.log.append((tyme, self.name))
+            self.count += 1
+            return self.count >= self.stop
+
+    def run(docketed):
+        log = []
+        doers = [LogDoer(name="a", log=log, stop=4, tock=0.5),
+                 LogDoer(name="b", log=log, stop=6, tock=0.0),
+                 LogDoer(name="c", log=log, stop=2, tock=1.0),
+                 LogDoer(name="d", log=log, stop=3, tock=0.75)]
+        doist = doing.Doist(tock=0.25, limit=2.0, docketed=docketed)
+        doist.do(doers=doers)
+        return (log, [doer.done for doer in doers], doist.done, doist.tyme)
+
+    doist = doing.Doist(docketed=True)
+    assert doist.docketed
+    assert isinstance(doist.deeds, doing.Docket)
+    assert not doist.deeds
+
+    assert run(docketed=True) == run(docketed=False)
+    log, dones, done, tyme = run(docketed=True)
+    assert dones == [True, True, True, True]
+    assert done == True  # all deeds completed before limit
+    assert tyme == 1.75
+    assert [name for tyme, name in log if tyme == 0.0] == ['a', 'b', 'c', 'd']
+    assert [name for tyme, name in log if tyme == 1.5] == ['a', 'd']
+
+    # test extend and remove with docket
+    doer0 = TryDoer(stop=1)
+    doer1 = TryDoer(stop=2)
+    doer2 = TryDoer(stop=3)
+    doers = [doer0, doer1, doer2]
+    doist = doing.Doist(tock=1.0, doers=list(doers), docketed=True)
+    doist.enter()
+    assert len(doist.deeds) == 3
+    doist.recur()
+    doist.recur()
+    assert doist.tyme == 2.0
+    assert doer0.done
+    assert [doer for dog, retyme, doer in doist.deeds] == [doer1, doer2]
+
+    doer3 = TryDoer(stop=1)
+    doer4 = TryDoer(stop=2)
+    doist.extend(doers=[doer3, doer4])
+    assert [doer for dog, retyme, doer in doist.deeds] == [doer1, doer2, doer3, doer4]
+    doist.remove(doers=[doer1, doer3])
+    assert doist.doers == [doer0, doer2, doer4]
+    assert [doer for dog, retyme, doer in doist.deeds] == [doer2, doer4]
+    assert not doer1.done  # forced exit
+    assert not doer3.done  # forced exit
+    doist.recur()
+    doist.recur()
+    assert doer2.done
+    assert not doer4.done
+    assert len(doist.deeds) == 1
+    doist.exit()
+    assert not doer4.done  # forced close
+    assert not doist.deeds
+    """Done Test"""
+
+
+@pytest.mark.benchmark
+def test_docket_benchmark():
+    """
+    Benchmark Docket scheduler against deque scheduler for mostly sleeping
+    doers at 10, 1k, and 100k doers
+    """
+    def bench(size, docketed, passes=10):
+        doist = doing.Doist(tock=0.03125, docketed=docketed)
+        # all but one doer sleep far in the future after first run
+        doist.doers = [Doer(tock=1000.0) for i in range(size - 1)] + [Doer()]
+        doist.enter()
+        doist.recur()  # first pass runs all
+        start = time.perf_counter()
+        for i in range(passes):
+            doist.recur()
+        elapsed = (time.perf_counter() - start) / passes
+        assert len(doist.deeds) == size
+        doist.exit()
+        return elapsed
+
+    results = {}
+    for size in (10, 1000, 100000):
+        results[size] = (bench(size, docketed=False), bench(size, docketed=True))
+        logger.info("%7d doers deque %10.1f us/pass docket %10.1f us/pass",
+                    size, results[size][0] * 1e6, results[size][1] * 1e6)
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_doist_basic()
     test_doist_once()
@@ -1459,3 +1750,7 @@ if __name__ == "__main__":
     test_doist_remove_by_own_doer()
     test_nested_doers()
     test_doist_asyncio()
+    test_doist_idle()
+    test_doist_arun()
+    test_doist_docketed()
+    test_docket_benchmark()
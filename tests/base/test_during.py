@@ -5,6 +5,7 @@
 import pytest
 
 import os
+import logging
 import platform
 import tempfile
 import lmdb
@@ -16,6 +17,7 @@ from hio.base import (Duror, openDuror, SuberBase, Suber, IoSuber, IoSetSuber,
 from hio.base.hier import Bag, IceBag, CanDom, Can
 from hio.help import RawDom, RegDom, IceRegDom
 
+logger = logging.getLogger(__name__)
 
 
 def test_duror_basic():
@@ -1873,6 +1875,243 @@ def test_dom_ioset_suber():
     """Done Test"""
 
 
+def test_duror_batch():
+    """Test Duror.batch shared write transaction"""
+    with openDuror() as duror:
+        suber = Suber(db=duror, subkey='bags.')
+        iosuber = IoSuber(db=duror, subkey='ions.')
+        assert duror.txn is None
+
+        with duror.batch() as txn:
+            assert duror.txn is txn
+            assert suber.put(keys="a", val="x")
+            assert suber.pin(keys="b", val="y")
+            assert iosuber.put(keys="c", vals=["p", "q"])
+            assert suber.get(keys="a") == "x"  # reads see batch writes
+            assert iosuber.get(keys="c") == ["p", "q"]
+            with duror.batch() as inner:  # nested joins outer
+                assert inner is txn
+                assert suber.rem(keys="b")
+            assert duror.txn is txn
+        assert duror.txn is None
+
+        assert suber.get(keys="a") == "x"
+        assert suber.get(keys="b") is None
+        assert iosuber.get(keys="c") == ["p", "q"]
+
+        with pytest.raises(ValueError):  # exception aborts whole batch
+            with duror.batch():
+                assert suber.pin(keys="a", val="z")
+                assert iosuber.add(keys="c", val="r")
+                raise ValueError("abort")
+        assert duror.txn is None
+        assert suber.get(keys="a") == "x"
+        assert iosuber.get(keys="c") == ["p", "q"]
+
+    """Done Test"""
+
+
+@pytest.mark.benchmark
+def test_duror_batch_benchmark():
+    """Benchmark pins each with own transaction versus one batch"""
+    import time
+
+    count = 2000
+    with openDuror() as duror:
+        suber = Suber(db=duror, subkey='bags.')
+
+        start = time.perf_counter()
+        for i in range(count):
+            suber.pin(keys=f"{i:08d}", val=f"{i}")
+        solo = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with duror.batch():
+            for i in range(count):
+                suber.pin(keys=f"{i:08d}", val=f"{i + 1}")
+        batch = time.perf_counter() - start
+
+        assert suber.get(keys=f"{count - 1:08d}") == f"{count}"
+        logger.info("%d pins own txn %.4fs batch %.4fs speedup %.1fx",
+                    count, solo, batch, solo / batch)
+
+    """Done Test"""
+
+
+def test_duror_io_last():
+    """Test Duror addIoVal putIoVals and getIoValLast find last ordinal of key
+    next to other keys that begin with key and sep"""
+    with openDuror() as duror:
+        sdb = duror.env.open_db(key=b'ions.', dupsort=False)
+        assert duror.getIoValLast(sdb, b'a') is None
+        assert duror.addIoVal(sdb, b'a.b', b'x')  # sorts after entries of a
+        assert duror.addIoVal(sdb, b'a.' + b'f' * 31, b'y')  # between a and max
+        assert duror.getIoValLast(sdb, b'a') is None
+
+        assert duror.addIoVal(sdb, b'a', b'0')
+        assert duror.addIoVal(sdb, b'a', b'1')
+        assert duror.putIoVals(sdb, b'a', [b'2', b'3'])
+        assert duror.getIoValLast(sdb, b'a') == b'3'
+        assert duror.getIoVals(sdb, b'a') == [b'0', b'1', b'2', b'3']
+        assert duror.getIoVals(sdb, b'a.b') == [b'x']
+        assert duror.getIoValLast(sdb, b'a.b') == b'x'
+
+        assert duror.addIoVal(sdb, b'b', b'z')  # key after a
+        assert duror.addIoVal(sdb, b'', b'e')  # empty key sorts first
+        assert duror.getIoValLast(sdb, b'a') == b'3'
+        assert duror.popIoVal(sdb, b'a')
+        assert duror.addIoVal(sdb, b'a', b'4')  # still after last not first
+        assert duror.getIoVals(sdb, b'a') == [b'1', b'2', b'3', b'4']
+        assert duror.getIoValLast(sdb, b'b') == b'z'
+        assert duror.getIoValLast(sdb, b'c') is None
+
+    """Done Test"""
+
+
+@pytest.mark.benchmark
+def test_dom_io_suber_add_benchmark():
+    """Benchmark DomIoSuber.add at 10, 1k and 100k values per key.
+    Append cost is independent of number of values at key."""
+    import time
+
+    count = 200  # timed adds at each size
+    with openDuror() as duror:
+        suber = DomIoSuber(db=duror)
+        for size in (10, 1000, 100000):
+            keys = ("size", f"{size}")
+            with duror.batch():
+                suber.put(keys=keys, vals=[Bag(value=i) for i in range(size)])
+            assert suber.cnt(keys=keys) == size
+
+            start = time.perf_counter()
+            with duror.batch():  # exclude per add commit fsync from timing
+                for i in range(count):
+                    suber.add(keys=keys, val=Bag(value=size + i))
+            elapsed = time.perf_counter() - start
+
+            assert suber.getLast(keys=keys).value == size + count - 1
+            logger.info("DomIoSuber.add at %d values per key %.1fus per add",
+                        size, elapsed / count * 1e6)
+
+    """Done Test"""
+
+
+def test_ioset_suber_index():
+    """Test IoSetSuber value index sub db and migration of unindexed entries"""
+    with openDuror() as duror:
+        def entries(sdb):
+            with duror.env.begin() as txn:
+                return txn.stat(sdb)['entries']
+
+        assert IoSetSuber(db=duror, subkey='nons.').isdb is None  # default
+        suber = IoSetSuber(db=duror, subkey='bags.', indexed=True)
+        assert isinstance(suber.isdb, lmdb._Database)
+        keys = ("test", "pop")
+
+        assert suber.put(keys=keys, vals=["a", "b", "c"])
+        assert not suber.add(keys=keys, val="b")  # already in set
+        assert suber.add(keys=keys, val="d")
+        assert suber.get(keys=keys) == ["a", "b", "c", "d"]
+        assert entries(suber.isdb) == 4
+        ixkey = duror.ixkey(b"test_pop", b"c")
+        assert len(ixkey) == len(b"test_pop.") + 32
+        with duror.env.begin(db=suber.isdb) as txn:
+            assert txn.get(ixkey) == b"%032x" % 2
+
+        assert suber.rem(keys=keys, val="b")
+        assert not suber.rem(keys=keys, val="b")
+        assert suber.add(keys=keys, val="b")  # re-added at end
+        assert suber.get(keys=keys) == ["a", "c", "d", "b"]
+        assert suber.pop(keys=keys) == "a"
+        assert suber.add(keys=keys, val="a")
+        assert suber.get(keys=keys) == ["c", "d", "b", "a"]
+        assert entries(suber.isdb) == 4
+
+        assert suber.pin(keys=keys, vals=["x", "y", "x"])
+        assert suber.get(keys=keys) == ["x", "y"]
+        assert not suber.add(keys=keys, val="y")
+        assert suber.add(keys=keys, val="c")
+        assert entries(suber.isdb) == 3
+
+        assert suber.put(keys=("test", "popp"), vals=["x", "z"])  # prefix key
+        assert suber.rem(keys=keys)
+        assert suber.cnt(keys=keys) == 0
+        assert entries(suber.isdb) == 2
+        assert suber.add(keys=keys, val="x")
+        assert suber.trim(keys=("test", ""))
+        assert entries(suber.sdb) == 0
+        assert entries(suber.isdb) == 0
+
+        # migrate entries written without index
+        plain = IoSetSuber(db=duror, subkey='olds.', indexed=False)
+        assert plain.isdb is None
+        assert plain.put(keys=keys, vals=["a", "b", "c"])
+        assert plain.put(keys=("test", "push"), vals=["b"])
+        assert plain.reindex() == 0
+
+        suber = IoSetSuber(db=duror, subkey='olds.', indexed=True)  # reindexes
+        assert entries(suber.isdb) == 4
+        assert not suber.add(keys=keys, val="a")
+        assert suber.rem(keys=keys, val="b")
+        assert suber.get(keys=keys) == ["a", "c"]
+        assert suber.get(keys=("test", "push")) == ["b"]
+
+        plain.add(keys=keys, val="e")  # bypass index so stale
+        assert entries(suber.isdb) == 3
+        assert suber.reindex() == 4
+        assert not suber.add(keys=keys, val="e")
+
+    # readonly neither creates nor migrates index
+    with tempfile.TemporaryDirectory() as headDirPath:
+        duror = Duror(name="ixro", headDirPath=headDirPath, temp=False, reopen=True)
+        plain = IoSetSuber(db=duror, subkey='olds.')
+        assert plain.put(keys=("test", "pop"), vals=["a", "b"])
+        IoSetSuber(db=duror, subkey='news.', indexed=True).put(keys="x", vals=["c"])
+        duror.close()
+
+        duror.reopen(readonly=True)
+        suber = IoSetSuber(db=duror, subkey='olds.', indexed=True)
+        assert suber.isdb is None  # no index so scan
+        assert suber.get(keys=("test", "pop")) == ["a", "b"]
+        suber = IoSetSuber(db=duror, subkey='news.', indexed=True)
+        assert isinstance(suber.isdb, lmdb._Database)  # existing index
+        assert suber.get(keys="x") == ["c"]
+        duror.close(clear=True)
+
+    """Done Test"""
+
+
+@pytest.mark.benchmark
+def test_ioset_suber_add_benchmark():
+    """Benchmark IoSetSuber.add and rem with and without value index at 10,
+    1k and 10k values per key."""
+    import time
+
+    count = 100  # timed adds at each size
+    with openDuror() as duror:
+        for indexed in (False, True):
+            suber = IoSetSuber(db=duror, subkey=f"ix{int(indexed)}.", indexed=indexed)
+            for size in (10, 1000, 10000):
+                keys = ("size", f"{size}")
+                with duror.batch():
+                    suber.put(keys=keys, vals=[f"{i}" for i in range(size)])
+                assert suber.cnt(keys=keys) == size
+
+                start = time.perf_counter()
+                with duror.batch():  # exclude per add commit fsync from timing
+                    for i in range(count):
+                        assert suber.add(keys=keys, val=f"{size + i}")
+                        assert suber.rem(keys=keys, val=f"{i}")
+                elapsed = time.perf_counter() - start
+
+                assert suber.cnt(keys=keys) == size
+                logger.info("IoSetSuber indexed=%s add and rem at %d values "
+                            "per key %.1fus per pair", indexed, size,
+                            elapsed / count * 1e6)
+
+    """Done Test"""
+
+
 def test_subery_basic():
     """Test Subery class"""
 
@@ -1971,6 +2210,12 @@ if __name__ == "__main__":
     test_dom_suber()
     test_dom_io_suber()
     test_dom_ioset_suber()
+    test_duror_batch()
+    test_duror_batch_benchmark()
+    test_duror_io_last()
+    test_dom_io_suber_add_benchmark()
+    test_ioset_suber_index()
+    test_ioset_suber_add_benchmark()
     test_subery_basic()
 
 
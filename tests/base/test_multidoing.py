@@ -17,6 +17,7 @@ import json
 
 from dataclasses import dataclass, astuple, asdict, field
 
+from hio import hioing
 from hio.help import helping
 from hio.help.doming import datify, dictify
 from hio.base import tyming
@@ -221,6 +222,25 @@ def test_memo_doms():
     bd = multidoing.BokDom._fromdict(d)
     assert bd == bokdom
 
+    jobdom = multidoing.JobDom(load=multidoing.WorkDom(jid=3, data=[1, 2]))
+    memo = jobdom._asjson()
+    assert memo == b'{"tag":"JOB","name":"boss","load":{"jid":3,"data":[1,2],"error":""}}'
+    jd = multidoing.JobDom._fromjson(memo)
+    assert jd == jobdom
+    assert isinstance(jd.load, multidoing.WorkDom)
+
+    resdom = multidoing.ResDom(load=multidoing.WorkDom(jid=3, error="bad"))
+    memo = resdom._asjson()
+    assert memo == b'{"tag":"RES","name":"hand","load":{"jid":3,"data":null,"error":"bad"}}'
+    assert multidoing.ResDom._fromjson(memo) == resdom
+
+    memo = multidoing.HbtDom(name='hand0')._asjson()
+    assert memo == b'{"tag":"HBT","name":"hand0","load":{}}'
+
+    policy = multidoing.PolicyDom(restart=multidoing.RestartDex.failure, timeout=2.0)
+    assert policy._asdict() == {'restart': 'failure', 'limit': 3,
+                                'window': 60.0, 'timeout': 2.0}
+
     # test TagDex
     assert isinstance(multidoing.TagDex, multidoing.TagDomCodex)
 
@@ -232,6 +252,10 @@ def test_memo_doms():
         'ACK': multidoing.AckDom,
         'END': multidoing.EndDom,
         'BOK': multidoing.BokDom,
+        'JOB': multidoing.JobDom,
+        'RES': multidoing.ResDom,
+        'HBT': multidoing.HbtDom,
+        'TIM': multidoing.TimDom,
     }
 
     dom = multidoing.RegDom(name='testy')
@@ -598,6 +622,227 @@ def test_boss_crew_memo_cmd_end():
     """Done Test """
 
 
+class Test2Bosser(Bosser):
+    """Bosser that submits jobs and ends crew when all results are in"""
+
+    def __init__(self, **kwa):
+        """Initialize instance."""
+        super(Test2Bosser, self).__init__(**kwa)
+        self.works = list(range(12))
+
+
+    def enter(self, *, temp=None):
+        """Do 'enter' context."""
+        super(Test2Bosser, self).enter(temp=temp)
+        for work in self.works:
+            self.submit(work)
+
+
+    def recur(self, tyme):
+        """Do 'recur' context."""
+        done = super(Test2Bosser, self).recur(tyme=tyme)
+
+        assert all(len(dom.jobs) <= self.flight for dom in self.crew.values())
+
+        if len(self.results) == len(self.works):
+            for name, dom in self.crew.items():  # dom is CrewDom instance
+                memo = EndDom(name=self.name)._asjson().decode()
+                if dom.proc.is_alive() and not dom.exiting:
+                    self.memoit(memo, self.getAddr(name=name))
+                    dom.exiting = True  # now exiting
+
+            if not self.ctx.active_children():
+                return True  # all crew hands completed
+
+        return False  # incomplete recur again
+
+
+class Test2Crewer(Crewer):
+    """Crewer that squares work and fails odd multiples of five"""
+
+    def work(self, data):
+        """Returns square of data"""
+        if data % 5 == 0 and data % 2:
+            raise ValueError(f"Odd multiple of five {data}.")
+        return data * data
+
+
+def test_boss_crew_jobs():
+    """
+    Test Bosser dispatching JOB memos to Crewer hands and collecting RES memos.
+    """
+    if platform.system() == 'Windows':
+        pytest.skip("Windows not supported")
+
+    loads = []
+    for name in ('hand0', 'hand1'):
+        crewdoer = Test2Crewer(tock=0.01)
+        loads.append(dict(name=name, tyme=0.0, tock=0.01, real=True, limit=None,
+                          doers=[crewdoer], temp=True, boss=None))
+
+    doer = Test2Bosser(name="boss", tock=0.01, loads=loads, flight=2)
+    assert doer.flight == 2
+    assert not doer.jobs and not doer.results
+    assert doer.inflight == 0
+    assert doer.throughput == 0.0
+
+    doist = doing.Doist(tock=0.01, real=True, limit=20.0, doers=[doer], temp=True)
+    doist.do()
+
+    assert doist.done
+    assert doer.done == True
+    assert doer.submitted == doer.dispatched == 12
+    assert doer.completed == 11
+    assert doer.failed == 1  # 5
+    assert doer.inflight == 0
+    assert not doer.jobs
+    assert doer.throughput > 0.0
+    results = {jid: (data, error) for jid, data, error, name in doer.results}
+    assert len(results) == 12
+    for work in doer.works:
+        jid = work + 1
+        if work == 5:
+            assert results[jid] == (None, "Odd multiple of five 5.")
+        else:
+            assert results[jid] == (work * work, '')
+    assert {name for jid, data, error, name in doer.results} == {'hand0', 'hand1'}
+    assert sum(dom.done for dom in doer.crew.values()) == 12
+    for dom in doer.crew.values():
+        assert set(dom.startup) == {'boot', 'unpickle', 'enter'}
+        assert all(v >= 0.0 for v in dom.startup.values())
+    """Done Test """
+
+
+def test_boss_crew_forkserver():
+    """
+    Test Bosser with forkserver start method and preloaded modules.
+    """
+    if platform.system() == 'Windows':
+        pytest.skip("Windows not supported")
+
+    with pytest.raises(hioing.MultiError):
+        Bosser(method='fork')
+
+    loads = []
+    for name in ('hand0', 'hand1'):
+        crewdoer = Test2Crewer(tock=0.01)
+        loads.append(dict(name=name, tyme=0.0, tock=0.01, real=True, limit=None,
+                          doers=[crewdoer], temp=True, boss=None))
+
+    doer = Test2Bosser(name="boss", tock=0.01, loads=loads, method='forkserver',
+                       preload=['hio.base.multidoing', 'json'])
+    assert doer.method == 'forkserver'
+    assert doer.preload == ['hio.base.multidoing', 'json']
+    assert Bosser().method == Bosser.Method == 'spawn'
+
+    doist = doing.Doist(tock=0.01, real=True, limit=20.0, doers=[doer], temp=True)
+    doist.do()
+
+    assert doer.done == True
+    assert doer.completed == 11
+    assert doer.failed == 1
+    for name, dom in doer.crew.items():
+        assert dom.proc.exitcode == 0
+        assert set(dom.startup) == {'boot', 'unpickle', 'enter'}
+    """Done Test """
+
+
+def test_boss_res_match():
+    """
+    Test Bosser only completes job from RES of the hand holding the job at
+    the registered address of that hand.
+    """
+    doer = Bosser(name="boss", temp=True)
+    doer.logger = ogler.getLogger()
+    for name in ('hand0', 'hand1'):
+        doer.crew[name] = multidoing.HandDom()
+    doer.crew['hand0'].jobs[1] = 7
+    doer.addNameAddr(name='hand0', addr='/tmp/hand0')
+
+    def res(name, src):
+        memo = multidoing.ResDom(name=name,
+                                 load=multidoing.WorkDom(jid=1, data=49))
+        doer.rxms.append((memo._asjson().decode(), src, None))
+        doer.serviceRxMemos()
+
+    res('hand1', '/tmp/hand0')  # other hand does not hold job
+    res('hand0', '/tmp/hand1')  # not from registered address of hand
+    res('hand0', None)
+    assert not doer.results and doer.crew['hand0'].jobs == {1: 7}
+
+    doer.remNameAddr(name='hand0')  # killed so late RES before reregister
+    res('hand0', '/tmp/hand0')
+    assert not doer.results and doer.crew['hand0'].jobs == {1: 7}
+
+    doer.addNameAddr(name='hand0', addr='/tmp/hand0')
+    res('hand0', '/tmp/hand0')
+    assert list(doer.results) == [(1, 49, '', 'hand0')]
+    assert not doer.crew['hand0'].jobs
+    assert doer.completed == doer.crew['hand0'].done == 1
+    """Done Test """
+
+
+class Test3Crewer(Crewer):
+    """Crewer that crashes soon after it registers"""
+
+    def recur(self, tyme):
+        """Do 'recur' context."""
+        done = super(Test3Crewer, self).recur(tyme=tyme)
+        if self.registered and tyme > 0.2:
+            os._exit(3)  # crash
+        return False  # incomplete
+
+
+class Test4Crewer(Crewer):
+    """Crewer that hangs soon after it registers"""
+
+    def recur(self, tyme):
+        """Do 'recur' context."""
+        done = super(Test4Crewer, self).recur(tyme=tyme)
+        if self.registered and tyme > 0.2:
+            time.sleep(60)  # hang
+        return False  # incomplete
+
+
+def test_boss_crew_supervise():
+    """
+    Test Bosser restarting crashed Crewer hands per policy and killing hung
+    hands that stop heartbeating.
+    """
+    if platform.system() == 'Windows':
+        pytest.skip("Windows not supported")
+
+    loads = []
+    for name, cls in (('hand0', Test3Crewer), ('hand1', Test4Crewer)):
+        crewdoer = cls(tock=0.01, beat=0.05)
+        loads.append(dict(name=name, tyme=0.0, tock=0.01, real=True, limit=None,
+                          doers=[crewdoer], temp=True, boss=None))
+
+    policies = dict(hand0=multidoing.PolicyDom(restart=multidoing.RestartDex.failure,
+                                               limit=2, window=60.0),
+                    hand1=multidoing.PolicyDom(timeout=0.5))
+    doer = Bosser(name="boss", tock=0.01, loads=loads, policies=policies)
+    assert doer.policy == multidoing.PolicyDom()
+    assert doer.restarted == 0
+
+    doist = doing.Doist(tock=0.01, real=True, limit=30.0, doers=[doer], temp=True)
+    doist.do()
+
+    assert doer.done == True  # exited on own before limit
+    assert doist.tyme < 30.0
+    assert doer.restarted == 2
+    hand0 = doer.crew['hand0']
+    assert hand0.down
+    assert len(hand0.restarts) == 2
+    assert hand0.proc.exitcode == 3
+    hand1 = doer.crew['hand1']
+    assert hand1.down
+    assert not hand1.restarts
+    assert hand1.proc.exitcode == -9  # killed as hung
+    assert doer.countNameAddr == 0
+    """Done Test """
+
+
 if __name__ == "__main__":
     test_retag_regex()
     test_memo_doms()
@@ -606,5 +851,9 @@ if __name__ == "__main__":
     test_boss_crew_terminate()
     test_crewer_own_exit()
     test_boss_crew_memo_cmd_end()
+    test_boss_crew_jobs()
+    test_boss_res_match()
+    test_boss_crew_supervise()
+    test_boss_crew_forkserver()
 
 
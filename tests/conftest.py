@@ -38,3 +38,33 @@ def mockHelpingNowIso8601(monkeypatch):
         return "2021-06-27T21:26:21.233257+00:00"
 
     monkeypatch.setattr(hio.help.timing, "nowIso8601", mockNowIso8601)
+
+
+def pytest_addoption(parser):
+    """
+    Add --benchmark option to opt in to running benchmark tests
+    """
+    parser.addoption("--benchmark", action="store_true", default=False,
+                     help="run tests marked benchmark. Their results are "
+                          "logged at INFO so add --log-cli-level=INFO to see them")
+
+
+def pytest_configure(config):
+    """
+    Register benchmark marker
+    """
+    config.addinivalue_line("markers",
+                            "benchmark: opt in performance benchmark only run "
+                            "with --benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip tests marked benchmark unless --benchmark so the unit suite stays fast
+    """
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark so needs --benchmark to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
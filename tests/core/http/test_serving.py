@@ -162,6 +162,64 @@ def test_wsgi_server():
             assert responder.headers == response['headers']
 
 
+def test_wsgi_server_selective():
+    """
+    Test WSGI Server service request response with readiness driven servant
+    """
+    tymist = tyming.Tymist(tyme=0.0)
+
+    def wsgiApp(environ, start_response):
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', '12')])
+        return [b"Hello World!"]
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         selective=True, tymth=tymist.tymen()) as alpha:
+
+        assert alpha.servant.selective
+        assert alpha.servant.selector is not None
+
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+
+        with http.openClient(bufsize=131072, path=path, reconnectable=True, \
+                             tymth=tymist.tymen()) as beta:
+
+            for i in range(2):  # second request reuses persisted connection
+                request = dict([('method', u'GET'),
+                                 ('path', u'/echo?name=fame'),
+                                 ('qargs', dict()),
+                                 ('fragment', u''),
+                                 ('headers', dict([('Accept', 'application/json'),
+                                                    ('Content-Length', 0)])),
+                                ])
+
+                beta.requests.append(request)
+
+                while (beta.requests or beta.connector.txbs or not beta.responses or
+                       not alpha.idle()):
+                    alpha.service()
+                    time.sleep(0.05)
+                    beta.service()
+                    time.sleep(0.05)
+
+                assert len(alpha.servant.ixes) == 1
+                assert len(alpha.reqs) == 1
+                assert len(alpha.reps) == 1
+                assert not alpha.busies
+
+                assert len(beta.responses) == 1
+                response = beta.responses.popleft()
+                assert response['body'] == (b'Hello World!')
+                assert response['status'] == 200
+
+            ca = list(alpha.servant.ixes.keys())[0]
+            alpha.closeConnection(ca)
+            assert not alpha.servant.ixes
+            assert len(alpha.servant.selector.get_map()) == 1  # only listen socket
+
+    assert alpha.servant.selector is None
+
+
 def test_wsgi_server_tls():
     """
     Test Valet WSGI service with secure TLS request response
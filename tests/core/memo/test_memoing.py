@@ -3,6 +3,9 @@
 tests.core.test_memoing module
 
 """
+import time
+import logging
+
 from collections import deque
 from dataclasses import asdict
 from base64 import urlsafe_b64encode as encodeB64
@@ -19,8 +22,11 @@ from hio.base import doing, tyming
 from hio.core.memo import memoing
 from hio.core.memo import (Versionage, Sizage, Keyage,
                            MemoDex, ZeroDex, GramDex, AuthDex, SureDex, AckDex,
+                           MemoAuthDex,
                            Memoer, AuthMemoer, openMemoer, openAM,
-                           MemoerDoer, AuthMemoerDoer)
+                           MemoerDoer, AuthMemoerDoer, SureMemoer, openSM)
+
+logger = logging.getLogger(__name__)
 
 
 def _setupKeep(salt=None):
@@ -108,7 +114,11 @@ def test_memoing_codices():
         'GramSureAuthZero': 'bAAG',
         'GramSureAuth': 'bAAH',
         'Ack': 'bAAI',
-        'AckAuth': 'bAAJ'
+        'AckAuth': 'bAAJ',
+        'GramMemoAuthZero': 'bAAK',
+        'GramMemoAuth': 'bAAL',
+        'GramSureMemoAuthZero': 'bAAM',
+        'GramSureMemoAuth': 'bAAN',
     }
 
     assert asdict(ZeroDex) == \
@@ -117,6 +127,8 @@ def test_memoing_codices():
         'GramAuthZero': 'bAAC',
         'GramSureZero': 'bAAE',
         'GramSureAuthZero': 'bAAG',
+        'GramMemoAuthZero': 'bAAK',
+        'GramSureMemoAuthZero': 'bAAM',
     }
 
     assert asdict(GramDex) == \
@@ -125,6 +137,8 @@ def test_memoing_codices():
         'GramAuth': 'bAAD',
         'GramSure': 'bAAF',
         'GramSureAuth': 'bAAH',
+        'GramMemoAuth': 'bAAL',
+        'GramSureMemoAuth': 'bAAN',
     }
 
     assert asdict(AuthDex) == \
@@ -134,6 +148,18 @@ def test_memoing_codices():
         'GramSureAuthZero': 'bAAG',
         'GramSureAuth': 'bAAH',
         'AckAuth': 'bAAJ',
+        'GramMemoAuthZero': 'bAAK',
+        'GramMemoAuth': 'bAAL',
+        'GramSureMemoAuthZero': 'bAAM',
+        'GramSureMemoAuth': 'bAAN',
+    }
+
+    assert asdict(MemoAuthDex) == \
+    {
+        'GramMemoAuthZero': 'bAAK',
+        'GramMemoAuth': 'bAAL',
+        'GramSureMemoAuthZero': 'bAAM',
+        'GramSureMemoAuth': 'bAAN',
     }
 
     assert asdict(SureDex) == \
@@ -142,6 +168,8 @@ def test_memoing_codices():
         'GramSure': 'bAAF',
         'GramSureAuthZero': 'bAAG',
         'GramSureAuth': 'bAAH',
+        'GramSureMemoAuthZero': 'bAAM',
+        'GramSureMemoAuth': 'bAAN',
     }
 
     assert asdict(AckDex) == \
@@ -170,7 +198,11 @@ def test_memoer_class():
         'GramSureAuthZero': 'bAAG',
         'GramSureAuth': 'bAAH',
         'Ack': 'bAAI',
-        'AckAuth': 'bAAJ'
+        'AckAuth': 'bAAJ',
+        'GramMemoAuthZero': 'bAAK',
+        'GramMemoAuth': 'bAAL',
+        'GramSureMemoAuthZero': 'bAAM',
+        'GramSureMemoAuth': 'bAAN',
     }
 
     # Codes table with sizes of code (hard) and full primitive material
@@ -185,7 +217,11 @@ def test_memoer_class():
         'bAAG': Sizage(bz=4, nz=4, mz=24, vz=44, az=88),
         'bAAH': Sizage(bz=4, nz=4, mz=24, vz=0, az=88),
         'bAAI': Sizage(bz=4, nz=4, mz=24, vz=0, az=0),
-        'bAAJ': Sizage(bz=4, nz=4, mz=24, vz=44, az=88)
+        'bAAJ': Sizage(bz=4, nz=4, mz=24, vz=44, az=88),
+        'bAAK': Sizage(bz=4, nz=4, mz=24, vz=44, az=88),
+        'bAAL': Sizage(bz=4, nz=4, mz=24, vz=0, az=0),
+        'bAAM': Sizage(bz=4, nz=4, mz=24, vz=44, az=88),
+        'bAAN': Sizage(bz=4, nz=4, mz=24, vz=0, az=0),
     }
     #  verify Sizes and Codes
     for code, val in Memoer.Sizes.items():
@@ -224,11 +260,16 @@ def test_memoer_class():
         'bAAG': 'GramSureAuthZero',
         'bAAH': 'GramSureAuth',
         'bAAI': 'Ack',
-        'bAAJ': 'AckAuth'
+        'bAAJ': 'AckAuth',
+        'bAAK': 'GramMemoAuthZero',
+        'bAAL': 'GramMemoAuth',
+        'bAAM': 'GramSureMemoAuthZero',
+        'bAAN': 'GramSureMemoAuth',
     }
 
     assert Memoer.Zedex == ZeroDex
     assert Memoer.Audex == AuthDex
+    assert Memoer.Madex == MemoAuthDex
 
     for zero, nonzero in Memoer.Pairs.items():
         assert zero in ZeroDex
@@ -247,6 +288,8 @@ def test_memoer_class():
     assert Memoer.Pairs[MemoDex.GramAuthZero] == MemoDex.GramAuth
     assert Memoer.Pairs[MemoDex.GramSureZero] == MemoDex.GramSure
     assert Memoer.Pairs[MemoDex.GramSureAuthZero] == MemoDex.GramSureAuth
+    assert Memoer.Pairs[MemoDex.GramMemoAuthZero] == MemoDex.GramMemoAuth
+    assert Memoer.Pairs[MemoDex.GramSureMemoAuthZero] == MemoDex.GramSureMemoAuth
 
     # Base2 Binary index representation of Text Base64 Char Codes
     #assert Memoer.Bodes == {b'\xff\xf0': '__', b'\xff\xe0': '_-'}
@@ -393,6 +436,111 @@ def test_memoer_sign_verify():
 
 
 
+def test_memoer_key_cache():
+    """Test Memoer cached key material is reused and invalidated when .keep
+    changes
+    """
+    salt = b"ABCDEFGHIJKLMNOP"
+    try:
+        keep = _setupKeep(salt=salt)
+    except MemoerError as ex:
+        return
+
+    vid, vidD, vidE = list(keep.keys())
+    peer = Memoer(code=MemoDex.GramAuthZero, keep=keep, vid=vid)
+    assert not peer._sigkeys and not peer._verkeys
+
+    ser = b"Hello There"
+    sig = peer.sign(vidD, ser)
+    assert peer._sigkeys[vidD][0] == keep[vidD]
+    sigkey = peer._sigkeys[vidD][1]
+    assert peer.sigkey(vidD) is sigkey  # cached
+    assert peer.sign(vidD, ser) == sig
+    assert peer.verify(vidD, sig, ser)
+    verkey = peer._verkeys[vidD][1]
+    assert peer.verkey(vidD) is verkey  # cached
+
+    # non-transferable vid verkey is in vid but still cached when in keep
+    assert peer.verify(vid, peer.sign(vid, ser), ser)
+    assert vid in peer._verkeys
+
+    # replace keyage in keep with that of vidE so cache invalidated
+    keep[vidD] = keep[vidE]
+    assert peer.sigkey(vidD) is not sigkey
+    assert peer._sigkeys[vidD][0] == keep[vidE]
+    assert peer.sign(vidD, ser) == peer.sign(vidE, ser) != sig
+    with pytest.raises(MemoerVerifyError):
+        peer.verify(vidD, sig, ser)  # old sig fails with new verkey
+    assert peer._verkeys[vidD][0] == keep[vidE]
+
+    # remove from keep so cache invalidated
+    del keep[vidD]
+    with pytest.raises(MemoerError):
+        peer.sign(vidD, ser)
+    assert vidD not in peer._sigkeys
+    with pytest.raises(MemoerVerifyError):
+        peer.verify(vidD, sig, ser)
+    assert vidD not in peer._verkeys
+    """Done Test"""
+
+
+def test_memoer_pick_view():
+    """Test Memoer pick parses headers in place and returns body view
+    """
+    salt = b"ABCDEFGHIJKLMNOP"
+    try:
+        keep = _setupKeep(salt=salt)
+    except MemoerError as ex:
+        return
+
+    vid = list(keep.keys())[1]
+    peer = Memoer(code=MemoDex.GramAuthZero, keep=keep, vid=vid)
+
+    for curt, az in ((False, 88), (True, 66)):
+        peer.curt = curt
+        peer.size = (140 if curt else 174)  # forces two grams
+        grams = peer.rend("Hello there. How ya doing?")
+        assert len(grams) == 2
+        gram = bytes(grams[0])
+
+        # bytes gram body is view into same gram no copy
+        mid, gvid, gn, gc, body, code = peer.pick(gram)
+        assert code == MemoDex.GramAuthZero
+        assert isinstance(body, memoryview)
+        assert body.obj is gram
+        assert (gvid, gn, gc) == (vid, 0, 2)
+        peer.vids[mid] = gvid
+
+        # writable reused buffer verified in place
+        buf = bytearray(peer.size)
+        slot = memoryview(buf)[:len(grams[1])]
+        slot[:] = grams[1]
+        nmid, nvid, gn, gc, nbody, code = peer.pick(slot)
+        assert code == MemoDex.GramAuth
+        assert (nmid, nvid, gn, gc) == (mid, vid, 1, None)
+        assert nbody.obj is buf
+        assert bytes(body) + bytes(nbody) == b"Hello there. How ya doing?"
+        assert len(buf) == peer.size  # buffer not stripped
+
+        slot[-az - 1] ^= 0x01  # tamper body in place
+        with pytest.raises(MemoerVerifyError):
+            peer.pick(slot)
+        peer.vids = dict()
+
+        # absorb copies body out of view since buffer may be reused
+        slot[-az - 1] ^= 0x01  # restore
+        peer._absorbGram(gram, "beta")
+        peer._absorbGram(slot, "beta")
+        assert peer.rxgs[mid][0].obj is gram
+        assert isinstance(peer.rxgs[mid][1], bytes)
+        slot[:] = bytes(len(slot))  # reuse buffer
+        peer.serviceRxGrams()
+        assert peer.rxms.popleft() == ("Hello there. How ya doing?", "beta", vid)
+
+    """Done Test"""
+
+
+
 def test_memoer_basic():
     """Test Memoer class basic
     """
@@ -739,6 +887,281 @@ def test_memoer_small_gram_size():
     """ End Test """
 
 
+def test_memoer_completes():
+    """Test Memoer incremental completion tracking and preallocated fuse
+    """
+    peer = memoing.Memoer(size=38)
+    grams = peer.rend("Hello there. How ya doing?")
+    assert len(grams) == 5
+    other = peer.rend("See ya later!")
+
+    # out of order with zeroth last only completes once all received
+    for gram in grams[1:]:
+        peer._absorbGram(gram, "alpha")
+    peer._absorbGram(other[0], "beta")
+    assert not peer.completes
+    peer.serviceRxGrams()
+    assert len(peer.rxgs) == 2
+    assert not peer.rxms
+
+    peer._absorbGram(grams[0], "alpha")
+    assert len(peer.completes) == 1
+    peer._absorbGram(grams[0], "alpha")  # replay does not requeue
+    assert len(peer.completes) == 1
+    mid = peer.completes[0]
+    assert peer.fuse(peer.rxgs[mid], peer.counts[mid]) == "Hello there. How ya doing?"
+    assert peer.fuse(peer.rxgs[mid], peer.counts[mid], kind=bytes) == b"Hello there. How ya doing?"
+    memo = peer.fuse(peer.rxgs[mid], peer.counts[mid], kind=memoryview)
+    assert isinstance(memo, memoryview)
+    assert memo == b"Hello there. How ya doing?"
+    assert len(memo.obj) == len(memo)  # preallocated to exact size
+    assert peer.fuse(peer.rxgs[mid], peer.counts[mid] + 1) is None
+
+    peer.serviceRxGrams()
+    assert not peer.completes
+    assert peer.rxms.popleft() == ("Hello there. How ya doing?", "alpha", None)
+    assert len(peer.rxgs) == 1  # incomplete other remains
+
+    for gram in other[1:]:
+        peer._absorbGram(gram, "beta")
+    peer.serviceRxGrams()
+    assert not peer.rxgs
+    assert peer.rxms.popleft() == ("See ya later!", "beta", None)
+
+    """Done Test"""
+
+
+def test_memoer_rx_budget_expiry():
+    """Test Memoer bounded reassembly with budgets, LRU eviction, and expiry
+    """
+    peer = memoing.Memoer(size=38, srcbudget=30, rxbudget=40)
+    assert peer.rxtymeout == memoing.Memoer.RxTymeout == 30.0
+    assert (peer.dropped, peer.expired, peer.load) == (0, 0, 0)
+
+    memos = [peer.rend("Hello there. How ya doing?") for i in range(4)]
+
+    # partial memos from alpha and beta, each gram body 6 bytes but last 2
+    peer._absorbGram(memos[0][0], "alpha")
+    peer._absorbGram(memos[0][1], "alpha")
+    peer._absorbGram(memos[1][0], "beta")
+    peer._absorbGram(memos[2][0], "alpha")
+    assert peer.load == 24
+    assert peer.srcloads == {"alpha": 18, "beta": 6}
+    mids = list(peer.rxgs)
+    assert len(mids) == 3
+
+    # alpha over source budget evicts alpha least recent not beta
+    peer._absorbGram(memos[2][1], "alpha")
+    peer._absorbGram(memos[2][2], "alpha")
+    assert peer.dropped == 0
+    assert peer.srcloads == {"alpha": 30, "beta": 6}
+    peer._absorbGram(memos[2][3], "alpha")
+    assert peer.dropped == 1
+    assert mids[0] not in peer.rxgs
+    assert list(peer.rxgs) == mids[1:]
+    assert peer.srcloads == {"alpha": 24, "beta": 6}
+    assert peer.sizes[mids[2]] == 24
+
+    # total over rx budget evicts least recent of any source
+    peer._absorbGram(memos[3][0], "gamma")
+    peer._absorbGram(memos[3][1], "gamma")
+    assert peer.dropped == 2
+    assert mids[1] not in peer.rxgs  # beta was least recent
+    assert peer.load == 36 <= peer.rxbudget
+    assert peer.srcloads == {"alpha": 24, "gamma": 12}
+
+    # gram count that can never fit in budget drops on arrival
+    big = memoing.Memoer(size=38).rend("x" * 60)
+    peer._absorbGram(big[0], "delta")
+    assert peer.dropped == 3
+    assert "delta" not in peer.srcloads
+
+    # completed memo releases its load
+    peer._absorbGram(memos[2][4], "alpha")
+    peer.serviceRxGrams()
+    assert peer.rxms.popleft()[0] == "Hello there. How ya doing?"
+    assert peer.srcloads == {"gamma": 12}
+    assert peer.load == 12
+
+    # expiry of incomplete memos driven by tymers when wound
+    tymist = tyming.Tymist(tock=1.0)
+    peer = memoing.Memoer(size=38, rxtymeout=2.0, tymth=tymist.tymen())
+    memos = [peer.rend("Hello there. How ya doing?") for i in range(2)]
+    peer._absorbGram(memos[0][0], "alpha")
+    tymist.tick()
+    peer._absorbGram(memos[1][0], "beta")
+    tymist.tick()
+    peer._absorbGram(memos[0][1], "alpha")  # restarts alpha tymer
+    mids = list(peer.rxgs)  # restarted alpha moved to end
+    assert peer.sources[mids[0]] == "beta"
+    assert peer.rxtymers[mids[0]].remaining == 1.0
+    assert peer.rxtymers[mids[1]].remaining == 2.0
+    tymist.tick()
+    peer.serviceRxGrams()
+    assert peer.expired == 1
+    assert list(peer.rxgs) == [mids[1]]  # restarted alpha not yet expired
+    tymist.tick()
+    peer.serviceRxGrams()
+    assert peer.expired == 2
+    assert not peer.rxgs and not peer.rxtymers and not peer.srcloads
+    assert peer.load == 0
+
+    """Done Test"""
+
+
+def _shuttle(tx, rx, src, log, drop=None):
+    """Move echoed grams of tx into echos of rx as if received from src.
+    Lossy in-process transport drops gram number n of log when drop(n, gram).
+    """
+    while tx.echos:
+        gram, dst = tx.echos.popleft()
+        log.append(gram)
+        if drop and drop(len(log) - 1, gram):
+            continue
+        rx.echos.append((gram, src))
+
+
+def test_sure_memoer_lossy():
+    """Test SureMemoer reliable delivery over lossy echo transport
+    """
+    tymist = tyming.Tymist(tock=0.25)
+    memo = "Hello there. How ya doing? " * 2  # 54 bytes in 9 grams
+    with (openSM(name="alpha", size=38, echoic=True, window=4,
+                 tymth=tymist.tymen()) as alpha,
+          openSM(name="beta", size=38, echoic=True,
+                 tymth=tymist.tymen()) as beta):
+        assert alpha.code == MemoDex.GramSureZero
+        assert alpha.tymeout == SureMemoer.Tymeout == 1.0
+        assert alpha.window == 4
+        assert beta.window == SureMemoer.Window == 64
+
+        alpha.memoit(memo, "beta")
+        alpha.serviceAllTx()
+        assert len(alpha.sures) == 1
+        mid = list(alpha.sures)[0]
+        assert alpha.flights == {"beta": 4}  # window limits first flight
+        assert len(alpha.echos) == 4
+        assert mid in alpha.tymers
+
+        tx, rx = [], []
+        dropped = set()
+        def drop(n, gram):  # drop first transmission of gram number 1 and 6
+            gn = helping.b64ToInt(gram[4:8])
+            if gram[:4] == b'bAAF' and gn in (1, 6) and gn not in dropped:
+                dropped.add(gn)
+                return True
+            return False
+
+        flights = []
+        for i in range(40):
+            _shuttle(alpha, beta, "alpha", tx, drop)
+            beta.serviceAll()
+            _shuttle(beta, alpha, "beta", rx)
+            alpha.serviceAll()
+            flights.append(alpha.flights.get("beta", 0))
+            if alpha.delivered:
+                break
+            tymist.tick()
+
+        assert alpha.delivered == 1
+        assert not alpha.sures and not alpha.tymers and not alpha.flights
+        assert max(flights) <= alpha.window
+        assert beta.inbox.popleft() == (memo, "alpha", None)
+        assert not beta.inbox
+        assert beta.dones == {mid: 9}
+        assert not beta.ackables and not beta.rxgs
+        assert len(tx) == 11  # 9 grams plus 2 retransmitted missing only
+        assert all(ack[:4] == b'bAAI' for ack in rx)
+
+        # selective ack of received gram numbers as spans
+        peer = SureMemoer(size=38)
+        ack = peer.rendAck(mid, 3, [(0, 1), (2, 4)])
+        amid, avid, cnt, gc, body, code = peer.pick(ack)
+        assert (amid, avid, cnt, gc, code) == (mid, None, 3, None, MemoDex.Ack)
+        assert bytes(body) == b'\x00\x00\x00\x00\x00\x01\x00\x00\x02\x00\x00\x04'
+
+        # lost final ack so retransmit is reacked from dones but not redelivered
+        alpha.memoit("See ya later!", "beta")  # 3 grams
+        alpha.serviceAllTx()
+        mid = list(alpha.sures)[0]
+        _shuttle(alpha, beta, "alpha", tx)
+        beta.serviceAll()
+        assert beta.inbox.popleft()[0] == "See ya later!"
+        beta.echos.clear()  # lose ack
+        for i in range(4):  # until tymeout
+            tymist.tick()
+        alpha.serviceAll()
+        assert alpha.sures[mid].tries == 1
+        _shuttle(alpha, beta, "alpha", tx)  # all 3 grams retransmitted
+        beta.serviceAll()
+        assert not beta.inbox and not beta.rxgs
+        _shuttle(beta, alpha, "beta", rx)
+        alpha.serviceAll()
+        assert alpha.delivered == 2
+
+        # no acks at all fails after retries
+        alpha.retries = 2
+        alpha.memoit("Anybody home?", "gamma")
+        alpha.serviceAllTx()
+        lost = []
+        for i in range(12):
+            lost.extend(alpha.echos)  # lose all so no acks
+            alpha.echos.clear()
+            tymist.tick()
+            alpha.serviceAll()
+        assert alpha.failed == 1
+        assert not alpha.sures and not alpha.flights
+        assert len(lost) == 9  # 3 grams sent 3 times
+
+    """Done Test"""
+
+
+def test_sure_memoer_ack_source():
+    """Test SureMemoer ignores acks not from memo destination and when
+    authenticated acks that are unsigned or from other than the pinned vid
+    """
+    try:
+        keep = _setupKeep()  # uses default salt
+    except MemoerError as ex:
+        return
+
+    vidAlpha, vidBeta, vidGamma = list(keep.keys())[:3]
+    code = MemoDex.GramSureAuthZero
+    memo = "Hello there. How ya doing? " * 4
+    with (openSM(name="alpha", code=code, size=200, echoic=True, keep=keep,
+                 vid=vidAlpha) as alpha,
+          openSM(name="beta", code=code, keep=keep, vid=vidBeta) as beta,
+          openSM(name="gamma", code=code, keep=keep, vid=vidGamma) as gamma,
+          openSM(name="plain") as plain):
+        alpha.memoit(memo, "beta", vidAlpha)
+        alpha.serviceAllTx()
+        mid = list(alpha.sures)[0]
+        sure = alpha.sures[mid]
+        gc = len(sure.grams)
+        assert gc > 1
+        assert sure.nxt == gc and sure.vid is None
+
+        full = beta.rendAck(mid, gc, [(0, gc)])
+        alpha._absorbGram(full, "gamma")  # wrong src so ignored
+        assert not sure.acks and mid in alpha.sures
+
+        alpha._absorbGram(plain.rendAck(mid, gc, [(0, gc)]), "beta")  # unsigned
+        assert not sure.acks and mid in alpha.sures
+
+        alpha._absorbGram(beta.rendAck(mid, 1, [(0, 1)]), "beta")
+        assert sure.acks == {0}
+        assert sure.vid == vidBeta  # pinned
+
+        alpha._absorbGram(gamma.rendAck(mid, gc, [(0, gc)]), "beta")  # other vid
+        assert sure.acks == {0} and mid in alpha.sures
+
+        alpha._absorbGram(full, "beta")
+        assert mid not in alpha.sures
+        assert alpha.delivered == 1
+
+    """Done Test"""
+
+
 def test_memoer_multiple():
     """Test Memoer class with small gram size and multiple queued memos
     """
@@ -872,6 +1295,225 @@ def test_memoer_multiple_echoic_service_tx_rx():
     """ End Test """
 
 
+def test_memoer_batch():
+    """Test Memoer batched receive and send services with partial sends
+    Use .echoic property true so can service all
+    """
+    peer = memoing.Memoer(size=38, echoic=True, bn=2)
+    assert peer.bn == 2
+    assert memoing.Memoer().bn == memoing.Memoer.BatchCount == 16
+    peer.reopen()
+
+    peer.memoit("Hello there.", "alpha")
+    peer.memoit("How ya doing?", "beta")
+    peer.serviceTxMemos()
+    assert len(peer.txgs) == 5
+    grams = list(peer.txgs)
+
+    # fallback sendBatch stops at first incomplete
+    assert peer.sendBatch(grams[:2]) == [len(grams[0][0]), len(grams[1][0])]
+    assert len(peer.echos) == 2
+    peer.echos = deque()
+
+    # fallback receiveBatch drains up to bn
+    peer.echos.extend(grams[:3])
+    assert peer.receiveBatch(2) == grams[:2]
+    assert peer.receiveBatch(2) == grams[2:3]
+    assert peer.receiveBatch(2) == []
+    peer.echos = deque()
+
+    # batch round robins across destinations. Partial send puts remainder
+    # back at front of its destination queue and restores unattempted grams
+    sends = []
+    def send(gram, dst, *, echoic=False):
+        sends.append(bytes(gram))
+        cnt = len(gram) if len(sends) != 2 else 10  # second send partial
+        peer.echos.append((bytes(gram[:cnt]), dst))
+        return cnt
+
+    peer.send = send
+    assert not peer._serviceBatchTxGrams()  # first batch second gram partial
+    assert not peer.txgs
+    assert peer.txbs == (b'', None)
+    assert list(peer.txqs) == ["alpha", "beta"]
+    assert peer.txqs["alpha"] == deque([grams[1][0]])
+    assert peer.txqs["beta"][0] == bytearray(grams[2][0][10:])
+    assert len(peer.txqs["beta"]) == 3
+    peer.serviceTxGrams()  # greedy finishes partial then rest in batches
+    assert not peer.txqs
+    assert sends == [grams[0][0], grams[2][0], grams[1][0], grams[2][0][10:],
+                     grams[3][0], grams[4][0]]
+    del peer.send
+
+    # merge partial echo back to whole grams
+    echos = list(peer.echos)
+    peer.echos = deque([echos[0], (echos[1][0] + echos[3][0], echos[1][1]),
+                        echos[2]])
+    peer.echos.extend(echos[4:])
+    assert sorted(g for g, d in peer.echos) == sorted(g for g, d in grams)
+
+    peer.serviceAllRx()  # batched receives
+    assert not peer.echos
+    assert peer.inbox[0] == ('Hello there.', 'alpha', None)
+    assert peer.inbox[1] == ('How ya doing?', 'beta', None)
+
+    peer.close()
+    """ End Test """
+
+
+
+def test_memoer_rendit():
+    """Test Memoer lazy streaming rendit of str, bytes, and memoryview memos
+    and lazy enqueue of grams as .txgs drains
+    """
+    peer = memoing.Memoer(size=38)
+    mid = Memoer.makeMID()
+    memo = "Hello there. How ya doing?"
+    grams = peer.rend(memo, mid=mid)
+    assert len(grams) == 5
+
+    rendings = peer.rendit(memo, mid=mid)
+    assert not isinstance(rendings, list)
+    assert next(rendings) == grams[0]
+    assert list(rendings) == grams[1:]
+    assert list(peer.rendit(memo.encode(), mid=mid)) == grams
+    assert list(peer.rendit(bytearray(memo.encode()), mid=mid)) == grams
+    assert list(peer.rendit(memoryview(memo.encode()), mid=mid)) == grams
+    assert peer.rend(b"", mid=mid) == []
+
+    with pytest.raises(MemoerError):  # validated before first gram
+        peer.rendit(memo, mid="bad")
+
+    # lazy enqueue only up to .RendCount queued grams
+    peer = memoing.Memoer(size=38, echoic=True)
+    peer.RendCount = 4
+    peer.reopen()
+    memo = "x" * 600  # 100 grams
+    peer.memoit(memo.encode(), "alpha")
+    peer.serviceTxMemos()
+    assert not peer.txms
+    assert len(peer.txgs) == 4
+    assert len(peer.txrs) == 1
+    peer._serviceBatchTxGrams(bn=2)
+    assert len(peer.echos) == 2
+    assert len(peer.txqs["alpha"]) == 2
+    peer.serviceTxGrams()  # greedy drains all lazily
+    assert not peer.txrs and not peer.txgs and not peer.txqs
+    assert len(peer.echos) == 100
+    peer.serviceAllRx()
+    assert peer.inbox[0] == (memo, 'alpha', None)
+    peer.close()
+
+    # segmentation is linear in memo size
+    peer = memoing.Memoer(size=peer.MaxGramSize)
+    memo = bytes(2**24)
+    count = sum(1 for gram in peer.rendit(memo))
+    assert count == 257
+    """Done Test"""
+
+
+def test_memoer_binary():
+    """Test Memoer binary memo mode with bytes in and bytes out"""
+    peer = memoing.Memoer(size=38, echoic=True, binary=True)
+    assert peer.binary
+    assert not memoing.Memoer().binary
+    peer.reopen()
+
+    memo = bytes(range(256))  # not utf-8 decodable
+    peer.memoit(memo, "alpha")
+    peer.memoit(memoryview(memo)[:10], "beta")
+    peer.memoit("Hello there.", "gamma")
+    peer.serviceAllTx()
+    peer.serviceAllRx()
+    inbox = {src: (memo, vid) for memo, src, vid in peer.inbox}
+    assert inbox == {"alpha": (memo, None),
+                     "beta": (memo[:10], None),
+                     "gamma": (b"Hello there.", None)}
+
+    grams = {0: b"abc", 1: memoryview(b"def")}
+    assert peer.fuse(grams, 2, kind=bytes) == b"abcdef"
+    assert peer.fuse(grams, 2) == "abcdef"
+    assert peer.fuse(grams, 3, kind=bytes) is None
+    peer.close()
+    """Done Test"""
+
+
+def test_memoer_pacing():
+    """Test Memoer per destination transmit queues with token bucket pacers
+    and AIMD rate adaptation so noisy destination does not starve others
+    """
+    pacer = memoing.Pacer()
+    assert pacer.rate == memoing.Pacer.Rate
+    assert pacer.tokens == pacer.burst == memoing.Pacer.Burst
+    assert pacer.ready  # not wound so unpaced
+    pacer.spend(2 * pacer.burst)
+    assert pacer.ready  # still unpaced
+
+    tymist = tyming.Tymist(tock=1.0)
+    pacer = memoing.Pacer(rate=100.0, burst=200.0, tymth=tymist.tymen())
+    assert pacer.ready
+    pacer.spend(250)  # may go into debt
+    assert pacer.tokens == -50.0
+    assert not pacer.ready
+    tymist.tick()
+    assert pacer.ready
+    assert pacer.tokens == 50.0
+    tymist.tick()
+    tymist.tick()
+    assert pacer.ready
+    assert pacer.tokens == 200.0  # capped at burst
+
+    pacer.rate = memoing.Pacer.MinRate
+    pacer.decrease()
+    assert pacer.rate == memoing.Pacer.MinRate  # floor
+    pacer.increase()
+    assert pacer.rate == memoing.Pacer.MinRate + memoing.Pacer.Step
+    pacer.decrease()
+    assert pacer.rate == memoing.Pacer.MinRate  # (2 * MinRate) * 0.5
+    pacer.rate = 2 * memoing.Pacer.Rate
+    pacer.decrease()
+    assert pacer.rate == memoing.Pacer.Rate
+
+    # noisy destination does not starve quiet destination
+    tymist = tyming.Tymist(tock=1.0)
+    peer = memoing.Memoer(size=38, echoic=True, bn=4, rate=38.0)
+    peer.wind(tymist.tymen())
+    peer.reopen()
+    peer.memoit("x" * 48, "noisy")
+    peer.memoit("Hello there.", "quiet")
+    peer.serviceTxMemos()
+    assert len(peer.txgs) == 10
+    peer.pacer("noisy").burst = peer.pacer("noisy").tokens = 76.0
+    peer.pacer("quiet").burst = peer.pacer("quiet").tokens = 76.0
+
+    peer.serviceTxGrams()
+    assert not peer.txgs
+    dsts = [dst for gram, dst in peer.echos]
+    assert dsts == ["noisy", "quiet", "noisy", "quiet"]  # round robin
+    assert len(peer.txqs["noisy"]) == 6
+    assert "quiet" not in peer.txqs  # quiet all sent
+    peer.echos.clear()
+
+    peer.serviceTxGrams()  # no tokens so nothing sent
+    assert not peer.echos
+    tymist.tick()  # refill one gram worth
+    peer.serviceTxGrams()
+    assert len(peer.echos) == 1
+    assert len(peer.txqs["noisy"]) == 5
+
+    # zero count send is congestion signal so back off and requeue
+    rate = peer.pacers["noisy"].rate
+    peer.send = lambda gram, dst, *, echoic=False: 0
+    tymist.tick()
+    assert not peer._serviceBatchTxGrams()
+    assert peer.pacers["noisy"].rate == rate == 38.0  # already below MinRate
+    assert len(peer.txqs["noisy"]) == 5
+    assert peer.pacers["noisy"].ready  # refunded
+    del peer.send
+
+    peer.close()
+    """Done Test"""
+
 def test_memoer_multiple_echoic_service_all():
     """Test Memoer class with small gram size and multiple queued memos
     Use .echoic property true so can service all
@@ -1787,6 +2429,330 @@ def test_auth_memoer_multiple_echoic_service_all():
     """ End Test """
 
 
+def test_auth_memoer_deferred():
+    """Test AuthMemoer deferred batch verification of signed grams
+    """
+    try:
+        keep = _setupKeep()  # uses default salt
+    except MemoerError as ex:
+        return
+
+    vid = list(keep.keys())[1]  # vid not in non-zeroth grams
+
+    with memoing.openAM(size=170, echoic=True, keep=keep, vid=vid,
+                        deferred=True) as peer:
+        assert peer.deferred
+        assert not memoing.AuthMemoer(keep=keep).deferred
+
+        memo = "Hello there. How ya doing? " * 3
+        grams = peer.rend(memo, vid)
+        assert len(grams) == 3
+
+        # out of order non-zeroth before zeroth verified later together
+        # unverified until zeroth so charged to .pendload not src budget
+        for gram in (grams[2], grams[1]):
+            peer._absorbGram(memoryview(bytearray(gram)), "alpha")
+        mid = list(peer.rxgs)[0]
+        assert peer.pends == {mid}
+        assert peer.pendload == peer.sizes[mid] > 0
+        assert not peer.load and not peer.srcloads
+        peer._absorbGram(memoryview(bytearray(grams[0])), "alpha")
+        assert not peer.pends and not peer.pendload
+        assert peer.load == peer.srcloads["alpha"] == peer.sizes[mid]
+        assert len(peer.rxsgs[mid]) == 2  # zeroth verified eagerly
+        assert 0 not in peer.rxsgs[mid]
+        assert all(isinstance(g, bytes) for g in peer.rxsgs[mid].values())
+        assert peer.vids[mid] == vid
+        peer.serviceRxGrams()
+        assert not peer.rxsgs
+        assert not peer.rxgs
+        assert peer.rxms.popleft() == (memo, "alpha", vid)
+        assert peer.forged == 0
+
+        # tampered gram body caught by batch verify so whole memo dropped
+        grams = peer.rend(memo, vid)
+        bad = bytearray(grams[1])
+        bad[-89] ^= 0x01  # last body byte
+        for gram in (grams[0], bytes(bad), grams[2]):
+            peer._absorbGram(gram, "alpha")
+        assert len(peer.completes) == 1
+        peer.serviceRxGrams()
+        assert peer.forged == 1
+        assert not peer.rxms
+        assert not peer.rxgs and not peer.rxsgs and not peer.load
+
+        # tampered zeroth gram dropped eagerly
+        bad = bytearray(grams[0])
+        bad[-89] ^= 0x01  # last body byte
+        peer._absorbGram(bytes(bad), "alpha")
+        assert not peer.rxgs and not peer.load
+
+        # unverified grams never evict verified partial memo
+        peer.rxbudget = peer.srcbudget = 2 * len(memo)
+        grams = peer.rend(memo, vid)
+        peer._absorbGram(grams[0], "alpha")  # verified partial
+        mid = list(peer.rxgs)[0]
+        dropped = peer.dropped
+        for i in range(8):  # flood of unverified grams from other src
+            forged = peer.rend(memo, vid)
+            peer._absorbGram(forged[1], "mallory")
+            peer._absorbGram(forged[2], "mallory")
+        assert peer.dropped > dropped  # unverified evicted
+        assert peer.pendload <= peer.srcbudget
+        assert mid in peer.rxgs and mid not in peer.pends
+        peer._absorbGram(grams[1], "alpha")
+        peer._absorbGram(grams[2], "alpha")
+        peer.serviceRxGrams()
+        assert peer.rxms.popleft() == (memo, "alpha", vid)
+        for m in list(peer.rxgs):
+            peer._discard(m)
+        assert not peer.pends and not peer.pendload and not peer.load
+    """Done Test"""
+
+
+def test_auth_memoer_memo_signed():
+    """Test AuthMemoer with memo signed codes where only zeroth gram carries
+    signature over blake3 digest of all gram bodies
+    """
+    try:
+        keep = _setupKeep()  # uses default salt
+    except MemoerError as ex:
+        return
+
+    vid = list(keep.keys())[1]
+    memo = "Hello there. How ya doing? " * 40
+
+    # fewer grams than per gram signed on small gram transport
+    peer = AuthMemoer(size=548, keep=keep, vid=vid)
+    assert len(peer.rend(memo * 10, vid)) == 26  # 428 body bytes per gram
+    peer = AuthMemoer(code=MemoDex.GramMemoAuthZero, size=548, keep=keep, vid=vid)
+    assert peer.code in peer.Madex
+    assert len(peer.rend(memo * 10, vid)) == 22  # 516 body bytes per gram
+
+    for curt in (False, True):
+        with memoing.openAM(code=MemoDex.GramMemoAuthZero, size=200, curt=curt,
+                            echoic=True, keep=keep, vid=vid) as peer:
+            assert peer.authic
+            grams = peer.rend(memo, vid)
+            assert len(grams) > 2
+            noz = 24 if curt else 32  # non-zeroth overhead no vid no sig
+            assert all(len(g) - noz == 200 - 32 for g in grams[1:-1])
+            # no per gram verify so non-zeroth before zeroth in any order
+            for gram in reversed(grams):
+                peer._absorbGram(memoryview(bytearray(gram)), "alpha")
+            mid = list(peer.rxgs)[0]
+            assert list(peer.rxsgs[mid]) == [0]  # only zeroth kept
+            peer.serviceRxGrams()
+            assert peer.rxms.popleft() == (memo, "alpha", vid)
+            assert not peer.rxsgs and not peer.rxgs
+
+            # tampered non-zeroth body caught once memo complete
+            grams = peer.rend(memo, vid)
+            bad = bytearray(grams[1])
+            bad[-1] ^= 0x01
+            grams[1] = bytes(bad)
+            for gram in grams:
+                peer._absorbGram(gram, "alpha")
+            peer.serviceRxGrams()
+            assert peer.forged == 1
+            assert not peer.rxms and not peer.rxgs and not peer.rxsgs
+
+            # signature binds gram count so truncated memo never completes
+            grams = peer.rend(memo, vid)
+            for gram in grams[:-1]:
+                peer._absorbGram(gram, "alpha")
+            peer.serviceRxGrams()
+            assert not peer.rxms
+            assert len(peer.rxgs) == 1
+
+    # reliable memo signed
+    with memoing.openSM(code=MemoDex.GramSureMemoAuthZero, size=200, keep=keep,
+                        vid=vid, authic=True) as peer:
+        peer.memoit(memo, "beta")
+        peer.serviceTxMemos()
+        assert len(peer.txgs) > 2
+        for gram, dst in list(peer.txgs):
+            peer._absorbGram(gram, "alpha")
+        peer.serviceRxGrams()
+        assert peer.rxms.popleft() == (memo, "alpha", vid)
+        assert peer.rendAck(list(peer.acks)[0], 1, [])[:4] == MemoDex.AckAuth.encode()
+
+    # spoofed memo signed grams never evict verified partial memo of src
+    # even when not deferred since unverifiable until memo complete
+    with memoing.openAM(size=200, keep=keep, vid=vid) as peer:
+        assert not peer.deferred
+        spoofer = AuthMemoer(code=MemoDex.GramMemoAuthZero, size=200, keep=keep,
+                             vid=vid)
+        peer.rxbudget = peer.srcbudget = 2 * len(memo)
+        grams = peer.rend(memo, vid)
+        peer._absorbGram(grams[0], "alpha")  # verified partial
+        mid = list(peer.rxgs)[0]
+        load = peer.srcloads["alpha"]
+        dropped = peer.dropped
+        for i in range(8):  # flood of spoofed grams claiming same src
+            for gram in spoofer.rend(memo, vid)[1:]:
+                peer._absorbGram(gram, "alpha")
+        assert peer.dropped > dropped  # spoofed evicted
+        assert peer.pendload <= peer.srcbudget
+        assert peer.srcloads["alpha"] == peer.load == load  # not charged
+        assert mid in peer.rxgs and mid not in peer.pends
+        for gram in grams[1:]:
+            peer._absorbGram(gram, "alpha")
+        peer.serviceRxGrams()
+        assert peer.rxms.popleft() == (memo, "alpha", vid)
+        for m in list(peer.rxgs):
+            peer._discard(m)
+        assert not peer.pends and not peer.pendload and not peer.load
+    """Done Test"""
+
+
+def test_auth_memoer_rend_errors():
+    """Test AuthMemoer rejects invalid memo or signer in memoit and drops a
+    rending that fails later without stalling the memos queued after it
+    """
+    try:
+        keep = _setupKeep()  # uses default salt
+    except MemoerError as ex:
+        return
+
+    vid = list(keep.keys())[1]
+    memo = "Hello there. How ya doing? " * 4
+    with memoing.openAM(size=200, echoic=True, keep=dict(keep),
+                        vid=vid) as peer:
+        with pytest.raises(MemoerError):
+            peer.memoit(12345, "beta")  # not str or bytes like
+        with pytest.raises(MemoerError):
+            peer.memoit(memo, "beta", vid[:-1])  # invalid vid
+        with pytest.raises(MemoerError):
+            peer.memoit(memo, "beta", "B" + vid[1:])  # no signing key
+        with pytest.raises(MemoerError):
+            peer.memoit(bytes(peer.MaxMemoSize + 1), "beta")  # too big
+        assert not peer.txms
+
+        # signing key removed after memoit so lazy rending fails on first gram
+        other = list(keep.keys())[2]
+        peer.memoit(memo, "beta", other)
+        peer.memoit(memo, "beta", vid)
+        del peer.keep[other]
+        peer.serviceTxMemos()
+        assert not peer.txrs
+        assert len(peer.txgs) == len(peer.rend(memo, vid))
+        peer.serviceTxGrams()
+        peer.serviceAllRx()
+        assert peer.inbox.popleft() == (memo, "beta", vid)
+        assert not peer.inbox
+
+    """Done Test"""
+
+
+def test_auth_memoer_mixed_family():
+    """Test AuthMemoer drops grams of a memo whose code family differs from the
+    family of its first gram so unsigned memo signed grams can not ride on a
+    per gram signed zeroth gram
+    """
+    try:
+        keep = _setupKeep()  # uses default salt
+    except MemoerError as ex:
+        return
+
+    vid = list(keep.keys())[1]
+    memo = "Hello there. How ya doing? " * 4
+    fake = "Send all the money to Eve. " * 4
+    signer = AuthMemoer(size=200, keep=keep, vid=vid)
+    forger = AuthMemoer(code=MemoDex.GramMemoAuthZero, size=200, keep=keep,
+                        vid=vid)
+
+    for deferred in (False, True):
+        with memoing.openAM(size=200, echoic=True, keep=keep, vid=vid,
+                            deferred=deferred) as peer:
+            # per gram signed zeroth first then unsigned memo signed grams
+            mid = signer.makeMID()
+            grams = signer.rend(memo, vid, mid=mid)
+            forged = forger.rend(fake, vid, mid=mid)
+            assert grams[0][:4] == MemoDex.GramAuthZero.encode()
+            assert forged[1][:4] == MemoDex.GramMemoAuth.encode()
+            peer._absorbGram(grams[0], "alpha")
+            assert peer.families[mid] == MemoDex.GramAuth
+            for gram in forged[1:]:
+                peer._absorbGram(gram, "alpha")
+            assert list(peer.rxgs[mid]) == [0]  # forged grams dropped
+            peer.serviceRxGrams()
+            assert not peer.rxms
+
+            for gram in grams[1:]:  # genuine grams still complete memo
+                peer._absorbGram(gram, "alpha")
+            peer.serviceRxGrams()
+            assert peer.rxms.popleft() == (memo, "alpha", vid)
+            assert not peer.rxgs and not peer.families
+
+            # unsigned memo signed grams first then per gram signed zeroth
+            mid = signer.makeMID()
+            grams = signer.rend(memo, vid, mid=mid)
+            forged = forger.rend(fake, vid, mid=mid)
+            for gram in forged[1:]:
+                peer._absorbGram(gram, "alpha")
+            assert peer.families[mid] == MemoDex.GramMemoAuth
+            peer._absorbGram(grams[0], "alpha")  # other family so dropped
+            assert mid not in peer.counts
+            peer.serviceRxGrams()
+            assert not peer.rxms
+
+            # memo signed mid without its zeroth gram never fuses
+            peer.counts[mid] = len(forged)
+            peer.rxgs[mid][0] = b""
+            peer.completes.append(mid)
+            forged = peer.forged
+            peer.serviceRxGrams()
+            assert not peer.rxms
+            assert peer.forged == forged + 1
+            assert not peer.rxgs and not peer.families and not peer.load
+
+    """Done Test"""
+
+
+@pytest.mark.benchmark
+def test_auth_memoer_benchmark():
+    """Benchmark AuthMemoer signed memo throughput with key material derived
+    per gram (uncached) against cached key material with per gram and batch
+    deferred verification.
+    """
+    try:
+        keep = _setupKeep()  # uses default salt
+    except MemoerError as ex:
+        return
+
+    class Uncached(AuthMemoer):
+        """Derives key material on every gram as before caching"""
+        def sigkey(self, vid):
+            self._sigkeys.clear()
+            return super().sigkey(vid)
+
+        def verkey(self, vid):
+            self._verkeys.clear()
+            return super().verkey(vid)
+
+    vid = list(keep.keys())[1]
+    memo = "x" * 100000
+
+    def bench(cls, deferred=False):
+        peer = cls(size=1024, keep=keep, vid=vid, deferred=deferred)
+        start = time.perf_counter()
+        grams = peer.rend(memo, vid)
+        for gram in grams:
+            peer._absorbGram(gram, "alpha")
+        peer.serviceRxGrams()
+        elapsed = time.perf_counter() - start
+        assert peer.rxms.popleft()[0] == memo
+        return len(grams) / elapsed
+
+    uncached = bench(Uncached)
+    cached = bench(AuthMemoer)
+    deferred = bench(AuthMemoer, deferred=True)
+    logger.info("AuthMemoer grams/s uncached %.0f cached %.0f deferred %.0f",
+                uncached, cached, deferred)
+    """Done Test"""
+
+
 def test_auth_memoer_doer():
     """Test AuthMemoerDoer class
     """
@@ -1834,10 +2800,20 @@ if __name__ == "__main__":
     test_memoer_class()
     test_setup_keep()
     test_memoer_sign_verify()
+    test_memoer_key_cache()
+    test_memoer_pick_view()
     test_memoer_basic()
     test_memoer_small_gram_size()
+    test_memoer_completes()
+    test_memoer_rx_budget_expiry()
+    test_sure_memoer_lossy()
+    test_sure_memoer_ack_source()
     test_memoer_multiple()
     test_memoer_multiple_echoic_service_tx_rx()
+    test_memoer_batch()
+    test_memoer_rendit()
+    test_memoer_binary()
+    test_memoer_pacing()
     test_memoer_multiple_echoic_service_all()
     test_memoer_basic_signed()
     test_memoer_multiple_signed()
@@ -1848,5 +2824,10 @@ if __name__ == "__main__":
     test_auth_memoer_basic()
     test_open_sm()
     test_auth_memoer_multiple_echoic_service_all()
+    test_auth_memoer_deferred()
+    test_auth_memoer_memo_signed()
+    test_auth_memoer_rend_errors()
+    test_auth_memoer_mixed_family()
+    test_auth_memoer_benchmark()
     test_auth_memoer_doer()
 
@@ -0,0 +1,69 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.shm.test_peer_memoing module
+
+"""
+from hio.base import doing
+from hio.core.memo import MemoDex
+from hio.core.shm import peermemoing
+
+
+def test_memoer_peer_basic():
+    """Test shared memory PeerMemoer class"""
+    with (peermemoing.openPM(name="alpha", peers=["beta"], size=38) as alpha,
+          peermemoing.openPM(name="beta", peers=["alpha"], size=38) as beta):
+        assert alpha.code == MemoDex.GramZero
+        assert alpha.bc == 64
+        assert alpha.opened and beta.opened
+
+        alpha.memoit("Hello there.", beta.path)
+        alpha.memoit("How ya doing?", beta.path)
+        alpha.serviceTxMemos()
+        alpha.serviceTxGrams()
+        assert not alpha.txgs
+        assert alpha.txbs == (b'', None)
+
+        beta.serviceReceives()
+        beta.serviceRxGrams()
+        assert [(memo, src) for memo, src, vid in beta.rxms] == [
+            ("Hello there.", "alpha"), ("How ya doing?", "alpha")]
+
+    """Done Test"""
+
+
+def test_memoer_peer_binary():
+    """Test shared memory PeerMemoer large binary memos in batches"""
+    memo = bytes(range(256)) * 4096  # 1 MiB
+    with (peermemoing.openPM(name="alpha", peers=["beta"], bn=16) as alpha,
+          peermemoing.openPM(name="beta", peers=["alpha"], bn=16,
+                             binary=True) as beta):
+        alpha.memoit(memo, beta.path)
+        while not beta.inbox:
+            alpha.service()
+            beta.service()
+        assert not alpha.txgs and not alpha.txqs
+        data, src, vid = beta.inbox.popleft()
+        assert isinstance(data, bytes)
+        assert data == memo
+        assert src == "alpha"
+
+    """Done Test"""
+
+
+def test_peermemoer_doer():
+    """Test shared memory PeerMemoerDoer class"""
+    peer = peermemoing.PeerMemoer(name="test", reopen=False)
+    assert not peer.opened
+    doer = peermemoing.PeerMemoerDoer(peer=peer)
+    assert doer.peer == peer
+    doist = doing.Doist(tock=0.03125, real=True, limit=0.125)
+    doist.do(doers=[doer])
+    assert doist.tyme == 0.125
+    assert not peer.opened
+    """Done Test"""
+
+
+if __name__ == "__main__":
+    test_memoer_peer_basic()
+    test_memoer_peer_binary()
+    test_peermemoer_doer()
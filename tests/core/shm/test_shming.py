@@ -0,0 +1,171 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.shm.test_shming module
+
+"""
+import pytest
+
+from hio import hioing
+from hio.base import doing
+from hio.core.shm import shming
+
+
+def test_ring_basic():
+    """Test Ring put get release and wrap"""
+    ring = shming.Ring("hio_test_ring", capacity=60, create=True)
+    assert ring.owned
+    assert ring.capacity == 64  # rounded up to alignment
+    assert ring.cursor == ring.head == 0
+    assert ring.count == 0
+    assert ring.get() is None
+
+    peer = shming.Ring("hio_test_ring")  # producer attaches
+    assert not peer.owned
+    assert peer.capacity == 64
+
+    assert peer.put(b"abc")  # 4 + 3 padded to 8
+    assert peer.put(b"0123456789")  # 4 + 10 padded to 16
+    assert peer.head == 24
+    assert ring.count == 24
+
+    data = ring.get()
+    assert isinstance(data, memoryview)
+    assert data == b"abc"
+    assert bytes(ring.get()) == b"0123456789"
+    assert ring.get() is None
+    assert ring.cursor == 24
+    assert ring.count == 24  # not yet released
+    del data
+
+    with pytest.raises(hioing.SizeError):
+        peer.put(b"x" * 61)
+
+    assert peer.put(b"x" * 28)  # 32 fills to 56
+    assert not peer.put(b"y" * 12)  # would wrap but tail not released
+    ring.release()
+    assert ring.count == 32
+    assert peer.put(b"y" * 12)  # pads 8 to end and wraps to 0
+    assert peer.head == 64 + 16
+    assert bytes(ring.get()) == b"x" * 28
+    assert bytes(ring.get()) == b"y" * 12  # skips pad
+    assert ring.get() is None
+    ring.release()
+    assert ring.count == 0
+
+    peer.close()
+    ring.close()
+    assert ring.shm is None
+    with pytest.raises(FileNotFoundError):
+        shming.Ring("hio_test_ring")
+    """Done Test"""
+
+
+def test_peer_basic():
+    """Test Peer send and receive"""
+    alpha = shming.Peer(name="alpha", peers=["beta"], capacity=1024)
+    assert alpha.name == alpha.path == "alpha"
+    assert alpha.bs == alpha.BufSize
+    assert not alpha.opened
+    assert alpha.reopen()
+    assert alpha.opened
+    assert list(alpha.rxrings) == ["beta"]
+
+    beta = shming.Peer(name="beta", capacity=1024)
+    assert beta.send(b"Hello", "gamma") == 0  # gamma not open
+    assert beta.send(b"Hello", alpha.path) == 5  # attaches
+    assert "alpha" in beta.txrings
+    assert alpha.receive() == (b"Hello", "beta")
+    assert alpha.receive() == (b'', None)
+
+    assert alpha.send(b"Hi", "beta") == 0  # beta not receiving from alpha
+    assert beta.reopen()
+    beta.addPeer("alpha")
+    assert alpha.send(b"Hi", "beta") == 2
+    assert beta.receive() == (b"Hi", "alpha")
+
+    for i in range(5):
+        assert beta.send(b"x" * 100, "alpha") == 100
+    grams = alpha.receiveBatch(3)
+    assert len(grams) == 3
+    assert all(isinstance(gram, memoryview) for gram, src in grams)
+    assert [(bytes(gram), src) for gram, src in grams] == [(b"x" * 100, "beta")] * 3
+    del grams
+    assert len(alpha.receiveBatch(3)) == 2
+    assert alpha.receiveBatch(3) == []
+
+    while beta.send(b"z" * 100, "alpha"):  # fill
+        pass
+    assert alpha.receive() == (b"z" * 100, "beta")
+    assert beta.send(b"z" * 100, "alpha") == 100  # room again
+
+    beta.close()
+    assert not beta.opened
+    assert not beta.rxrings and not beta.txrings
+    alpha.close()
+    """Done Test"""
+
+
+def test_peer_consumer_restart():
+    """Test Peer producer reattaches after consumer closes or is replaced"""
+    alpha = shming.Peer(name="alpha", peers=["beta"], capacity=1024, reopen=True)
+    beta = shming.Peer(name="beta", capacity=1024)
+    assert beta.send(b"one", "alpha") == 3
+    ring = beta.txrings["alpha"]
+    assert ring.current
+    assert ring.epoch == alpha.rxrings["beta"].epoch != shming.Ring.Closed
+    assert alpha.receive() == (b"one", "beta")
+
+    # consumer restarts so stale ring dropped and new ring attached
+    alpha.close()
+    assert not ring.current
+    assert beta.send(b"two", "alpha") == 0  # not open so try again later
+    assert "alpha" not in beta.txrings
+    alpha.reopen()
+    assert beta.send(b"two", "alpha") == 3
+    assert beta.txrings["alpha"] is not ring
+    assert beta.txrings["alpha"].current
+    assert alpha.receive() == (b"two", "beta")
+
+    # consumer dies without close so replacement closes stale segment
+    ring = beta.txrings["alpha"]
+    gamma = shming.Peer(name="alpha", peers=["beta"], capacity=1024, reopen=True)
+    assert not ring.current
+    assert beta.send(b"three", "alpha") == 5
+    assert beta.txrings["alpha"].epoch == gamma.rxrings["beta"].epoch
+    assert gamma.receive() == (b"three", "beta")
+    assert alpha.receive() == (b'', None)
+
+    alpha.close()  # replaced so does not unlink segment of gamma
+    assert beta.send(b"four", "alpha") == 4
+    assert gamma.receive() == (b"four", "beta")
+    beta.close()
+    gamma.close()
+    with pytest.raises(FileNotFoundError):
+        shming.Ring(beta.ringName("beta", "alpha"))
+    """Done Test"""
+
+
+def test_open_peer():
+    """Test openPeer and PeerDoer"""
+    with (shming.openPeer(name="alpha", peers=["beta"]) as alpha,
+          shming.openPeer(name="beta", peers=["alpha"]) as beta):
+        assert alpha.opened and beta.opened
+        assert alpha.send(b"Hello", beta.path) == 5
+        assert beta.receive() == (b"Hello", "alpha")
+
+    assert not alpha.opened and not beta.opened
+
+    peer = shming.Peer(name="alpha")
+    doer = shming.PeerDoer(peer=peer)
+    assert doer.peer == peer
+    doist = doing.Doist(tock=0.03125, real=True, limit=0.125)
+    doist.do(doers=[doer])
+    assert not peer.opened
+    """Done Test"""
+
+
+if __name__ == "__main__":
+    test_ring_basic()
+    test_peer_basic()
+    test_peer_consumer_restart()
+    test_open_peer()
@@ -5,6 +5,7 @@ tests.core.test_tcp module
 """
 import pytest
 
+import asyncio
 import platform
 import sys
 import os
@@ -577,6 +578,102 @@ def test_tcp_service():
 
     """Done Test"""
 
+def test_tcp_service_selective():
+    """
+    Test Server selective readiness driven service methods
+    """
+    tymist = tyming.Tymist()
+    with tcp.openServer(tymth=tymist.tymen(),  ha=("", 6101), selective=True) as server, \
+         tcp.openClient(tymth=tymist.tymen(),  ha=("127.0.0.1", 6101)) as beta, \
+         tcp.openClient(tymth=tymist.tymen(),  ha=("127.0.0.1", 6101)) as gamma:
+
+        assert server.opened == True
+        assert server.selective == True
+        assert server.selector is not None
+        assert len(server.selector.get_map()) == 1  # listen socket
+
+        # nothing accepted until select finds listen socket readable
+        beta.serviceConnect()
+        time.sleep(0.05)
+        server.serviceConnects()
+        assert not server.ixes
+
+        while not (beta.connected and beta.ca in server.ixes):
+            beta.serviceConnect()
+            server.serviceSelects()
+            server.serviceConnects()
+            time.sleep(0.05)
+
+        while not (gamma.connected and gamma.ca in server.ixes):
+            gamma.serviceConnect()
+            server.serviceSelects()
+            server.serviceConnects()
+            time.sleep(0.05)
+
+        assert len(server.selector.get_map()) == 3
+        ixBeta = server.ixes[beta.ca]
+        ixGamma = server.ixes[gamma.ca]
+        assert ixBeta.pends is server.txpends
+
+        # only readable remoters are serviced
+        msgOut = b"Beta sends to Server"
+        beta.tx(msgOut)
+        beta.serviceSends()
+        time.sleep(0.05)
+        server.serviceSelects()
+        assert server.readables == {beta.ca}
+        server.serviceReceivesAllIx()
+        assert not server.readables  # consumed
+        assert bytes(ixBeta.rxbs) == msgOut
+        assert not ixGamma.rxbs
+        ixBeta.clearRxbs()
+
+        # tx flags pending send
+        msgOut = b"Server sends to Gamma"
+        ixGamma.tx(msgOut)
+        assert server.txpends == {gamma.ca}
+        server.serviceSendsAllIx()
+        assert not server.txpends
+        assert not server.txblocks
+        while len(gamma.rxbs) < len(msgOut):
+            gamma.serviceReceives()
+            time.sleep(0.05)
+        assert bytes(gamma.rxbs) == msgOut
+        gamma.clearRxbs()
+
+        # send big from server to beta so blocks and waits for writable
+        size = beta.actualBufSizes()[1]
+        msgOutBig = bytearray()
+        count = 0
+        while (len(msgOutBig) <= size * 8):
+            msgOutBig.extend(b"%032x_" % (count))
+            count += 1
+
+        ixBeta.tx(msgOutBig)
+        while len(beta.rxbs) < len(msgOutBig):
+            server.service()
+            time.sleep(0.01)
+            beta.serviceReceives()
+        assert bytes(beta.rxbs) == msgOutBig
+        beta.clearRxbs()
+        server.service()
+        assert not server.txblocks
+        assert not ixBeta.txbs
+
+        # far side close is detected as readable
+        gamma.close()
+        time.sleep(0.05)
+        server.service()
+        assert ixGamma.cutoff
+        server.removeIx(gamma.ca)
+        assert len(server.selector.get_map()) == 2
+
+    assert server.opened == False
+    assert server.selector is None
+
+    """Done Test"""
+
+
 def test_client_auto_reconnect():
     """
     Test client auto reconnect when  .reconnectable
@@ -1520,5 +1617,42 @@ def test_echo_server_client_doers():
     """End Test """
 
 
+def test_server_client_doers_arun():
+    """
+    Test ServerDoer ClientDoer under Doist.arun where ServerDoer with long tock
+    is woken by readiness of its watched sockets both directly and nested
+    """
+    for nested in (False, True):
+        port = 6120
+        server = tcp.Server(host="", port=port)
+        client = tcp.Client(host="localhost", port=port)
+        serdoer = tcp.ServerDoer(server=server, tock=10.0)  # sleeps long
+        clidoer = tcp.ClientDoer(client=client, tock=0.01)
+        doist = doing.Doist(tock=0.01, limit=0.5)
+
+        msgTx = b"Hello me maties!"
+        client.tx(msgTx)
+
+        if nested:
+            dodoer = doing.DoDoer(doers=[serdoer], tock=10.0)
+            doers = [dodoer, clidoer]  # server services before client opens
+        else:
+            doers = [serdoer, clidoer]  # server services before client opens
+
+        asyncio.run(doist.arun(doers=doers))
+        assert doist.tyme >= 0.5
+        assert server.opened == False
+        assert client.opened == False
+        assert serdoer.watched == set()  # unwatched on exit
+        assert not doist.selector.get_map()  # all unregistered
+
+        assert not client.txbs
+        ca, ix = list(server.ixes.items())[0]
+        assert bytes(ix.rxbs) == msgTx  # never recurs again by tock alone
+
+    """End Test """
+
+
 if __name__ == "__main__":
     test_tcp_tls_server_with_client_abort_handshake()
+    test_server_client_doers_arun()
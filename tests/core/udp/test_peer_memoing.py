@@ -289,6 +289,69 @@ def test_memoer_peer_open():
 
 
 
+def test_memoer_peer_batch():
+    """Test MemoerPeer batched receive into preallocated slots"""
+    alphaPort = 6103
+    betaPort = 6104
+    size = 38
+
+    with (peermemoing.openPM(name='alpha', size=size, port=alphaPort, bn=3) as alpha,
+          peermemoing.openPM(name='beta', size=size, port=betaPort, bn=3) as beta):
+        assert alpha.bn == beta.bn == 3
+        assert not beta.rxslots
+
+        memos = ["Hello there.", "How ya doing?", "Well is not this a fine day?"]
+        for memo in memos:
+            alpha.memoit(memo, beta.path)
+        alpha.serviceTxMemos()
+        assert len(alpha.txgs) == 10
+        alpha.serviceTxGrams()  # four batches
+        assert not alpha.txgs
+        assert alpha.txbs == (b'', None)
+        time.sleep(0.05)
+
+        grams = beta.receiveBatch(3)
+        assert len(grams) == 3
+        assert len(beta.rxslots) == 3
+        assert all(len(slot) == beta.MaxGramSize for slot in beta.rxslots)
+        gram, src = grams[0]
+        assert isinstance(gram, memoryview)
+        assert gram.obj is beta.rxslots[0].obj  # view into preallocated buffer
+        assert src == alpha.path
+        for gram, src in grams:
+            beta._absorbGram(gram, src)
+
+        beta.serviceAllRx()  # greedy batches drain remainder
+        assert not beta.rxgs
+        assert [memo for memo, src, vid in beta.inbox] == memos
+        assert beta.receiveBatch(3) == []
+
+    """Done Test"""
+
+
+def test_memoer_peer_binary():
+    """Test MemoerPeer with binary memos in and out"""
+    alphaPort = 6105
+    betaPort = 6106
+
+    with (peermemoing.openPM(name='alpha', size=38, port=alphaPort) as alpha,
+          peermemoing.openPM(name='beta', size=38, port=betaPort,
+                             binary=True) as beta):
+        assert not alpha.binary
+        assert beta.binary
+
+        memo = bytes(range(256))  # not utf-8 decodable
+        alpha.memoit(memo, beta.path)
+        alpha.memoit("Hello there.", beta.path)  # str still allowed per memo
+        alpha.serviceAllTx()
+        time.sleep(0.05)
+        beta.serviceAllRx()
+        assert beta.inbox[0] == (memo, alpha.path, None)
+        assert beta.inbox[1] == (b"Hello there.", alpha.path, None)
+
+    """Done Test"""
+
+
 def test_peermemoer_doer():
     """Test PeerMemoerDoer class
     """
@@ -322,6 +385,8 @@ def test_peermemoer_doer():
 if __name__ == "__main__":
     test_memoer_peer_basic()
     test_memoer_peer_open()
+    test_memoer_peer_batch()
+    test_memoer_peer_binary()
     test_peermemoer_doer()
 
 
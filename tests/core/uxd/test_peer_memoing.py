@@ -266,6 +266,43 @@ def test_memoer_peer_open():
 
 
 
+def test_memoer_peer_batch():
+    """Test MemoerPeer batched receive into preallocated slots"""
+    if platform.system() == "Windows":
+        return
+
+    with (peermemoing.openPM(name='alpha', size=38, bn=3) as alpha,
+          peermemoing.openPM(name='beta', size=38, bn=3) as beta):
+        assert alpha.bn == beta.bn == 3
+        assert not beta.rxslots
+
+        memos = ["Hello there.", "How ya doing?", "Well is not this a fine day?"]
+        for memo in memos:
+            alpha.memoit(memo, beta.path)
+        alpha.serviceTxMemos()
+        assert len(alpha.txgs) == 10
+        alpha.serviceTxGrams()  # four batches
+        assert not alpha.txgs
+        assert alpha.txbs == (b'', None)
+
+        grams = beta.receiveBatch(3)
+        assert len(grams) == 3
+        assert len(beta.rxslots) == 3
+        assert all(len(slot) == beta.MaxGramSize for slot in beta.rxslots)
+        gram, src = grams[0]
+        assert isinstance(gram, memoryview)
+        assert src == alpha.path
+        for gram, src in grams:
+            beta._absorbGram(gram, src)
+
+        beta.serviceAllRx()  # greedy batches drain remainder
+        assert not beta.rxgs
+        assert [memo for memo, src, vid in beta.inbox] == memos
+        assert beta.receiveBatch(3) == []
+
+    """Done Test"""
+
+
 def test_peermemoer_doer():
     """Test PeerMemoerDoer class
     """
@@ -303,5 +340,6 @@ def test_peermemoer_doer():
 if __name__ == "__main__":
     test_memoer_peer_basic()
     test_memoer_peer_open()
+    test_memoer_peer_batch()
     test_peermemoer_doer()
 
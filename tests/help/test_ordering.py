@@ -0,0 +1,67 @@
+# -*- encoding: utf-8 -*-
+"""tests.help.test_ordering module
+
+"""
+import pytest
+
+from hio.help import Orset
+
+def test_orset():
+    """
+    Test Orset class
+    """
+    orset = Orset()
+    assert len(orset) == 0
+    assert not orset  # empty
+    assert repr(orset) == "Orset([])"
+
+    with pytest.raises(IndexError):
+        orset[0]
+
+    with pytest.raises(IndexError):
+        orset.pull(emptive=False)
+
+    assert orset.pull() is None
+
+    orset = Orset(["a", "b", "c", "b"])
+    assert len(orset) == 3
+    assert list(orset) == ["a", "b", "c"]
+    assert list(reversed(orset)) == ["c", "b", "a"]
+    assert repr(orset) == "Orset(['a', 'b', 'c'])"
+    assert orset[0] == "a"
+    assert orset[-1] == "c"
+    assert orset[1] == "b"
+    assert orset[-2] == "b"
+    with pytest.raises(IndexError):
+        orset[3]
+
+    assert "b" in orset
+    assert "d" not in orset
+    orset.add("a")  # already in set so keeps position
+    assert list(orset) == ["a", "b", "c"]
+    orset.add("d")
+    assert list(orset) == ["a", "b", "c", "d"]
+
+    orset.remove("b")
+    assert "b" not in orset
+    with pytest.raises(KeyError):
+        orset.remove("b")
+    orset.discard("b")  # no error
+    assert list(orset) == ["a", "c", "d"]
+
+    orset.update(["e", "a", "f"])
+    assert list(orset) == ["a", "c", "d", "e", "f"]
+    assert orset == {"a", "c", "d", "e", "f"}  # Set comparison
+
+    assert orset.pull() == "a"
+    assert orset.pop() == "c"
+    assert orset[0] == "d"
+    orset.clear()
+    assert not orset
+    assert orset.pull() is None
+
+    """End Test"""
+
+
+if __name__ == "__main__":
+    test_orset()